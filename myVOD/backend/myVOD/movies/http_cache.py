@@ -0,0 +1,61 @@
+"""
+HTTP caching helpers for public, user-independent movie endpoints.
+
+ETags are derived from the response payload itself (a SHA-256 of its
+canonical JSON), so every worker produces the same validator for the same
+cached result and a CDN or browser can revalidate with `If-None-Match`.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def payload_etag(payload) -> str:
+    """Return a strong, quoted ETag for a JSON-serializable payload."""
+    canonical = json.dumps(payload, sort_keys=True, separators=(',', ':'), default=str)
+    return '"%s"' % hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:32]
+
+
+def is_not_modified(request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names `etag` (weak comparison, RFC 9110)."""
+    header = request.headers.get('If-None-Match')
+    if not header:
+        return False
+    etags = parse_etags(header)
+    # Compression proxies may hand out W/ variants of our strong validator.
+    return '*' in etags or etag in {tag.removeprefix('W/') for tag in etags}
+
+
+def apply_public_cache_headers(response, etag: str):
+    """Attach ETag and shared-cache Cache-Control (MOVIE_SEARCH_HTTP_* settings)."""
+    response['ETag'] = etag
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=getattr(settings, 'MOVIE_SEARCH_HTTP_MAX_AGE', 60),
+        stale_while_revalidate=getattr(settings, 'MOVIE_SEARCH_HTTP_STALE_WHILE_REVALIDATE', 300),
+    )
+    return response
+
+
+def cached_public_response(request, payload) -> Response:
+    """Build a 200 response for `payload`, or a bodyless 304 if the client copy is current."""
+    etag = payload_etag(payload)
+    if is_not_modified(request, etag):
+        return apply_public_cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return apply_public_cache_headers(Response(payload, status=status.HTTP_200_OK), etag)
+
+
+def cached_public_json_response(request, payload) -> HttpResponse:
+    """`cached_public_response` for plain Django views (e.g. the async search view)."""
+    etag = payload_etag(payload)
+    if is_not_modified(request, etag):
+        return apply_public_cache_headers(HttpResponse(status=status.HTTP_304_NOT_MODIFIED), etag)
+    response = JsonResponse(payload, safe=False, json_dumps_params={'separators': (',', ':')})
+    return apply_public_cache_headers(response, etag)
@@ -0,0 +1,123 @@
+import statistics
+import time
+from typing import Callable, List
+
+from django.core.management.base import BaseCommand
+
+from services.movie_search_index import build_index_from_database  # type: ignore
+from services.movie_search_service import (  # type: ignore
+    _normalized_title_expression,
+    _build_search_queryset,
+    _calculate_similarity_threshold,
+    _normalize_search_query,
+    _project_search_row,
+)
+
+
+DEFAULT_QUERIES = [
+    "ma",
+    "the",
+    "matrix",
+    "dark knight",
+    "incepton",
+    "amelie",
+    "star wars",
+    "pulp fiction",
+]
+
+
+def _percentile(samples: List[float], percentile: float) -> float:
+    ordered = sorted(samples)
+    position = min(len(ordered) - 1, int(round(percentile * (len(ordered) - 1))))
+    return ordered[position]
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark movie search against PostgreSQL and the in-memory trigram index. "
+        "Caching is bypassed so every iteration measures the search itself."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--query",
+            action="append",
+            dest="queries",
+            help="Query to benchmark (repeatable, defaults to a built-in sample set)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Number of runs per query and backend (default: 20)",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=20,
+            help="Result limit passed to the search (default: 20)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queries: List[str] = options["queries"] or DEFAULT_QUERIES
+        iterations: int = options["iterations"]
+        limit: int = options["limit"]
+
+        self.stdout.write("Building in-memory index...")
+        build_start = time.perf_counter()
+        index = build_index_from_database()
+        self.stdout.write(
+            f"  {len(index)} titles indexed in {(time.perf_counter() - build_start) * 1000:.1f} ms"
+        )
+
+        title_expr = _normalized_title_expression()
+        mismatches = 0
+
+        for query in queries:
+            normalized = _normalize_search_query(query)
+            threshold, _ = _calculate_similarity_threshold(normalized)
+
+            def run_database() -> List[dict]:
+                queryset = _build_search_queryset(title_expr, normalized, threshold, limit)
+                return [_project_search_row(row) for row in queryset]
+
+            def run_memory() -> List[dict]:
+                return index.search(normalized, threshold, limit)
+
+            database_samples, database_results = self._measure(run_database, iterations)
+            memory_samples, memory_results = self._measure(run_memory, iterations)
+
+            self.stdout.write(f"\nQuery '{query}' (normalized: '{normalized}', threshold {threshold})")
+            self._report("database", database_samples)
+            self._report("memory", memory_samples)
+
+            database_ids = [row["tconst"] for row in database_results]
+            memory_ids = [row["tconst"] for row in memory_results]
+            if database_ids != memory_ids:
+                mismatches += 1
+                self.stdout.write(self.style.WARNING(
+                    f"  ranking differs: database={database_ids[:5]} memory={memory_ids[:5]}"
+                ))
+
+        self.stdout.write("")
+        if mismatches:
+            self.stdout.write(self.style.WARNING(f"{mismatches} queries returned different rankings."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Both backends returned identical rankings."))
+
+    @staticmethod
+    def _measure(runner: Callable[[], List[dict]], iterations: int):
+        samples = []
+        results: List[dict] = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            results = runner()
+            samples.append((time.perf_counter() - start) * 1000)
+        return samples, results
+
+    def _report(self, label: str, samples: List[float]) -> None:
+        self.stdout.write(
+            f"  {label:<8} mean {statistics.mean(samples):8.2f} ms"
+            f"  p50 {_percentile(samples, 0.5):8.2f} ms"
+            f"  p95 {_percentile(samples, 0.95):8.2f} ms"
+        )
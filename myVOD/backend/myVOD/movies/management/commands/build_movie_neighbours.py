@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services.movie_neighbours_service import build_movie_neighbours  # type: ignore
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute \"more like this\" neighbours (genres, year, rating and user_movie "
+        "co-occurrence) for GET /api/movies/<tconst>/similar/. Meant to run nightly."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            help="Neighbours stored per movie (default: MOVIE_NEIGHBOURS_TOP_K)",
+        )
+        parser.add_argument(
+            "--min-votes",
+            type=int,
+            help="Only movies with at least this many votes (default: MOVIE_NEIGHBOURS_MIN_VOTES)",
+        )
+        parser.add_argument(
+            "--block-size",
+            type=int,
+            default=256,
+            help="Movies scored per NumPy block; bounds memory use (default: 256)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["top_k"] is not None and options["top_k"] < 1:
+            raise CommandError("--top-k must be positive")
+        if options["block_size"] < 1:
+            raise CommandError("--block-size must be positive")
+
+        self.stdout.write("Building movie neighbours...")
+        written = build_movie_neighbours(
+            top_k=options["top_k"],
+            min_votes=options["min_votes"],
+            block_size=options["block_size"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Stored neighbours for {written} movies."))
@@ -0,0 +1,42 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+
+from services.movie_autocomplete_service import (  # type: ignore
+    rebuild_prefix_table,
+    refresh_prefix_table,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the movie_title_prefix table used by autocomplete (GET /api/movies/?mode=prefix). "
+        "Runs a full rebuild unless --incremental is given."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only merge movies updated since the last build (or --since) into the table",
+        )
+        parser.add_argument(
+            "--since",
+            help="ISO timestamp for --incremental (default: last time the table was written)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not options["incremental"]:
+            self.stdout.write("Rebuilding movie title prefix table...")
+            written = rebuild_prefix_table()
+            self.stdout.write(self.style.SUCCESS(f"Wrote {written} prefixes."))
+            return
+
+        since = None
+        if options["since"]:
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError(f"Invalid --since timestamp: {options['since']}")
+
+        self.stdout.write("Refreshing movie title prefix table incrementally...")
+        written = refresh_prefix_table(since)
+        self.stdout.write(self.style.SUCCESS(f"Updated {written} prefixes."))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from services.movie_short_query_answers import rebuild_short_query_answers  # type: ignore
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute search results for every 1-2 character title-word prefix into "
+        "movie_short_query_answer, so short searches never scan the movie table."
+    )
+
+    def handle(self, *args, **options) -> None:
+        self.stdout.write("Rebuilding precomputed short query answers...")
+        written = rebuild_short_query_answers()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} answers."))
@@ -4,22 +4,16 @@ from typing import Iterable
 from django.core.management.base import BaseCommand
 from django.db import connection
 
+from services.search_capabilities import (  # type: ignore
+    CHECK_EXTENSION_SQL,
+    CHECK_INDEX_SQL,
+    TRIGRAM_INDEX_NAME,
+    probe_search_capabilities,
+)
 
-CHECK_INDEX_SQL = """
-SELECT indexname
-FROM pg_indexes
-WHERE schemaname = 'public'
-  AND tablename = 'movie'
-  AND indexname = %s;
-"""
-
-CHECK_EXTENSION_SQL = """
-SELECT extname
-FROM pg_extension
-WHERE extname IN ('pg_trgm', 'unaccent');
-"""
 
-EXPLAIN_ANALYZE_SQL = """
+# Pre-0004 plan: the normalized title is recomputed for every candidate row.
+EXPLAIN_ANALYZE_EXPRESSION_SQL = """
 EXPLAIN ANALYZE
 SELECT tconst, primary_title
 FROM movie
@@ -37,6 +31,22 @@ ORDER BY
 LIMIT %s;
 """
 
+# Current plan used by search_movies: stored normalized column, `%%` prefilter
+# served by the GIN trigram index.
+EXPLAIN_ANALYZE_SQL = """
+EXPLAIN ANALYZE
+SELECT tconst, primary_title
+FROM movie
+WHERE primary_title_normalized %% %s
+  AND similarity(primary_title_normalized, %s) > 0.4
+ORDER BY
+    similarity(primary_title_normalized, %s) DESC,
+    num_votes DESC NULLS LAST,
+    avg_rating DESC,
+    start_year DESC
+LIMIT %s;
+"""
+
 
 def _print_lines(command: BaseCommand, lines: Iterable[str]) -> None:
     for line in lines:
@@ -85,19 +95,19 @@ class Command(BaseCommand):
                 self.stdout.write(self.style.SUCCESS("Required extensions (pg_trgm, unaccent) are installed."))
 
             self.stdout.write("\nChecking trigram index presence...")
-            cursor.execute(CHECK_INDEX_SQL, ["movie_primary_title_trgm_idx"])
+            cursor.execute(CHECK_INDEX_SQL, [TRIGRAM_INDEX_NAME])
             index_exists = cursor.fetchone() is not None
 
             if index_exists:
-                self.stdout.write(self.style.SUCCESS("Index movie_primary_title_trgm_idx exists."))
+                self.stdout.write(self.style.SUCCESS(f"Index {TRIGRAM_INDEX_NAME} exists."))
             else:
-                self.stdout.write(self.style.WARNING("Index movie_primary_title_trgm_idx is missing."))
+                self.stdout.write(self.style.WARNING(f"Index {TRIGRAM_INDEX_NAME} is missing."))
                 self.stdout.write(
-                    "Run the following SQL to create it (requires superuser privileges):"
+                    "Apply migration movies.0004_movie_primary_title_normalized or run the following SQL:"
                 )
                 _print_lines(self, [
-                    "CREATE INDEX CONCURRENTLY movie_primary_title_trgm_idx",
-                    "  ON movie USING gin (public.immutable_unaccent(lower(primary_title)) gin_trgm_ops);",
+                    f"CREATE INDEX CONCURRENTLY {TRIGRAM_INDEX_NAME}",
+                    "  ON movie USING gin (primary_title_normalized gin_trgm_ops);",
                 ])
 
             normalized_search = _normalize_search_query(search_term)
@@ -106,9 +116,20 @@ class Command(BaseCommand):
             self.stdout.write(
                 f"Running EXPLAIN ANALYZE for sample query '{search_term}' (normalized: '{normalized_search}')"
             )
-            cursor.execute(EXPLAIN_ANALYZE_SQL, [normalized_search, normalized_search, limit])
-            explain_rows = [row[0] for row in cursor.fetchall()]
-            _print_lines(self, explain_rows)
+            self.stdout.write("Expression plan (immutable_unaccent per row):")
+            cursor.execute(EXPLAIN_ANALYZE_EXPRESSION_SQL, [normalized_search, normalized_search, limit])
+            _print_lines(self, [row[0] for row in cursor.fetchall()])
+
+            self.stdout.write("")
+            self.stdout.write("Stored column plan (primary_title_normalized):")
+            cursor.execute(EXPLAIN_ANALYZE_SQL, [normalized_search, normalized_search, normalized_search, limit])
+            _print_lines(self, [row[0] for row in cursor.fetchall()])
+
+        capabilities = probe_search_capabilities()
+        self.stdout.write("")
+        self.stdout.write(f"Search strategy selected by the capability probe: {capabilities.strategy}")
+        if not capabilities.has_immutable_unaccent:
+            self.stdout.write(self.style.WARNING("Function immutable_unaccent is missing."))
 
         self.stdout.write("")
         self.stdout.write(self.style.SUCCESS("Check completed."))
@@ -0,0 +1,43 @@
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from services.user_movie_import_service import (  # type: ignore
+    IMPORT_KINDS,
+    ImportFileError,
+    apply_user_movie_import,
+    parse_imdb_csv,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import an IMDb watchlist or ratings CSV export for one user, in this process. "
+        "Users upload the same files through POST /api/user-movies/import/, which runs "
+        "the import as a Celery job."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument("path", type=Path, help="IMDb CSV export")
+        parser.add_argument("--kind", choices=IMPORT_KINDS, required=True,
+                            help="watchlist: add to the watchlist; ratings: mark as watched")
+        parser.add_argument("--email", required=True, help="Email of the user to import for")
+        parser.add_argument("--max-rows", type=int, help="Override USER_MOVIE_IMPORT_MAX_ROWS")
+
+    def handle(self, *args, **options) -> None:
+        user = get_user_model().objects.filter(email__iexact=options["email"]).first()
+        if user is None:
+            raise CommandError(f"No user with email {options['email']}")
+
+        try:
+            with open(options["path"], "r", encoding="utf-8-sig", newline="") as handle:
+                rows, invalid = parse_imdb_csv(handle, options["kind"], options["max_rows"])
+        except (OSError, ImportFileError) as e:
+            raise CommandError(str(e))
+
+        result = apply_user_movie_import(None, str(user.id), options["kind"], rows)
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {options['path'].name}: {result['created']} added, {result['updated']} updated, "
+            f"{result['unknown']} not in the movie table, {invalid} rows without a valid tconst."
+        ))
@@ -0,0 +1,55 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from services.movie_aka_service import configured_aka_regions, load_akas  # type: ignore
+
+DEFAULT_AKAS_PATH = Path(settings.BASE_DIR).parents[2] / "IMDB_data_set_lite" / "title.akas.tsv"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load regional alternate titles from IMDb title.akas.tsv into movie_aka, "
+        "which movie search matches alongside primary titles."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--path",
+            default=str(DEFAULT_AKAS_PATH),
+            help=f"Path to title.akas.tsv (default: {DEFAULT_AKAS_PATH})",
+        )
+        parser.add_argument(
+            "--regions",
+            help="Comma-separated region codes (default: MOVIE_SEARCH_AKA_REGIONS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per INSERT statement (default: 5000)",
+        )
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="Delete existing alternate titles for the regions before loading",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = Path(options["path"])
+        if not path.exists():
+            raise CommandError(f"File not found: {path}")
+
+        if options["regions"]:
+            regions = tuple(region.strip().upper() for region in options["regions"].split(",") if region.strip())
+        else:
+            regions = configured_aka_regions()
+        if not regions:
+            raise CommandError("No regions given; set --regions or MOVIE_SEARCH_AKA_REGIONS.")
+
+        self.stdout.write(f"Loading alternate titles for {', '.join(regions)} from {path}...")
+        counts = load_akas(path, regions, batch_size=options["batch_size"], replace=options["replace"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Read {counts['read']} alternate titles, inserted {counts['inserted']}."
+        ))
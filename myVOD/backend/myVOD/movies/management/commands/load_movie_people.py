@@ -0,0 +1,47 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from services.movie_people_service import load_people  # type: ignore
+
+DEFAULT_DATA_DIR = Path(settings.BASE_DIR).parents[2] / "IMDB_data_set_lite"
+PEOPLE_FILES = ("name.basics.tsv", "title.principals.tsv", "title.crew.tsv")
+
+
+class Command(BaseCommand):
+    help = (
+        "Load directors, writers and actors from IMDb name.basics.tsv, title.principals.tsv "
+        "and title.crew.tsv into person and movie_person, which mode=person search uses."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--path",
+            default=str(DEFAULT_DATA_DIR),
+            help=f"Directory holding the IMDb files (default: {DEFAULT_DATA_DIR})",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per INSERT statement (default: 5000)",
+        )
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="Delete existing people and credits before loading",
+        )
+
+    def handle(self, *args, **options) -> None:
+        data_dir = Path(options["path"])
+        missing = [name for name in PEOPLE_FILES if not (data_dir / name).exists()]
+        if missing:
+            raise CommandError(f"File(s) not found in {data_dir}: {', '.join(missing)}")
+
+        self.stdout.write(f"Loading people from {data_dir}...")
+        counts = load_people(data_dir, batch_size=options["batch_size"], replace=options["replace"])
+        self.stdout.write(self.style.SUCCESS(
+            f"Read {counts['credits_read']} credits and {counts['people_read']} names; "
+            f"loaded {counts['people']} people and {counts['credits']} credits."
+        ))
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Tuple
+
+import httpx
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+
+from movies.management.commands.benchmark_movie_search import DEFAULT_QUERIES, _percentile
+
+SEARCH_PATH = "/api/movies/"
+
+# Must be in ALLOWED_HOSTS for in-process runs.
+IN_PROCESS_BASE_URL = "http://localhost"
+
+
+class Command(BaseCommand):
+    help = (
+        "Load test GET /api/movies/ and compare WSGI and ASGI throughput. By default both "
+        "handlers run in this process through httpx transports: WSGI with a fixed thread pool "
+        "(like one gthread worker), ASGI with concurrent requests on one event loop. With --url "
+        "the requests go to a running server instead (e.g. gunicorn vs uvicorn). Set "
+        "MOVIE_SEARCH_ASYNC=true to route the async view; compare e.g. "
+        "`--mode wsgi` with it off against `--mode asgi` with it on."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--mode",
+            choices=["wsgi", "asgi", "both"],
+            default="both",
+            help="Handler(s) to test in-process (ignored with --url)",
+        )
+        parser.add_argument("--url", help="Base URL of a running server, e.g. http://localhost:8000")
+        parser.add_argument("--requests", type=int, default=500, help="Total requests per run")
+        parser.add_argument("--concurrency", type=int, default=50, help="Requests in flight")
+        parser.add_argument(
+            "--wsgi-threads",
+            type=int,
+            default=4,
+            help="Threads serving the in-process WSGI handler",
+        )
+        parser.add_argument(
+            "--query",
+            dest="queries",
+            action="append",
+            help="Search query to request (repeatable; default: a typeahead sample)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["requests"] < 1 or options["concurrency"] < 1:
+            raise CommandError("--requests and --concurrency must be positive")
+
+        # httpx logs every request at INFO.
+        logging.getLogger("httpx").setLevel(logging.WARNING)
+
+        view = "AsyncMovieSearchView" if settings.MOVIE_SEARCH_ASYNC else "MovieSearchView"
+        self.stdout.write(f"Routing {SEARCH_PATH} to {view}")
+
+        queries: List[str] = options["queries"] or DEFAULT_QUERIES
+        total: int = options["requests"]
+        concurrency: int = options["concurrency"]
+
+        if options["url"]:
+            transport = httpx.AsyncHTTPTransport()
+            self._report("http", *asyncio.run(
+                self._run_async(transport, options["url"], queries, total, concurrency)
+            ))
+            return
+
+        if options["mode"] in ("wsgi", "both"):
+            self._report(f"wsgi ({options['wsgi_threads']} threads)", *self._run_wsgi(
+                queries, total, options["wsgi_threads"]
+            ))
+        if options["mode"] in ("asgi", "both"):
+            transport = httpx.ASGITransport(app=get_asgi_application())
+            self._report(f"asgi (concurrency {concurrency})", *asyncio.run(
+                self._run_async(transport, IN_PROCESS_BASE_URL, queries, total, concurrency)
+            ))
+
+    def _run_wsgi(self, queries: List[str], total: int, threads: int) -> Tuple[float, List[float], Counter]:
+        client = httpx.Client(
+            transport=httpx.WSGITransport(app=get_wsgi_application()),
+            base_url=IN_PROCESS_BASE_URL,
+        )
+
+        def request(index: int) -> Tuple[float, int]:
+            start = time.perf_counter()
+            response = client.get(SEARCH_PATH, params={"search": queries[index % len(queries)]})
+            return (time.perf_counter() - start) * 1000, response.status_code
+
+        start = time.perf_counter()
+        with client, ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(request, range(total)))
+        elapsed = time.perf_counter() - start
+        return elapsed, [latency for latency, _ in results], Counter(code for _, code in results)
+
+    async def _run_async(self, transport, base_url: str, queries: List[str], total: int,
+                         concurrency: int) -> Tuple[float, List[float], Counter]:
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies: List[float] = []
+        statuses: Counter = Counter()
+
+        async with httpx.AsyncClient(transport=transport, base_url=base_url, timeout=30) as client:
+            async def request(index: int) -> None:
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get(
+                        SEARCH_PATH, params={"search": queries[index % len(queries)]}
+                    )
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    statuses[response.status_code] += 1
+
+            start = time.perf_counter()
+            await asyncio.gather(*(request(index) for index in range(total)))
+            elapsed = time.perf_counter() - start
+        return elapsed, latencies, statuses
+
+    def _report(self, label: str, elapsed: float, latencies: List[float], statuses: Counter) -> None:
+        codes = ", ".join(f"{code}: {count}" for code, count in sorted(statuses.items()))
+        self.stdout.write(
+            f"{label:<28} {len(latencies) / elapsed:8.1f} req/s  "
+            f"p50 {_percentile(latencies, 0.50):7.2f} ms  "
+            f"p95 {_percentile(latencies, 0.95):7.2f} ms  "
+            f"p99 {_percentile(latencies, 0.99):7.2f} ms  "
+            f"[{codes}]"
+        )
@@ -5,6 +5,9 @@ from django.utils import timezone
 import logging
 
 from movies.models import Movie, MovieAvailability, Platform
+from services.availability_mask_service import refresh_availability_masks
+from services.movie_detail_service import invalidate_movie_details
+from services.movie_top_chart_service import refresh_top_charts
 from services.watchmode_service import WatchmodeService
 
 logger = logging.getLogger(__name__)
@@ -72,8 +75,10 @@ class Command(BaseCommand):
                     self.stdout.write(f"No more titles found for {platform_name}. Moving to next platform.")
                     break
 
-                for title in titles:
-                    self.process_title(title, platform_obj, service)
+                touched = [self.process_title(title, platform_obj, service) for title in titles]
+                touched = [tconst for tconst in touched if tconst]
+                refresh_availability_masks(touched)
+                invalidate_movie_details(touched)
 
                 if page >= response.get('total_pages', 1):
                     break
@@ -81,25 +86,27 @@ class Command(BaseCommand):
                 page += 1
                 time.sleep(1)  # Respectful delay between pages
 
+        refresh_top_charts()
         self.stdout.write(self.style.SUCCESS("Finished populating movie availability."))
 
     def process_title(self, title_data, platform_obj, service):
+        """Upsert availability for one Watchmode title; returns its tconst if it was updated."""
         watchmode_id = title_data.get('id')
         imdb_id = title_data.get('imdb_id')
 
         if title_data.get('type') != 'movie':
             logger.info(f"Skipping non-movie title: {title_data.get('title')} (type: {title_data.get('type')})")
-            return
+            return None
 
         if not watchmode_id or not imdb_id:
-            return
+            return None
 
         # Check if the movie already exists in the database (loaded from IMDB)
         try:
             movie = Movie.objects.get(tconst=imdb_id)
         except Movie.DoesNotExist:
             logger.info(f"Skipping movie not in IMDB database: {title_data.get('title')} (tconst: {imdb_id})")
-            return
+            return None
 
         # Update watchmode_id if not already set
         if not movie.watchmode_id:
@@ -117,3 +124,4 @@ class Command(BaseCommand):
                 'source': 'watchmode',
             }
         )
+        return movie.tconst
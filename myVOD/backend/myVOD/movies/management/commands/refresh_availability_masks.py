@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from services.availability_mask_service import refresh_availability_masks  # type: ignore
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the per-movie availability bitmasks (movie.available_platforms and "
+        "movie.unavailable_platforms) from movie_availability. The availability commands "
+        "keep them current for the titles they touch; run this after editing "
+        "movie_availability by other means."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "tconsts",
+            nargs="*",
+            help="Movies to refresh (default: all movies)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        updated = refresh_availability_masks(options["tconsts"] or None)
+        self.stdout.write(self.style.SUCCESS(f"Refreshed availability masks ({updated} movies changed)."))
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from services.movie_top_chart_service import refresh_top_charts  # type: ignore
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the per-platform, per-genre top charts (movie_top_chart) from current "
+        "availability. The availability commands run this automatically when they finish."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--size",
+            type=int,
+            help="Movies kept per chart (default: MOVIE_TOP_CHART_SIZE)",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["size"] is not None and options["size"] < 1:
+            raise CommandError("--size must be positive")
+
+        written = refresh_top_charts(size=options["size"])
+        self.stdout.write(self.style.SUCCESS(f"Refreshed top charts ({written} rows)."))
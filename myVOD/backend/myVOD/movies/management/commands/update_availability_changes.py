@@ -4,6 +4,9 @@ from datetime import timedelta
 import logging
 
 from movies.models import Movie, MovieAvailability, Platform
+from services.availability_mask_service import refresh_availability_masks
+from services.movie_detail_service import invalidate_movie_details
+from services.movie_top_chart_service import refresh_top_charts
 from services.watchmode_service import WatchmodeService
 from django.conf import settings
 
@@ -52,6 +55,7 @@ class Command(BaseCommand):
                 break
             page += 1
 
+        refresh_top_charts()
         self.stdout.write(self.style.SUCCESS("Finished daily availability update."))
 
     def process_title_update(self, watchmode_id, service):
@@ -109,3 +113,6 @@ class Command(BaseCommand):
                     "source": "watchmode",
                 },
             )
+
+        refresh_availability_masks([movie.tconst])
+        invalidate_movie_details([movie.tconst])
@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from services.search_cache_warmup import warm_search_cache  # type: ignore
+from services.search_query_stats import prune_query_stats  # type: ignore
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-populate the movie search cache with the most frequent queries recorded in "
+        "movie_search_query_stat. Run after deploys or cache flushes."
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=None,
+            help="Number of queries to warm (default: MOVIE_SEARCH_WARM_TOP_N)",
+        )
+        parser.add_argument(
+            "--max-age-days",
+            type=int,
+            default=7,
+            help="Skip queries not searched within this many days (0: no limit)",
+        )
+        parser.add_argument(
+            "--prune",
+            action="store_true",
+            help="Also trim the stats table to MOVIE_SEARCH_QUERY_STATS_MAX_ROWS rows",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if options["prune"]:
+            keep = getattr(settings, "MOVIE_SEARCH_QUERY_STATS_MAX_ROWS", 10000)
+            deleted = prune_query_stats(keep)
+            self.stdout.write(f"Pruned {deleted} query stats rows (keeping {keep}).")
+
+        max_age_days = options["max_age_days"] or None
+        counts = warm_search_cache(options["top"], max_age_days)
+        self.stdout.write(self.style.SUCCESS(
+            f"Warmed {counts['warmed']} queries "
+            f"({counts['skipped']} already cached, {counts['failed']} failed)."
+        ))
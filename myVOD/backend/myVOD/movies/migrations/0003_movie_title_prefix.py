@@ -0,0 +1,63 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def _create_prefix_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_title_prefix (
+                prefix text PRIMARY KEY,
+                tconsts text[] NOT NULL,
+                payload jsonb NOT NULL,
+                updated_at timestamptz NOT NULL DEFAULT now()
+            );
+            """
+        )
+        # Lets incremental refreshes find every prefix row that lists a changed title.
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS movie_title_prefix_tconsts_idx
+            ON movie_title_prefix USING gin (tconsts);
+            """
+        )
+
+
+def _drop_prefix_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_title_prefix;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0002_movie_primary_title_trgm_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_prefix_table, reverse_code=_drop_prefix_table),
+        migrations.CreateModel(
+            name="MovieTitlePrefix",
+            fields=[
+                ("prefix", models.TextField(primary_key=True, serialize=False)),
+                (
+                    "tconsts",
+                    django.contrib.postgres.fields.ArrayField(
+                        base_field=models.TextField(), size=None
+                    ),
+                ),
+                ("payload", models.JSONField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "movie_title_prefix",
+                "managed": False,
+            },
+        ),
+    ]
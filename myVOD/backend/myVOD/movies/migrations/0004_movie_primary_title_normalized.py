@@ -0,0 +1,60 @@
+from django.db import migrations
+
+
+COLUMN_NAME = "primary_title_normalized"
+TRGM_INDEX_NAME = "movie_primary_title_normalized_trgm_idx"
+COVERING_INDEX_NAME = "movie_primary_title_normalized_covering_idx"
+LEGACY_TRGM_INDEX_NAME = "movie_primary_title_trgm_idx"
+
+
+def _add_normalized_title(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # Generated columns are maintained by PostgreSQL on every insert/update,
+        # so bulk loads and the ORM keep the normalized title in sync for free.
+        cursor.execute(
+            f"""
+            ALTER TABLE movie
+            ADD COLUMN IF NOT EXISTS {COLUMN_NAME} text
+            GENERATED ALWAYS AS (immutable_unaccent(lower(primary_title))) STORED;
+            """
+        )
+        cursor.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRGM_INDEX_NAME}
+            ON movie
+            USING gin ({COLUMN_NAME} gin_trgm_ops);
+            """
+        )
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {LEGACY_TRGM_INDEX_NAME};")
+
+
+def _drop_normalized_title(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {LEGACY_TRGM_INDEX_NAME}
+            ON movie
+            USING gin (immutable_unaccent(lower(primary_title)) gin_trgm_ops);
+            """
+        )
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {COVERING_INDEX_NAME};")
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {TRGM_INDEX_NAME};")
+        cursor.execute(f"ALTER TABLE movie DROP COLUMN IF EXISTS {COLUMN_NAME};")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0003_movie_title_prefix"),
+    ]
+
+    operations = [
+        migrations.RunPython(_add_normalized_title, reverse_code=_drop_normalized_title),
+    ]
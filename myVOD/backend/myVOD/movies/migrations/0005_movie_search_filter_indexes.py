@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+# (name, definition) pairs backing the optional search filters.
+FILTER_INDEXES = [
+    # genres @> ARRAY[...] (containment) is served by the default GIN array_ops.
+    ("movie_genres_gin_idx", "USING gin (genres)"),
+    # year_from/year_to, optionally combined with min_votes.
+    ("movie_start_year_num_votes_idx", "(start_year, num_votes)"),
+    # min_rating, optionally combined with min_votes.
+    ("movie_avg_rating_num_votes_idx", "(avg_rating, num_votes)"),
+    ("movie_num_votes_idx", "(num_votes)"),
+]
+
+
+def _create_filter_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name, definition in FILTER_INDEXES:
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON movie {definition};")
+
+
+def _drop_filter_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name, _definition in FILTER_INDEXES:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0004_movie_primary_title_normalized"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_filter_indexes, reverse_code=_drop_filter_indexes),
+    ]
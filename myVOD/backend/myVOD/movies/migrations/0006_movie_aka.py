@@ -0,0 +1,69 @@
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def _create_aka_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_aka (
+                id bigserial PRIMARY KEY,
+                tconst text NOT NULL REFERENCES movie (tconst) ON DELETE CASCADE,
+                region text NOT NULL,
+                title text NOT NULL,
+                title_normalized text
+                    GENERATED ALWAYS AS (immutable_unaccent(lower(title))) STORED,
+                UNIQUE (tconst, region, title)
+            );
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS movie_aka_title_normalized_trgm_idx
+            ON movie_aka USING gin (title_normalized gin_trgm_ops);
+            """
+        )
+
+
+def _drop_aka_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_aka;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0005_movie_search_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_aka_table, reverse_code=_drop_aka_table),
+        migrations.CreateModel(
+            name="MovieAka",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("region", models.TextField()),
+                ("title", models.TextField()),
+                (
+                    "tconst",
+                    models.ForeignKey(
+                        db_column="tconst",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="akas",
+                        to="movies.movie",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "movie_aka",
+                "managed": False,
+                "unique_together": {("tconst", "region", "title")},
+            },
+        ),
+    ]
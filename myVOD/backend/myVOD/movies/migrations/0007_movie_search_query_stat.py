@@ -0,0 +1,54 @@
+from django.db import migrations, models
+
+
+def _create_query_stat_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_search_query_stat (
+                id bigserial PRIMARY KEY,
+                normalized_query text NOT NULL,
+                result_limit integer NOT NULL,
+                hits bigint NOT NULL DEFAULT 0,
+                last_seen_at timestamptz NOT NULL DEFAULT now(),
+                UNIQUE (normalized_query, result_limit)
+            );
+            """
+        )
+
+
+def _drop_query_stat_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_search_query_stat;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0006_movie_aka"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_query_stat_table, reverse_code=_drop_query_stat_table),
+        migrations.CreateModel(
+            name="MovieSearchQueryStat",
+            fields=[
+                ("id", models.BigAutoField(primary_key=True, serialize=False)),
+                ("normalized_query", models.TextField()),
+                ("result_limit", models.IntegerField()),
+                ("hits", models.BigIntegerField()),
+                ("last_seen_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "movie_search_query_stat",
+                "managed": False,
+                "unique_together": {("normalized_query", "result_limit")},
+            },
+        ),
+    ]
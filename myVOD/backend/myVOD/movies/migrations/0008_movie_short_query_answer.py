@@ -0,0 +1,51 @@
+from django.db import migrations, models
+
+
+def _create_short_query_answer_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_short_query_answer (
+                query text PRIMARY KEY,
+                payload jsonb NOT NULL,
+                updated_at timestamptz NOT NULL DEFAULT now()
+            );
+            """
+        )
+
+
+def _drop_short_query_answer_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_short_query_answer;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0007_movie_search_query_stat"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _create_short_query_answer_table,
+            reverse_code=_drop_short_query_answer_table,
+        ),
+        migrations.CreateModel(
+            name="MovieShortQueryAnswer",
+            fields=[
+                ("query", models.TextField(primary_key=True, serialize=False)),
+                ("payload", models.JSONField()),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "movie_short_query_answer",
+                "managed": False,
+            },
+        ),
+    ]
@@ -0,0 +1,140 @@
+from django.db import migrations, models
+import django.contrib.postgres.search
+import django.db.models.deletion
+import django.db.models.functions.text
+
+
+def _create_people_tables(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS person (
+                nconst text PRIMARY KEY,
+                primary_name text NOT NULL,
+                name_normalized text
+                    GENERATED ALWAYS AS (immutable_unaccent(lower(primary_name))) STORED,
+                name_tsv tsvector
+                    GENERATED ALWAYS AS (
+                        to_tsvector('simple'::regconfig, immutable_unaccent(lower(primary_name)))
+                    ) STORED
+            );
+            """
+        )
+        # Typo-tolerant (`%`) and whole-word (`@@`) name matching.
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS person_name_normalized_trgm_idx
+            ON person USING gin (name_normalized gin_trgm_ops);
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS person_name_tsv_idx
+            ON person USING gin (name_tsv);
+            """
+        )
+        # Filmography lookups go through the primary key (nconst first).
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_person (
+                nconst text NOT NULL REFERENCES person (nconst) ON DELETE CASCADE,
+                tconst text NOT NULL REFERENCES movie (tconst) ON DELETE CASCADE,
+                category text NOT NULL,
+                PRIMARY KEY (nconst, tconst, category)
+            );
+            """
+        )
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS movie_person_tconst_idx
+            ON movie_person (tconst);
+            """
+        )
+
+
+def _drop_people_tables(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_person;")
+        cursor.execute("DROP TABLE IF EXISTS person;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0008_movie_short_query_answer"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_people_tables, reverse_code=_drop_people_tables),
+        migrations.CreateModel(
+            name="Person",
+            fields=[
+                ("nconst", models.TextField(primary_key=True, serialize=False)),
+                ("primary_name", models.TextField()),
+                (
+                    "name_normalized",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=models.Func(
+                            django.db.models.functions.text.Lower("primary_name"),
+                            function="immutable_unaccent",
+                        ),
+                        output_field=models.TextField(),
+                    ),
+                ),
+                (
+                    "name_tsv",
+                    models.GeneratedField(
+                        db_persist=True,
+                        expression=django.contrib.postgres.search.SearchVector(
+                            models.Func(
+                                django.db.models.functions.text.Lower("primary_name"),
+                                function="immutable_unaccent",
+                            ),
+                            config="simple",
+                        ),
+                        output_field=django.contrib.postgres.search.SearchVectorField(),
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "person",
+                "managed": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="MoviePerson",
+            fields=[
+                ("pk", models.CompositePrimaryKey("nconst", "tconst", "category", blank=True, editable=False, primary_key=True, serialize=False)),
+                ("category", models.TextField()),
+                (
+                    "nconst",
+                    models.ForeignKey(
+                        db_column="nconst",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="credits",
+                        to="movies.person",
+                    ),
+                ),
+                (
+                    "tconst",
+                    models.ForeignKey(
+                        db_column="tconst",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="credits",
+                        to="movies.movie",
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "movie_person",
+                "managed": False,
+            },
+        ),
+    ]
@@ -0,0 +1,54 @@
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+
+def _create_movie_neighbour_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_neighbour (
+                tconst text PRIMARY KEY REFERENCES movie (tconst) ON DELETE CASCADE,
+                neighbours text[] NOT NULL,
+                scores real[] NOT NULL,
+                updated_at timestamptz NOT NULL DEFAULT now()
+            );
+            """
+        )
+
+
+def _drop_movie_neighbour_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_neighbour;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0009_person_movie_person"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _create_movie_neighbour_table,
+            reverse_code=_drop_movie_neighbour_table,
+        ),
+        migrations.CreateModel(
+            name="MovieNeighbour",
+            fields=[
+                ("tconst", models.TextField(primary_key=True, serialize=False)),
+                ("neighbours", django.contrib.postgres.fields.ArrayField(base_field=models.TextField(), size=None)),
+                ("scores", django.contrib.postgres.fields.ArrayField(base_field=models.FloatField(), size=None)),
+                ("updated_at", models.DateTimeField()),
+            ],
+            options={
+                "db_table": "movie_neighbour",
+                "managed": False,
+            },
+        ),
+    ]
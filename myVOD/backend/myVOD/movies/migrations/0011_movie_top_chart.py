@@ -0,0 +1,65 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _create_top_chart_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS movie_top_chart (
+                platform_id smallint NOT NULL REFERENCES platform (id) ON DELETE CASCADE,
+                genre text NOT NULL,
+                rank integer NOT NULL,
+                tconst text NOT NULL REFERENCES movie (tconst) ON DELETE CASCADE,
+                num_votes integer NOT NULL,
+                PRIMARY KEY (platform_id, genre, rank)
+            );
+            """
+        )
+        # Keyset order shared by single- and multi-platform charts.
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS movie_top_chart_keyset_idx
+            ON movie_top_chart (genre, platform_id, num_votes DESC, tconst);
+            """
+        )
+
+
+def _drop_top_chart_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS movie_top_chart;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0010_movie_neighbour"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _create_top_chart_table,
+            reverse_code=_drop_top_chart_table,
+        ),
+        migrations.CreateModel(
+            name="MovieTopChart",
+            fields=[
+                ("pk", models.CompositePrimaryKey("platform", "genre", "rank", blank=True, editable=False, primary_key=True, serialize=False)),
+                ("genre", models.TextField()),
+                ("rank", models.IntegerField()),
+                ("num_votes", models.IntegerField()),
+                ("platform", models.ForeignKey(on_delete=django.db.models.deletion.DO_NOTHING, to="movies.platform")),
+                ("tconst", models.ForeignKey(db_column="tconst", on_delete=django.db.models.deletion.DO_NOTHING, related_name="top_chart_entries", to="movies.movie")),
+            ],
+            options={
+                "db_table": "movie_top_chart",
+                "managed": False,
+            },
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+
+# (name, definition) pairs matching the keyset orders of GET /api/user-movies/.
+KEYSET_INDEXES = [
+    (
+        "user_movie_watchlist_keyset_idx",
+        "(user_id, watchlisted_at DESC, id DESC) "
+        "WHERE watchlisted_at IS NOT NULL AND watchlist_deleted_at IS NULL",
+    ),
+    (
+        "user_movie_watched_keyset_idx",
+        "(user_id, watched_at DESC, id DESC) WHERE watched_at IS NOT NULL",
+    ),
+]
+
+
+def _create_keyset_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name, definition in KEYSET_INDEXES:
+            cursor.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON user_movie {definition};")
+
+
+def _drop_keyset_indexes(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        for name, _definition in KEYSET_INDEXES:
+            cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name};")
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0011_movie_top_chart"),
+    ]
+
+    operations = [
+        migrations.RunPython(_create_keyset_indexes, reverse_code=_drop_keyset_indexes),
+    ]
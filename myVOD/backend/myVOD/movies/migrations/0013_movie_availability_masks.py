@@ -0,0 +1,73 @@
+from django.db import migrations
+
+
+AVAILABLE_INDEX_NAME = "movie_available_platforms_num_votes_idx"
+
+
+def _add_availability_masks(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # One bit per platform id (see services.availability_mask_service).
+        cursor.execute(
+            """
+            ALTER TABLE movie
+            ADD COLUMN IF NOT EXISTS available_platforms bigint NOT NULL DEFAULT 0,
+            ADD COLUMN IF NOT EXISTS unavailable_platforms bigint NOT NULL DEFAULT 0;
+            """
+        )
+        cursor.execute(
+            """
+            UPDATE movie m
+            SET available_platforms = coalesce(a.available, 0),
+                unavailable_platforms = coalesce(a.unavailable, 0)
+            FROM (
+                SELECT tconst,
+                       bit_or(1::bigint << platform_id) FILTER (WHERE is_available) AS available,
+                       bit_or(1::bigint << platform_id) FILTER (WHERE NOT is_available) AS unavailable
+                FROM movie_availability
+                WHERE platform_id <= 62
+                GROUP BY tconst
+            ) a
+            WHERE m.tconst = a.tconst;
+            """
+        )
+        # Only a small part of the catalogue is available anywhere; the AI
+        # candidate query walks this index by popularity and tests the mask
+        # without touching the heap.
+        cursor.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {AVAILABLE_INDEX_NAME}
+            ON movie (num_votes DESC NULLS LAST)
+            INCLUDE (available_platforms)
+            WHERE available_platforms <> 0;
+            """
+        )
+
+
+def _drop_availability_masks(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {AVAILABLE_INDEX_NAME};")
+        cursor.execute(
+            """
+            ALTER TABLE movie
+            DROP COLUMN IF EXISTS available_platforms,
+            DROP COLUMN IF EXISTS unavailable_platforms;
+            """
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0012_user_movie_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(_add_availability_masks, reverse_code=_drop_availability_masks),
+    ]
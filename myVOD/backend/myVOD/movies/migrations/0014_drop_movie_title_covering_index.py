@@ -0,0 +1,40 @@
+from django.db import migrations
+
+
+COVERING_INDEX_NAME = "movie_primary_title_normalized_covering_idx"
+
+
+def _drop_covering_index(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    # No query uses it: title search ranks through the trigram GIN index and
+    # prefix autocomplete reads movie_title_prefix. It only cost writes.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {COVERING_INDEX_NAME};")
+
+
+def _create_covering_index(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS {COVERING_INDEX_NAME}
+            ON movie (primary_title_normalized text_pattern_ops)
+            INCLUDE (num_votes, avg_rating, start_year, poster_path);
+            """
+        )
+
+
+class Migration(migrations.Migration):
+    atomic = False
+
+    dependencies = [
+        ("movies", "0013_movie_availability_masks"),
+    ]
+
+    operations = [
+        migrations.RunPython(_drop_covering_index, reverse_code=_create_covering_index),
+    ]
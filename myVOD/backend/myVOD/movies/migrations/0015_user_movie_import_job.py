@@ -0,0 +1,81 @@
+from django.db import migrations, models
+
+
+def _create_import_job_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        # Job status lives in the database rather than the Django cache, so the
+        # web process and the Celery worker see the same row whatever cache
+        # backend each of them runs with.
+        cursor.execute(
+            """
+            CREATE TABLE IF NOT EXISTS user_movie_import_job (
+                id uuid PRIMARY KEY,
+                user_id uuid NOT NULL,
+                kind text NOT NULL,
+                status text NOT NULL,
+                total integer NOT NULL,
+                processed integer NOT NULL DEFAULT 0,
+                created integer NOT NULL DEFAULT 0,
+                updated integer NOT NULL DEFAULT 0,
+                unknown integer NOT NULL DEFAULT 0,
+                invalid integer NOT NULL DEFAULT 0,
+                error text,
+                created_at timestamptz NOT NULL DEFAULT now(),
+                finished_at timestamptz
+            );
+            """
+        )
+        # Pruning a user's finished jobs when they start a new one.
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS user_movie_import_job_user_finished_idx
+            ON user_movie_import_job (user_id, finished_at);
+            """
+        )
+
+
+def _drop_import_job_table(apps, schema_editor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("DROP TABLE IF EXISTS user_movie_import_job;")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("movies", "0014_drop_movie_title_covering_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _create_import_job_table,
+            reverse_code=_drop_import_job_table,
+        ),
+        migrations.CreateModel(
+            name="UserMovieImportJob",
+            fields=[
+                ("id", models.UUIDField(primary_key=True, serialize=False)),
+                ("user_id", models.UUIDField()),
+                ("kind", models.TextField()),
+                ("status", models.TextField()),
+                ("total", models.IntegerField()),
+                ("processed", models.IntegerField(default=0)),
+                ("created", models.IntegerField(default=0)),
+                ("updated", models.IntegerField(default=0)),
+                ("unknown", models.IntegerField(default=0)),
+                ("invalid", models.IntegerField(default=0)),
+                ("error", models.TextField(blank=True, null=True)),
+                ("created_at", models.DateTimeField()),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "db_table": "user_movie_import_job",
+                "managed": False,
+            },
+        ),
+    ]
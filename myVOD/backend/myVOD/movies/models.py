@@ -1,5 +1,7 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.search import SearchVector, SearchVectorField
 
 # Uwaga: Modele te zostały wygenerowane ręcznie na podstawie schematu SQL.
 # UWAGA TYMCZASOWA: user_id jest obecnie UUIDField, ponieważ baza danych używa UUID.
@@ -20,6 +22,12 @@ class Platform(models.Model):
 class Movie(models.Model):
     tconst = models.TextField(primary_key=True)
     primary_title = models.TextField()
+    # Stored generated column (see migration 0004) backing the trigram search indexes
+    primary_title_normalized = models.GeneratedField(
+        expression=models.Func(Lower('primary_title'), function='immutable_unaccent'),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
     original_title = models.TextField(blank=True, null=True)
     start_year = models.SmallIntegerField(blank=True, null=True)
     genres = ArrayField(models.TextField(), blank=True, null=True)  # PostgreSQL text[] array
@@ -29,6 +37,9 @@ class Movie(models.Model):
     poster_last_checked = models.DateTimeField(blank=True, null=True)
     tmdb_id = models.BigIntegerField(blank=True, null=True)
     watchmode_id = models.BigIntegerField(blank=True, null=True)
+    # Bit platform_id set per platform (see migration 0013 and availability_mask_service)
+    available_platforms = models.BigIntegerField(default=0)
+    unavailable_platforms = models.BigIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -117,3 +128,143 @@ class IntegrationErrorLog(models.Model):
         managed = False
         db_table = 'integration_error_log'
         unique_together = (('id', 'occurred_at'),)
+
+
+class MovieTitlePrefix(models.Model):
+    """Precomputed autocomplete answers: normalized word prefix -> top titles by num_votes."""
+    prefix = models.TextField(primary_key=True)
+    tconsts = ArrayField(models.TextField())
+    payload = models.JSONField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_title_prefix'
+
+
+class MovieShortQueryAnswer(models.Model):
+    """Precomputed search results for a 1-2 character normalized query (see `build_short_query_answers`)."""
+    query = models.TextField(primary_key=True)
+    payload = models.JSONField()
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_short_query_answer'
+
+
+class MovieAka(models.Model):
+    """Regional alternate title from IMDb title.akas (loaded by `load_movie_akas`)."""
+    id = models.BigAutoField(primary_key=True)
+    tconst = models.ForeignKey(Movie, models.DO_NOTHING, db_column='tconst', related_name='akas')
+    region = models.TextField()
+    title = models.TextField()
+    title_normalized = models.GeneratedField(
+        expression=models.Func(Lower('title'), function='immutable_unaccent'),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'movie_aka'
+        unique_together = (('tconst', 'region', 'title'),)
+
+
+class Person(models.Model):
+    """IMDb person from name.basics, kept only if credited on a movie (see `load_movie_people`)."""
+    nconst = models.TextField(primary_key=True)
+    primary_name = models.TextField()
+    name_normalized = models.GeneratedField(
+        expression=models.Func(Lower('primary_name'), function='immutable_unaccent'),
+        output_field=models.TextField(),
+        db_persist=True,
+    )
+    name_tsv = models.GeneratedField(
+        expression=SearchVector(
+            models.Func(Lower('primary_name'), function='immutable_unaccent'),
+            config='simple',
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+
+    class Meta:
+        managed = False
+        db_table = 'person'
+
+
+class MoviePerson(models.Model):
+    """Credit linking a person to a movie as director, writer, actor or actress."""
+    pk = models.CompositePrimaryKey('nconst', 'tconst', 'category')
+    nconst = models.ForeignKey(Person, models.DO_NOTHING, db_column='nconst', related_name='credits')
+    tconst = models.ForeignKey(Movie, models.DO_NOTHING, db_column='tconst', related_name='credits')
+    category = models.TextField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_person'
+
+
+class MovieNeighbour(models.Model):
+    """Precomputed "more like this" list: the top-K most similar movies, best first (see `build_movie_neighbours`)."""
+    tconst = models.TextField(primary_key=True)
+    neighbours = ArrayField(models.TextField())
+    scores = ArrayField(models.FloatField())
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_neighbour'
+
+
+class MovieTopChart(models.Model):
+    """Top-N available movies per platform and genre by num_votes (see `refresh_top_charts`).
+
+    genre is '' for the all-genres chart; num_votes is the value at refresh time.
+    """
+    pk = models.CompositePrimaryKey('platform', 'genre', 'rank')
+    platform = models.ForeignKey(Platform, models.DO_NOTHING)
+    genre = models.TextField()
+    rank = models.IntegerField()
+    tconst = models.ForeignKey(Movie, models.DO_NOTHING, db_column='tconst', related_name='top_chart_entries')
+    num_votes = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_top_chart'
+
+
+class MovieSearchQueryStat(models.Model):
+    """Search frequency per normalized query and limit, used to warm the search cache."""
+    id = models.BigAutoField(primary_key=True)
+    normalized_query = models.TextField()
+    result_limit = models.IntegerField()
+    hits = models.BigIntegerField()
+    last_seen_at = models.DateTimeField()
+
+    class Meta:
+        managed = False
+        db_table = 'movie_search_query_stat'
+        unique_together = (('normalized_query', 'result_limit'),)
+
+
+class UserMovieImportJob(models.Model):
+    """Status and progress of an IMDb CSV import run by Celery (see `start_user_movie_import`)."""
+    id = models.UUIDField(primary_key=True)
+    user_id = models.UUIDField()
+    kind = models.TextField()
+    status = models.TextField()
+    total = models.IntegerField()
+    processed = models.IntegerField(default=0)
+    created = models.IntegerField(default=0)
+    updated = models.IntegerField(default=0)
+    unknown = models.IntegerField(default=0)
+    invalid = models.IntegerField(default=0)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField()
+    finished_at = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        managed = False
+        db_table = 'user_movie_import_job'
@@ -3,8 +3,11 @@ Serializers for movies app.
 
 This module contains serializers for movie-related API endpoints.
 """
+from django.conf import settings
+from drf_spectacular.utils import extend_schema_serializer
 from rest_framework import serializers
 from .models import Movie, MovieAvailability, Platform
+from .pagination import InvalidCursor, decode_cursor
 
 
 class MovieSearchQueryParamsSerializer(serializers.Serializer):
@@ -13,6 +16,13 @@ class MovieSearchQueryParamsSerializer(serializers.Serializer):
 
     Query Parameters:
         search (str): Search query for movie title (required, min 1 char)
+        mode (str): 'search' for fuzzy title search (default), 'prefix' for autocomplete
+            or 'person' for movies by a director, writer or actor name
+        year_from (int): Earliest release year (optional)
+        year_to (int): Latest release year (optional)
+        genres (str): Comma-separated IMDb genres; movies must have all of them (optional)
+        min_rating (decimal): Minimum average rating, 0.0-10.0 (optional)
+        min_votes (int): Minimum number of votes (optional)
     """
     search = serializers.CharField(
         required=True,
@@ -25,14 +35,124 @@ class MovieSearchQueryParamsSerializer(serializers.Serializer):
             'max_length': 'Search query cannot exceed 255 characters.'
         }
     )
+    mode = serializers.ChoiceField(
+        choices=['search', 'prefix', 'person'],
+        required=False,
+        default='search',
+        error_messages={
+            'invalid_choice': 'Invalid mode. Must be "search", "prefix" or "person".'
+        }
+    )
+    year_from = serializers.IntegerField(required=False, min_value=1870, max_value=2100)
+    year_to = serializers.IntegerField(required=False, min_value=1870, max_value=2100)
+    genres = serializers.CharField(required=False, max_length=255)
+    min_rating = serializers.DecimalField(
+        required=False,
+        max_digits=3,
+        decimal_places=1,
+        min_value=0,
+        max_value=10,
+    )
+    min_votes = serializers.IntegerField(required=False, min_value=0)
+
+    def validate_genres(self, value):
+        """Parse the comma-separated genre list, dropping blanks and duplicates."""
+        genres = tuple(sorted({genre.strip() for genre in value.split(',') if genre.strip()}))
+        if not genres:
+            raise serializers.ValidationError('Genres cannot be blank.')
+        return genres
+
+    def validate(self, attrs):
+        year_from = attrs.get('year_from')
+        year_to = attrs.get('year_to')
+        if year_from is not None and year_to is not None and year_from > year_to:
+            raise serializers.ValidationError({'year_to': 'year_to must be greater than or equal to year_from.'})
+        return attrs
+
+
+class MovieBatchSearchRequestSerializer(serializers.Serializer):
+    """
+    Serializer for validating the body of the batch movie search endpoint.
+
+    Fields:
+        queries (list[str]): Search strings, 1..MOVIE_SEARCH_BATCH_MAX_QUERIES entries
+        limit (int): Maximum results per query (optional, default 20)
+    """
+    queries = serializers.ListField(
+        child=serializers.CharField(min_length=1, max_length=255),
+        allow_empty=False,
+        error_messages={
+            'empty': 'At least one query is required.',
+        }
+    )
+    limit = serializers.IntegerField(required=False, default=20, min_value=1, max_value=50)
+
+    def validate_queries(self, value):
+        max_queries = getattr(settings, 'MOVIE_SEARCH_BATCH_MAX_QUERIES', 50)
+        if len(value) > max_queries:
+            raise serializers.ValidationError(f'At most {max_queries} queries are allowed per request.')
+        return value
+
+
+class MovieSimilarQueryParamsSerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters for the similar movies endpoint.
+
+    Query Parameters:
+        limit (int): Maximum number of movies (optional, default 20, max MOVIE_NEIGHBOURS_TOP_K)
+    """
+    limit = serializers.IntegerField(required=False, default=20, min_value=1)
+
+    def validate_limit(self, value):
+        top_k = getattr(settings, 'MOVIE_NEIGHBOURS_TOP_K', 20)
+        if value > top_k:
+            raise serializers.ValidationError(f'limit cannot exceed {top_k}.')
+        return value
 
 
+class MovieTopChartQueryParamsSerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters for the top chart endpoint.
+
+    Query Parameters:
+        platform (str): Comma-separated platform slugs (optional; defaults to the user's platforms)
+        genre (str): IMDb genre (optional; all genres when omitted)
+        limit (int): Page size, 1-100 (optional, default 20)
+        cursor (str): Cursor from the previous page's `next` link (optional)
+    """
+    platform = serializers.CharField(required=False, max_length=255)
+    genre = serializers.CharField(required=False, max_length=64)
+    limit = serializers.IntegerField(required=False, default=20, min_value=1, max_value=100)
+    cursor = serializers.CharField(required=False, max_length=512)
+
+    def validate_platform(self, value):
+        """Parse the comma-separated slug list, dropping blanks and duplicates."""
+        slugs = tuple(sorted({slug.strip() for slug in value.split(',') if slug.strip()}))
+        if not slugs:
+            raise serializers.ValidationError('Platform cannot be blank.')
+        return slugs
+
+    def validate_cursor(self, value):
+        """Decode the cursor into the (num_votes, tconst) key of the previous page's last movie."""
+        try:
+            num_votes, tconst = decode_cursor(value, 2)
+        except InvalidCursor as exc:
+            raise serializers.ValidationError(str(exc))
+        if not isinstance(num_votes, int) or not isinstance(tconst, str):
+            raise serializers.ValidationError('Invalid cursor.')
+        return num_votes, tconst
+
+
+# Named apart from myVOD.serializers.PlatformSerializer in the OpenAPI schema.
+@extend_schema_serializer(component_name='AvailabilityPlatform')
 class PlatformSerializer(serializers.ModelSerializer):
     class Meta:
         model = Platform
         fields = ['platform_slug', 'platform_name']
 
 
+# Named apart from myVOD.serializers.MovieAvailabilitySerializer in the OpenAPI schema.
+@extend_schema_serializer(component_name='MovieDetailAvailability')
 class MovieAvailabilitySerializer(serializers.ModelSerializer):
     platform = PlatformSerializer(read_only=True)
 
@@ -71,3 +191,52 @@ class MovieSearchResultSerializer(serializers.ModelSerializer):
         if obj.avg_rating is not None:
             return str(obj.avg_rating)
         return None
+
+
+class MovieDetailSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the movie detail endpoint.
+
+    Fields:
+        - tconst, primary_title, original_title, start_year, genres
+        - avg_rating: Average rating as a string (e.g. "8.6"), like search results
+        - num_votes, poster_path
+        - availability: Every MovieAvailability row of the movie, with its platform
+    """
+    avg_rating = serializers.SerializerMethodField()
+    availability = MovieAvailabilitySerializer(source='availability_entries', many=True, read_only=True)
+
+    class Meta:
+        model = Movie
+        fields = [
+            'tconst', 'primary_title', 'original_title', 'start_year', 'genres',
+            'avg_rating', 'num_votes', 'poster_path', 'availability',
+        ]
+
+    def get_avg_rating(self, obj):
+        if obj.avg_rating is not None:
+            return str(obj.avg_rating)
+        return None
+
+
+class MovieSimilarSerializer(serializers.ModelSerializer):
+    """
+    Serializer for similar movies.
+
+    Like search results plus genres and the movie's availability on the
+    requesting user's platforms (prefetched into `availability_filtered`).
+    """
+    avg_rating = serializers.SerializerMethodField()
+    availability = MovieAvailabilitySerializer(source='availability_filtered', many=True, read_only=True)
+
+    class Meta:
+        model = Movie
+        fields = [
+            'tconst', 'primary_title', 'start_year', 'genres', 'avg_rating',
+            'num_votes', 'poster_path', 'availability',
+        ]
+
+    def get_avg_rating(self, obj):
+        if obj.avg_rating is not None:
+            return str(obj.avg_rating)
+        return None
@@ -3,17 +3,24 @@ Integration tests for movies API endpoints.
 
 Tests the full request-response cycle for movie-related endpoints.
 """
+import json
 import unittest
+import uuid
 from io import StringIO
 
+from django.core.cache import cache
 from django.core.management import call_command
 from django.db import DatabaseError
+from django.test import AsyncRequestFactory, SimpleTestCase, override_settings
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.test import APITestCase
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from movies.models import Movie, Platform, MovieAvailability  # type: ignore
+from movies.pagination import InvalidCursor, decode_cursor, encode_cursor  # type: ignore
+from movies.views import AsyncMovieSearchView  # type: ignore
+from services.movie_detail_service import invalidate_movie_details  # type: ignore
 
 
 class MovieSearchAPITests(APITestCase):
@@ -337,6 +344,123 @@ class MovieSearchAPITests(APITestCase):
         titles = [m['primary_title'] for m in response.data]
         self.assertIn('ApiTest Café París', titles)
 
+    def test_prefix_mode_uses_autocomplete_service(self):
+        """mode=prefix should be served by the autocomplete service."""
+        url = reverse('movie-search')
+
+        with patch('movies.views.autocomplete_movies', return_value=[]) as autocomplete:
+            response = self.client.get(url, {'search': 'Ap', 'mode': 'prefix'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        autocomplete.assert_called_once_with('Ap', filters=None)
+
+    def test_person_mode_uses_person_search_service(self):
+        """mode=person should be served by the person search service."""
+        url = reverse('movie-search')
+
+        with patch('movies.views.search_movies_by_person', return_value=[]) as person_search:
+            response = self.client.get(url, {'search': 'Nolan', 'mode': 'person'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        person_search.assert_called_once_with('Nolan', filters=None)
+
+    def test_invalid_mode_returns_400(self):
+        """Unknown mode values should be rejected."""
+        url = reverse('movie-search')
+        response = self.client.get(url, {'search': 'ApiTest', 'mode': 'everything'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('mode', response.data)
+
+    def test_filters_are_parsed_and_passed_to_service(self):
+        """Structured filters should be validated and forwarded as SearchFilters."""
+        url = reverse('movie-search')
+
+        with patch('movies.views.search_movies', return_value=[]) as search:
+            response = self.client.get(url, {
+                'search': 'ApiTest',
+                'year_from': 1990,
+                'year_to': 2000,
+                'genres': 'Sci-Fi, Action,,Action',
+                'min_rating': '7.5',
+                'min_votes': 1000,
+            })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        filters = search.call_args.kwargs['filters']
+        self.assertEqual(filters.year_from, 1990)
+        self.assertEqual(filters.year_to, 2000)
+        self.assertEqual(filters.genres, ('Action', 'Sci-Fi'))
+        self.assertEqual(str(filters.min_rating), '7.5')
+        self.assertEqual(filters.min_votes, 1000)
+
+    def test_inverted_year_range_returns_400(self):
+        """year_from greater than year_to should be rejected."""
+        url = reverse('movie-search')
+        response = self.client.get(url, {'search': 'ApiTest', 'year_from': 2010, 'year_to': 2000})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('year_to', response.data)
+
+    def test_out_of_range_rating_returns_400(self):
+        """min_rating must be between 0 and 10."""
+        url = reverse('movie-search')
+        response = self.client.get(url, {'search': 'ApiTest', 'min_rating': '11'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('min_rating', response.data)
+
+    @override_settings(MOVIE_SEARCH_HTTP_MAX_AGE=30, MOVIE_SEARCH_HTTP_STALE_WHILE_REVALIDATE=120)
+    def test_response_has_etag_and_public_cache_control(self):
+        """Successful searches should be cacheable by shared caches."""
+        url = reverse('movie-search')
+        payload = [{'tconst': 'tt9980001', 'primary_title': 'ApiTest Space Adventure'}]
+
+        with patch('movies.views.search_movies', return_value=payload):
+            response = self.client.get(url, {'search': 'ApiTest Space'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response['ETag'], r'^"[0-9a-f]{32}"$')
+        cache_control = {part.strip() for part in response['Cache-Control'].split(',')}
+        self.assertTrue({'public', 'max-age=30', 'stale-while-revalidate=120'} <= cache_control)
+
+    def test_etag_is_deterministic_per_payload(self):
+        """Identical payloads share an ETag; different payloads do not."""
+        url = reverse('movie-search')
+
+        with patch('movies.views.search_movies', return_value=[{'tconst': 'tt1'}]):
+            first = self.client.get(url, {'search': 'ApiTest'})
+            second = self.client.get(url, {'search': 'ApiTest'})
+        with patch('movies.views.search_movies', return_value=[{'tconst': 'tt2'}]):
+            other = self.client.get(url, {'search': 'ApiTest'})
+
+        self.assertEqual(first['ETag'], second['ETag'])
+        self.assertNotEqual(first['ETag'], other['ETag'])
+
+    def test_conditional_get_returns_304(self):
+        """If-None-Match with the current ETag (strong or weak) should return 304 without a body."""
+        url = reverse('movie-search')
+
+        with patch('movies.views.search_movies', return_value=[{'tconst': 'tt1'}]):
+            etag = self.client.get(url, {'search': 'ApiTest'})['ETag']
+            not_modified = self.client.get(url, {'search': 'ApiTest'}, HTTP_IF_NONE_MATCH=etag)
+            weak = self.client.get(url, {'search': 'ApiTest'}, HTTP_IF_NONE_MATCH=f'W/{etag}')
+            stale = self.client.get(url, {'search': 'ApiTest'}, HTTP_IF_NONE_MATCH='"0000"')
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b'')
+        self.assertEqual(not_modified['ETag'], etag)
+        self.assertEqual(weak.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
+
+    def test_error_responses_are_not_cacheable(self):
+        """400 responses should not advertise public caching."""
+        url = reverse('movie-search')
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertNotIn('public', response.get('Cache-Control', ''))
+
     def test_internal_server_error_from_service(self):
         """Movies endpoint should return 500 when service raises DatabaseError."""
         url = reverse('movie-search')
@@ -349,6 +473,287 @@ class MovieSearchAPITests(APITestCase):
         self.assertIn('error', response.data)
 
 
+class MovieBatchSearchAPITests(APITestCase):
+    """
+    Integration tests for POST /api/movies/search/batch/ endpoint.
+
+    Tests cover:
+    - Authentication requirement (401)
+    - Request validation (400)
+    - Results keyed by query (200)
+    """
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+
+        self.user, _ = get_user_model().objects.get_or_create(
+            email='batchsearch@example.com',
+            defaults={'username': 'batchsearch', 'is_active': True},
+        )
+        self.url = reverse('movie-search-batch')
+
+    def test_requires_authentication(self):
+        response = self.client.post(self.url, {'queries': ['Inception']}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_results_keyed_by_query(self):
+        self.client.force_authenticate(user=self.user)
+        payload = {'Inception': [], 'Matrix': []}
+
+        with patch('movies.views.search_movies_batch', return_value=payload) as batch:
+            response = self.client.post(self.url, {'queries': ['Inception', 'Matrix'], 'limit': 5}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {'results': payload})
+        batch.assert_called_once_with(['Inception', 'Matrix'], limit=5)
+
+    @override_settings(MOVIE_SEARCH_BATCH_MAX_QUERIES=2)
+    def test_too_many_queries_returns_400(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.url, {'queries': ['a', 'b', 'c']}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('queries', response.data)
+
+    def test_empty_queries_returns_400(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(self.url, {'queries': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AsyncMovieSearchViewTests(SimpleTestCase):
+    """
+    Tests for the async search view routed when MOVIE_SEARCH_ASYNC is enabled.
+
+    The view is called directly, independent of the URL configuration.
+    """
+
+    def setUp(self):
+        self.factory = AsyncRequestFactory()
+        self.view = AsyncMovieSearchView.as_view()
+
+    async def test_returns_results_with_cache_headers(self):
+        movies = [{'tconst': 'tt0133093', 'primary_title': 'The Matrix'}]
+
+        with patch('movies.views.asearch_movies', new=AsyncMock(return_value=movies)) as search:
+            response = await self.view(self.factory.get('/api/movies/', {'search': 'Matrix'}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), movies)
+        self.assertIn('public', response['Cache-Control'])
+        search.assert_awaited_once_with('Matrix', filters=None)
+
+        conditional = self.factory.get(
+            '/api/movies/', {'search': 'Matrix'}, headers={'If-None-Match': response['ETag']}
+        )
+        with patch('movies.views.asearch_movies', new=AsyncMock(return_value=movies)):
+            not_modified = await self.view(conditional)
+
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    async def test_person_mode_uses_person_search_service(self):
+        movies = [{'tconst': 'tt1375666', 'primary_title': 'Inception'}]
+
+        with patch('movies.views.search_movies_by_person', return_value=movies) as person_search:
+            response = await self.view(
+                self.factory.get('/api/movies/', {'search': 'Nolan', 'mode': 'person'})
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(response.content), movies)
+        person_search.assert_called_once_with('Nolan', filters=None)
+
+    async def test_invalid_parameters_return_400(self):
+        response = await self.view(self.factory.get('/api/movies/'))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('search', json.loads(response.content))
+
+    async def test_database_error_returns_500(self):
+        with patch('movies.views.asearch_movies', new=AsyncMock(side_effect=DatabaseError("DB error"))):
+            response = await self.view(self.factory.get('/api/movies/', {'search': 'Matrix'}))
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertIn('error', json.loads(response.content))
+
+
+class MovieDetailAPITests(APITestCase):
+    """Integration tests for GET /api/movies/<tconst>/."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.movie = Movie.objects.create(
+            tconst='tt9970001',
+            primary_title='DetailTest Movie',
+            start_year=2010,
+            genres=['Drama', 'Sci-Fi'],
+            avg_rating='8.4',
+            num_votes=1200,
+        )
+        cls.platform, _ = Platform.objects.get_or_create(
+            platform_slug='netflix',
+            defaults={'platform_name': 'Netflix'},
+        )
+        MovieAvailability.objects.create(
+            tconst=cls.movie,
+            platform=cls.platform,
+            is_available=True,
+            last_checked='2025-01-01T00:00:00Z',
+            source='watchmode',
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('movie-detail', args=[self.movie.tconst])
+
+    def test_returns_movie_with_availability(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['genres'], ['Drama', 'Sci-Fi'])
+        self.assertEqual(response.data['avg_rating'], '8.4')
+        self.assertEqual(len(response.data['availability']), 1)
+        self.assertEqual(response.data['availability'][0]['platform']['platform_slug'], 'netflix')
+        self.assertIn('public', response['Cache-Control'])
+
+    def test_repeated_request_is_served_from_cache(self):
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_invalidation_reloads_availability(self):
+        self.client.get(self.url)
+        MovieAvailability.objects.filter(tconst=self.movie).update(is_available=False)
+
+        cached = self.client.get(self.url)
+        invalidate_movie_details([self.movie.tconst])
+        fresh = self.client.get(self.url)
+
+        self.assertTrue(cached.data['availability'][0]['is_available'])
+        self.assertFalse(fresh.data['availability'][0]['is_available'])
+
+    def test_unknown_movie_returns_404(self):
+        response = self.client.get(reverse('movie-detail', args=['tt0000000']))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class MovieSimilarAPITests(APITestCase):
+    """Tests for GET /api/movies/<tconst>/similar/ (neighbour lookup is mocked)."""
+
+    def setUp(self):
+        from django.contrib.auth import get_user_model
+
+        self.user = get_user_model().objects.create(
+            id=uuid.uuid4(), email='similar@example.com', username='similar'
+        )
+        self.url = reverse('movie-similar', args=['tt0133093'])
+
+    def test_authentication_required(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_returns_neighbours_with_user_availability(self):
+        neighbour = Movie(tconst='tt0234215', primary_title='The Matrix Reloaded', avg_rating='7.2')
+        neighbour.availability_filtered = []
+        self.client.force_authenticate(user=self.user)
+
+        with patch('movies.views.get_similar_movies', return_value=[neighbour]) as similar:
+            response = self.client.get(self.url, {'limit': 5})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]['tconst'], 'tt0234215')
+        self.assertEqual(response.data[0]['avg_rating'], '7.2')
+        self.assertEqual(response.data[0]['availability'], [])
+        similar.assert_called_once_with(user=self.user, tconst='tt0133093', limit=5)
+
+    def test_unknown_movie_returns_404(self):
+        self.client.force_authenticate(user=self.user)
+
+        with patch('movies.views.get_similar_movies', return_value=None):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @override_settings(MOVIE_NEIGHBOURS_TOP_K=10)
+    def test_limit_above_top_k_returns_400(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(self.url, {'limit': 11})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('limit', response.data)
+
+
+class CursorPaginationTests(SimpleTestCase):
+    """Cursor helpers round-trip sort keys and reject tampered values."""
+
+    def test_round_trip(self):
+        cursor = encode_cursor([4000, 'tt0111161'])
+
+        self.assertEqual(decode_cursor(cursor, 2), [4000, 'tt0111161'])
+        self.assertNotIn('=', cursor)
+
+    def test_invalid_cursor_is_rejected(self):
+        for cursor in ('not base64!', encode_cursor([1]), 'e30'):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                decode_cursor(cursor, 2)
+
+
+class MovieTopChartAPITests(APITestCase):
+    """Tests for GET /api/movies/top/ (chart reads are mocked)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.netflix, _ = Platform.objects.get_or_create(
+            platform_slug='netflix', defaults={'platform_name': 'Netflix'}
+        )
+
+    def setUp(self):
+        self.url = reverse('movie-top-chart')
+
+    def test_next_link_carries_the_cursor(self):
+        movies = [{'tconst': 'tt0111161', 'num_votes': 4000}]
+
+        with patch('movies.views.get_top_chart', return_value=(movies, (4000, 'tt0111161'))) as chart:
+            response = self.client.get(self.url, {'platform': 'netflix', 'genre': 'Drama', 'limit': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], movies)
+        chart.assert_called_once_with([self.netflix.id], genre='Drama', limit=1, after=None)
+
+        with patch('movies.views.get_top_chart', return_value=([], None)) as chart:
+            last_page = self.client.get(response.data['next'])
+
+        self.assertIsNone(last_page.data['next'])
+        chart.assert_called_once_with([self.netflix.id], genre='Drama', limit=1, after=(4000, 'tt0111161'))
+
+    def test_anonymous_request_without_platform_returns_400(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('platform', response.data)
+
+    def test_unknown_platform_returns_400(self):
+        response = self.client.get(self.url, {'platform': 'netflix,nosuchplatform'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_cursor_returns_400(self):
+        response = self.client.get(self.url, {'platform': 'netflix', 'cursor': 'garbage'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('cursor', response.data)
+
+
 class ManagementCommandsTests(APITestCase):
 
     @patch('movies.management.commands.populate_availability.WatchmodeService')
@@ -388,6 +793,23 @@ class ManagementCommandsTests(APITestCase):
         )
         mock_service_instance.list_titles.assert_called_once()
 
+    @patch('movies.management.commands.populate_availability.invalidate_movie_details')
+    @patch('movies.management.commands.populate_availability.WatchmodeService')
+    def test_populate_availability_invalidates_movie_details(self, MockWatchmodeService, invalidate):
+        Platform.objects.get_or_create(platform_slug='netflix', defaults={'platform_name': 'Netflix'})
+        Movie.objects.get_or_create(tconst='tt0111161', defaults={'primary_title': 'Test Movie'})
+        MockWatchmodeService.return_value.list_titles.return_value = {
+            'titles': [
+                {'id': 12345, 'title': 'Test Movie', 'imdb_id': 'tt0111161', 'type': 'movie'},
+                {'id': 12346, 'title': 'Unknown', 'imdb_id': 'tt9999999', 'type': 'movie'},
+            ],
+            'total_pages': 1,
+        }
+
+        call_command('populate_availability', 'netflix', stdout=StringIO())
+
+        self.assertEqual(list(invalidate.call_args.args[0]), ['tt0111161'])
+
     @unittest.skip("Temporarily disabled until MovieAvailability setup is revisited")
     @patch('movies.management.commands.update_availability_changes.WatchmodeService')
     def test_update_availability_changes_command(self, MockWatchmodeService):
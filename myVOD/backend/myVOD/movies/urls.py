@@ -1,9 +1,17 @@
 """
 URL configuration for movies app.
 """
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# MOVIE_SEARCH_ASYNC swaps in the native async view (for ASGI deployments).
+search_view = views.AsyncMovieSearchView if settings.MOVIE_SEARCH_ASYNC else views.MovieSearchView
+
 urlpatterns = [
-    path('', views.MovieSearchView.as_view(), name='movie-search'),
+    path('', search_view.as_view(), name='movie-search'),
+    path('search/batch/', views.MovieBatchSearchView.as_view(), name='movie-search-batch'),
+    path('top/', views.MovieTopChartView.as_view(), name='movie-top-chart'),
+    path('<str:tconst>/', views.MovieDetailView.as_view(), name='movie-detail'),
+    path('<str:tconst>/similar/', views.MovieSimilarView.as_view(), name='movie-similar'),
 ]
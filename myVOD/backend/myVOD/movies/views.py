@@ -4,33 +4,76 @@ Views for movies app.
 This module contains API views for movie-related endpoints.
 """
 import logging
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views import View
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.db import DatabaseError
 from drf_spectacular.utils import extend_schema, OpenApiParameter, OpenApiExample
 from drf_spectacular.types import OpenApiTypes
+from .http_cache import cached_public_json_response, cached_public_response
+from .models import Platform
+from .pagination import encode_cursor, next_page_url
 from .serializers import (
+    MovieBatchSearchRequestSerializer,
+    MovieDetailSerializer,
     MovieSearchQueryParamsSerializer,
     MovieSearchResultSerializer,
+    MovieSimilarQueryParamsSerializer,
+    MovieSimilarSerializer,
+    MovieTopChartQueryParamsSerializer,
 )
-from services.movie_search_service import search_movies  # type: ignore
+from services.movie_batch_search_service import search_movies_batch  # type: ignore
+from services.movie_detail_service import get_movie_detail  # type: ignore
+from services.movie_search_service import (  # type: ignore
+    SearchFilters,
+    asearch_movies,
+    search_movies,
+)
+from services.movie_autocomplete_service import autocomplete_movies  # type: ignore
+from services.movie_person_search_service import search_movies_by_person  # type: ignore
+from services.movie_similar_service import get_similar_movies  # type: ignore
+from services.movie_top_chart_service import get_top_chart  # type: ignore
+from services.user_movies_service import _resolve_user_uuid  # type: ignore
+from services.user_platform_cache import get_user_platform_ids  # type: ignore
 
 logger = logging.getLogger(__name__)
 
 
+def _search_filters(validated_data) -> SearchFilters | None:
+    """Build SearchFilters from validated query parameters (None when no filter is set)."""
+    filters = SearchFilters(
+        year_from=validated_data.get('year_from'),
+        year_to=validated_data.get('year_to'),
+        genres=validated_data.get('genres', ()),
+        min_rating=validated_data.get('min_rating'),
+        min_votes=validated_data.get('min_votes'),
+    )
+    return None if filters.is_empty else filters
+
+
 class MovieSearchView(APIView):
     """
     API view for searching movies.
 
     GET /api/movies/?search=<query>
+    GET /api/movies/?search=<prefix>&mode=prefix
+    GET /api/movies/?search=<name>&mode=person
 
     This is a public endpoint (no authentication required).
     Searches for movies using case-insensitive, accent-insensitive matching.
 
     Query Parameters:
         search (str, required): Search query for movie title
+        mode (str, optional): 'search' (default), 'prefix' for autocomplete or
+            'person' for movies by a director, writer or actor
+        year_from, year_to (int, optional): Release year range
+        genres (str, optional): Comma-separated genres, all must match
+        min_rating (decimal, optional): Minimum average rating
+        min_votes (int, optional): Minimum number of votes
 
     Returns:
         200: List of MovieSearchResultDto
@@ -42,6 +85,12 @@ class MovieSearchView(APIView):
         - Validates search parameter (required, min 1 character)
         - Uses PostgreSQL GIN index for efficient search
         - Returns movies ordered by similarity score
+        - mode=prefix answers short single-word prefixes from the precomputed
+          prefix table (ranked by num_votes) and falls back to search otherwise
+        - mode=person returns the filmography of the best-matching people,
+          ranked by num_votes
+        - Successful responses carry a payload-derived ETag and public
+          Cache-Control; If-None-Match with a current ETag returns 304
     """
     permission_classes = [AllowAny]
 
@@ -78,9 +127,58 @@ class MovieSearchView(APIView):
                     ),
                 ]
             ),
+            OpenApiParameter(
+                name='mode',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                enum=['search', 'prefix', 'person'],
+                description=(
+                    "'search' (default) runs fuzzy title matching; 'prefix' serves keystroke "
+                    "autocomplete from precomputed prefixes ranked by number of votes; "
+                    "'person' matches director, writer and actor names and returns their "
+                    "movies ranked by number of votes"
+                ),
+            ),
+            OpenApiParameter(
+                name='year_from',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Only movies released in or after this year',
+            ),
+            OpenApiParameter(
+                name='year_to',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Only movies released in or before this year',
+            ),
+            OpenApiParameter(
+                name='genres',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Comma-separated IMDb genres (e.g. "Drama,Sci-Fi"); movies must have all of them',
+            ),
+            OpenApiParameter(
+                name='min_rating',
+                type=OpenApiTypes.DECIMAL,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Minimum average rating (0.0-10.0)',
+            ),
+            OpenApiParameter(
+                name='min_votes',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Minimum number of votes',
+            ),
         ],
         responses={
             200: MovieSearchResultSerializer(many=True),
+            304: None,
             400: OpenApiTypes.OBJECT,
             500: OpenApiTypes.OBJECT,
         },
@@ -107,16 +205,24 @@ class MovieSearchView(APIView):
             )
 
         search_query = params_serializer.validated_data['search']
+        mode = params_serializer.validated_data['mode']
+        filters = _search_filters(params_serializer.validated_data)
 
         try:
             # Use service layer for business logic (already serialized data)
-            movies = search_movies(search_query)
+            if mode == 'prefix':
+                movies = autocomplete_movies(search_query, filters=filters)
+            elif mode == 'person':
+                movies = search_movies_by_person(search_query, filters=filters)
+            else:
+                movies = search_movies(search_query, filters=filters)
 
             logger.info(
                 f"Successfully returned {len(movies)} movies for search '{search_query}'"
             )
 
-            return Response(movies, status=status.HTTP_200_OK)
+            # Results are the same for every user: let browsers, proxies and CDNs cache them.
+            return cached_public_response(request, movies)
 
         except DatabaseError as e:
             logger.error(
@@ -137,3 +243,372 @@ class MovieSearchView(APIView):
                 {"error": "An unexpected error occurred. Please try again later."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+class AsyncMovieSearchView(View):
+    """
+    Native async variant of MovieSearchView, routed instead of it when
+    MOVIE_SEARCH_ASYNC is enabled.
+
+    GET /api/movies/?search=<query>
+
+    Same parameters, responses and caching headers as MovieSearchView. Under
+    ASGI, fresh hits in the process-local cache tier are served on the event
+    loop without occupying a thread. Shared-tier (Redis) reads and database
+    work run on a worker thread (see asearch_movies).
+    DRF's APIView cannot run async handlers, so this is a plain Django view
+    that reuses the DRF parameter serializer.
+    """
+
+    http_method_names = ['get', 'head', 'options']
+
+    async def get(self, request):
+        params_serializer = MovieSearchQueryParamsSerializer(data=request.GET)
+        if not params_serializer.is_valid():
+            logger.warning(
+                f"Invalid search parameters: {params_serializer.errors}"
+            )
+            return JsonResponse(params_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        search_query = params_serializer.validated_data['search']
+        mode = params_serializer.validated_data['mode']
+        filters = _search_filters(params_serializer.validated_data)
+
+        try:
+            if mode == 'prefix':
+                movies = await sync_to_async(autocomplete_movies)(search_query, filters=filters)
+            elif mode == 'person':
+                movies = await sync_to_async(search_movies_by_person)(search_query, filters=filters)
+            else:
+                movies = await asearch_movies(search_query, filters=filters)
+
+            logger.info(
+                f"Successfully returned {len(movies)} movies for search '{search_query}'"
+            )
+            return cached_public_json_response(request, movies)
+
+        except DatabaseError as e:
+            logger.error(
+                f"Database error during movie search for query '{search_query}': {str(e)}",
+                exc_info=True
+            )
+            return JsonResponse(
+                {"error": "An error occurred while searching for movies. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error during movie search for query '{search_query}': {str(e)}",
+                exc_info=True
+            )
+            return JsonResponse(
+                {"error": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class MovieBatchSearchView(APIView):
+    """
+    API view for resolving many movie titles in one request.
+
+    POST /api/movies/search/batch/
+
+    Body:
+        queries (list[str], required): Up to MOVIE_SEARCH_BATCH_MAX_QUERIES titles
+        limit (int, optional): Maximum results per query (default 20)
+
+    Returns:
+        200: {"results": {<query>: [MovieSearchResultDto, ...]}}
+        400: Invalid request body
+        401: Not authenticated
+        500: Internal server error
+
+    Business Logic:
+        - Requires authentication (used by import tooling and onboarding)
+        - Cached queries are answered from the search cache
+        - Remaining queries are resolved with a single SQL statement
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Search for many movies at once",
+        description=(
+            "Resolve a list of title queries in one round trip. Each query is matched exactly "
+            "like GET /api/movies/?search=<query>; results are keyed by the query string."
+        ),
+        request=MovieBatchSearchRequestSerializer,
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            500: OpenApiTypes.OBJECT,
+        },
+        examples=[
+            OpenApiExample(
+                'Batch request',
+                value={'queries': ['Inception', 'The Matrix'], 'limit': 5},
+                request_only=True,
+            ),
+        ],
+        tags=['Movies'],
+    )
+    def post(self, request):
+        """Handle POST request for batch movie search."""
+        serializer = MovieBatchSearchRequestSerializer(data=request.data)
+        if not serializer.is_valid():
+            logger.warning(f"Invalid batch search request: {serializer.errors}")
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        queries = serializer.validated_data['queries']
+        limit = serializer.validated_data['limit']
+
+        try:
+            results = search_movies_batch(queries, limit=limit)
+            logger.info(f"Successfully resolved batch search of {len(queries)} queries")
+            return Response({"results": results}, status=status.HTTP_200_OK)
+
+        except DatabaseError as e:
+            logger.error(f"Database error during batch movie search: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "An error occurred while searching for movies. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        except Exception as e:
+            logger.error(f"Unexpected error during batch movie search: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class MovieDetailView(APIView):
+    """
+    API view for a single movie.
+
+    GET /api/movies/<tconst>/
+
+    This is a public endpoint (no authentication required).
+
+    Returns:
+        200: MovieDetailDto (movie fields, genres, rating and availability on every platform)
+        304: Client copy is current (If-None-Match)
+        404: Movie not found
+        500: Internal server error
+
+    Business Logic:
+        - Served from a per-tconst cache, invalidated when the availability
+          commands update the title
+        - Responses carry a payload-derived ETag and public Cache-Control
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        summary="Get movie details",
+        description=(
+            "Return one movie with its genres, rating and availability on every tracked platform. "
+            "This is a public endpoint that does not require authentication."
+        ),
+        responses={
+            200: MovieDetailSerializer,
+            304: None,
+            404: OpenApiTypes.OBJECT,
+            500: OpenApiTypes.OBJECT,
+        },
+        tags=['Movies'],
+    )
+    def get(self, request, tconst):
+        """Handle GET request for movie details."""
+        try:
+            movie = get_movie_detail(tconst)
+        except DatabaseError as e:
+            logger.error(f"Database error while fetching movie {tconst}: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "An error occurred while fetching the movie. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        if movie is None:
+            return Response({"detail": "Movie not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return cached_public_response(request, movie)
+
+
+class MovieSimilarView(APIView):
+    """
+    API view for "more like this" recommendations.
+
+    GET /api/movies/<tconst>/similar/?limit=<n>
+
+    Returns:
+        200: List of similar movies with availability on the user's platforms
+        400: Invalid limit
+        401: Not authenticated
+        404: Movie not found
+        500: Internal server error
+
+    Business Logic:
+        - Neighbours are precomputed nightly (build_movie_neighbours), so a
+          request is a key lookup plus an availability join on the user's platforms
+        - Movies without precomputed neighbours return an empty list
+    """
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="Get similar movies",
+        description=(
+            "Return movies similar to the given one (genres, release year, rating and what other "
+            "users collect together), each with its availability on the user's platforms."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Maximum number of movies (default 20)',
+            ),
+        ],
+        responses={
+            200: MovieSimilarSerializer(many=True),
+            400: OpenApiTypes.OBJECT,
+            401: OpenApiTypes.OBJECT,
+            404: OpenApiTypes.OBJECT,
+            500: OpenApiTypes.OBJECT,
+        },
+        tags=['Movies'],
+    )
+    def get(self, request, tconst):
+        """Handle GET request for similar movies."""
+        params_serializer = MovieSimilarQueryParamsSerializer(data=request.query_params)
+        if not params_serializer.is_valid():
+            return Response(params_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            movies = get_similar_movies(
+                user=request.user,
+                tconst=tconst,
+                limit=params_serializer.validated_data['limit'],
+            )
+        except DatabaseError as e:
+            logger.error(f"Database error while fetching movies similar to {tconst}: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "An error occurred while fetching similar movies. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        if movies is None:
+            return Response({"detail": "Movie not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(MovieSimilarSerializer(movies, many=True).data, status=status.HTTP_200_OK)
+
+
+class MovieTopChartView(APIView):
+    """
+    API view for the most voted movies available on given platforms.
+
+    GET /api/movies/top/?platform=<slug,...>&genre=<genre>&limit=<n>&cursor=<cursor>
+
+    This is a public endpoint; without `platform` it requires authentication
+    and uses the user's platforms ("top on my platforms").
+
+    Returns:
+        200: {"results": [MovieSearchResultDto, ...], "next": <url or null>}
+        400: Invalid parameters, unknown platform, or no platform to chart
+        500: Internal server error
+
+    Business Logic:
+        - Served from the precomputed movie_top_chart table (top
+          MOVIE_TOP_CHART_SIZE per platform and genre, refreshed after
+          availability updates), ordered by num_votes
+        - Keyset pagination: `next` carries the last movie's sort key, so
+          every page is an index range scan
+    """
+    permission_classes = [AllowAny]
+
+    @extend_schema(
+        summary="Top movies on platforms",
+        description=(
+            "Most voted movies currently available on the given platforms, optionally in one genre. "
+            "Without `platform`, the authenticated user's platforms are used. Follow `next` for "
+            "further pages."
+        ),
+        parameters=[
+            OpenApiParameter(
+                name='platform',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Comma-separated platform slugs (e.g. "netflix,hbomax"); defaults to your platforms',
+            ),
+            OpenApiParameter(
+                name='genre',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='IMDb genre (e.g. "Drama"); all genres when omitted',
+            ),
+            OpenApiParameter(
+                name='limit',
+                type=OpenApiTypes.INT,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Page size (1-100, default 20)',
+            ),
+            OpenApiParameter(
+                name='cursor',
+                type=OpenApiTypes.STR,
+                location=OpenApiParameter.QUERY,
+                required=False,
+                description='Opaque cursor taken from the previous page\'s `next` link',
+            ),
+        ],
+        responses={
+            200: OpenApiTypes.OBJECT,
+            400: OpenApiTypes.OBJECT,
+            500: OpenApiTypes.OBJECT,
+        },
+        tags=['Movies'],
+    )
+    def get(self, request):
+        """Handle GET request for a top chart page."""
+        params_serializer = MovieTopChartQueryParamsSerializer(data=request.query_params)
+        if not params_serializer.is_valid():
+            return Response(params_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        params = params_serializer.validated_data
+
+        try:
+            if 'platform' in params:
+                platform_ids = list(
+                    Platform.objects.filter(platform_slug__in=params['platform']).values_list('id', flat=True)
+                )
+                if len(platform_ids) != len(params['platform']):
+                    return Response({"platform": ["Unknown platform."]}, status=status.HTTP_400_BAD_REQUEST)
+            elif request.user.is_authenticated:
+                platform_ids = get_user_platform_ids(_resolve_user_uuid(request.user))
+            else:
+                return Response(
+                    {"platform": ["Platform is required for anonymous requests."]},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            movies, next_key = get_top_chart(
+                platform_ids,
+                genre=params.get('genre'),
+                limit=params['limit'],
+                after=params.get('cursor'),
+            )
+
+        except DatabaseError as e:
+            logger.error(f"Database error while fetching top chart: {str(e)}", exc_info=True)
+            return Response(
+                {"error": "An error occurred while fetching top movies. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        next_cursor = encode_cursor(next_key) if next_key is not None else None
+        return Response(
+            {"results": movies, "next": next_page_url(request, next_cursor)},
+            status=status.HTTP_200_OK
+        )
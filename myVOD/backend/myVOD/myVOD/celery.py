@@ -16,6 +16,26 @@ app.conf.beat_schedule = {
         'task': 'movies.tasks.run_update_availability_changes',
         'schedule': crontab(hour=3, minute=0),  # Run daily at 3:00 AM
     },
+    'refresh-movie-prefix-index': {
+        'task': 'movies.tasks.run_refresh_movie_prefix_index',
+        'schedule': crontab(minute=15),  # Hourly incremental merge
+    },
+    'rebuild-movie-prefix-index': {
+        'task': 'movies.tasks.run_rebuild_movie_prefix_index',
+        'schedule': crontab(hour=4, minute=0),  # Nightly full rebuild
+    },
+    'build-short-query-answers': {
+        'task': 'movies.tasks.run_build_short_query_answers',
+        'schedule': crontab(hour=4, minute=30),  # Nightly, after the prefix rebuild
+    },
+    'build-movie-neighbours': {
+        'task': 'movies.tasks.run_build_movie_neighbours',
+        'schedule': crontab(hour=5, minute=0),  # Nightly "more like this" lists
+    },
+    'warm-search-cache': {
+        'task': 'movies.tasks.run_warm_search_cache',
+        'schedule': crontab(minute=30),  # Hourly: refill top queries, trim stats
+    },
 }
 
 # We need a task to call the management command
@@ -24,3 +44,35 @@ from django.core.management import call_command
 @app.task(name='movies.tasks.run_update_availability_changes')
 def run_update_availability_changes():
     call_command('update_availability_changes')
+
+
+@app.task(name='movies.tasks.run_refresh_movie_prefix_index')
+def run_refresh_movie_prefix_index():
+    call_command('build_movie_prefix_index', '--incremental')
+
+
+@app.task(name='movies.tasks.run_rebuild_movie_prefix_index')
+def run_rebuild_movie_prefix_index():
+    call_command('build_movie_prefix_index')
+
+
+@app.task(name='movies.tasks.run_build_short_query_answers')
+def run_build_short_query_answers():
+    call_command('build_short_query_answers')
+
+
+@app.task(name='movies.tasks.run_warm_search_cache')
+def run_warm_search_cache():
+    call_command('warm_search_cache', '--prune')
+
+
+@app.task(name='movies.tasks.run_build_movie_neighbours')
+def run_build_movie_neighbours():
+    call_command('build_movie_neighbours')
+
+
+@app.task(name='user_movies.tasks.run_user_movie_import')
+def run_user_movie_import(job_id, user_id, kind, rows):
+    # Queued by POST /api/user-movies/import/; progress is kept in user_movie_import_job.
+    from services.user_movie_import_service import apply_user_movie_import
+    apply_user_movie_import(job_id, user_id, kind, rows)
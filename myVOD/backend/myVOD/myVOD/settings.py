@@ -38,6 +38,94 @@ else:
     }
 
 MOVIE_SEARCH_CACHE_TIMEOUT = int(os.getenv("MOVIE_SEARCH_CACHE_TIMEOUT", "60"))
+# TTLs for empty result sets and short (1-2 character) queries, which rarely change
+MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT = int(os.getenv("MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT", "300"))
+MOVIE_SEARCH_CACHE_SHORT_TIMEOUT = int(os.getenv("MOVIE_SEARCH_CACHE_SHORT_TIMEOUT", "3600"))
+# Expired search entries stay servable this long while one request revalidates them
+MOVIE_SEARCH_CACHE_STALE_SECONDS = int(os.getenv("MOVIE_SEARCH_CACHE_STALE_SECONDS", "300"))
+# Per-process LRU in front of the shared cache (0 disables the local tier)
+MOVIE_SEARCH_LOCAL_CACHE_SIZE = int(os.getenv("MOVIE_SEARCH_LOCAL_CACHE_SIZE", "1024"))
+MOVIE_SEARCH_CACHE_LOCK_TIMEOUT = int(os.getenv("MOVIE_SEARCH_CACHE_LOCK_TIMEOUT", "10"))
+MOVIE_SEARCH_CACHE_LOCK_WAIT_MS = int(os.getenv("MOVIE_SEARCH_CACHE_LOCK_WAIT_MS", "500"))
+
+# Movie search backend: "database" (pg_trgm query) or "memory" (per-worker trigram index)
+MOVIE_SEARCH_BACKEND = os.getenv("MOVIE_SEARCH_BACKEND", "database")
+MOVIE_SEARCH_INDEX_REFRESH_SECONDS = int(os.getenv("MOVIE_SEARCH_INDEX_REFRESH_SECONDS", "300"))
+
+# Typo correction: retry searches with fewer than MIN_RESULTS hits using a per-worker
+# SymSpell dictionary of title words (capped at MAX_WORDS, refreshed with the index)
+MOVIE_SEARCH_SPELLING_CORRECTION = os.getenv("MOVIE_SEARCH_SPELLING_CORRECTION", "false").lower() == "true"
+MOVIE_SEARCH_SPELLING_MIN_RESULTS = int(os.getenv("MOVIE_SEARCH_SPELLING_MIN_RESULTS", "3"))
+MOVIE_SEARCH_SPELLING_MAX_WORDS = int(os.getenv("MOVIE_SEARCH_SPELLING_MAX_WORDS", "50000"))
+
+# Prefix autocomplete (mode=prefix): word prefixes up to this length are precomputed
+MOVIE_AUTOCOMPLETE_MAX_PREFIX_LENGTH = int(os.getenv("MOVIE_AUTOCOMPLETE_MAX_PREFIX_LENGTH", "3"))
+MOVIE_AUTOCOMPLETE_TOP_K = int(os.getenv("MOVIE_AUTOCOMPLETE_TOP_K", "20"))
+
+# Regions whose IMDb alternate titles (movie_aka) are searched; empty disables akas
+MOVIE_SEARCH_AKA_REGIONS = os.getenv("MOVIE_SEARCH_AKA_REGIONS", "PL")
+
+# mode=person: movies of at most this many best-matching people (see `load_movie_people`)
+MOVIE_SEARCH_PERSON_MATCHES = int(os.getenv("MOVIE_SEARCH_PERSON_MATCHES", "5"))
+
+# HTTP caching of GET /api/movies/ (Cache-Control: public, max-age, stale-while-revalidate)
+MOVIE_SEARCH_HTTP_MAX_AGE = int(os.getenv("MOVIE_SEARCH_HTTP_MAX_AGE", "60"))
+MOVIE_SEARCH_HTTP_STALE_WHILE_REVALIDATE = int(os.getenv("MOVIE_SEARCH_HTTP_STALE_WHILE_REVALIDATE", "300"))
+
+# GET /api/movies/<tconst>/ payloads are cached this long; availability commands invalidate them
+MOVIE_DETAIL_CACHE_TIMEOUT = int(os.getenv("MOVIE_DETAIL_CACHE_TIMEOUT", "3600"))
+
+# "More like this" neighbours (built nightly by `build_movie_neighbours`)
+MOVIE_NEIGHBOURS_TOP_K = int(os.getenv("MOVIE_NEIGHBOURS_TOP_K", "20"))
+MOVIE_NEIGHBOURS_MIN_VOTES = int(os.getenv("MOVIE_NEIGHBOURS_MIN_VOTES", "1000"))
+MOVIE_NEIGHBOURS_MAX_COOCCURRENCE_ITEMS = int(os.getenv("MOVIE_NEIGHBOURS_MAX_COOCCURRENCE_ITEMS", "4000"))
+
+# Movies kept per (platform, genre) chart in movie_top_chart (GET /api/movies/top/)
+MOVIE_TOP_CHART_SIZE = int(os.getenv("MOVIE_TOP_CHART_SIZE", "500"))
+
+# Per-user platform sets: shared cache TTL, and how long a process trusts its local copy
+# before re-checking the version key (PATCH /api/me/ invalidates both tiers)
+USER_PLATFORM_CACHE_TIMEOUT = int(os.getenv("USER_PLATFORM_CACHE_TIMEOUT", "3600"))
+USER_PLATFORM_LOCAL_CACHE_SECONDS = int(os.getenv("USER_PLATFORM_LOCAL_CACHE_SECONDS", "5"))
+USER_PLATFORM_LOCAL_CACHE_SIZE = int(os.getenv("USER_PLATFORM_LOCAL_CACHE_SIZE", "10000"))
+# The shared tier needs a cache every process sees (Redis via CACHE_URL). With the
+# per-process LocMem fallback an invalidation would reach only one process, so
+# only the local tier is used and it is never trusted longer than
+# USER_PLATFORM_LOCAL_CACHE_SECONDS.
+USER_PLATFORM_SHARED_CACHE = os.getenv(
+    "USER_PLATFORM_SHARED_CACHE", "true" if DEFAULT_CACHE_URL else "false"
+).lower() == "true"
+
+# Maximum number of operations accepted by POST /api/user-movies/bulk/
+USER_MOVIES_BULK_MAX_OPERATIONS = int(os.getenv("USER_MOVIES_BULK_MAX_OPERATIONS", "500"))
+
+# IMDb CSV imports (POST /api/user-movies/import/): upload limits, rows per upsert
+# and how long a finished job's status row is kept
+USER_MOVIE_IMPORT_MAX_BYTES = int(os.getenv("USER_MOVIE_IMPORT_MAX_BYTES", str(10 * 1024 * 1024)))
+USER_MOVIE_IMPORT_MAX_ROWS = int(os.getenv("USER_MOVIE_IMPORT_MAX_ROWS", "20000"))
+USER_MOVIE_IMPORT_BATCH_SIZE = int(os.getenv("USER_MOVIE_IMPORT_BATCH_SIZE", "1000"))
+USER_MOVIE_IMPORT_STATUS_TIMEOUT = int(os.getenv("USER_MOVIE_IMPORT_STATUS_TIMEOUT", "86400"))
+
+# Maximum number of queries accepted by POST /api/movies/search/batch/
+MOVIE_SEARCH_BATCH_MAX_QUERIES = int(os.getenv("MOVIE_SEARCH_BATCH_MAX_QUERIES", "50"))
+
+# Query-frequency stats (count-min sketch per process, flushed to movie_search_query_stat)
+# feeding `warm_search_cache`; TOP_K bounds the keys kept per flush window
+MOVIE_SEARCH_QUERY_STATS = os.getenv("MOVIE_SEARCH_QUERY_STATS", "true").lower() == "true"
+MOVIE_SEARCH_QUERY_STATS_FLUSH_SECONDS = int(os.getenv("MOVIE_SEARCH_QUERY_STATS_FLUSH_SECONDS", "60"))
+MOVIE_SEARCH_QUERY_STATS_TOP_K = int(os.getenv("MOVIE_SEARCH_QUERY_STATS_TOP_K", "200"))
+MOVIE_SEARCH_QUERY_STATS_MAX_ROWS = int(os.getenv("MOVIE_SEARCH_QUERY_STATS_MAX_ROWS", "10000"))
+MOVIE_SEARCH_WARM_TOP_N = int(os.getenv("MOVIE_SEARCH_WARM_TOP_N", "200"))
+
+# Precomputed answers for 1-2 character queries (built by `build_short_query_answers`)
+MOVIE_SEARCH_SHORT_QUERY_ANSWERS = os.getenv("MOVIE_SEARCH_SHORT_QUERY_ANSWERS", "true").lower() == "true"
+MOVIE_SEARCH_SHORT_QUERY_MAX_RESULTS = int(os.getenv("MOVIE_SEARCH_SHORT_QUERY_MAX_RESULTS", "50"))
+
+# Route GET /api/movies/ to the native async view (serve with an ASGI server, see myVOD/asgi.py)
+MOVIE_SEARCH_ASYNC = os.getenv("MOVIE_SEARCH_ASYNC", "false").lower() == "true"
+
+# Bearer token required by /metrics; leave unset to expose metrics without auth
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
 
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 from datetime import datetime, time
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.test import APIClient, APITestCase
@@ -21,6 +22,7 @@ from movies.models import (
     UserPlatform,
     MovieAvailability
 )
+from services.user_platform_cache import user_platform_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -45,6 +47,9 @@ class AISuggestionsGetAPITests(APITestCase):
         """Set up test data for each test."""
         # Clean up first to ensure clean state
         self.test_user_id = uuid.UUID(os.getenv("TEST_USER", str(uuid.uuid4())))
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
 
         # Clean up any leftover data from previous tests
         AiSuggestionBatch.objects.filter(user_id=self.test_user_id).delete()
@@ -0,0 +1,37 @@
+"""
+Tests for the Prometheus metrics endpoint.
+
+Tests GET /metrics, including the optional METRICS_TOKEN bearer check.
+"""
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+
+from services.search_metrics import search_metrics
+
+
+class MetricsEndpointTests(SimpleTestCase):
+    def setUp(self):
+        search_metrics.reset()
+        self.addCleanup(search_metrics.reset)
+        self.url = reverse('metrics')
+
+    @override_settings(METRICS_TOKEN=None)
+    def test_metrics_exposed_without_token(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        self.assertIn(b'# TYPE movie_search_duration_milliseconds histogram', response.content)
+
+    @override_settings(METRICS_TOKEN='secret')
+    def test_token_required_when_configured(self):
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        self.assertEqual(
+            self.client.get(self.url, HTTP_AUTHORIZATION='Bearer wrong').status_code, 401
+        )
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, 200)
+
+    def test_post_not_allowed(self):
+        self.assertEqual(self.client.post(self.url).status_code, 405)
@@ -8,12 +8,14 @@ import uuid
 from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import DatabaseError
 from django.urls import reverse
 from rest_framework.test import APIClient, APITestCase
 from rest_framework import status
 
 from movies.models import Platform, UserPlatform
+from services.user_platform_cache import user_platform_cache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -43,6 +45,9 @@ class UserProfileGetAPITests(APITestCase):
         # Clean up first
         self.test_user_id = uuid.UUID(os.getenv("TEST_USER", str(uuid.uuid4())))
         self.test_user2_id = uuid.UUID(os.getenv("TEST_USER_2", str(uuid.uuid4())))
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
 
         # Clean up any leftover data
         UserPlatform.objects.filter(user_id=self.test_user_id).delete()
@@ -256,6 +261,9 @@ class UserProfilePatchAPITests(APITestCase):
         """
         # Clean up first
         self.test_user_id = uuid.UUID(os.getenv("TEST_USER", str(uuid.uuid4())))
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
         UserPlatform.objects.filter(user_id=self.test_user_id).delete()
 
         # Get or create test user
@@ -40,6 +40,9 @@ urlpatterns = [
     path("api/docs/", SpectacularSwaggerView.as_view(url_name="schema"), name="swagger-ui"),
     path("api/redoc/", SpectacularRedocView.as_view(url_name="schema"), name="redoc"),
 
+    # Prometheus metrics (optionally protected by METRICS_TOKEN)
+    path("metrics", views.metrics, name="metrics"),
+
     # JWT Authentication (uses email instead of username)
     path("api/token/", views.EmailTokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
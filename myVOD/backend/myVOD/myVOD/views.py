@@ -2,8 +2,12 @@
 Views for myVOD project root.
 """
 
+import hmac
 import logging
+from django.conf import settings
+from django.http import HttpResponse
 from django.shortcuts import redirect
+from django.views.decorators.http import require_GET
 from django.db import DatabaseError, IntegrityError
 from rest_framework import status
 from rest_framework.views import APIView
@@ -34,6 +38,7 @@ from services.ai_suggestions_service import (
     InsufficientDataError,
     RateLimitError
 )
+from services.search_metrics import PROMETHEUS_CONTENT_TYPE, search_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +53,28 @@ def root_redirect(request):
     return redirect('swagger-ui')
 
 
+@require_GET
+def metrics(request):
+    """
+    Expose in-process search metrics in Prometheus text format.
+
+    GET /metrics
+
+    When METRICS_TOKEN is configured the scraper must send
+    `Authorization: Bearer <token>`; otherwise the endpoint is open.
+    """
+    token = getattr(settings, 'METRICS_TOKEN', None)
+    if token:
+        supplied = request.headers.get('Authorization', '')
+        if not hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode()):
+            return HttpResponse(status=401)
+
+    return HttpResponse(
+        search_metrics.render_prometheus(),
+        content_type=PROMETHEUS_CONTENT_TYPE,
+    )
+
+
 class EmailTokenObtainPairView(TokenObtainPairView):
     """
     Custom JWT token obtain view that uses email instead of username.
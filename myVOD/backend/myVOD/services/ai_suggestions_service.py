@@ -10,17 +10,19 @@ import json
 import re
 from datetime import datetime, time
 from django.db import DatabaseError, transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from django.utils import timezone
 from django.conf import settings
 from movies.models import (
     AiSuggestionBatch,
     UserMovie,
     MovieAvailability,
-    UserPlatform,
     IntegrationErrorLog,
-    Movie
+    Movie,
+    Platform
 )
+from services.availability_mask_service import filter_available  # type: ignore
+from services.user_platform_cache import get_user_platform_ids  # type: ignore
 from collections import Counter
 
 try:
@@ -142,8 +144,7 @@ def get_or_generate_suggestions(user, debug=False):
             )
 
         # Validate user has VOD platforms configured
-        user_platforms_count = UserPlatform.objects.filter(user_id=user.id).count()
-        if user_platforms_count == 0:
+        if not get_user_platform_ids(user.id):
             logger.warning(
                 f"User {user.email} has no VOD platforms configured"
             )
@@ -184,10 +185,7 @@ def _format_cached_suggestions(user, cached_batch):
     suggestions = cached_batch.response or []
 
     # Get user's selected platform IDs
-    user_platform_ids = list(
-        UserPlatform.objects.filter(user_id=user.id)
-        .values_list('platform_id', flat=True)
-    )
+    user_platform_ids = get_user_platform_ids(user.id)
     suggestion_tconsts = [s.get('tconst') for s in suggestions if s.get('tconst')]
 
     # Enrich suggestions with availability data in a single query
@@ -247,9 +245,11 @@ def _generate_new_suggestions(user, expires_at):
             )[:50]  # Limit for API call
 
             # Get user's platforms
-            user_platform_qs = UserPlatform.objects.filter(user_id=user.id).select_related('platform')
-            user_platform_ids = list(user_platform_qs.values_list('platform_id', flat=True))
-            user_platform_names = [up.platform.platform_name for up in user_platform_qs]
+            user_platform_ids = get_user_platform_ids(user.id)
+            user_platform_names = list(
+                Platform.objects.filter(id__in=user_platform_ids).order_by('id')
+                .values_list('platform_name', flat=True)
+            )
 
             # Generate AI suggestions with error handling
             try:
@@ -335,7 +335,7 @@ def _generate_mock_suggestions(user, user_movies, user_platform_ids, user_platfo
     return None
 
 
-def _analyze_user_preferences(user_movies, user_platforms):
+def _analyze_user_preferences(user_movies, user_platform_ids):
     """
     Analyze user's movie preferences for diversity.
     
@@ -344,7 +344,7 @@ def _analyze_user_preferences(user_movies, user_platforms):
     
     Args:
         user_movies: List of user movie dicts
-        user_platforms: List of UserPlatform instances
+        user_platform_ids: List of user's platform IDs
     
     Returns:
         dict: {'top_genres': list[str], 'platform_distribution': dict[int, int]}
@@ -360,7 +360,7 @@ def _analyze_user_preferences(user_movies, user_platforms):
     genre_counts = Counter(all_genres)
     top_genres = [genre for genre, _ in genre_counts.most_common(3)]
     
-    num_platforms = len(user_platforms)
+    num_platforms = len(user_platform_ids)
     if num_platforms == 0:
         platform_dist = {}
     else:
@@ -368,9 +368,9 @@ def _analyze_user_preferences(user_movies, user_platforms):
         base = 5 // num_platforms
         extra = 5 % num_platforms
         platform_dist = {}
-        for i, up in enumerate(user_platforms):
+        for i, platform_id in enumerate(user_platform_ids):
             count = base + (1 if i < extra else 0)
-            platform_dist[up.platform_id] = min(count, 2)  # Max 2 per platform
+            platform_dist[platform_id] = min(count, 2)  # Max 2 per platform
     
     logger.info(f"User preferences: Top genres {top_genres}, Platform dist {platform_dist}")
     
@@ -442,12 +442,8 @@ def _generate_ai_suggestions(user, user_movies, user_platform_ids, user_platform
             )
             return []
 
-        # Get user's platforms for analysis
-        user_platform_qs = UserPlatform.objects.filter(user_id=user.id).select_related('platform')
-        user_platforms = list(user_platform_qs)
-
         # Analyze preferences for diversity
-        preferences = _analyze_user_preferences(user_movies, user_platforms)
+        preferences = _analyze_user_preferences(user_movies, user_platform_ids)
 
         # Build prompt with user data, available movies, and preferences
         prompt = _build_gemini_prompt(
@@ -529,43 +525,40 @@ def _get_available_movies_for_platforms(user_platform_ids, user_movies):
 
     logger.info(f"Excluding {len(watched_tconsts)} watched movies for platforms: {user_platform_ids}")
 
-    # Query movies available on user's platforms
-    available_movies = MovieAvailability.objects.filter(
-        platform_id__in=user_platform_ids,
-        is_available=True
-    ).exclude(
-        tconst__in=watched_tconsts
-    ).select_related(
-        'tconst', 'platform'
+    # Query movies available on user's platforms: one bitwise AND against the
+    # denormalized availability mask instead of a movie_availability join
+    platform_names = dict(
+        Platform.objects.filter(id__in=user_platform_ids).values_list('id', 'platform_name')
+    )
+    available_movies = filter_available(
+        Movie.objects.exclude(tconst__in=watched_tconsts), user_platform_ids
     ).values(
-        'tconst__tconst',
-        'tconst__primary_title',
-        'tconst__start_year',
-        'tconst__genres',
-        'tconst__avg_rating',
-        'tconst__num_votes',
-        'platform__platform_name'
+        'tconst',
+        'primary_title',
+        'start_year',
+        'genres',
+        'avg_rating',
+        'available_platforms',
     ).order_by(
-        '-tconst__num_votes',  # Prioritize popular movies
-        '-tconst__avg_rating'
+        F('num_votes').desc(nulls_last=True),  # Prioritize popular movies
+        '-avg_rating'
     )[:100]  # Limit to top 100 to keep prompt size reasonable
 
     logger.info(f"Query returned {len(available_movies)} available movies")
 
-    # Group by tconst and aggregate platform names
     movies_dict = {}
     for item in available_movies:
-        tconst = item['tconst__tconst']
-        if tconst not in movies_dict:
-            movies_dict[tconst] = {
-                'tconst': tconst,
-                'title': item['tconst__primary_title'],
-                'year': item['tconst__start_year'],
-                'genres': item['tconst__genres'] or [],
-                'rating': item['tconst__avg_rating'],
-                'platforms': []
-            }
-        movies_dict[tconst]['platforms'].append(item['platform__platform_name'])
+        movies_dict[item['tconst']] = {
+            'tconst': item['tconst'],
+            'title': item['primary_title'],
+            'year': item['start_year'],
+            'genres': item['genres'] or [],
+            'rating': item['avg_rating'],
+            'platforms': [
+                name for platform_id, name in sorted(platform_names.items())
+                if item['available_platforms'] & (1 << platform_id)
+            ]
+        }
 
     result = list(movies_dict.values())
     if result:
@@ -0,0 +1,107 @@
+"""Denormalized per-movie availability bitmasks.
+
+``movie.available_platforms`` has bit ``platform_id`` set when the movie is
+available on that platform, and ``movie.unavailable_platforms`` when it was
+checked and found unavailable there. Filtering on a user's platforms then needs
+no ``movie_availability`` lookup, just a bitwise AND with their platform mask
+(``platform_mask``). The masks are recomputed from ``movie_availability`` by the
+availability commands for the titles they touch (``refresh_availability_masks``).
+
+Masks are ``bigint``; bit 63 is the sign bit, so platform ids 0-62 fit.
+"""
+
+import logging
+from typing import Iterable, List
+
+from django.db import connection
+from django.db.models import F, QuerySet
+
+logger = logging.getLogger(__name__)
+
+MAX_MASK_PLATFORM_ID = 62
+
+# Movies without any movie_availability row get zero masks via the LEFT JOIN.
+REFRESH_MASKS_SQL = """
+UPDATE movie m
+SET available_platforms = coalesce(a.available, 0),
+    unavailable_platforms = coalesce(a.unavailable, 0)
+FROM movie t
+LEFT JOIN (
+    SELECT tconst,
+           bit_or(1::bigint << platform_id) FILTER (WHERE is_available) AS available,
+           bit_or(1::bigint << platform_id) FILTER (WHERE NOT is_available) AS unavailable
+    FROM movie_availability
+    WHERE platform_id <= {max_id} {tconst_filter}
+    GROUP BY tconst
+) a ON a.tconst = t.tconst
+WHERE m.tconst = t.tconst {movie_filter}
+  AND (m.available_platforms, m.unavailable_platforms)
+      IS DISTINCT FROM (coalesce(a.available, 0), coalesce(a.unavailable, 0));
+"""
+
+
+def platform_mask(platform_ids: Iterable[int]) -> int:
+    """Bitmask with one bit per platform id."""
+
+    mask = 0
+    for platform_id in platform_ids:
+        if 0 <= platform_id <= MAX_MASK_PLATFORM_ID:
+            mask |= 1 << platform_id
+        else:
+            logger.warning("Platform id %s does not fit the availability mask", platform_id)
+    return mask
+
+
+def filter_available(queryset: QuerySet, platform_ids: Iterable[int], prefix: str = "") -> QuerySet:
+    """Movies available on at least one of `platform_ids`.
+
+    `prefix` is the lookup path to the movie, e.g. ``"tconst__"`` for user_movie.
+    """
+
+    mask = platform_mask(platform_ids)
+    # The redundant `available_platforms <> 0` lets the planner use the partial
+    # index movie_available_platforms_num_votes_idx; it cannot infer that
+    # predicate from the bitwise AND.
+    return queryset.alias(
+        available_on_platforms=F(f"{prefix}available_platforms").bitand(mask)
+    ).filter(available_on_platforms__gt=0).exclude(**{f"{prefix}available_platforms": 0})
+
+
+def filter_unavailable(queryset: QuerySet, platform_ids: Iterable[int], prefix: str = "") -> QuerySet:
+    """Movies checked as unavailable on one of `platform_ids` and available on none."""
+
+    mask = platform_mask(platform_ids)
+    return queryset.alias(
+        available_on_platforms=F(f"{prefix}available_platforms").bitand(mask),
+        unavailable_on_platforms=F(f"{prefix}unavailable_platforms").bitand(mask),
+    ).filter(available_on_platforms=0, unavailable_on_platforms__gt=0)
+
+
+def refresh_availability_masks(tconsts: Iterable[str] | None = None) -> int:
+    """Recompute the masks of `tconsts` (all movies when None); returns rows changed."""
+
+    params: List = []
+    tconst_filter = movie_filter = ""
+    if tconsts is not None:
+        tconsts = sorted(set(tconsts))
+        if not tconsts:
+            return 0
+        tconst_filter = "AND tconst = ANY(%s)"
+        movie_filter = "AND t.tconst = ANY(%s)"
+        params = [tconsts, tconsts]
+
+    sql = REFRESH_MASKS_SQL.format(
+        max_id=MAX_MASK_PLATFORM_ID, tconst_filter=tconst_filter, movie_filter=movie_filter
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        updated = max(cursor.rowcount, 0)
+
+    logger.info(
+        "Refreshed availability masks",
+        extra={"availability_masks": {
+            "movies": None if tconsts is None else len(tconsts),
+            "updated": updated,
+        }},
+    )
+    return updated
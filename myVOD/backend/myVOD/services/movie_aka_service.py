@@ -0,0 +1,97 @@
+"""Service layer for loading IMDb alternate titles (title.akas.tsv).
+
+Only the regions configured for search are kept, and an alternate title is
+stored only when it differs from the movie's normalized primary title, so
+the table stays small enough to trigram-index cheaply.
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+_NULL = "\\N"
+
+# Rows for unknown movies and titles equal to the primary title are dropped in SQL.
+INSERT_AKAS_SQL = """
+INSERT INTO movie_aka (tconst, region, title)
+SELECT v.tconst, v.region, v.title
+FROM unnest(%s::text[], %s::text[], %s::text[]) AS v(tconst, region, title)
+JOIN movie m ON m.tconst = v.tconst
+WHERE immutable_unaccent(lower(v.title)) <> m.primary_title_normalized
+ON CONFLICT (tconst, region, title) DO NOTHING;
+"""
+
+
+def configured_aka_regions() -> Tuple[str, ...]:
+    """Regions whose alternate titles are loaded and searched (MOVIE_SEARCH_AKA_REGIONS)."""
+
+    raw = getattr(settings, "MOVIE_SEARCH_AKA_REGIONS", "PL")
+    return tuple(region.strip().upper() for region in raw.split(",") if region.strip())
+
+
+def iter_aka_rows(lines: Iterable[str], regions: Sequence[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (tconst, region, title) for akas in the given regions, deduplicated per movie."""
+
+    wanted = set(regions)
+    seen = set()
+    reader = csv.DictReader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    for row in reader:
+        region = row.get("region")
+        title = row.get("title")
+        if region not in wanted or not title or title == _NULL:
+            continue
+        key = (row["titleId"], region, title)
+        if key in seen:
+            continue
+        seen.add(key)
+        yield key
+
+
+def _insert_batch(batch: List[Tuple[str, str, str]]) -> int:
+    tconsts, regions, titles = (list(column) for column in zip(*batch))
+    with connection.cursor() as cursor:
+        cursor.execute(INSERT_AKAS_SQL, [tconsts, regions, titles])
+        return max(cursor.rowcount, 0)
+
+
+def load_akas(path: Path, regions: Sequence[str], batch_size: int = 5000, replace: bool = False) -> Dict[str, int]:
+    """
+    Load alternate titles for `regions` from a title.akas.tsv file.
+
+    Args:
+        path: Path to the (optionally trimmed) IMDb title.akas.tsv
+        regions: Region codes to keep, e.g. ("PL",)
+        batch_size: Rows per INSERT statement
+        replace: Delete existing rows for `regions` first
+
+    Returns:
+        dict: {"read": rows matching the regions, "inserted": new rows}
+    """
+    read = inserted = 0
+    with transaction.atomic():
+        if replace:
+            with connection.cursor() as cursor:
+                cursor.execute("DELETE FROM movie_aka WHERE region = ANY(%s);", [list(regions)])
+
+        with open(path, "r", encoding="utf-8", newline="") as handle:
+            batch: List[Tuple[str, str, str]] = []
+            for row in iter_aka_rows(handle, regions):
+                batch.append(row)
+                read += 1
+                if len(batch) >= batch_size:
+                    inserted += _insert_batch(batch)
+                    batch = []
+            if batch:
+                inserted += _insert_batch(batch)
+
+    logger.info(
+        "Loaded movie akas",
+        extra={"movie_aka_load": {"regions": list(regions), "read": read, "inserted": inserted}},
+    )
+    return {"read": read, "inserted": inserted}
@@ -0,0 +1,231 @@
+"""Service layer for prefix autocomplete backed by the `movie_title_prefix` table.
+
+Every word of a normalized title contributes its 1..N character prefixes. For
+each prefix the table stores the top-K titles ranked by ``num_votes``, so a
+keystroke with a short prefix is a single primary-key lookup (and usually a
+local cache hit) instead of a fuzzy similarity query.
+"""
+
+import logging
+import re
+import time
+from typing import Dict, Iterable, List, Set
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+
+from movies.models import Movie, MovieTitlePrefix  # type: ignore
+from services.movie_search_service import (  # type: ignore
+    SEARCH_RESULT_FIELDS,
+    SearchFilters,
+    _normalize_search_query,
+    _project_search_row,
+    search_movies,
+)
+from services.search_cache import search_cache  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+_BULK_BATCH_SIZE = 1000
+
+
+def _max_prefix_length() -> int:
+    return getattr(settings, "MOVIE_AUTOCOMPLETE_MAX_PREFIX_LENGTH", 3)
+
+
+def _top_k() -> int:
+    return getattr(settings, "MOVIE_AUTOCOMPLETE_TOP_K", 20)
+
+
+def _build_prefix_cache_key(prefix: str) -> str:
+    return f"movie_prefix:{prefix}"
+
+
+def extract_title_prefixes(normalized_title: str, max_length: int) -> Set[str]:
+    """Return the 1..max_length character prefixes of every word in a normalized title."""
+
+    prefixes: Set[str] = set()
+    for word in _WORD_PATTERN.findall(normalized_title):
+        for length in range(1, min(len(word), max_length) + 1):
+            prefixes.add(word[:length])
+    return prefixes
+
+
+def _ranking_key(entry: dict) -> tuple:
+    """``num_votes DESC NULLS LAST`` with tconst as a deterministic tie-breaker."""
+
+    num_votes = entry["num_votes"]
+    return (num_votes is None, -(num_votes or 0), entry["tconst"])
+
+
+def build_prefix_entries(rows: Iterable[dict], max_length: int, top_k: int) -> Dict[str, List[dict]]:
+    """Group search result rows by title prefix, keeping the top-K per prefix.
+
+    Rows must already be ordered by the ranking (``num_votes`` descending).
+    """
+
+    entries: Dict[str, List[dict]] = {}
+    for row in rows:
+        result = _project_search_row(row)
+        for prefix in extract_title_prefixes(_normalize_search_query(row["primary_title"] or ""), max_length):
+            bucket = entries.setdefault(prefix, [])
+            if len(bucket) < top_k:
+                bucket.append(result)
+    return entries
+
+
+def _ranked_movie_rows(queryset=None):
+    queryset = queryset if queryset is not None else Movie.objects.all()
+    return queryset.values(*SEARCH_RESULT_FIELDS).order_by(
+        F("num_votes").desc(nulls_last=True), "tconst"
+    )
+
+
+def rebuild_prefix_table() -> int:
+    """Recompute the whole prefix table; returns the number of prefixes written."""
+
+    entries = build_prefix_entries(
+        _ranked_movie_rows().iterator(chunk_size=5000), _max_prefix_length(), _top_k()
+    )
+    now = timezone.now()
+    with transaction.atomic():
+        MovieTitlePrefix.objects.all().delete()
+        MovieTitlePrefix.objects.bulk_create(
+            [
+                MovieTitlePrefix(
+                    prefix=prefix,
+                    tconsts=[entry["tconst"] for entry in bucket],
+                    payload=bucket,
+                    updated_at=now,
+                )
+                for prefix, bucket in entries.items()
+            ],
+            batch_size=_BULK_BATCH_SIZE,
+        )
+    logger.info("Rebuilt movie title prefix table with %s prefixes", len(entries))
+    return len(entries)
+
+
+def refresh_prefix_table(since=None) -> int:
+    """Merge titles changed since ``since`` into the prefix table.
+
+    Defaults to the last time the table was written. Rows listing a changed
+    title are re-ranked with its new data; a title that drops out of a full
+    top-K is not backfilled until the next full rebuild.
+    """
+
+    if since is None:
+        since = MovieTitlePrefix.objects.aggregate(last=Max("updated_at"))["last"]
+        if since is None:
+            return rebuild_prefix_table()
+
+    max_length = _max_prefix_length()
+    top_k = _top_k()
+    changed_rows = list(_ranked_movie_rows(Movie.objects.filter(updated_at__gte=since)))
+    if not changed_rows:
+        return 0
+
+    changed_entries = build_prefix_entries(changed_rows, max_length, top_k)
+    changed_tconsts = [row["tconst"] for row in changed_rows]
+    now = timezone.now()
+
+    with transaction.atomic():
+        existing = {
+            row.prefix: row
+            for row in MovieTitlePrefix.objects.select_for_update().filter(
+                Q(prefix__in=list(changed_entries)) | Q(tconsts__overlap=changed_tconsts)
+            )
+        }
+        changed_set = set(changed_tconsts)
+        to_update, to_create = [], []
+        for prefix in set(existing) | set(changed_entries):
+            row = existing.get(prefix)
+            bucket = [entry for entry in (row.payload if row else []) if entry["tconst"] not in changed_set]
+            bucket.extend(changed_entries.get(prefix, []))
+            bucket = sorted(bucket, key=_ranking_key)[:top_k]
+            if row is None:
+                to_create.append(MovieTitlePrefix(
+                    prefix=prefix,
+                    tconsts=[entry["tconst"] for entry in bucket],
+                    payload=bucket,
+                    updated_at=now,
+                ))
+            else:
+                row.payload = bucket
+                row.tconsts = [entry["tconst"] for entry in bucket]
+                row.updated_at = now
+                to_update.append(row)
+
+        MovieTitlePrefix.objects.bulk_create(to_create, batch_size=_BULK_BATCH_SIZE)
+        MovieTitlePrefix.objects.bulk_update(
+            to_update, ["payload", "tconsts", "updated_at"], batch_size=_BULK_BATCH_SIZE
+        )
+
+    logger.info(
+        "Refreshed movie title prefix table: %s changed titles, %s prefixes updated, %s created",
+        len(changed_rows),
+        len(to_update),
+        len(to_create),
+    )
+    return len(to_update) + len(to_create)
+
+
+def autocomplete_movies(query: str, limit: int = 20, filters: SearchFilters | None = None) -> List[dict]:
+    """
+    Return autocomplete suggestions for a (usually short) typed prefix.
+
+    Single-word prefixes up to MOVIE_AUTOCOMPLETE_MAX_PREFIX_LENGTH characters
+    are answered from the precomputed prefix table; anything longer or
+    multi-word falls back to the fuzzy search in `search_movies`, as does any
+    request with filters (the prefix table is not filter-aware).
+
+    Args:
+        query: Raw text typed by the user
+        limit: Maximum number of results to return (default: 20)
+        filters: Optional structured filters (see SearchFilters)
+
+    Returns:
+        list[dict]: Results in the MovieSearchResultSerializer shape, ranked by num_votes.
+    """
+    if not query or not query.strip():
+        return []
+
+    normalized = _normalize_search_query(query.strip())
+    words = _WORD_PATTERN.findall(normalized)
+    if (
+        len(words) != 1
+        or len(words[0]) > _max_prefix_length()
+        or limit > _top_k()
+        or (filters is not None and not filters.is_empty)
+    ):
+        return search_movies(query, limit=limit, filters=filters)
+
+    prefix = words[0]
+    cache_key = _build_prefix_cache_key(prefix)
+    start = time.perf_counter()
+    lookup = search_cache.get(cache_key)
+    if lookup.is_fresh:
+        payload = lookup.payload or []
+        cache_status = "hit"
+    else:
+        payload = (
+            MovieTitlePrefix.objects.filter(prefix=prefix).values_list("payload", flat=True).first()
+            or []
+        )
+        search_cache.set(cache_key, payload, getattr(settings, "MOVIE_SEARCH_CACHE_TIMEOUT", 60))
+        cache_status = "miss"
+
+    logger.info(
+        "Movie autocomplete served from prefix table",
+        extra={"movie_autocomplete": {
+            "prefix": prefix,
+            "cache_status": cache_status,
+            "result_count": min(len(payload), limit),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        }},
+    )
+    return payload[:limit]
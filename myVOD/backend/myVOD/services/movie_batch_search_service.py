@@ -0,0 +1,228 @@
+"""Service layer for resolving many movie title searches in one request.
+
+Queries already in the search cache are answered from it. Misses take the
+same steps `search_movies` takes before the database: precomputed short-query
+answers first, then the in-memory index when it is enabled. The remaining
+queries are resolved together by a single SQL statement that unnests the
+query list and runs the ranked trigram search for each entry in a ``LATERAL``
+subquery. Results are written back under the same cache keys `search_movies`
+uses, so single searches and batches share entries. A batched query that
+would have triggered spelling correction is re-run through `search_movies`
+instead, so a cache entry never depends on which endpoint filled it.
+"""
+
+import logging
+import time
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.db import connection
+
+from services.movie_search_service import (  # type: ignore
+    PG_TRGM_DEFAULT_THRESHOLD,
+    _build_cache_key,
+    _calculate_similarity_threshold,
+    _normalize_search_query,
+    _project_search_row,
+    _searchable_aka_regions,
+    _store_results_in_cache,
+    search_movies,
+)
+from services.movie_search_index import is_in_memory_search_enabled  # type: ignore
+from services.movie_short_query_answers import lookup_short_query_answer  # type: ignore
+from services.movie_spelling_index import is_spelling_correction_enabled  # type: ignore
+from services.search_cache import search_cache  # type: ignore
+from services.search_capabilities import (  # type: ignore
+    STRATEGY_ACCENT_INSENSITIVE,
+    get_search_capabilities,
+)
+
+logger = logging.getLogger(__name__)
+
+_PRIMARY_SIMILARITY = "similarity(m.primary_title_normalized, q.query)"
+
+# Best alternate-title similarity within the searched regions (cf. _aka_best_similarity).
+_AKA_SIMILARITY = (
+    "GREATEST(similarity(m.primary_title_normalized, q.query), COALESCE(("
+    "SELECT max(similarity(a.title_normalized, q.query)) FROM movie_aka a "
+    "WHERE a.tconst = m.tconst AND a.region = ANY(%s)), 0))"
+)
+
+_PRIMARY_MATCH = "{prefilter}similarity(m.primary_title_normalized, q.query) > q.threshold"
+
+# Candidates as a UNION of two index-driven sets (cf. _build_search_queryset):
+# an OR between the primary match and an aka subquery cannot use the GIN indexes.
+_AKA_MATCH = (
+    "m.tconst IN ("
+    "SELECT p.tconst FROM movie p "
+    "WHERE {primary_prefilter}similarity(p.primary_title_normalized, q.query) > q.threshold "
+    "UNION "
+    "SELECT a.tconst FROM movie_aka a WHERE a.region = ANY(%s) "
+    "AND {aka_prefilter}similarity(a.title_normalized, q.query) > q.threshold)"
+)
+
+_LATERAL_SEARCH_SQL = """
+    SELECT m.tconst, m.primary_title, m.start_year, m.avg_rating, m.poster_path, m.num_votes,
+           {similarity} AS sim
+    FROM movie m
+    WHERE {match}
+    ORDER BY sim DESC, m.num_votes DESC NULLS LAST, m.avg_rating DESC, m.start_year DESC
+    LIMIT %s
+"""
+
+
+def _lateral_sql(indexed: bool, with_akas: bool) -> str:
+    if with_akas:
+        match = _AKA_MATCH.format(
+            primary_prefilter="p.primary_title_normalized %% q.query AND " if indexed else "",
+            aka_prefilter="a.title_normalized %% q.query AND " if indexed else "",
+        )
+    else:
+        match = _PRIMARY_MATCH.format(
+            prefilter="m.primary_title_normalized %% q.query AND " if indexed else "",
+        )
+    return _LATERAL_SEARCH_SQL.format(
+        similarity=_AKA_SIMILARITY if with_akas else _PRIMARY_SIMILARITY,
+        match=match,
+    )
+
+
+def _batch_search_sql(with_akas: bool) -> str:
+    # Long queries get the indexable `%` prefilter (see _title_match); short
+    # ones use thresholds below pg_trgm's default and cannot. Thresholds are
+    # `real` like similarity() itself, matching the ORM comparison. Each branch
+    # numbers its own queries, so rows carry the branch alongside the ordinal.
+    return f"""
+SELECT 0 AS branch, q.ord, r.*
+FROM unnest(%s::text[], %s::real[]) WITH ORDINALITY AS q(query, threshold, ord)
+CROSS JOIN LATERAL ({_lateral_sql(True, with_akas)}) r
+UNION ALL
+SELECT 1 AS branch, q.ord, r.*
+FROM unnest(%s::text[], %s::real[]) WITH ORDINALITY AS q(query, threshold, ord)
+CROSS JOIN LATERAL ({_lateral_sql(False, with_akas)}) r
+ORDER BY branch, ord, sim DESC, num_votes DESC NULLS LAST, avg_rating DESC, start_year DESC
+"""
+
+
+BATCH_SEARCH_SQL = _batch_search_sql(with_akas=False)
+BATCH_SEARCH_WITH_AKAS_SQL = _batch_search_sql(with_akas=True)
+
+_COLUMNS = ("tconst", "primary_title", "start_year", "avg_rating", "poster_path", "num_votes")
+
+
+def _fetch_batch(normalized_queries: List[str], limit: int,
+                 aka_regions: Tuple[str, ...] = ()) -> Dict[str, List[dict]]:
+    """Resolve several normalized queries with a single round trip."""
+
+    branches: List[List[str]] = [[], []]
+    thresholds: List[List[float]] = [[], []]
+    for normalized in normalized_queries:
+        threshold, _ = _calculate_similarity_threshold(normalized)
+        branch = 0 if threshold >= PG_TRGM_DEFAULT_THRESHOLD else 1
+        branches[branch].append(normalized)
+        thresholds[branch].append(threshold)
+
+    params: List[object] = []
+    for branch in (0, 1):
+        params.extend([branches[branch], thresholds[branch]])
+        if aka_regions:
+            # One array for the similarity in the select list, one for the match.
+            params.extend([list(aka_regions), list(aka_regions)])
+        params.append(limit)
+
+    sql = BATCH_SEARCH_WITH_AKAS_SQL if aka_regions else BATCH_SEARCH_SQL
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    results: Dict[str, List[dict]] = {normalized: [] for normalized in normalized_queries}
+    for branch, ordinal, *values in rows:
+        normalized = branches[branch][ordinal - 1]
+        results[normalized].append(_project_search_row(dict(zip(_COLUMNS, values))))
+    return results
+
+
+def search_movies_batch(queries: List[str], limit: int = 20) -> Dict[str, List[dict]]:
+    """
+    Search for several movie titles at once.
+
+    Args:
+        queries: Raw search strings (blank entries are ignored, duplicates collapsed)
+        limit: Maximum number of results per query (default: 20)
+
+    Returns:
+        dict[str, list[dict]]: Results keyed by the (stripped) query string, each
+        list shaped and ranked exactly like `search_movies` output.
+
+    Raises:
+        DatabaseError: If there's an issue querying the database
+
+    Business Logic:
+        - Fresh cache entries are served without touching the database
+        - Short queries covered by the precomputed answers are served from them
+        - Other misses are resolved by one LATERAL/unnest statement and cached;
+          like `search_movies`, alternate titles are matched when available
+        - With the in-memory index enabled or without the accent-insensitive
+          capabilities, misses fall back to individual `search_movies` calls,
+          as do batched queries with too few hits for spelling correction
+    """
+    start = time.perf_counter()
+    stripped = list(dict.fromkeys(query.strip() for query in queries if query and query.strip()))
+    normalized_by_query = {query: _normalize_search_query(query) for query in stripped}
+    # The first raw spelling of each normalized query, for the search_movies fallback.
+    query_by_normalized: Dict[str, str] = {}
+    for query, normalized in normalized_by_query.items():
+        query_by_normalized.setdefault(normalized, query)
+
+    results_by_normalized: Dict[str, List[dict]] = {}
+    misses: List[str] = []
+    for normalized in dict.fromkeys(normalized_by_query.values()):
+        lookup = search_cache.get(_build_cache_key(normalized, limit))
+        if lookup.is_fresh:
+            results_by_normalized[normalized] = lookup.payload or []
+        else:
+            misses.append(normalized)
+
+    to_fetch: List[str] = []
+    for normalized in misses:
+        precomputed = lookup_short_query_answer(normalized, limit)
+        if precomputed is not None:
+            _store_results_in_cache(_build_cache_key(normalized, limit), precomputed, normalized)
+            results_by_normalized[normalized] = precomputed
+        else:
+            to_fetch.append(normalized)
+
+    capabilities = get_search_capabilities()
+    strategy = capabilities.strategy
+    individually: List[str] = []
+    batched = 0
+    if to_fetch and strategy == STRATEGY_ACCENT_INSENSITIVE and not is_in_memory_search_enabled():
+        fetched = _fetch_batch(to_fetch, limit, _searchable_aka_regions(capabilities))
+        min_results = min(getattr(settings, "MOVIE_SEARCH_SPELLING_MIN_RESULTS", 3), limit)
+        for normalized, payload in fetched.items():
+            if is_spelling_correction_enabled() and len(payload) < min_results:
+                individually.append(normalized)
+                continue
+            _store_results_in_cache(_build_cache_key(normalized, limit), payload, normalized)
+            results_by_normalized[normalized] = payload
+            batched += 1
+    else:
+        individually = to_fetch
+    for normalized in individually:
+        # The raw query, as a single search would receive it: the case-insensitive
+        # strategy matches on it rather than on the normalized form.
+        results_by_normalized[normalized] = search_movies(query_by_normalized[normalized], limit=limit)
+
+    logger.info(
+        "Movie batch search executed",
+        extra={"movie_batch_search": {
+            "query_count": len(stripped),
+            "cache_hits": len(results_by_normalized) - len(misses),
+            "cache_misses": len(misses),
+            "batched": batched,
+            "strategy": strategy,
+            "limit": limit,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        }},
+    )
+    return {query: results_by_normalized[normalized] for query, normalized in normalized_by_query.items()}
@@ -0,0 +1,84 @@
+"""Service layer for the movie detail endpoint.
+
+A detail payload (movie fields plus every MovieAvailability row) is cached in
+the shared Django cache under ``movie_detail:<tconst>``. The per-process
+search LRU is deliberately not used: availability commands invalidate entries
+explicitly with `invalidate_movie_details`, and a process-local copy would
+keep serving the old availability after that.
+"""
+
+import logging
+from typing import Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from movies.models import Movie, MovieAvailability  # type: ignore
+from movies.serializers import MovieDetailSerializer  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Cached in place of a payload so unknown tconsts don't hit the database each time.
+_MISSING = "missing"
+
+
+def _movie_detail_cache_key(tconst: str) -> str:
+    return f"movie_detail:{tconst}"
+
+
+def _load_movie_detail(tconst: str) -> dict | None:
+    movie = (
+        Movie.objects.filter(tconst=tconst)
+        .prefetch_related(Prefetch(
+            "availability_entries",
+            queryset=MovieAvailability.objects.select_related("platform").order_by("platform__platform_name"),
+        ))
+        .first()
+    )
+    if movie is None:
+        return None
+    return dict(MovieDetailSerializer(movie).data)
+
+
+def get_movie_detail(tconst: str) -> dict | None:
+    """
+    Return one movie with its genres, rating and availability on every platform.
+
+    Args:
+        tconst: IMDb identifier
+
+    Returns:
+        dict | None: MovieDetailSerializer payload, or None if the movie doesn't exist
+
+    Raises:
+        DatabaseError: If there's an issue querying the database
+
+    Business Logic:
+        - Served from the shared cache for MOVIE_DETAIL_CACHE_TIMEOUT seconds
+        - populate_availability and update_availability_changes invalidate the
+          entries of the titles they touch
+        - Unknown tconsts are cached too, for MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT seconds
+    """
+    cache_key = _movie_detail_cache_key(tconst)
+    cached = cache.get(cache_key)
+    if cached == _MISSING:
+        return None
+    if cached is not None:
+        return cached
+
+    payload = _load_movie_detail(tconst)
+    if payload is None:
+        cache.set(cache_key, _MISSING, getattr(settings, "MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT", 300))
+        return None
+    cache.set(cache_key, payload, getattr(settings, "MOVIE_DETAIL_CACHE_TIMEOUT", 3600))
+    return payload
+
+
+def invalidate_movie_details(tconsts: Iterable[str]) -> None:
+    """Drop the cached detail payloads of `tconsts` (call after changing their availability)."""
+
+    keys = [_movie_detail_cache_key(tconst) for tconst in set(tconsts)]
+    if keys:
+        cache.delete_many(keys)
+        logger.debug("Invalidated %s movie detail cache entries", len(keys))
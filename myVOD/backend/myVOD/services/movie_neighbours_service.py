@@ -0,0 +1,216 @@
+"""Nightly "more like this" neighbours for GET /api/movies/<tconst>/similar/.
+
+Every movie with at least MOVIE_NEIGHBOURS_MIN_VOTES votes is scored against
+all the others with NumPy, one block of rows at a time. A pair's score is a
+weighted sum of:
+
+- genre cosine similarity (one-hot genre vectors)
+- release-year closeness, exp(-|dy| / YEAR_SCALE)
+- rating closeness, 1 - |dr| / 10
+- co-occurrence: cosine similarity of the sets of users who have the two
+  movies on their watchlist or marked them watched (``user_movie``)
+- a small popularity prior, log(num_votes), so well-known titles break ties
+
+The top MOVIE_NEIGHBOURS_TOP_K neighbours of each movie are stored in one
+``movie_neighbour`` row as parallel arrays. The endpoint then needs only a
+primary-key lookup (see movie_similar_service).
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from movies.models import Movie, MovieNeighbour, UserMovie  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+GENRE_WEIGHT = 0.40
+YEAR_WEIGHT = 0.15
+RATING_WEIGHT = 0.10
+COOCCURRENCE_WEIGHT = 0.30
+POPULARITY_WEIGHT = 0.05
+
+# Years apart at which the year closeness drops to 1/e.
+YEAR_SCALE = 10.0
+
+
+@dataclass
+class MovieFeatures:
+    """Feature arrays for the candidate movies, row i describing tconsts[i]."""
+
+    tconsts: List[str]
+    genres: np.ndarray  # (n, genres) one-hot rows scaled to unit length
+    years: np.ndarray  # (n,) NaN when unknown
+    ratings: np.ndarray  # (n,) NaN when unknown
+    popularity: np.ndarray  # (n,) log(num_votes) scaled to [0, 1]
+
+
+@dataclass
+class Cooccurrence:
+    """User co-occurrence cosine similarity among the most collected candidates."""
+
+    positions: np.ndarray  # (m,) row of each item in MovieFeatures
+    similarity: np.ndarray  # (m, m), zero diagonal
+
+
+def load_movie_features(min_votes: int) -> MovieFeatures:
+    rows = list(
+        Movie.objects.filter(num_votes__gte=min_votes)
+        .order_by("tconst")
+        .values_list("tconst", "genres", "start_year", "avg_rating", "num_votes")
+    )
+    vocabulary = sorted({genre for row in rows for genre in row[1] or ()})
+    genre_index = {genre: column for column, genre in enumerate(vocabulary)}
+
+    genres = np.zeros((len(rows), len(vocabulary)), dtype=np.float32)
+    for row_index, row in enumerate(rows):
+        for genre in row[1] or ():
+            genres[row_index, genre_index[genre]] = 1.0
+    norms = np.linalg.norm(genres, axis=1, keepdims=True)
+    genres /= np.where(norms == 0, 1.0, norms)
+
+    votes = np.log1p(np.array([row[4] for row in rows], dtype=np.float32))
+    return MovieFeatures(
+        tconsts=[row[0] for row in rows],
+        genres=genres,
+        years=np.array([np.nan if row[2] is None else row[2] for row in rows], dtype=np.float32),
+        ratings=np.array([np.nan if row[3] is None else float(row[3]) for row in rows], dtype=np.float32),
+        popularity=votes / votes.max() if len(rows) and votes.max() > 0 else votes,
+    )
+
+
+def load_cooccurrence(tconsts: List[str], max_items: int) -> Cooccurrence:
+    """Co-occurrence over the `max_items` candidates collected by the most users (at least two)."""
+
+    row_of = {tconst: row for row, tconst in enumerate(tconsts)}
+    collected = (
+        UserMovie.objects.filter(
+            Q(watched_at__isnull=False) | Q(watchlisted_at__isnull=False, watchlist_deleted_at__isnull=True)
+        )
+        .values_list("user_id", "tconst_id")
+    )
+    pairs = [(user_id, row_of[tconst]) for user_id, tconst in collected.iterator() if tconst in row_of]
+
+    item_rows, item_counts = np.unique(np.array([row for _, row in pairs], dtype=np.int64), return_counts=True)
+    frequent = item_counts >= 2
+    keep = item_rows[frequent][np.argsort(-item_counts[frequent], kind="stable")][:max_items]
+    if len(keep) < 2:
+        return Cooccurrence(np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32))
+
+    column_of = {int(row): column for column, row in enumerate(keep)}
+    user_of: dict = {}
+    cells = [
+        (user_of.setdefault(user_id, len(user_of)), column_of[row])
+        for user_id, row in pairs
+        if row in column_of
+    ]
+    incidence = np.zeros((len(user_of), len(keep)), dtype=np.float32)
+    users, columns = zip(*cells)
+    incidence[list(users), list(columns)] = 1.0
+
+    counts = incidence.T @ incidence
+    diagonal = np.sqrt(np.diag(counts))
+    similarity = counts / np.outer(diagonal, diagonal)
+    np.fill_diagonal(similarity, 0.0)
+    return Cooccurrence(keep, similarity.astype(np.float32))
+
+
+def _closeness(block: np.ndarray, values: np.ndarray, scale: float, *, exponential: bool) -> np.ndarray:
+    distance = np.abs(block[:, None] - values[None, :])
+    closeness = np.exp(-distance / scale) if exponential else 1.0 - distance / scale
+    # Unknown years or ratings contribute nothing.
+    return np.nan_to_num(closeness, nan=0.0)
+
+
+def compute_neighbours(features: MovieFeatures, cooccurrence: Cooccurrence, top_k: int,
+                       block_size: int = 256) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+    """Yield (row, neighbour rows, scores) for every movie, best neighbour first."""
+
+    count = len(features.tconsts)
+    k = min(top_k, count - 1)
+    if k <= 0:
+        return
+
+    cooccurrence_row = np.full(count, -1, dtype=np.int64)
+    cooccurrence_row[cooccurrence.positions] = np.arange(len(cooccurrence.positions))
+
+    for start in range(0, count, block_size):
+        stop = min(start + block_size, count)
+        scores = GENRE_WEIGHT * (features.genres[start:stop] @ features.genres.T)
+        scores += YEAR_WEIGHT * _closeness(
+            features.years[start:stop], features.years, YEAR_SCALE, exponential=True
+        )
+        scores += RATING_WEIGHT * _closeness(
+            features.ratings[start:stop], features.ratings, 10.0, exponential=False
+        )
+        scores += POPULARITY_WEIGHT * features.popularity[None, :]
+
+        block_rows = cooccurrence_row[start:stop]
+        has_cooccurrence = np.nonzero(block_rows >= 0)[0]
+        if len(has_cooccurrence):
+            scores[np.ix_(has_cooccurrence, cooccurrence.positions)] += (
+                COOCCURRENCE_WEIGHT * cooccurrence.similarity[block_rows[has_cooccurrence]]
+            )
+
+        local = np.arange(stop - start)
+        scores[local, local + start] = -np.inf
+
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        neighbours = np.take_along_axis(candidates, order, axis=1)
+        neighbour_scores = np.take_along_axis(candidate_scores, order, axis=1)
+        for offset in local:
+            yield start + int(offset), neighbours[offset], neighbour_scores[offset]
+
+
+def build_movie_neighbours(top_k: int | None = None, min_votes: int | None = None,
+                           block_size: int = 256) -> int:
+    """Recompute and store the neighbour list of every candidate movie; returns rows written."""
+
+    top_k = top_k or getattr(settings, "MOVIE_NEIGHBOURS_TOP_K", 20)
+    if min_votes is None:
+        min_votes = getattr(settings, "MOVIE_NEIGHBOURS_MIN_VOTES", 1000)
+
+    features = load_movie_features(min_votes)
+    cooccurrence = load_cooccurrence(
+        features.tconsts, getattr(settings, "MOVIE_NEIGHBOURS_MAX_COOCCURRENCE_ITEMS", 4000)
+    )
+    now = timezone.now()
+    rows = [
+        MovieNeighbour(
+            tconst=features.tconsts[row],
+            neighbours=[features.tconsts[neighbour] for neighbour in neighbours],
+            scores=[round(float(score), 4) for score in scores],
+            updated_at=now,
+        )
+        for row, neighbours, scores in compute_neighbours(features, cooccurrence, top_k, block_size)
+    ]
+
+    with transaction.atomic():
+        MovieNeighbour.objects.bulk_create(
+            rows,
+            batch_size=1000,
+            update_conflicts=True,
+            unique_fields=["tconst"],
+            update_fields=["neighbours", "scores", "updated_at"],
+        )
+        # Movies that dropped out of the candidate set.
+        MovieNeighbour.objects.filter(updated_at__lt=now).delete()
+
+    logger.info(
+        "Built movie neighbours",
+        extra={"movie_neighbours": {
+            "movies": len(rows),
+            "cooccurrence_items": len(cooccurrence.positions),
+            "top_k": top_k,
+            "min_votes": min_votes,
+        }},
+    )
+    return len(rows)
@@ -0,0 +1,150 @@
+"""Service layer for loading IMDb people (name.basics, title.principals, title.crew).
+
+Only credits on movies present in the ``movie`` table and in
+PERSON_CATEGORIES are kept, and only people with at least one such credit
+are loaded, so ``person`` and ``movie_person`` stay small enough to index
+cheaply. Credits are read first into a temporary staging table, which decides
+which names from name.basics are kept; they are published to movie_person once
+their people exist.
+"""
+
+import csv
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+_NULL = "\\N"
+
+# Roles people are searched by; other principals (producer, composer, ...) are skipped.
+PERSON_CATEGORIES = frozenset({"director", "writer", "actor", "actress"})
+
+# The person row may not exist yet, so credits are staged first (see load_people).
+INSERT_CREDITS_SQL = """
+INSERT INTO movie_person_staging (nconst, tconst, category)
+SELECT v.nconst, v.tconst, v.category
+FROM unnest(%s::text[], %s::text[], %s::text[]) AS v(nconst, tconst, category)
+JOIN movie m ON m.tconst = v.tconst;
+"""
+
+INSERT_PEOPLE_SQL = """
+INSERT INTO person (nconst, primary_name)
+SELECT v.nconst, v.primary_name
+FROM unnest(%s::text[], %s::text[]) AS v(nconst, primary_name)
+WHERE EXISTS (SELECT 1 FROM movie_person_staging s WHERE s.nconst = v.nconst)
+ON CONFLICT (nconst) DO UPDATE SET primary_name = EXCLUDED.primary_name;
+"""
+
+PUBLISH_CREDITS_SQL = """
+INSERT INTO movie_person (nconst, tconst, category)
+SELECT DISTINCT s.nconst, s.tconst, s.category
+FROM movie_person_staging s
+JOIN person p ON p.nconst = s.nconst
+ON CONFLICT (nconst, tconst, category) DO NOTHING;
+"""
+
+
+def iter_principal_credits(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (nconst, tconst, category) from title.principals rows in PERSON_CATEGORIES."""
+
+    reader = csv.DictReader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    for row in reader:
+        category = row.get("category")
+        if category in PERSON_CATEGORIES:
+            yield row["nconst"], row["tconst"], category
+
+
+def iter_crew_credits(lines: Iterable[str]) -> Iterator[Tuple[str, str, str]]:
+    """Yield (nconst, tconst, category) for the directors and writers in title.crew rows."""
+
+    reader = csv.DictReader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    for row in reader:
+        for column, category in (("directors", "director"), ("writers", "writer")):
+            value = row.get(column)
+            if not value or value == _NULL:
+                continue
+            for nconst in value.split(","):
+                yield nconst, row["tconst"], category
+
+
+def iter_people(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Yield (nconst, primary_name) from name.basics rows."""
+
+    reader = csv.DictReader(lines, delimiter="\t", quoting=csv.QUOTE_NONE)
+    for row in reader:
+        name = row.get("primaryName")
+        if name and name != _NULL:
+            yield row["nconst"], name
+
+
+def _execute_batches(sql: str, rows: Iterable[Tuple[str, ...]], batch_size: int) -> Tuple[int, int]:
+    """Insert `rows` column-wise in batches; returns (rows read, rows inserted)."""
+
+    read = inserted = 0
+    batch: List[Tuple[str, ...]] = []
+
+    def flush() -> int:
+        columns = [list(column) for column in zip(*batch)]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, columns)
+            return max(cursor.rowcount, 0)
+
+    for row in rows:
+        batch.append(row)
+        read += 1
+        if len(batch) >= batch_size:
+            inserted += flush()
+            batch = []
+    if batch:
+        inserted += flush()
+    return read, inserted
+
+
+def load_people(data_dir: Path, batch_size: int = 5000, replace: bool = False) -> Dict[str, int]:
+    """
+    Load people and their movie credits from an IMDb dataset directory.
+
+    Args:
+        data_dir: Directory holding name.basics.tsv, title.principals.tsv and title.crew.tsv
+        batch_size: Rows per INSERT statement
+        replace: Delete existing people and credits first
+
+    Returns:
+        dict: {"credits_read", "people_read", "people", "credits"} counts
+    """
+    counts: Dict[str, int] = {}
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            if replace:
+                cursor.execute("TRUNCATE movie_person, person;")
+            cursor.execute(
+                "CREATE TEMP TABLE movie_person_staging "
+                "(nconst text, tconst text, category text) ON COMMIT DROP;"
+            )
+
+        credits_read = 0
+        for name, parser in (("title.principals.tsv", iter_principal_credits),
+                             ("title.crew.tsv", iter_crew_credits)):
+            with open(data_dir / name, "r", encoding="utf-8", newline="") as handle:
+                read, _ = _execute_batches(INSERT_CREDITS_SQL, parser(handle), batch_size)
+                credits_read += read
+        counts["credits_read"] = credits_read
+
+        with connection.cursor() as cursor:
+            cursor.execute("CREATE INDEX ON movie_person_staging (nconst);")
+            cursor.execute("ANALYZE movie_person_staging;")
+
+        with open(data_dir / "name.basics.tsv", "r", encoding="utf-8", newline="") as handle:
+            counts["people_read"], counts["people"] = _execute_batches(
+                INSERT_PEOPLE_SQL, iter_people(handle), batch_size
+            )
+
+        with connection.cursor() as cursor:
+            cursor.execute(PUBLISH_CREDITS_SQL)
+            counts["credits"] = max(cursor.rowcount, 0)
+
+    logger.info("Loaded movie people", extra={"movie_people_load": counts})
+    return counts
@@ -0,0 +1,128 @@
+"""Service layer for finding movies by the people who made or starred in them.
+
+A person query is resolved in one statement. The best-matching names come
+from a whole-word full-text match (``name_tsv @@``) or trigram similarity on
+``person.name_normalized``, both GIN indexed. Their credits in
+``movie_person`` select the movies, which are ranked by ``num_votes``.
+"""
+
+import logging
+import time
+from typing import List
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, TrigramSimilarity
+from django.db.models import F, Q
+
+from movies.models import Movie, MoviePerson, Person  # type: ignore
+from services.movie_search_service import (  # type: ignore
+    PG_TRGM_DEFAULT_THRESHOLD,
+    SEARCH_RESULT_FIELDS,
+    SearchFilters,
+    _normalize_search_query,
+    _project_search_row,
+    _store_results_in_cache,
+    _title_match,
+)
+from services.search_cache import search_cache  # type: ignore
+from services.search_capabilities import get_search_capabilities  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Names shorter than this match too many people to be useful.
+MIN_PERSON_QUERY_LENGTH = 3
+
+
+def _build_person_cache_key(normalized_query: str, limit: int, filters: SearchFilters | None = None) -> str:
+    key = f"movie_person_search:{normalized_query}:{limit}"
+    if filters is not None and not filters.is_empty:
+        key = f"{key}:{filters.cache_fragment()}"
+    return key
+
+
+def _build_person_movies_queryset(normalized_query: str, limit: int,
+                                  filters: SearchFilters | None = None):
+    """Movies credited to the people best matching `normalized_query`, most voted first."""
+
+    matches = getattr(settings, "MOVIE_SEARCH_PERSON_MATCHES", 5)
+    people = Person.objects.filter(
+        Q(name_tsv=SearchQuery(normalized_query, config="simple"))
+        | _title_match(F("name_normalized"), normalized_query, PG_TRGM_DEFAULT_THRESHOLD)
+    ).annotate(
+        similarity=TrigramSimilarity("name_normalized", normalized_query)
+    ).order_by("-similarity", "nconst").values("nconst")[:matches]
+
+    queryset = Movie.objects.filter(
+        tconst__in=MoviePerson.objects.filter(nconst__in=people).values("tconst")
+    )
+    if filters is not None:
+        queryset = filters.apply(queryset)
+    return queryset.order_by(
+        F("num_votes").desc(nulls_last=True),
+        "-avg_rating",
+        "-start_year",
+    ).values(*SEARCH_RESULT_FIELDS)[:limit]
+
+
+def search_movies_by_person(search_query: str, limit: int = 20,
+                            filters: SearchFilters | None = None) -> List[dict]:
+    """
+    Find movies by a director, writer or actor name.
+
+    Args:
+        search_query: Person name (full or partial, typos tolerated)
+        limit: Maximum number of movies to return (default: 20)
+        filters: Optional year/genre/rating/votes filters (see SearchFilters)
+
+    Returns:
+        list[dict]: Movies in the MovieSearchResultSerializer shape, ranked by num_votes.
+
+    Raises:
+        DatabaseError: If there's an issue querying the database
+
+    Business Logic:
+        - Up to MOVIE_SEARCH_PERSON_MATCHES best-matching people are used;
+          their combined filmography is ranked by num_votes
+        - Queries shorter than 3 characters return no results
+        - Without the person tables (see `load_movie_people`) returns no results
+        - Results are cached like title searches, under a separate key space
+    """
+    if not search_query or not search_query.strip():
+        logger.warning("Empty search query provided to search_movies_by_person")
+        return []
+
+    if filters is not None and filters.is_empty:
+        filters = None
+
+    normalized_query = _normalize_search_query(search_query.strip())
+    if len("".join(normalized_query.split())) < MIN_PERSON_QUERY_LENGTH:
+        return []
+    if not get_search_capabilities().has_person_tables:
+        logger.warning("Person search requested but the person tables are missing")
+        return []
+
+    start = time.perf_counter()
+    cache_key = _build_person_cache_key(normalized_query, limit, filters)
+    lookup = search_cache.get(cache_key)
+    if lookup.is_fresh:
+        return lookup.payload or []
+
+    db_start = time.perf_counter()
+    rows = list(_build_person_movies_queryset(normalized_query, limit, filters))
+    db_duration_ms = (time.perf_counter() - db_start) * 1000
+    payload = [_project_search_row(row) for row in rows]
+    _store_results_in_cache(cache_key, payload, normalized_query)
+
+    logger.info(
+        "Movie person search executed",
+        extra={"movie_person_search": {
+            "query": search_query,
+            "normalized_query": normalized_query,
+            "limit": limit,
+            "result_count": len(payload),
+            "db_duration_ms": round(db_duration_ms, 2),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "filters": filters.asdict() if filters is not None else None,
+        }},
+    )
+    return payload
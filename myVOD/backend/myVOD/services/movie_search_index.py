@@ -0,0 +1,283 @@
+"""In-process trigram index used to answer movie searches without PostgreSQL.
+
+The index mirrors the semantics of ``pg_trgm``: titles are normalized
+(lowercase, accents stripped), split into alphanumeric words and every word is
+padded with two leading spaces and one trailing space before extracting
+trigrams. Similarity is the Jaccard ratio of the two trigram sets, which is what
+``similarity()`` returns in PostgreSQL, so the in-memory ranking matches the
+database ranking.
+
+Storage is array-backed to keep the per-worker footprint small: numeric columns
+live in ``array.array`` buffers indexed by row id and every trigram maps to an
+``array('I')`` posting list of row ids.
+
+A published index is never modified: searches run on other threads without a
+lock, so refreshes apply changed rows to a copy (`with_rows`) and the
+`RefreshingHolder` swaps the reference.
+"""
+
+import heapq
+import logging
+import re
+import time
+import unicodedata
+from array import array
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Set
+
+from django.conf import settings
+
+from movies.models import Movie  # type: ignore
+from services.refreshing_holder import RefreshingHolder  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# Sentinel stored in numeric arrays for NULL database values.
+_NULL = -1
+
+# Rebuild the index once this share of rows has been superseded by updates.
+_COMPACTION_RATIO = 0.25
+
+INDEX_FIELDS = (
+    "tconst",
+    "primary_title",
+    "start_year",
+    "avg_rating",
+    "num_votes",
+    "poster_path",
+    "updated_at",
+)
+
+
+def normalize_title(value: str) -> str:
+    """Return a lowercase, accent-free version of a title or query."""
+
+    normalized = unicodedata.normalize("NFKD", value.lower())
+    return "".join(character for character in normalized if not unicodedata.combining(character))
+
+
+def extract_trigrams(normalized_text: str) -> Set[str]:
+    """Extract the pg_trgm trigram set for an already normalized string."""
+
+    trigrams: Set[str] = set()
+    for word in _WORD_PATTERN.findall(normalized_text):
+        padded = f"  {word} "
+        for position in range(len(padded) - 2):
+            trigrams.add(padded[position:position + 3])
+    return trigrams
+
+
+class TrigramTitleIndex:
+    """Compact trigram inverted index over normalized movie titles."""
+
+    def __init__(self) -> None:
+        self._tconsts: List[str] = []
+        self._titles: List[str] = []
+        self._poster_paths: List[str | None] = []
+        self._start_years = array("h")
+        self._ratings = array("h")  # avg_rating * 10
+        self._num_votes = array("q")
+        self._trigram_counts = array("H")
+        self._alive = bytearray()
+        self._postings: Dict[str, array] = {}
+        self._row_by_tconst: Dict[str, int] = {}
+        self._dead_rows = 0
+        self.watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._row_by_tconst)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict]) -> "TrigramTitleIndex":
+        index = cls()
+        for row in rows:
+            index._upsert_row(row)
+        return index._compacted_if_needed()
+
+    def with_rows(self, rows: Iterable[dict]) -> "TrigramTitleIndex":
+        """Return a new index with rows inserted or replaced; this one is left untouched."""
+
+        index = self._copy()
+        for row in rows:
+            index._upsert_row(row)
+        return index._compacted_if_needed()
+
+    def _copy(self) -> "TrigramTitleIndex":
+        index = TrigramTitleIndex()
+        index._tconsts = self._tconsts[:]
+        index._titles = self._titles[:]
+        index._poster_paths = self._poster_paths[:]
+        index._start_years = self._start_years[:]
+        index._ratings = self._ratings[:]
+        index._num_votes = self._num_votes[:]
+        index._trigram_counts = self._trigram_counts[:]
+        index._alive = self._alive[:]
+        index._postings = {trigram: postings[:] for trigram, postings in self._postings.items()}
+        index._row_by_tconst = dict(self._row_by_tconst)
+        index._dead_rows = self._dead_rows
+        index.watermark = self.watermark
+        return index
+
+    def _upsert_row(self, row: dict) -> None:
+        tconst = row["tconst"]
+        previous = self._row_by_tconst.get(tconst)
+        if previous is not None:
+            self._alive[previous] = 0
+            self._dead_rows += 1
+
+        row_id = len(self._tconsts)
+        trigrams = extract_trigrams(normalize_title(row["primary_title"] or ""))
+
+        self._tconsts.append(tconst)
+        self._titles.append(row["primary_title"])
+        self._poster_paths.append(row.get("poster_path"))
+        self._start_years.append(_NULL if row.get("start_year") is None else int(row["start_year"]))
+        rating = row.get("avg_rating")
+        self._ratings.append(_NULL if rating is None else int(round(float(rating) * 10)))
+        self._num_votes.append(_NULL if row.get("num_votes") is None else int(row["num_votes"]))
+        self._trigram_counts.append(min(len(trigrams), 0xFFFF))
+        self._alive.append(1)
+        self._row_by_tconst[tconst] = row_id
+
+        for trigram in trigrams:
+            postings = self._postings.get(trigram)
+            if postings is None:
+                postings = self._postings[trigram] = array("I")
+            postings.append(row_id)
+
+        updated_at = row.get("updated_at")
+        if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+            self.watermark = updated_at
+
+    def _compacted_if_needed(self) -> "TrigramTitleIndex":
+        """Return an index rebuilt without superseded rows once enough have piled up."""
+
+        if not self._dead_rows or self._dead_rows <= len(self._alive) * _COMPACTION_RATIO:
+            return self
+        index = TrigramTitleIndex()
+        for row_id in self._row_by_tconst.values():
+            index._upsert_row(self._row_payload(row_id) | {"updated_at": None})
+        index.watermark = self.watermark
+        return index
+
+    def _row_payload(self, row_id: int) -> dict:
+        rating = self._ratings[row_id]
+        start_year = self._start_years[row_id]
+        num_votes = self._num_votes[row_id]
+        return {
+            "tconst": self._tconsts[row_id],
+            "primary_title": self._titles[row_id],
+            "start_year": None if start_year == _NULL else start_year,
+            # Match MovieSearchResultSerializer, which renders the Decimal as a string.
+            "avg_rating": None if rating == _NULL else f"{rating // 10}.{rating % 10}",
+            "poster_path": self._poster_paths[row_id],
+            "num_votes": None if num_votes == _NULL else num_votes,
+        }
+
+    def _ranking_key(self, row_id: int, similarity: float) -> tuple:
+        """Mirror ``-similarity, num_votes DESC NULLS LAST, -avg_rating, -start_year``.
+
+        PostgreSQL sorts NULLs first for plain DESC ordering, which is what the
+        ORM emits for ``-avg_rating`` and ``-start_year``.
+        """
+
+        num_votes = self._num_votes[row_id]
+        rating = self._ratings[row_id]
+        start_year = self._start_years[row_id]
+        return (
+            -similarity,
+            num_votes == _NULL,
+            -num_votes,
+            rating != _NULL,
+            -rating,
+            start_year != _NULL,
+            -start_year,
+            self._tconsts[row_id],
+        )
+
+    def search(self, normalized_query: str, similarity_threshold: float, limit: int) -> List[dict]:
+        """Return up to ``limit`` rows with similarity above the threshold."""
+
+        query_trigrams = extract_trigrams(normalized_query)
+        if not query_trigrams:
+            return []
+
+        shared_counts: Counter = Counter()
+        for trigram in query_trigrams:
+            postings = self._postings.get(trigram)
+            if postings is not None:
+                shared_counts.update(postings)
+
+        query_size = len(query_trigrams)
+        alive = self._alive
+        trigram_counts = self._trigram_counts
+        candidates = []
+        for row_id, shared in shared_counts.items():
+            if not alive[row_id]:
+                continue
+            similarity = shared / (query_size + trigram_counts[row_id] - shared)
+            if similarity > similarity_threshold:
+                candidates.append((row_id, similarity))
+
+        best = heapq.nsmallest(
+            limit,
+            candidates,
+            key=lambda candidate: self._ranking_key(candidate[0], candidate[1]),
+        )
+        return [self._row_payload(row_id) for row_id, _ in best]
+
+
+def build_index_from_database() -> TrigramTitleIndex:
+    """Build a fresh index from the ``movie`` table."""
+
+    start = time.perf_counter()
+    rows = Movie.objects.values(*INDEX_FIELDS).order_by().iterator(chunk_size=5000)
+    index = TrigramTitleIndex.from_rows(rows)
+    logger.info(
+        "Built in-memory movie search index with %s titles in %.1f ms",
+        len(index),
+        (time.perf_counter() - start) * 1000,
+    )
+    return index
+
+
+def refresh_index_from_database(index: TrigramTitleIndex) -> TrigramTitleIndex:
+    """Return a copy of the index with rows changed since its watermark applied."""
+
+    queryset = Movie.objects.values(*INDEX_FIELDS).order_by()
+    if index.watermark is not None:
+        # >= so rows sharing the watermark timestamp are never skipped; re-applying is idempotent.
+        queryset = queryset.filter(updated_at__gte=index.watermark)
+    rows = list(queryset.iterator(chunk_size=5000))
+    if not rows:
+        return index
+    logger.info("Refreshed in-memory movie search index with %s changed titles", len(rows))
+    return index.with_rows(rows)
+
+
+def _build_or_refresh_index(index: TrigramTitleIndex | None) -> TrigramTitleIndex:
+    return build_index_from_database() if index is None else refresh_index_from_database(index)
+
+
+_holder: RefreshingHolder[TrigramTitleIndex] = RefreshingHolder(
+    _build_or_refresh_index, "MOVIE_SEARCH_INDEX_REFRESH_SECONDS"
+)
+
+
+def get_movie_search_index() -> TrigramTitleIndex:
+    """Return the process-wide index, building or refreshing it as needed."""
+
+    return _holder.get()
+
+
+def reset_movie_search_index() -> None:
+    """Drop the process-wide index so the next search rebuilds it."""
+
+    _holder.reset()
+
+
+def is_in_memory_search_enabled() -> bool:
+    return getattr(settings, "MOVIE_SEARCH_BACKEND", "database") == "memory"
@@ -4,17 +4,45 @@ import logging
 import time
 import unicodedata
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from decimal import Decimal
+from typing import Callable, Dict, List, Tuple
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.contrib.postgres.lookups import TrigramSimilar
 from django.contrib.postgres.search import TrigramSimilarity
-from django.core.cache import cache
-from django.db import connection, models
-from django.db.models import F
-from django.db.models.functions import Lower
-
-from movies.models import Movie  # type: ignore
-from movies.serializers import MovieSearchResultSerializer
+from django.db import DatabaseError, connection
+from django.db.models import F, FloatField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest, Lower
+from django.db.models.lookups import GreaterThan
+
+from movies.models import Movie, MovieAka  # type: ignore
+from services.movie_search_index import (  # type: ignore
+    get_movie_search_index,
+    is_in_memory_search_enabled,
+)
+from services.movie_aka_service import configured_aka_regions  # type: ignore
+from services.movie_short_query_answers import (  # type: ignore
+    is_short_query,
+    lookup_short_query_answer,
+)
+from services.movie_spelling_index import (  # type: ignore
+    get_spelling_dictionary,
+    is_spelling_correction_enabled,
+)
+from services.search_cache import CacheLookup, search_cache  # type: ignore
+from services.search_capabilities import (  # type: ignore
+    STRATEGY_ACCENT_INSENSITIVE,
+    STRATEGY_CASE_INSENSITIVE,
+    SearchCapabilities,
+    downgrade_search_capabilities,
+    get_search_capabilities,
+)
+from services.search_metrics import search_metrics  # type: ignore
+from services.search_query_stats import (  # type: ignore
+    arecord_search_query,
+    record_search_query,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +58,7 @@ class SearchTelemetry:
     query_length: int
     cache_key: str
     cache_status: str = "miss"
+    cache_tier: str | None = None
     strategy: str = "accent_insensitive"
     result_count: int = 0
     duration_ms: float = 0.0
@@ -54,6 +83,10 @@ class SearchTelemetry:
             "db_duration_ms": round(self.db_duration_ms, 2),
             "serialization_duration_ms": round(self.serialization_duration_ms, 2),
             "cache_duration_ms": round(self.cache_duration_ms, 2),
+            "cache_tier": self.cache_tier,
+            "cache_hit_rates": {
+                tier: round(rate, 4) for tier, rate in search_cache.hit_rates().items()
+            },
         }
         if self.db_queries_count is not None:
             payload["db_queries_count"] = self.db_queries_count
@@ -62,34 +95,115 @@ class SearchTelemetry:
         return payload
 
 
-def _build_cache_key(normalized_query: str, limit: int) -> str:
+@dataclass(frozen=True)
+class SearchFilters:
+    """Optional structured filters narrowing a title search.
+
+    Genres are matched with array containment (`genres @> ARRAY[...]`), so a
+    movie must carry every requested genre; names use IMDb spelling ("Sci-Fi").
+    """
+
+    year_from: int | None = None
+    year_to: int | None = None
+    genres: Tuple[str, ...] = ()
+    min_rating: Decimal | None = None
+    min_votes: int | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return self == SearchFilters()
+
+    def apply(self, queryset):
+        """Narrow a Movie queryset; each condition is backed by an index from migration 0005."""
+
+        if self.year_from is not None:
+            queryset = queryset.filter(start_year__gte=self.year_from)
+        if self.year_to is not None:
+            queryset = queryset.filter(start_year__lte=self.year_to)
+        if self.genres:
+            queryset = queryset.filter(genres__contains=list(self.genres))
+        if self.min_rating is not None:
+            queryset = queryset.filter(avg_rating__gte=self.min_rating)
+        if self.min_votes is not None:
+            queryset = queryset.filter(num_votes__gte=self.min_votes)
+        return queryset
+
+    def cache_fragment(self) -> str:
+        """Canonical, order-independent representation used in cache keys."""
+
+        parts = []
+        if self.year_from is not None:
+            parts.append(f"yf={self.year_from}")
+        if self.year_to is not None:
+            parts.append(f"yt={self.year_to}")
+        if self.genres:
+            parts.append("g=" + ",".join(sorted(self.genres)))
+        if self.min_rating is not None:
+            parts.append(f"r={self.min_rating}")
+        if self.min_votes is not None:
+            parts.append(f"v={self.min_votes}")
+        return "|".join(parts)
+
+    def asdict(self) -> Dict[str, object]:
+        return {
+            "year_from": self.year_from,
+            "year_to": self.year_to,
+            "genres": list(self.genres),
+            "min_rating": str(self.min_rating) if self.min_rating is not None else None,
+            "min_votes": self.min_votes,
+        }
+
+
+def _build_cache_key(normalized_query: str, limit: int, filters: SearchFilters | None = None) -> str:
     """Build cache key for movie search results."""
 
-    return f"movie_search:{normalized_query}:{limit}"
+    if filters is None or filters.is_empty:
+        return f"movie_search:{normalized_query}:{limit}"
+    return f"movie_search:{normalized_query}:{limit}:{filters.cache_fragment()}"
 
 
-def _get_cached_results(cache_key: str) -> List[dict] | None:
-    """Safely retrieve cached search results."""
+def _cache_timeout(normalized_query: str, payload: List[dict]) -> int:
+    """Pick the cache TTL for a result set by query class.
 
-    try:
-        return cache.get(cache_key)
-    except Exception:  # pragma: no cover - defensive: cache backend failure shouldn't break search
-        logger.warning(
-            "Failed to read movie search cache for key '%s'", cache_key, exc_info=True
-        )
-        return None
+    Empty results and short (1-2 character) queries change rarely and are
+    expensive to recompute, so they get their own, longer TTLs.
+    """
 
+    if not payload:
+        return getattr(settings, "MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT", 300)
+    if is_short_query(normalized_query):
+        return getattr(settings, "MOVIE_SEARCH_CACHE_SHORT_TIMEOUT", 3600)
+    return getattr(settings, "MOVIE_SEARCH_CACHE_TIMEOUT", 60)
 
-def _store_results_in_cache(cache_key: str, payload: List[dict]) -> None:
-    """Store search results in cache with configured TTL."""
 
-    timeout = getattr(settings, "MOVIE_SEARCH_CACHE_TIMEOUT", 60)
-    try:
-        cache.set(cache_key, payload, timeout)
-    except Exception:  # pragma: no cover - defensive
-        logger.warning(
-            "Failed to store movie search cache for key '%s'", cache_key, exc_info=True
-        )
+def _store_results_in_cache(cache_key: str, payload: List[dict], normalized_query: str) -> None:
+    """Store search results in both cache tiers with the TTL for their query class."""
+
+    search_cache.set(cache_key, payload, _cache_timeout(normalized_query, payload))
+
+
+SEARCH_RESULT_FIELDS = (
+    "tconst",
+    "primary_title",
+    "start_year",
+    "avg_rating",
+    "poster_path",
+    "num_votes",
+)
+
+
+def _project_search_row(row: dict) -> dict:
+    """Project a `.values()` row onto the MovieSearchResultSerializer payload shape."""
+
+    avg_rating = row["avg_rating"]
+    return {
+        "tconst": row["tconst"],
+        "primary_title": row["primary_title"],
+        "start_year": row["start_year"],
+        "avg_rating": str(avg_rating) if avg_rating is not None else None,
+        "poster_path": row["poster_path"],
+        "num_votes": row["num_votes"],
+    }
 
 
 def _normalize_search_query(raw_query: str) -> str:
@@ -116,12 +230,319 @@ def _calculate_similarity_threshold(normalized_query: str) -> Tuple[float, int]:
     return 0.4, query_length
 
 
-def search_movies(search_query: str, limit: int = 20) -> List[dict]:
+# pg_trgm's default `pg_trgm.similarity_threshold`; the `%` operator matches at or above it.
+PG_TRGM_DEFAULT_THRESHOLD = 0.3
+
+
+def _normalized_title_expression():
+    """Stored `immutable_unaccent(lower(primary_title))` column (GIN trigram indexed)."""
+
+    return F("primary_title_normalized")
+
+
+def _title_match(title_expr, query_str: str, similarity_threshold: float) -> Q:
+    """Condition selecting titles whose trigram similarity exceeds the threshold."""
+
+    condition = Q(GreaterThan(TrigramSimilarity(title_expr, query_str), similarity_threshold))
+    if similarity_threshold >= PG_TRGM_DEFAULT_THRESHOLD:
+        # `similarity() > x` cannot use the GIN index but `%` can; it only
+        # narrows the candidates since the default threshold is lower.
+        condition = Q(TrigramSimilar(title_expr, query_str)) & condition
+    return condition
+
+
+def _aka_best_similarity(query_str: str, aka_regions: Tuple[str, ...]):
+    """Best alternate-title similarity of the outer movie within the given regions."""
+
+    return Subquery(
+        MovieAka.objects.filter(
+            tconst=OuterRef("tconst"),
+            region__in=aka_regions,
+        ).annotate(
+            aka_similarity=TrigramSimilarity("title_normalized", query_str)
+        ).order_by("-aka_similarity").values("aka_similarity")[:1],
+        output_field=FloatField(),
+    )
+
+
+def _build_search_queryset(title_expr, query_str: str, similarity_threshold: float, limit: int,
+                           filters: SearchFilters | None = None,
+                           aka_regions: Tuple[str, ...] = ()):
+    """Build the ranked trigram similarity queryset for a title expression.
+
+    With `aka_regions`, a movie also matches through its alternate titles and
+    is ranked by the better of its primary and best alternate similarity.
+    Candidates are still `movie` rows, so each tconst appears once. Rows are
+    `.values()` dicts limited to SEARCH_RESULT_FIELDS (see _fetch_search_payload).
+    """
+
+    queryset = Movie.objects.all()
+    if filters is not None:
+        queryset = filters.apply(queryset)
+
+    if aka_regions:
+        # `tconst IN (primary matches UNION aka matches)`: each branch is served
+        # by its own trigram GIN index. An OR of the two conditions cannot be,
+        # and scans the whole movie table.
+        primary_matches = Movie.objects.filter(
+            _title_match(title_expr, query_str, similarity_threshold)
+        ).values("tconst")
+        aka_matches = MovieAka.objects.filter(
+            Q(region__in=aka_regions)
+            & _title_match(F("title_normalized"), query_str, similarity_threshold)
+        ).values("tconst")
+        queryset = queryset.filter(tconst__in=primary_matches.union(aka_matches))
+        similarity = Greatest(
+            TrigramSimilarity(title_expr, query_str),
+            Coalesce(_aka_best_similarity(query_str, aka_regions), Value(0.0)),
+            output_field=FloatField(),
+        )
+    else:
+        queryset = queryset.filter(_title_match(title_expr, query_str, similarity_threshold))
+        similarity = TrigramSimilarity(title_expr, query_str)
+
+    return queryset.annotate(
+        similarity=similarity
+    ).order_by(
+        "-similarity",
+        F("num_votes").desc(nulls_last=True),
+        "-avg_rating",
+        "-start_year",
+    ).values(*SEARCH_RESULT_FIELDS)[:limit]
+
+
+def _searchable_aka_regions(capabilities: SearchCapabilities) -> Tuple[str, ...]:
+    """Alternate-title regions to search, if the movie_aka table is available."""
+
+    if not capabilities.has_aka_table or capabilities.strategy != STRATEGY_ACCENT_INSENSITIVE:
+        return ()
+    return configured_aka_regions()
+
+
+def _emit_telemetry(message: str, telemetry: SearchTelemetry) -> None:
+    """Record the search in the metrics registry and log its telemetry line."""
+
+    search_metrics.observe(telemetry)
+    logger.info(message, extra={"movie_search": telemetry.asdict()})
+
+
+def _apply_spelling_correction(
+    telemetry: SearchTelemetry,
+    payload: List[dict],
+    run_search: Callable[[str, float], List[dict]],
+) -> List[dict]:
+    """Retry a low-hit search with typos corrected and append the new matches.
+
+    Runs only when MOVIE_SEARCH_SPELLING_CORRECTION is on and the search
+    returned fewer than MOVIE_SEARCH_SPELLING_MIN_RESULTS rows. Original
+    matches keep their positions; corrected matches follow, without duplicates.
+    """
+
+    if not is_spelling_correction_enabled():
+        return payload
+    min_results = min(getattr(settings, "MOVIE_SEARCH_SPELLING_MIN_RESULTS", 3), telemetry.limit)
+    if len(payload) >= min_results:
+        return payload
+
+    correction_start = time.perf_counter()
+    corrected = get_spelling_dictionary().correct(telemetry.normalized_query)
+    if corrected is not None:
+        threshold, _ = _calculate_similarity_threshold(corrected)
+        seen = {row["tconst"] for row in payload}
+        additions = [row for row in run_search(corrected, threshold) if row["tconst"] not in seen]
+        payload = (payload + additions)[:telemetry.limit]
+        telemetry.extra["spelling_correction"] = corrected
+    telemetry.extra["spelling_duration_ms"] = round((time.perf_counter() - correction_start) * 1000, 2)
+    return payload
+
+
+def _search_in_memory(telemetry: SearchTelemetry) -> List[dict]:
+    """Answer a cache miss from the process-local trigram index."""
+
+    telemetry.strategy = "in_memory"
+    query_start = time.perf_counter()
+
+    index = get_movie_search_index()
+    search_start = time.perf_counter()
+    payload = index.search(
+        telemetry.normalized_query,
+        telemetry.similarity_threshold,
+        telemetry.limit,
+    )
+    telemetry.db_duration_ms = (time.perf_counter() - search_start) * 1000
+    payload = _apply_spelling_correction(
+        telemetry,
+        payload,
+        lambda corrected, threshold: index.search(corrected, threshold, telemetry.limit),
+    )
+    telemetry.result_count = len(payload)
+    telemetry.extra["index_size"] = len(index)
+
+    cache_store_start = time.perf_counter()
+    _store_results_in_cache(telemetry.cache_key, payload, telemetry.normalized_query)
+    telemetry.cache_duration_ms += (time.perf_counter() - cache_store_start) * 1000
+
+    telemetry.duration_ms = (time.perf_counter() - query_start) * 1000
+    _emit_telemetry("Movie search executed (in-memory index)", telemetry)
+    return payload
+
+
+def _serve_precomputed(telemetry: SearchTelemetry, payload: List[dict]) -> List[dict]:
+    """Answer a short query from the precomputed answer set."""
+
+    telemetry.strategy = "precomputed"
+    telemetry.result_count = len(payload)
+    cache_store_start = time.perf_counter()
+    _store_results_in_cache(telemetry.cache_key, payload, telemetry.normalized_query)
+    telemetry.cache_duration_ms += (time.perf_counter() - cache_store_start) * 1000
+    telemetry.duration_ms = telemetry.cache_duration_ms
+    _emit_telemetry("Movie search served from precomputed answers", telemetry)
+    return payload
+
+
+def _serve_cached(telemetry: SearchTelemetry, lookup: CacheLookup, cache_status: str) -> List[dict]:
+    telemetry.cache_status = cache_status
+    telemetry.cache_tier = lookup.tier
+    telemetry.result_count = len(lookup.payload or [])
+    telemetry.duration_ms = telemetry.cache_duration_ms
+    _emit_telemetry("Movie search served from cache", telemetry)
+    return lookup.payload or []
+
+
+def _build_strategy_queryset(strategy: str, search_query: str, normalized_query: str,
+                             similarity_threshold: float, limit: int,
+                             filters: SearchFilters | None = None,
+                             aka_regions: Tuple[str, ...] = ()):
+    """Build the queryset for the search plan selected by the capability probe."""
+
+    if strategy == STRATEGY_ACCENT_INSENSITIVE:
+        return _build_search_queryset(
+            _normalized_title_expression(), normalized_query, similarity_threshold, limit, filters,
+            aka_regions,
+        )
+    if strategy == STRATEGY_CASE_INSENSITIVE:
+        return _build_search_queryset(
+            Lower(F("primary_title")), search_query.lower(), similarity_threshold, limit, filters
+        )
+    # Without pg_trgm there is no similarity score: plain substring match ranked by popularity.
+    queryset = filters.apply(Movie.objects.all()) if filters is not None else Movie.objects.all()
+    return queryset.filter(
+        primary_title__icontains=search_query
+    ).order_by(
+        F("num_votes").desc(nulls_last=True),
+        "-avg_rating",
+        "-start_year",
+    ).values(*SEARCH_RESULT_FIELDS)[:limit]
+
+
+def _fetch_search_payload(telemetry: SearchTelemetry, queryset) -> List[dict]:
+    """Evaluate a search queryset and project its rows, timing each phase.
+
+    The list() forces the SQL to run, so db_duration_ms covers the actual
+    query and serialization_duration_ms only the dict projection. Durations
+    accumulate so a spelling-correction retry is included.
+    """
+
+    db_start = time.perf_counter()
+    rows = list(queryset)
+    telemetry.db_duration_ms += (time.perf_counter() - db_start) * 1000
+
+    serialization_start = time.perf_counter()
+    payload = [_project_search_row(row) for row in rows]
+    telemetry.serialization_duration_ms += (time.perf_counter() - serialization_start) * 1000
+    return payload
+
+
+def _search_database(telemetry: SearchTelemetry, search_query: str, strategy: str,
+                     filters: SearchFilters | None = None,
+                     aka_regions: Tuple[str, ...] = ()) -> List[dict]:
+    """Run the database search with the given strategy and store the payload in cache."""
+
+    telemetry.strategy = strategy
+    query_start = time.perf_counter()
+    if settings.DEBUG:
+        initial_query_count = len(getattr(connection, "queries", []))
+    else:
+        initial_query_count = None
+
+    queryset = _build_strategy_queryset(
+        strategy,
+        search_query,
+        telemetry.normalized_query,
+        telemetry.similarity_threshold,
+        telemetry.limit,
+        filters,
+        aka_regions,
+    )
+    payload = _fetch_search_payload(telemetry, queryset)
+
+    def search_corrected(corrected: str, threshold: float) -> List[dict]:
+        corrected_queryset = _build_strategy_queryset(
+            strategy, corrected, corrected, threshold, telemetry.limit, filters, aka_regions
+        )
+        return _fetch_search_payload(telemetry, corrected_queryset)
+
+    payload = _apply_spelling_correction(telemetry, payload, search_corrected)
+    telemetry.result_count = len(payload)
+
+    cache_store_start = time.perf_counter()
+    _store_results_in_cache(telemetry.cache_key, payload, telemetry.normalized_query)
+    telemetry.cache_duration_ms += (time.perf_counter() - cache_store_start) * 1000
+
+    telemetry.duration_ms = (time.perf_counter() - query_start) * 1000
+
+    if initial_query_count is not None:
+        telemetry.db_queries_count = len(getattr(connection, "queries", [])) - initial_query_count
+
+    _emit_telemetry("Movie search executed", telemetry)
+    return payload
+
+
+def _execute_search(telemetry: SearchTelemetry, search_query: str,
+                    filters: SearchFilters | None = None) -> List[dict]:
+    """Run the search against the configured backend and store the payload in cache."""
+
+    if filters is None:
+        precomputed = lookup_short_query_answer(telemetry.normalized_query, telemetry.limit)
+        if precomputed is not None:
+            return _serve_precomputed(telemetry, precomputed)
+
+    # The in-memory index only knows titles and ranking columns, so filtered
+    # searches always go to the database.
+    if is_in_memory_search_enabled() and filters is None:
+        return _search_in_memory(telemetry)
+
+    capabilities = get_search_capabilities()
+    if capabilities.missing:
+        telemetry.extra["missing_capabilities"] = capabilities.missing
+    aka_regions = _searchable_aka_regions(capabilities)
+    if aka_regions:
+        telemetry.extra["aka_regions"] = list(aka_regions)
+
+    try:
+        return _search_database(telemetry, search_query, capabilities.strategy, filters, aka_regions)
+    except DatabaseError:
+        if capabilities.strategy != STRATEGY_ACCENT_INSENSITIVE:
+            raise
+        # The function disappeared after the probe ran: downgrade once for the
+        # whole process instead of failing over on every request.
+        logger.warning(
+            "immutable_unaccent failed; switching movie search to case-insensitive matching",
+            exc_info=True,
+        )
+        capabilities = downgrade_search_capabilities()
+        telemetry.extra["fallback_reason"] = "immutable_unaccent_failure"
+        telemetry.extra["missing_capabilities"] = capabilities.missing
+        return _search_database(telemetry, search_query, capabilities.strategy, filters)
+
+
+def search_movies(search_query: str, limit: int = 20, filters: SearchFilters | None = None) -> List[dict]:
     """
     Search for movies using case-insensitive and accent-insensitive matching.
 
-    This function leverages the GIN index on
-    `public.immutable_unaccent(lower(primary_title))` for efficient searching.
+    This function leverages the GIN trigram index on the stored
+    `primary_title_normalized` column (`immutable_unaccent(lower(primary_title))`)
+    for efficient searching.
 
     Implementation uses Django's TrigramSimilarity for fuzzy matching, which works
     with the pg_trgm extension and the GIN index on the database.
@@ -129,6 +550,7 @@ def search_movies(search_query: str, limit: int = 20) -> List[dict]:
     Args:
         search_query: The search string to match against movie titles
         limit: Maximum number of results to return (default: 20)
+        filters: Optional year/genre/rating/votes filters (see SearchFilters)
 
     Returns:
         list[dict]: Serialized movie results ordered by similarity, rating, year.
@@ -138,168 +560,118 @@ def search_movies(search_query: str, limit: int = 20) -> List[dict]:
 
     Business Logic:
         - Uses PostgreSQL trigram similarity for fuzzy matching
-        - Case-insensitive and accent-insensitive search
+        - Matches primary titles and, when movie_aka is loaded, alternate titles
+          in MOVIE_SEARCH_AKA_REGIONS; each movie appears once, ranked by its
+          best-matching title
+        - Case-insensitive and accent-insensitive search; the query plan is
+          chosen once per process by probing for pg_trgm, unaccent and the
+          trigram index (see services.search_capabilities)
         - Returns movies ordered by similarity score (descending)
+        - Optionally (MOVIE_SEARCH_SPELLING_CORRECTION) retries low-hit queries
+          with typos corrected against an in-memory title-word dictionary
+        - Unfiltered 1-2 character queries are answered from a precomputed
+          answer set (see services.movie_short_query_answers) when available
         - Limits results to prevent large response sizes
-        - Caches serialized payloads for repeated queries
+        - Caches serialized payloads for repeated queries in a per-process LRU
+          and the shared cache; concurrent misses for one key are coalesced and
+          expired entries are served stale while a single request revalidates;
+          empty results and short queries are cached with their own TTLs
     """
     if not search_query or not search_query.strip():
         logger.warning("Empty search query provided to search_movies")
         return []
 
-    search_query = search_query.strip()
-    normalized_query = _normalize_search_query(search_query)
-    similarity_threshold, normalized_length = _calculate_similarity_threshold(normalized_query)
-    cache_key = _build_cache_key(normalized_query, limit)
+    if filters is not None and filters.is_empty:
+        filters = None
 
-    telemetry = SearchTelemetry(
-        query=search_query,
-        normalized_query=normalized_query,
-        limit=limit,
-        similarity_threshold=similarity_threshold,
-        query_length=normalized_length,
-        cache_key=cache_key,
-    )
+    search_query = search_query.strip()
+    telemetry = _new_telemetry(search_query, limit, filters)
+    if filters is None:
+        # Only unfiltered searches are warmed, so only they are counted.
+        record_search_query(telemetry.normalized_query, limit)
 
     cache_start = time.perf_counter()
-    cached_payload = _get_cached_results(cache_key)
+    lookup = search_cache.get(telemetry.cache_key)
     telemetry.cache_duration_ms = (time.perf_counter() - cache_start) * 1000
-    if cached_payload is not None:
-        telemetry.cache_status = "hit"
-        telemetry.result_count = len(cached_payload)
-        telemetry.duration_ms = telemetry.cache_duration_ms
-        logger.info(
-            "Movie search served from cache",
-            extra={"movie_search": telemetry.asdict()},
-        )
-        return cached_payload
-
-    telemetry.cache_status = "miss"
-
-    try:
-        query_start = time.perf_counter()
-        if settings.DEBUG:
-            initial_query_count = len(getattr(connection, "queries", []))
-        else:
-            initial_query_count = None
-
-        try:
-            connection.ensure_connection()
-        except Exception:
-            pass
-
-        title_expr = Lower(
-            models.Func(
-                F("primary_title"),
-                function="immutable_unaccent",
-                output_field=models.TextField(),
-            )
-        )
-        query_str = normalized_query
-
-        db_start = time.perf_counter()
-        queryset = Movie.objects.annotate(
-            similarity=TrigramSimilarity(title_expr, query_str)
-        ).filter(
-            similarity__gt=similarity_threshold
-        ).order_by(
-            "-similarity",
-            F("num_votes").desc(nulls_last=True),
-            "-avg_rating",
-            "-start_year",
-        ).only(
-            "tconst",
-            "primary_title",
-            "start_year",
-            "avg_rating",
-            "poster_path",
-            "num_votes",
-        )[:limit]
-        telemetry.db_duration_ms = (time.perf_counter() - db_start) * 1000
-
-        serialization_start = time.perf_counter()
-        serialized_results = list(
-            MovieSearchResultSerializer(queryset, many=True).data
-        )
-        payload: List[dict] = [dict(item) for item in serialized_results]
-        telemetry.serialization_duration_ms = (
-            time.perf_counter() - serialization_start
-        ) * 1000
-        telemetry.result_count = len(payload)
-
-        cache_store_start = time.perf_counter()
-        _store_results_in_cache(cache_key, payload)
-        telemetry.cache_duration_ms += (time.perf_counter() - cache_store_start) * 1000
+    return _search_after_lookup(telemetry, lookup, search_query, filters)
 
-        telemetry.duration_ms = (time.perf_counter() - query_start) * 1000
 
-        if initial_query_count is not None:
-            telemetry.db_queries_count = len(getattr(connection, "queries", [])) - initial_query_count
-
-        logger.info(
-            "Movie search executed",
-            extra={"movie_search": telemetry.asdict()},
-        )
-        return payload
+async def asearch_movies(search_query: str, limit: int = 20,
+                         filters: SearchFilters | None = None) -> List[dict]:
+    """
+    Async variant of `search_movies` for ASGI views.
+
+    Fresh local-tier hits are answered on the event loop. Shared-tier reads
+    go through Django's async cache API, which wraps the sync django-redis
+    client with `sync_to_async`, so they run on the sync thread.
+    Anything that needs the database (misses, revalidation, waiting for
+    another request's fill) runs the regular sync path in a worker thread,
+    since the ORM and psycopg2 are synchronous.
+    """
+    if not search_query or not search_query.strip():
+        logger.warning("Empty search query provided to asearch_movies")
+        return []
 
-    except Exception:
-        telemetry.strategy = "fallback"
-        telemetry.extra["fallback_reason"] = "immutable_unaccent_failure"
-        logger.warning(
-            "immutable_unaccent unavailable; falling back to case-insensitive search without accent removal",
-            exc_info=True,
-        )
+    if filters is not None and filters.is_empty:
+        filters = None
 
-        fallback_start = time.perf_counter()
-        if settings.DEBUG:
-            initial_query_count = len(getattr(connection, "queries", []))
-        else:
-            initial_query_count = None
-
-        title_expr = Lower(F("primary_title"))
-        query_str = search_query.lower()
-
-        db_start = time.perf_counter()
-        queryset = Movie.objects.annotate(
-            similarity=TrigramSimilarity(title_expr, query_str)
-        ).filter(
-            similarity__gt=similarity_threshold
-        ).order_by(
-            "-similarity",
-            F("num_votes").desc(nulls_last=True),
-            "-avg_rating",
-            "-start_year",
-        ).only(
-            "tconst",
-            "primary_title",
-            "start_year",
-            "avg_rating",
-            "poster_path",
-            "num_votes",
-        )[:limit]
-        telemetry.db_duration_ms = (time.perf_counter() - db_start) * 1000
-
-        serialization_start = time.perf_counter()
-        serialized_results = list(
-            MovieSearchResultSerializer(queryset, many=True).data
-        )
-        payload = [dict(item) for item in serialized_results]
-        telemetry.serialization_duration_ms = (
-            time.perf_counter() - serialization_start
-        ) * 1000
-        telemetry.result_count = len(payload)
+    search_query = search_query.strip()
+    telemetry = _new_telemetry(search_query, limit, filters)
+    if filters is None:
+        await arecord_search_query(telemetry.normalized_query, limit)
 
-        cache_store_start = time.perf_counter()
-        _store_results_in_cache(cache_key, payload)
-        telemetry.cache_duration_ms += (time.perf_counter() - cache_store_start) * 1000
+    cache_start = time.perf_counter()
+    lookup = await search_cache.aget(telemetry.cache_key)
+    telemetry.cache_duration_ms = (time.perf_counter() - cache_start) * 1000
+    if lookup.is_fresh:
+        return _serve_cached(telemetry, lookup, "hit")
+    return await sync_to_async(_search_after_lookup)(telemetry, lookup, search_query, filters)
 
-        telemetry.duration_ms = (time.perf_counter() - fallback_start) * 1000
 
-        if initial_query_count is not None:
-            telemetry.db_queries_count = len(getattr(connection, "queries", [])) - initial_query_count
+def _new_telemetry(search_query: str, limit: int, filters: SearchFilters | None) -> SearchTelemetry:
+    """Normalize the (stripped) query and start its telemetry record."""
 
-        logger.info(
-            "Movie search executed (fallback)",
-            extra={"movie_search": telemetry.asdict()},
-        )
-        return payload
+    normalized_query = _normalize_search_query(search_query)
+    similarity_threshold, normalized_length = _calculate_similarity_threshold(normalized_query)
+    telemetry = SearchTelemetry(
+        query=search_query,
+        normalized_query=normalized_query,
+        limit=limit,
+        similarity_threshold=similarity_threshold,
+        query_length=normalized_length,
+        cache_key=_build_cache_key(normalized_query, limit, filters),
+    )
+    if filters is not None:
+        telemetry.extra["filters"] = filters.asdict()
+    return telemetry
+
+
+def _search_after_lookup(telemetry: SearchTelemetry, lookup: CacheLookup, search_query: str,
+                         filters: SearchFilters | None) -> List[dict]:
+    """Serve a fresh cache entry or run the search under the single-flight lock."""
+
+    cache_key = telemetry.cache_key
+    if lookup.is_fresh:
+        return _serve_cached(telemetry, lookup, "hit")
+
+    # Single flight: only the lock holder recomputes; everyone else serves stale
+    # data or waits briefly for the holder to fill the entry.
+    locked = search_cache.try_lock(cache_key)
+    if not locked:
+        if lookup.payload is not None:
+            return _serve_cached(telemetry, lookup, "stale")
+
+        wait_start = time.perf_counter()
+        wait_seconds = getattr(settings, "MOVIE_SEARCH_CACHE_LOCK_WAIT_MS", 500) / 1000
+        filled = search_cache.wait_for_fill(cache_key, wait_seconds)
+        telemetry.cache_duration_ms += (time.perf_counter() - wait_start) * 1000
+        if filled.payload is not None:
+            return _serve_cached(telemetry, filled, "coalesced")
+        telemetry.extra["lock_wait_timed_out"] = True
+
+    telemetry.cache_status = "miss" if lookup.payload is None else "revalidate"
+    try:
+        return _execute_search(telemetry, search_query, filters)
+    finally:
+        if locked:
+            search_cache.unlock(cache_key)
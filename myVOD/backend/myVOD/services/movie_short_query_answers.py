@@ -0,0 +1,121 @@
+"""Precomputed answers for one- and two-character movie searches.
+
+Queries this short use a 0.1 similarity threshold, which the trigram index
+cannot serve, so each one scans the whole ``movie`` table; they are also the
+most repetitive (every keystroke of every search starts with one). The
+``build_short_query_answers`` command runs the regular ranked search once for
+every 1-2 character prefix of a title word and stores the top results in
+``movie_short_query_answer``. Each process loads that table into memory and
+`search_movies` answers unfiltered short queries from it without touching the
+database.
+"""
+
+import logging
+from typing import Dict, List
+
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.utils import timezone
+
+from movies.models import MovieShortQueryAnswer  # type: ignore
+from services.refreshing_holder import RefreshingHolder  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# Queries with at most this many non-space characters are "short" (threshold 0.1).
+SHORT_QUERY_MAX_LENGTH = 2
+
+SHORT_QUERY_KEYS_SQL = """
+SELECT DISTINCT left(word, lengths.n)
+FROM movie
+CROSS JOIN LATERAL regexp_split_to_table(primary_title_normalized, '[^[:alnum:]]+') AS word
+CROSS JOIN (VALUES (1), (2)) AS lengths(n)
+WHERE word <> '';
+"""
+
+
+def is_short_query(normalized_query: str) -> bool:
+    return len("".join(normalized_query.split())) <= SHORT_QUERY_MAX_LENGTH
+
+
+def _max_results() -> int:
+    return getattr(settings, "MOVIE_SEARCH_SHORT_QUERY_MAX_RESULTS", 50)
+
+
+def _load_answers(answers: Dict[str, List[dict]] | None) -> Dict[str, List[dict]]:
+    try:
+        return dict(MovieShortQueryAnswer.objects.values_list("query", "payload"))
+    except DatabaseError:
+        # Keep serving the previous copy; without one short queries hit the database.
+        logger.warning("Failed to load precomputed short query answers", exc_info=True)
+        return answers if answers is not None else {}
+
+
+_holder: RefreshingHolder[Dict[str, List[dict]]] = RefreshingHolder(
+    _load_answers, "MOVIE_SEARCH_INDEX_REFRESH_SECONDS"
+)
+
+
+def is_short_query_answers_enabled() -> bool:
+    return bool(getattr(settings, "MOVIE_SEARCH_SHORT_QUERY_ANSWERS", True))
+
+
+def lookup_short_query_answer(normalized_query: str, limit: int) -> List[dict] | None:
+    """Return the precomputed top ``limit`` results, or None if the query is not covered."""
+
+    if not is_short_query_answers_enabled() or not is_short_query(normalized_query):
+        return None
+    if limit > _max_results():
+        return None
+    payload = _holder.get().get(normalized_query)
+    return payload[:limit] if payload is not None else None
+
+
+def reset_short_query_answers() -> None:
+    """Drop the in-process copy so the next short query reloads it."""
+
+    _holder.reset()
+
+
+def rebuild_short_query_answers() -> int:
+    """Recompute the answer for every 1-2 character title-word prefix; returns keys written."""
+
+    # Imported here because movie_search_service imports this module.
+    from services.movie_search_service import (  # type: ignore
+        _build_strategy_queryset,
+        _calculate_similarity_threshold,
+        _project_search_row,
+        _searchable_aka_regions,
+    )
+    from services.search_capabilities import get_search_capabilities  # type: ignore
+
+    with connection.cursor() as cursor:
+        cursor.execute(SHORT_QUERY_KEYS_SQL)
+        keys = sorted(row[0] for row in cursor.fetchall())
+
+    capabilities = get_search_capabilities()
+    aka_regions = _searchable_aka_regions(capabilities)
+    limit = _max_results()
+    now = timezone.now()
+
+    answers = []
+    for key in keys:
+        threshold, _ = _calculate_similarity_threshold(key)
+        queryset = _build_strategy_queryset(
+            capabilities.strategy, key, key, threshold, limit, None, aka_regions
+        )
+        payload = [_project_search_row(row) for row in queryset]
+        answers.append(MovieShortQueryAnswer(query=key, payload=payload, updated_at=now))
+
+    with transaction.atomic():
+        MovieShortQueryAnswer.objects.bulk_create(
+            answers,
+            batch_size=500,
+            update_conflicts=True,
+            unique_fields=["query"],
+            update_fields=["payload", "updated_at"],
+        )
+        MovieShortQueryAnswer.objects.exclude(query__in=keys).delete()
+
+    logger.info("Rebuilt %s precomputed short query answers", len(answers))
+    return len(answers)
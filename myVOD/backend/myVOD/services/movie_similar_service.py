@@ -0,0 +1,52 @@
+"""Service layer for GET /api/movies/<tconst>/similar/.
+
+Neighbour lists are precomputed nightly by `build_movie_neighbours` (see
+movie_neighbours_service), so a request is one primary-key lookup on
+``movie_neighbour`` plus one query for the neighbours themselves, with their
+availability prefetched for the requesting user's platforms only.
+"""
+
+import logging
+from typing import List
+
+from django.db.models import Prefetch
+
+from movies.models import Movie, MovieAvailability, MovieNeighbour  # type: ignore
+from services.user_movies_service import _resolve_user_uuid  # type: ignore
+from services.user_platform_cache import get_user_platform_ids  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def get_similar_movies(*, user, tconst: str, limit: int = 20) -> List[Movie] | None:
+    """
+    Return the movies most similar to `tconst`, best first.
+
+    Args:
+        user: Authenticated user; availability is limited to their platforms
+        tconst: IMDb identifier of the reference movie
+        limit: Maximum number of movies (capped by MOVIE_NEIGHBOURS_TOP_K)
+
+    Returns:
+        list[Movie] | None: Neighbours with `availability_filtered` prefetched,
+        [] if no neighbours were computed for the movie, None if it doesn't exist
+
+    Raises:
+        DatabaseError: If there's an issue querying the database
+    """
+    neighbours = (
+        MovieNeighbour.objects.filter(tconst=tconst).values_list("neighbours", flat=True).first()
+    )
+    if neighbours is None:
+        # Only on a miss: movies below MOVIE_NEIGHBOURS_MIN_VOTES have no row.
+        return [] if Movie.objects.filter(tconst=tconst).exists() else None
+
+    neighbours = neighbours[:limit]
+    user_platforms = get_user_platform_ids(_resolve_user_uuid(user))
+    movies = Movie.objects.filter(tconst__in=neighbours).prefetch_related(Prefetch(
+        "availability_entries",
+        queryset=MovieAvailability.objects.filter(platform_id__in=user_platforms).select_related("platform"),
+        to_attr="availability_filtered",
+    ))
+    by_tconst = {movie.tconst: movie for movie in movies}
+    return [by_tconst[neighbour] for neighbour in neighbours if neighbour in by_tconst]
@@ -0,0 +1,248 @@
+"""In-process spelling dictionary used to correct typos in movie searches.
+
+This is a SymSpell-style symmetric delete dictionary over the words of
+normalized movie titles. Every vocabulary word is stored under itself and
+each of its single-character deletes (restricted to the first
+``_PREFIX_LENGTH`` characters, which bounds the key count per word). A query
+word generates the same keys; words sharing a key are within a transposition,
+substitution, insertion or deletion of it, and candidates are then confirmed
+with an optimal-string-alignment distance.
+
+Word frequency is the highest ``num_votes`` of any title containing the word,
+which prefers the spelling used by popular titles and stays idempotent when
+changed rows are re-applied. The vocabulary is capped by
+``MOVIE_SEARCH_SPELLING_MAX_WORDS`` to bound per-worker memory. Like the
+search index, a published dictionary is never modified; refreshes merge
+changed titles into a copy (`with_rows`).
+"""
+
+import logging
+import re
+import time
+from array import array
+from datetime import datetime
+from typing import Dict, Iterable, List, Set, Tuple
+
+from django.conf import settings
+
+from movies.models import Movie  # type: ignore
+from services.movie_search_index import normalize_title  # type: ignore
+from services.refreshing_holder import RefreshingHolder  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[^\W_]+")
+
+# Only the first characters of a word generate delete keys (SymSpell prefix optimisation).
+_PREFIX_LENGTH = 7
+
+# Shorter words are too ambiguous to correct.
+MIN_CORRECTABLE_LENGTH = 3
+
+SPELLING_FIELDS = ("primary_title", "num_votes", "updated_at")
+
+
+def _delete_keys(word: str) -> Set[str]:
+    prefix = word[:_PREFIX_LENGTH]
+    keys = {prefix}
+    for position in range(len(prefix)):
+        keys.add(prefix[:position] + prefix[position + 1:])
+    return keys
+
+
+def _max_distance(word: str) -> int:
+    return 2 if len(word) >= 8 else 1
+
+
+def edit_distance(source: str, target: str, max_distance: int) -> int:
+    """Optimal string alignment distance; returns ``max_distance + 1`` when exceeded."""
+
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_minimum = current[0]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (
+                i > 1 and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_minimum = min(row_minimum, value)
+        if row_minimum > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+class SpellingDictionary:
+    """Word vocabulary plus symmetric-delete lookup table."""
+
+    def __init__(self, max_words: int) -> None:
+        self.max_words = max_words
+        self._words: List[str] = []
+        self._frequencies = array("q")
+        self._word_ids: Dict[str, int] = {}
+        self._deletes: Dict[str, array] = {}
+        self.watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._word_ids
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict], max_words: int) -> "SpellingDictionary":
+        """Build from title rows, keeping the ``max_words`` most popular words."""
+
+        frequencies: Dict[str, int] = {}
+        watermark = None
+        for row in rows:
+            votes = row.get("num_votes") or 0
+            for word in _WORD_PATTERN.findall(normalize_title(row["primary_title"] or "")):
+                if votes > frequencies.get(word, -1):
+                    frequencies[word] = votes
+            updated_at = row.get("updated_at")
+            if updated_at is not None and (watermark is None or updated_at > watermark):
+                watermark = updated_at
+
+        dictionary = cls(max_words)
+        ranked = sorted(frequencies.items(), key=lambda item: (-item[1], item[0]))
+        for word, votes in ranked[:max_words]:
+            dictionary._add_word(word, votes)
+        dictionary.watermark = watermark
+        return dictionary
+
+    def with_rows(self, rows: Iterable[dict]) -> "SpellingDictionary":
+        """Return a copy with words from changed titles merged; new words are dropped once the cap is reached."""
+
+        dictionary = SpellingDictionary(self.max_words)
+        dictionary._words = self._words[:]
+        dictionary._frequencies = self._frequencies[:]
+        dictionary._word_ids = dict(self._word_ids)
+        dictionary._deletes = {key: postings[:] for key, postings in self._deletes.items()}
+        dictionary.watermark = self.watermark
+        dictionary._merge_rows(rows)
+        return dictionary
+
+    def _merge_rows(self, rows: Iterable[dict]) -> None:
+        for row in rows:
+            votes = row.get("num_votes") or 0
+            for word in _WORD_PATTERN.findall(normalize_title(row["primary_title"] or "")):
+                word_id = self._word_ids.get(word)
+                if word_id is not None:
+                    self._frequencies[word_id] = max(self._frequencies[word_id], votes)
+                elif len(self._words) < self.max_words:
+                    self._add_word(word, votes)
+            updated_at = row.get("updated_at")
+            if updated_at is not None and (self.watermark is None or updated_at > self.watermark):
+                self.watermark = updated_at
+
+    def _add_word(self, word: str, votes: int) -> None:
+        word_id = len(self._words)
+        self._words.append(word)
+        self._frequencies.append(votes)
+        self._word_ids[word] = word_id
+        for key in _delete_keys(word):
+            postings = self._deletes.get(key)
+            if postings is None:
+                postings = self._deletes[key] = array("I")
+            postings.append(word_id)
+
+    def lookup(self, word: str) -> str | None:
+        """Return the best known spelling for ``word`` or None if nothing is close."""
+
+        if word in self._word_ids:
+            return word
+        if len(word) < MIN_CORRECTABLE_LENGTH:
+            return None
+
+        max_distance = _max_distance(word)
+        candidate_ids: Set[int] = set()
+        for key in _delete_keys(word):
+            postings = self._deletes.get(key)
+            if postings is not None:
+                candidate_ids.update(postings)
+
+        best: Tuple[int, int, str] | None = None
+        for word_id in candidate_ids:
+            candidate = self._words[word_id]
+            distance = edit_distance(word, candidate, max_distance)
+            if distance > max_distance:
+                continue
+            rank = (distance, -self._frequencies[word_id], candidate)
+            if best is None or rank < best:
+                best = rank
+        return best[2] if best is not None else None
+
+    def correct(self, normalized_query: str) -> str | None:
+        """Return the query with unknown words corrected, or None if nothing changed."""
+
+        changed = False
+        corrected: List[str] = []
+        for word in _WORD_PATTERN.findall(normalized_query):
+            replacement = self.lookup(word) or word
+            changed = changed or replacement != word
+            corrected.append(replacement)
+        return " ".join(corrected) if changed else None
+
+
+def build_dictionary_from_database() -> SpellingDictionary:
+    """Build a fresh dictionary from the ``movie`` table."""
+
+    start = time.perf_counter()
+    rows = Movie.objects.values(*SPELLING_FIELDS).order_by().iterator(chunk_size=5000)
+    dictionary = SpellingDictionary.from_rows(
+        rows, getattr(settings, "MOVIE_SEARCH_SPELLING_MAX_WORDS", 50000)
+    )
+    logger.info(
+        "Built movie spelling dictionary with %s words in %.1f ms",
+        len(dictionary),
+        (time.perf_counter() - start) * 1000,
+    )
+    return dictionary
+
+
+def refresh_dictionary_from_database(dictionary: SpellingDictionary) -> SpellingDictionary:
+    """Return a copy of the dictionary with titles changed since its watermark merged."""
+
+    queryset = Movie.objects.values(*SPELLING_FIELDS).order_by()
+    if dictionary.watermark is not None:
+        queryset = queryset.filter(updated_at__gte=dictionary.watermark)
+    rows = list(queryset.iterator(chunk_size=5000))
+    return dictionary.with_rows(rows) if rows else dictionary
+
+
+def _build_or_refresh_dictionary(dictionary: SpellingDictionary | None) -> SpellingDictionary:
+    if dictionary is None:
+        return build_dictionary_from_database()
+    return refresh_dictionary_from_database(dictionary)
+
+
+_holder: RefreshingHolder[SpellingDictionary] = RefreshingHolder(
+    _build_or_refresh_dictionary, "MOVIE_SEARCH_INDEX_REFRESH_SECONDS"
+)
+
+
+def get_spelling_dictionary() -> SpellingDictionary:
+    """Return the process-wide dictionary, building or refreshing it as needed."""
+
+    return _holder.get()
+
+
+def reset_spelling_dictionary() -> None:
+    """Drop the process-wide dictionary so the next correction rebuilds it."""
+
+    _holder.reset()
+
+
+def is_spelling_correction_enabled() -> bool:
+    return bool(getattr(settings, "MOVIE_SEARCH_SPELLING_CORRECTION", False))
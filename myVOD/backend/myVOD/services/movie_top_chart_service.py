@@ -0,0 +1,107 @@
+"""Service layer for the per-platform, per-genre top charts.
+
+``movie_top_chart`` holds, for every platform and genre, the
+MOVIE_TOP_CHART_SIZE movies currently available there with the most votes
+(genre '' is the all-genres chart). It is rebuilt in one statement after
+each availability update, so browsing never joins movie_availability with
+movie or sorts the catalogue. Pages are read with keyset pagination on
+(num_votes DESC, tconst), the order of ``movie_top_chart_keyset_idx``.
+That order also merges the charts of several platforms ("top on my platforms").
+"""
+
+import logging
+from typing import List, Sequence, Tuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+
+from movies.models import MovieTopChart  # type: ignore
+from services.movie_search_service import _project_search_row  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# '' keys the all-genres chart.
+ALL_GENRES = ""
+
+REFRESH_TOP_CHARTS_SQL = """
+WITH available AS (
+    SELECT DISTINCT ma.platform_id, m.tconst, m.genres, m.num_votes
+    FROM movie_availability ma
+    JOIN movie m ON m.tconst = ma.tconst
+    WHERE ma.is_available AND m.num_votes IS NOT NULL
+),
+charted AS (
+    SELECT platform_id, '' AS genre, tconst, num_votes FROM available
+    UNION ALL
+    SELECT a.platform_id, g.genre, a.tconst, a.num_votes
+    FROM available a
+    CROSS JOIN LATERAL unnest(a.genres) AS g(genre)
+),
+ranked AS (
+    SELECT platform_id, genre, tconst, num_votes,
+           row_number() OVER (PARTITION BY platform_id, genre ORDER BY num_votes DESC, tconst) AS rank
+    FROM charted
+)
+INSERT INTO movie_top_chart (platform_id, genre, rank, tconst, num_votes)
+SELECT platform_id, genre, rank, tconst, num_votes
+FROM ranked
+WHERE rank <= %s;
+"""
+
+TopChartKey = Tuple[int, str]
+
+
+def refresh_top_charts(size: int | None = None) -> int:
+    """Rebuild every chart from current availability; returns rows written."""
+
+    size = size or getattr(settings, "MOVIE_TOP_CHART_SIZE", 500)
+    # Readers keep seeing the previous charts until the swap commits.
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute("DELETE FROM movie_top_chart;")
+        cursor.execute(REFRESH_TOP_CHARTS_SQL, [size])
+        written = cursor.rowcount
+
+    logger.info("Refreshed movie top charts", extra={"movie_top_charts": {"rows": written, "size": size}})
+    return written
+
+
+def get_top_chart(platform_ids: Sequence[int], genre: str | None = None, limit: int = 20,
+                  after: TopChartKey | None = None) -> Tuple[List[dict], TopChartKey | None]:
+    """
+    Return one page of the top chart for `platform_ids` (merged) and `genre`.
+
+    Args:
+        platform_ids: Platforms whose charts are merged
+        genre: IMDb genre, or None for all genres
+        limit: Page size
+        after: (num_votes, tconst) of the last movie on the previous page
+
+    Returns:
+        tuple: (movies in the MovieSearchResultSerializer shape, key to pass as
+        `after` for the next page or None on the last page)
+    """
+    queryset = (
+        MovieTopChart.objects.filter(platform_id__in=platform_ids, genre=genre or ALL_GENRES)
+        .values(
+            "tconst",
+            "num_votes",
+            primary_title=F("tconst__primary_title"),
+            start_year=F("tconst__start_year"),
+            avg_rating=F("tconst__avg_rating"),
+            poster_path=F("tconst__poster_path"),
+        )
+        # A movie on several of the platforms appears once.
+        .distinct()
+        .order_by("-num_votes", "tconst")
+    )
+    if after is not None:
+        num_votes, tconst = after
+        queryset = queryset.filter(Q(num_votes__lt=num_votes) | Q(num_votes=num_votes, tconst__gt=tconst))
+
+    rows = list(queryset[:limit + 1])
+    next_key = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_key = (rows[-1]["num_votes"], rows[-1]["tconst"])
+    return [_project_search_row(row) for row in rows], next_key
@@ -0,0 +1,49 @@
+"""Process-wide holder for in-memory data built from the database.
+
+The in-memory search index, the spelling dictionary and the precomputed
+short-query answers are each built on first use and rebuilt once the interval
+named by a settings key has passed. ``build`` receives the current value (None
+before the first build) and returns its replacement. The holder publishes the
+result with a single reference assignment, so readers, which take no lock,
+only ever see a complete value.
+"""
+
+import threading
+import time
+from typing import Callable, Generic, TypeVar
+
+from django.conf import settings
+
+T = TypeVar("T")
+
+
+class RefreshingHolder(Generic[T]):
+    """Lazily built value refreshed every ``getattr(settings, refresh_setting)`` seconds."""
+
+    def __init__(self, build: Callable[[T | None], T], refresh_setting: str, default_seconds: int = 300) -> None:
+        self._build = build
+        self._refresh_setting = refresh_setting
+        self._default_seconds = default_seconds
+        self._lock = threading.Lock()
+        self._value: T | None = None
+        self._last_refresh = 0.0
+
+    def _is_fresh(self) -> bool:
+        refresh_seconds = getattr(settings, self._refresh_setting, self._default_seconds)
+        return time.monotonic() - self._last_refresh < refresh_seconds
+
+    def get(self) -> T:
+        value = self._value
+        if value is not None and self._is_fresh():
+            return value
+
+        with self._lock:
+            if self._value is None or not self._is_fresh():
+                self._value = self._build(self._value)
+                self._last_refresh = time.monotonic()
+            return self._value
+
+    def reset(self) -> None:
+        with self._lock:
+            self._value = None
+            self._last_refresh = 0.0
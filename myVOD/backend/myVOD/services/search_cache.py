@@ -0,0 +1,219 @@
+"""Two-tier cache for movie search payloads.
+
+Tier 1 is a bounded, per-process LRU; tier 2 is the shared Django cache
+(Redis in production). Entries are stored in an envelope carrying a freshness
+deadline: once it passes, the entry is still served (stale-while-revalidate)
+while a single request — the one that wins the lock — recomputes it.
+
+The lock is a short-lived ``cache.add`` key, which is atomic on Redis and on
+the local-memory backend, so only one request per key hits PostgreSQL when a
+popular entry expires.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+_LOCK_SUFFIX = ":lock"
+_WAIT_POLL_SECONDS = 0.02
+
+
+@dataclass
+class CacheLookup:
+    """Result of a cache read: the payload (if any), which tier served it and whether it is stale."""
+
+    payload: List[dict] | None = None
+    tier: str | None = None
+    is_stale: bool = False
+
+    @property
+    def is_fresh(self) -> bool:
+        return self.payload is not None and not self.is_stale
+
+
+class LocalLRUCache:
+    """Thread-safe, size-bounded LRU holding cache envelopes."""
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict | None:
+        with self._lock:
+            envelope = self._entries.get(key)
+            if envelope is None:
+                return None
+            if envelope["expires_at"] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return envelope
+
+    def set(self, key: str, envelope: dict, max_entries: int) -> None:
+        if max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = envelope
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredSearchCache:
+    """Local LRU in front of the shared cache, with single-flight locking."""
+
+    def __init__(self) -> None:
+        self.local = LocalLRUCache()
+        self._stats_lock = threading.Lock()
+        self._lookups = 0
+        self._local_hits = 0
+        self._shared_lookups = 0
+        self._shared_hits = 0
+
+    # --- reads -----------------------------------------------------------------
+
+    def get(self, key: str) -> CacheLookup:
+        lookup = self._get_local(key)
+        if lookup is not None:
+            return lookup
+
+        try:
+            envelope = cache.get(key)
+        except Exception:  # pragma: no cover - defensive: cache backend failure shouldn't break search
+            logger.warning("Failed to read movie search cache for key '%s'", key, exc_info=True)
+            envelope = None
+        return self._shared_lookup(key, envelope)
+
+    async def aget(self, key: str) -> CacheLookup:
+        """Async `get`: local hits return on the event loop.
+
+        The shared tier is read through Django's async cache API, which for
+        django-redis (no native async support) is `sync_to_async` around the
+        sync client, so a shared read occupies the request's sync thread.
+        """
+
+        lookup = self._get_local(key)
+        if lookup is not None:
+            return lookup
+
+        try:
+            envelope = await cache.aget(key)
+        except Exception:  # pragma: no cover - defensive: cache backend failure shouldn't break search
+            logger.warning("Failed to read movie search cache for key '%s'", key, exc_info=True)
+            envelope = None
+        return self._shared_lookup(key, envelope)
+
+    def _get_local(self, key: str) -> CacheLookup | None:
+        envelope = self.local.get(key)
+        if envelope is None:
+            return None
+        self._record(local_hit=True)
+        return CacheLookup(payload=envelope["payload"], tier="local")
+
+    def _shared_lookup(self, key: str, envelope) -> CacheLookup:
+        if not isinstance(envelope, dict) or "payload" not in envelope:
+            self._record(local_hit=False, shared_hit=False)
+            return CacheLookup()
+
+        self._record(local_hit=False, shared_hit=True)
+        is_stale = envelope["fresh_until"] <= time.time()
+        if not is_stale:
+            self.local.set(key, self._local_envelope(envelope), self._local_max_entries())
+        return CacheLookup(payload=envelope["payload"], tier="shared", is_stale=is_stale)
+
+    def wait_for_fill(self, key: str, timeout_seconds: float) -> CacheLookup:
+        """Poll the shared tier until another request stores a fresh entry."""
+
+        deadline = time.monotonic() + timeout_seconds
+        while time.monotonic() < deadline:
+            time.sleep(_WAIT_POLL_SECONDS)
+            try:
+                envelope = cache.get(key)
+            except Exception:  # pragma: no cover - defensive
+                return CacheLookup()
+            if isinstance(envelope, dict) and envelope["fresh_until"] > time.time():
+                self.local.set(key, self._local_envelope(envelope), self._local_max_entries())
+                return CacheLookup(payload=envelope["payload"], tier="shared")
+        return CacheLookup()
+
+    # --- writes ----------------------------------------------------------------
+
+    def set(self, key: str, payload: List[dict], timeout: int) -> None:
+        now = time.time()
+        stale_seconds = getattr(settings, "MOVIE_SEARCH_CACHE_STALE_SECONDS", 300)
+        envelope = {"payload": payload, "fresh_until": now + timeout}
+        self.local.set(key, self._local_envelope(envelope), self._local_max_entries())
+        try:
+            cache.set(key, envelope, timeout + stale_seconds)
+        except Exception:  # pragma: no cover - defensive
+            logger.warning("Failed to store movie search cache for key '%s'", key, exc_info=True)
+
+    def clear(self) -> None:
+        """Clear the local tier and reset statistics (the shared tier is left untouched)."""
+
+        self.local.clear()
+        with self._stats_lock:
+            self._lookups = self._local_hits = self._shared_lookups = self._shared_hits = 0
+
+    # --- single flight ---------------------------------------------------------
+
+    def try_lock(self, key: str) -> bool:
+        lock_timeout = getattr(settings, "MOVIE_SEARCH_CACHE_LOCK_TIMEOUT", 10)
+        try:
+            return bool(cache.add(f"{key}{_LOCK_SUFFIX}", 1, lock_timeout))
+        except Exception:  # pragma: no cover - defensive: without a lock, just recompute
+            logger.warning("Failed to acquire movie search cache lock for key '%s'", key, exc_info=True)
+            return True
+
+    def unlock(self, key: str) -> None:
+        try:
+            cache.delete(f"{key}{_LOCK_SUFFIX}")
+        except Exception:  # pragma: no cover - defensive: lock expires on its own
+            logger.warning("Failed to release movie search cache lock for key '%s'", key, exc_info=True)
+
+    # --- statistics ------------------------------------------------------------
+
+    def hit_rates(self) -> Dict[str, float]:
+        """Return hit ratios per tier; the shared ratio counts only lookups that reached it."""
+
+        with self._stats_lock:
+            local_rate = self._local_hits / self._lookups if self._lookups else 0.0
+            shared_rate = self._shared_hits / self._shared_lookups if self._shared_lookups else 0.0
+        return {"local": local_rate, "shared": shared_rate}
+
+    def _record(self, *, local_hit: bool, shared_hit: bool = False) -> None:
+        with self._stats_lock:
+            self._lookups += 1
+            if local_hit:
+                self._local_hits += 1
+                return
+            self._shared_lookups += 1
+            if shared_hit:
+                self._shared_hits += 1
+
+    @staticmethod
+    def _local_envelope(envelope: dict) -> dict:
+        # Local entries never outlive their freshness: stale serving is coordinated via the shared tier.
+        return {**envelope, "expires_at": envelope["fresh_until"]}
+
+    @staticmethod
+    def _local_max_entries() -> int:
+        return getattr(settings, "MOVIE_SEARCH_LOCAL_CACHE_SIZE", 1024)
+
+
+search_cache = TieredSearchCache()
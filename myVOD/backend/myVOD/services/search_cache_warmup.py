@@ -0,0 +1,60 @@
+"""Pre-populate the movie search cache with the most frequent queries.
+
+After a deploy or a cache flush every search misses until traffic refills the
+cache. `warm_search_cache` replays the top queries recorded in
+``movie_search_query_stat`` (see services.search_query_stats) through
+`search_movies`, so the shared cache tier holds them before users ask.
+"""
+
+import logging
+import time
+from typing import Dict
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from services.movie_search_service import _build_cache_key, search_movies  # type: ignore
+from services.search_cache import search_cache  # type: ignore
+from services.search_query_stats import query_stats_paused, top_queries  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+def warm_search_cache(top_n: int | None = None, max_age_days: int | None = 7) -> Dict[str, int]:
+    """
+    Run the ``top_n`` most frequent recent searches so their results are cached.
+
+    Args:
+        top_n: Number of queries to warm (default: MOVIE_SEARCH_WARM_TOP_N)
+        max_age_days: Ignore queries not seen for this many days (None: no limit)
+
+    Returns:
+        dict: Counts of ``warmed`` queries, ``skipped`` (already fresh) and ``failed``.
+    """
+    if top_n is None:
+        top_n = getattr(settings, "MOVIE_SEARCH_WARM_TOP_N", 200)
+
+    start = time.perf_counter()
+    counts = {"warmed": 0, "skipped": 0, "failed": 0}
+    with query_stats_paused():
+        for normalized_query, limit, _hits in top_queries(top_n, max_age_days):
+            if search_cache.get(_build_cache_key(normalized_query, limit)).is_fresh:
+                counts["skipped"] += 1
+                continue
+            try:
+                search_movies(normalized_query, limit=limit)
+            except DatabaseError:
+                logger.warning("Failed to warm movie search for %r", normalized_query, exc_info=True)
+                counts["failed"] += 1
+                continue
+            counts["warmed"] += 1
+
+    logger.info(
+        "Movie search cache warmed",
+        extra={"movie_search_warmup": {
+            **counts,
+            "top_n": top_n,
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+        }},
+    )
+    return counts
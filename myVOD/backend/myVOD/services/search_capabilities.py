@@ -0,0 +1,180 @@
+"""Database capability probe for movie search.
+
+The probe runs once per process (lazily, on the first search) and records
+which PostgreSQL features the search can rely on. `search_movies` then goes
+straight to the matching query plan instead of attempting the accent-insensitive
+path and recovering from a failure on every request.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, replace
+
+from django.db import DatabaseError, connection
+
+logger = logging.getLogger(__name__)
+
+TRIGRAM_INDEX_NAME = "movie_primary_title_normalized_trgm_idx"
+
+STRATEGY_ACCENT_INSENSITIVE = "accent_insensitive"
+STRATEGY_CASE_INSENSITIVE = "case_insensitive"
+STRATEGY_SUBSTRING = "substring"
+
+CHECK_INDEX_SQL = """
+SELECT indexname
+FROM pg_indexes
+WHERE schemaname = 'public'
+  AND tablename = 'movie'
+  AND indexname = %s;
+"""
+
+CHECK_EXTENSION_SQL = """
+SELECT extname
+FROM pg_extension
+WHERE extname IN ('pg_trgm', 'unaccent');
+"""
+
+CHECK_AKA_TABLE_SQL = """
+SELECT to_regclass('public.movie_aka') IS NOT NULL;
+"""
+
+CHECK_PERSON_TABLES_SQL = """
+SELECT to_regclass('public.person') IS NOT NULL AND to_regclass('public.movie_person') IS NOT NULL;
+"""
+
+CHECK_FUNCTION_SQL = """
+SELECT 1
+FROM pg_proc
+WHERE proname = 'immutable_unaccent';
+"""
+
+
+@dataclass(frozen=True)
+class SearchCapabilities:
+    """PostgreSQL features available to movie search."""
+
+    has_pg_trgm: bool = False
+    has_unaccent: bool = False
+    has_immutable_unaccent: bool = False
+    has_trigram_index: bool = False
+    # Optional: alternate titles are searched only once movie_aka exists.
+    has_aka_table: bool = False
+    # Optional: mode=person needs the person and movie_person tables.
+    has_person_tables: bool = False
+
+    @property
+    def strategy(self) -> str:
+        """Best search plan supported by the database."""
+
+        if not self.has_pg_trgm:
+            return STRATEGY_SUBSTRING
+        if self.has_unaccent and self.has_immutable_unaccent:
+            return STRATEGY_ACCENT_INSENSITIVE
+        return STRATEGY_CASE_INSENSITIVE
+
+    @property
+    def missing(self) -> list[str]:
+        """Names of the missing features, for logs and telemetry."""
+
+        checks = {
+            "pg_trgm": self.has_pg_trgm,
+            "unaccent": self.has_unaccent,
+            "immutable_unaccent": self.has_immutable_unaccent,
+            TRIGRAM_INDEX_NAME: self.has_trigram_index,
+        }
+        return [name for name, present in checks.items() if not present]
+
+
+def probe_search_capabilities() -> SearchCapabilities:
+    """Query the catalog for the extensions, function, index and tables used by search."""
+
+    if connection.vendor != "postgresql":
+        return SearchCapabilities()
+
+    with connection.cursor() as cursor:
+        cursor.execute(CHECK_EXTENSION_SQL)
+        extensions = {row[0] for row in cursor.fetchall()}
+        cursor.execute(CHECK_FUNCTION_SQL)
+        has_function = cursor.fetchone() is not None
+        cursor.execute(CHECK_INDEX_SQL, [TRIGRAM_INDEX_NAME])
+        has_index = cursor.fetchone() is not None
+        cursor.execute(CHECK_AKA_TABLE_SQL)
+        has_aka_table = bool(cursor.fetchone()[0])
+        cursor.execute(CHECK_PERSON_TABLES_SQL)
+        has_person_tables = bool(cursor.fetchone()[0])
+
+    return SearchCapabilities(
+        has_pg_trgm="pg_trgm" in extensions,
+        has_unaccent="unaccent" in extensions,
+        has_immutable_unaccent=has_function,
+        has_trigram_index=has_index,
+        has_aka_table=has_aka_table,
+        has_person_tables=has_person_tables,
+    )
+
+
+class _CapabilitiesHolder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._capabilities: SearchCapabilities | None = None
+
+    def get(self) -> SearchCapabilities:
+        capabilities = self._capabilities
+        if capabilities is not None:
+            return capabilities
+
+        with self._lock:
+            if self._capabilities is None:
+                try:
+                    self._capabilities = probe_search_capabilities()
+                except DatabaseError:
+                    # Don't cache: the next search retries the probe.
+                    logger.warning("Movie search capability probe failed", exc_info=True)
+                    return SearchCapabilities(has_pg_trgm=True)
+                self._log(self._capabilities)
+            return self._capabilities
+
+    def downgrade(self) -> SearchCapabilities:
+        """Drop accent-insensitive support after the function failed at query time."""
+
+        with self._lock:
+            current = self._capabilities or SearchCapabilities(has_pg_trgm=True)
+            self._capabilities = replace(current, has_immutable_unaccent=False)
+            self._log(self._capabilities)
+            return self._capabilities
+
+    def reset(self) -> None:
+        with self._lock:
+            self._capabilities = None
+
+    @staticmethod
+    def _log(capabilities: SearchCapabilities) -> None:
+        if capabilities.missing:
+            logger.warning(
+                "Movie search using '%s' strategy; missing: %s",
+                capabilities.strategy,
+                ", ".join(capabilities.missing),
+            )
+        else:
+            logger.info("Movie search using '%s' strategy", capabilities.strategy)
+
+
+_holder = _CapabilitiesHolder()
+
+
+def get_search_capabilities() -> SearchCapabilities:
+    """Return the cached capabilities, probing the database on first use."""
+
+    return _holder.get()
+
+
+def downgrade_search_capabilities() -> SearchCapabilities:
+    """Stop using immutable_unaccent for the rest of the process lifetime."""
+
+    return _holder.downgrade()
+
+
+def reset_search_capabilities() -> None:
+    """Forget the cached probe result (mainly for tests)."""
+
+    _holder.reset()
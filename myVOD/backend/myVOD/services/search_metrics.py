@@ -0,0 +1,138 @@
+"""In-process metrics for movie search, exported in Prometheus text format.
+
+Every `search_movies` call records its `SearchTelemetry` here: stage durations
+go into fixed-bucket histograms and the request is counted by cache status and
+strategy. Recording is a few list increments under one lock, so it is cheap
+enough for the hot path.
+
+Values are per process. With several workers, each one reports its own series
+(scrape them individually or aggregate in Prometheus).
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Upper bounds in milliseconds; observations above the last bucket land in +Inf.
+DEFAULT_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Telemetry attribute -> (metric name, help text)
+_HISTOGRAMS = {
+    "duration_ms": (
+        "movie_search_duration_milliseconds",
+        "Total time spent in search_movies.",
+    ),
+    "db_duration_ms": (
+        "movie_search_db_duration_milliseconds",
+        "Time spent querying the database or in-memory index on cache misses.",
+    ),
+    "serialization_duration_ms": (
+        "movie_search_serialization_duration_milliseconds",
+        "Time spent serializing results on cache misses.",
+    ),
+    "cache_duration_ms": (
+        "movie_search_cache_duration_milliseconds",
+        "Time spent reading, waiting for and writing the search cache.",
+    ),
+}
+
+# Only these statuses ran the search; cache hits would record zero backend time.
+_BACKEND_CACHE_STATUSES = frozenset({"miss", "revalidate"})
+_BACKEND_STAGES = frozenset({"db_duration_ms", "serialization_duration_ms"})
+
+_REQUESTS_METRIC = "movie_search_requests_total"
+
+
+def _format_value(value: float) -> str:
+    if value == int(value):
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Histogram:
+    """Cumulative-bucket histogram; callers serialize access through the registry lock."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, self.counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{le="+Inf"}} {self.count}')
+        lines.append(f"{name}_sum {_format_value(round(self.sum, 3))}")
+        lines.append(f"{name}_count {self.count}")
+        return lines
+
+
+class SearchMetricsRegistry:
+    """Histograms per telemetry stage plus request counts by cache status and strategy."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> None:
+        self._lock = threading.Lock()
+        self._buckets = tuple(buckets)
+        self._histograms: Dict[str, Histogram] = {}
+        self._requests: Dict[Tuple[str, str], int] = {}
+        self.reset()
+
+    def observe(self, telemetry) -> None:
+        """Record one `SearchTelemetry`."""
+
+        ran_backend = telemetry.cache_status in _BACKEND_CACHE_STATUSES
+        key = (telemetry.cache_status, telemetry.strategy)
+        with self._lock:
+            for attribute, histogram in self._histograms.items():
+                if attribute in _BACKEND_STAGES and not ran_backend:
+                    continue
+                histogram.observe(getattr(telemetry, attribute))
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+    def request_counts(self) -> Dict[Tuple[str, str], int]:
+        with self._lock:
+            return dict(self._requests)
+
+    def render_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+
+        lines: List[str] = []
+        with self._lock:
+            for attribute, histogram in self._histograms.items():
+                name, help_text = _HISTOGRAMS[attribute]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                lines.extend(histogram.render(name))
+
+            lines.append(f"# HELP {_REQUESTS_METRIC} Movie searches by cache status and strategy.")
+            lines.append(f"# TYPE {_REQUESTS_METRIC} counter")
+            for (cache_status, strategy), count in sorted(self._requests.items()):
+                lines.append(
+                    f'{_REQUESTS_METRIC}{{cache_status="{_escape_label(cache_status)}",'
+                    f'strategy="{_escape_label(strategy)}"}} {count}'
+                )
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms = {attribute: Histogram(self._buckets) for attribute in _HISTOGRAMS}
+            self._requests = {}
+
+
+search_metrics = SearchMetricsRegistry()
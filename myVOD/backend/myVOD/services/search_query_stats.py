@@ -0,0 +1,205 @@
+"""Query-frequency tracking for movie search cache warmup.
+
+Each process counts unfiltered searches per (normalized query, limit) in a
+count-min sketch and keeps the heaviest keys as top-K candidates, so memory
+stays fixed however many distinct queries arrive. Every
+``MOVIE_SEARCH_QUERY_STATS_FLUSH_SECONDS`` the candidates' estimated counts
+are added to the ``movie_search_query_stat`` table. The table survives cache
+flushes and deploys, and `warm_search_cache` reads the top queries back from it.
+"""
+
+import logging
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import timedelta
+from typing import Dict, Iterator, List, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.utils import timezone
+
+from movies.models import MovieSearchQueryStat  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+SKETCH_WIDTH = 2048
+SKETCH_DEPTH = 4
+
+UPSERT_QUERY_STATS_SQL = """
+INSERT INTO movie_search_query_stat (normalized_query, result_limit, hits, last_seen_at)
+SELECT query, result_limit, hits, now()
+FROM unnest(%s::text[], %s::int[], %s::bigint[]) AS t(query, result_limit, hits)
+ON CONFLICT (normalized_query, result_limit) DO UPDATE
+SET hits = movie_search_query_stat.hits + EXCLUDED.hits,
+    last_seen_at = EXCLUDED.last_seen_at;
+"""
+
+PRUNE_QUERY_STATS_SQL = """
+DELETE FROM movie_search_query_stat
+WHERE id NOT IN (
+    SELECT id FROM movie_search_query_stat
+    ORDER BY hits DESC, last_seen_at DESC
+    LIMIT %s
+);
+"""
+
+QueryKey = Tuple[str, int]
+
+# Cleared while the warmup replays queries, so warming does not count as traffic.
+_recording: ContextVar[bool] = ContextVar("movie_search_query_stats_recording", default=True)
+
+
+class CountMinSketch:
+    """Fixed-size frequency estimator; estimates never undercount."""
+
+    def __init__(self, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH) -> None:
+        self.width = width
+        self.depth = depth
+        self._rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+
+    def add(self, key: QueryKey, count: int = 1) -> int:
+        """Add ``count`` occurrences of ``key`` and return its new estimate."""
+
+        estimate = None
+        for seed, row in enumerate(self._rows):
+            position = hash((seed, key)) % self.width
+            row[position] += count
+            if estimate is None or row[position] < estimate:
+                estimate = row[position]
+        return estimate or 0
+
+    def estimate(self, key: QueryKey) -> int:
+        return min(row[hash((seed, key)) % self.width] for seed, row in enumerate(self._rows))
+
+
+class QueryFrequencyTracker:
+    """Count-min sketch plus the ``top_k`` keys with the highest estimates."""
+
+    def __init__(self, top_k: int, width: int = SKETCH_WIDTH, depth: int = SKETCH_DEPTH) -> None:
+        self.top_k = top_k
+        self._width = width
+        self._depth = depth
+        self._lock = threading.Lock()
+        self._sketch = CountMinSketch(width, depth)
+        self._candidates: Dict[QueryKey, int] = {}
+        self._floor = 0
+        self._last_flush = time.monotonic()
+
+    def record(self, normalized_query: str, limit: int) -> None:
+        key = (normalized_query, limit)
+        with self._lock:
+            estimate = self._sketch.add(key)
+            if key in self._candidates or len(self._candidates) < self.top_k:
+                self._candidates[key] = estimate
+            elif estimate > self._floor:
+                # Only keys that beat the current minimum pay for the eviction scan.
+                del self._candidates[min(self._candidates, key=self._candidates.__getitem__)]
+                self._candidates[key] = estimate
+                self._floor = min(self._candidates.values())
+
+    def top(self) -> List[Tuple[str, int, int]]:
+        """Current candidates as (normalized_query, limit, estimated hits), most frequent first."""
+
+        with self._lock:
+            items = sorted(self._candidates.items(), key=lambda item: -item[1])
+        return [(query, limit, hits) for (query, limit), hits in items]
+
+    def due_for_flush(self, interval_seconds: float) -> bool:
+        return time.monotonic() - self._last_flush >= interval_seconds
+
+    def drain(self) -> List[Tuple[str, int, int]]:
+        """Return the candidates and start a new counting window."""
+
+        with self._lock:
+            items = [(query, limit, hits) for (query, limit), hits in self._candidates.items()]
+            self._sketch = CountMinSketch(self._width, self._depth)
+            self._candidates = {}
+            self._floor = 0
+            self._last_flush = time.monotonic()
+        return items
+
+
+_tracker = QueryFrequencyTracker(top_k=getattr(settings, "MOVIE_SEARCH_QUERY_STATS_TOP_K", 200))
+
+
+def is_query_stats_enabled() -> bool:
+    return bool(getattr(settings, "MOVIE_SEARCH_QUERY_STATS", True))
+
+
+def _count(normalized_query: str, limit: int) -> bool:
+    """Count one search; returns whether the window is due to be flushed."""
+
+    if not is_query_stats_enabled() or not _recording.get():
+        return False
+    _tracker.record(normalized_query, limit)
+    return _tracker.due_for_flush(getattr(settings, "MOVIE_SEARCH_QUERY_STATS_FLUSH_SECONDS", 60))
+
+
+def record_search_query(normalized_query: str, limit: int) -> None:
+    """Count one unfiltered search and flush the window to the database when due."""
+
+    if _count(normalized_query, limit):
+        flush_query_stats()
+
+
+async def arecord_search_query(normalized_query: str, limit: int) -> None:
+    """Async `record_search_query`; the flush runs in a worker thread."""
+
+    if _count(normalized_query, limit):
+        await sync_to_async(flush_query_stats)()
+
+
+def flush_query_stats() -> int:
+    """Add this process's counts to movie_search_query_stat; returns rows written."""
+
+    items = _tracker.drain()
+    if not items or connection.vendor != "postgresql":
+        return 0
+
+    queries, limits, hits = (list(column) for column in zip(*items))
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(UPSERT_QUERY_STATS_SQL, [queries, limits, hits])
+    except DatabaseError:
+        # Losing one window of counts is harmless; failing the search is not.
+        logger.warning("Failed to flush movie search query stats", exc_info=True)
+        return 0
+    return len(items)
+
+
+def top_queries(count: int, max_age_days: int | None = None) -> List[Tuple[str, int, int]]:
+    """Most searched (normalized_query, limit, hits), optionally only recently seen ones."""
+
+    queryset = MovieSearchQueryStat.objects.order_by("-hits", "-last_seen_at")
+    if max_age_days is not None:
+        queryset = queryset.filter(last_seen_at__gte=timezone.now() - timedelta(days=max_age_days))
+    return list(queryset.values_list("normalized_query", "result_limit", "hits")[:count])
+
+
+def prune_query_stats(keep: int) -> int:
+    """Delete all but the ``keep`` most searched rows; returns rows deleted."""
+
+    with connection.cursor() as cursor:
+        cursor.execute(PRUNE_QUERY_STATS_SQL, [keep])
+        return cursor.rowcount
+
+
+@contextmanager
+def query_stats_paused() -> Iterator[None]:
+    """Don't record searches made inside the block (used by the cache warmup)."""
+
+    token = _recording.set(False)
+    try:
+        yield
+    finally:
+        _recording.reset(token)
+
+
+def reset_query_stats() -> None:
+    """Discard the in-process counting window (mainly for tests)."""
+
+    _tracker.drain()
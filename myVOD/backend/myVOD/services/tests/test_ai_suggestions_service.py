@@ -8,6 +8,7 @@ import uuid
 from datetime import datetime, time
 from unittest.mock import Mock, patch, MagicMock
 
+from django.core.cache import cache
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.utils import timezone
@@ -27,6 +28,8 @@ from services.ai_suggestions_service import (
     _get_movie_availability,
     _log_integration_error
 )
+from services.availability_mask_service import refresh_availability_masks
+from services.user_platform_cache import user_platform_cache
 
 User = get_user_model()
 
@@ -60,6 +63,9 @@ class GetOrGenerateSuggestionsTests(TestCase):
         """Set up test data for each test."""
         # Ensure we have a real Django user with a deterministic UUID
         test_user_uuid = resolve_test_user_uuid()
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
 
         # Clean up any leftover data from previous tests
         AiSuggestionBatch.objects.filter(user_id=test_user_uuid).delete()
@@ -168,6 +174,7 @@ class GetOrGenerateSuggestionsTests(TestCase):
             source='test'
         )
 
+        refresh_availability_masks([self.movie.tconst])
         result = get_or_generate_suggestions(self.user)
 
         # Verify response structure
@@ -321,6 +328,7 @@ class GetOrGenerateSuggestionsTests(TestCase):
             source='test'
         )
 
+        refresh_availability_masks([self.movie.tconst])
         # Should succeed (not raise InsufficientDataError)
         result = get_or_generate_suggestions(self.user)
 
@@ -0,0 +1,112 @@
+"""Unit tests for availability_mask_service."""
+
+from unittest import skipUnless
+
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase
+
+from movies.models import Movie, MovieAvailability, Platform  # type: ignore
+from services.ai_suggestions_service import _get_available_movies_for_platforms  # type: ignore
+from services.availability_mask_service import (  # type: ignore
+    filter_available,
+    filter_unavailable,
+    platform_mask,
+    refresh_availability_masks,
+)
+
+
+class PlatformMaskTests(SimpleTestCase):
+    def test_one_bit_per_platform_id(self):
+        self.assertEqual(platform_mask([1, 3]), 0b1010)
+        self.assertEqual(platform_mask([]), 0)
+
+    def test_ids_beyond_the_sign_bit_are_ignored(self):
+        self.assertEqual(platform_mask([2, 63]), 0b100)
+
+    def test_filter_is_a_single_bitwise_and(self):
+        sql = str(filter_available(Movie.objects.all(), [1, 2]).query)
+
+        self.assertIn('"movie"."available_platforms" & 6', sql)
+        self.assertNotIn("movie_availability", sql)
+
+    def test_filter_repeats_the_partial_index_predicate(self):
+        sql = str(filter_available(Movie.objects.all(), [1, 2]).query)
+
+        self.assertIn('NOT ("movie"."available_platforms" = 0)', sql)
+
+
+class AvailabilityMaskTests(TestCase):
+    """Masks are recomputed from movie_availability and drive the availability filters."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.netflix, _ = Platform.objects.get_or_create(platform_slug="netflix", defaults={"platform_name": "Netflix"})
+        cls.hbo, _ = Platform.objects.get_or_create(platform_slug="hbomax", defaults={"platform_name": "HBO Max"})
+        MovieAvailability.objects.filter(tconst__startswith="tt9940").delete()
+
+        # tconst -> (num_votes, {platform: is_available})
+        movies = {
+            "tt9940001": (3000, {cls.netflix: True, cls.hbo: False}),
+            "tt9940002": (2000, {cls.netflix: False}),
+            "tt9940003": (1000, {cls.hbo: True}),
+            "tt9940004": (5000, {}),
+        }
+        for tconst, (votes, availability) in movies.items():
+            movie = Movie.objects.create(tconst=tconst, primary_title=f"MaskTest {tconst}", num_votes=votes)
+            for platform, is_available in availability.items():
+                MovieAvailability.objects.create(
+                    tconst=movie, platform=platform, is_available=is_available,
+                    last_checked="2025-01-01T00:00:00Z", source="test",
+                )
+
+    def setUp(self):
+        refresh_availability_masks()
+
+    def _movies(self):
+        return Movie.objects.filter(tconst__startswith="tt9940")
+
+    def test_refresh_sets_one_bit_per_platform(self):
+        movie = Movie.objects.get(tconst="tt9940001")
+
+        self.assertEqual(movie.available_platforms, 1 << self.netflix.id)
+        self.assertEqual(movie.unavailable_platforms, 1 << self.hbo.id)
+
+    def test_refresh_of_selected_movies_clears_removed_availability(self):
+        MovieAvailability.objects.filter(tconst="tt9940003").delete()
+
+        refresh_availability_masks(["tt9940003"])
+
+        self.assertEqual(Movie.objects.get(tconst="tt9940003").available_platforms, 0)
+
+    def test_filters_match_the_platform_mask(self):
+        platforms = [self.netflix.id]
+
+        self.assertEqual(
+            sorted(filter_available(self._movies(), platforms).values_list("tconst", flat=True)),
+            ["tt9940001"],
+        )
+        self.assertEqual(
+            sorted(filter_unavailable(self._movies(), platforms).values_list("tconst", flat=True)),
+            ["tt9940002"],
+        )
+
+    def test_ai_candidates_come_from_the_mask(self):
+        movies = _get_available_movies_for_platforms(
+            [self.netflix.id, self.hbo.id], [{"watched_at": "2025-01-01", "tconst__tconst": "tt9940003"}]
+        )
+        by_tconst = {movie["tconst"]: movie for movie in movies}
+
+        self.assertIn("tt9940001", by_tconst)
+        self.assertEqual(by_tconst["tt9940001"]["platforms"], ["Netflix"])
+        self.assertNotIn("tt9940003", by_tconst)
+        self.assertNotIn("tt9940004", by_tconst)
+
+    @skipUnless(connection.vendor == "postgresql", "partial index only exists on PostgreSQL")
+    def test_available_filter_can_use_the_partial_index(self):
+        queryset = filter_available(Movie.objects.all(), [self.netflix.id]).order_by("-num_votes")
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("movie_available_platforms_num_votes_idx", plan)
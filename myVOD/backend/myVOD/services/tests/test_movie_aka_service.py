@@ -0,0 +1,76 @@
+"""Unit tests for movie_aka_service."""
+
+import tempfile
+from pathlib import Path
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from movies.models import Movie, MovieAka  # type: ignore
+from services.movie_aka_service import (  # type: ignore
+    configured_aka_regions,
+    iter_aka_rows,
+    load_akas,
+)
+
+HEADER = "titleId\tordering\ttitle\tregion\tlanguage\ttypes\tattributes\tisOriginalTitle\n"
+
+
+def _aka(tconst, ordering, title, region):
+    return f"{tconst}\t{ordering}\t{title}\t{region}\t\\N\t\\N\t\\N\t0\n"
+
+
+class AkaParsingTests(SimpleTestCase):
+    """TSV parsing keeps only the requested regions and drops duplicates."""
+
+    def test_filters_regions_and_duplicates(self):
+        lines = [
+            HEADER,
+            _aka("tt0000001", 1, "Carmencita", "\\N"),
+            _aka("tt0000001", 2, "Karmencita", "PL"),
+            _aka("tt0000001", 3, "Karmencita", "PL"),
+            _aka("tt0000001", 4, "Carmencita", "DE"),
+        ]
+
+        self.assertEqual(
+            list(iter_aka_rows(lines, ["PL"])),
+            [("tt0000001", "PL", "Karmencita")],
+        )
+
+    def test_titles_with_quotes_are_kept_verbatim(self):
+        lines = [HEADER, _aka("tt0000002", 1, '"Ojciec chrzestny"', "PL")]
+
+        self.assertEqual(list(iter_aka_rows(lines, ["PL"]))[0][2], '"Ojciec chrzestny"')
+
+    @override_settings(MOVIE_SEARCH_AKA_REGIONS=" pl, de ,")
+    def test_configured_regions_are_normalized(self):
+        self.assertEqual(configured_aka_regions(), ("PL", "DE"))
+
+
+class AkaLoaderTests(TestCase):
+    """load_akas inserts alternate titles for known movies only."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(tconst="tt9950001", primary_title="AkaTest The Godfather")
+
+    def _write(self, *rows):
+        handle = tempfile.NamedTemporaryFile("w", suffix=".tsv", delete=False, encoding="utf-8")
+        handle.write(HEADER + "".join(rows))
+        handle.close()
+        self.addCleanup(Path(handle.name).unlink)
+        return Path(handle.name)
+
+    def test_load_skips_unknown_movies_and_primary_title_copies(self):
+        path = self._write(
+            _aka("tt9950001", 1, "AkaTest Ojciec chrzestny", "PL"),
+            _aka("tt9950001", 2, "AkaTest the godfather", "PL"),
+            _aka("tt9950999", 1, "AkaTest Nieznany", "PL"),
+        )
+
+        counts = load_akas(path, ("PL",))
+
+        self.assertEqual(counts, {"read": 3, "inserted": 1})
+        self.assertEqual(
+            list(MovieAka.objects.filter(tconst="tt9950001").values_list("title", flat=True)),
+            ["AkaTest Ojciec chrzestny"],
+        )
@@ -0,0 +1,111 @@
+"""Unit tests for movie_autocomplete_service."""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from movies.models import Movie, MovieTitlePrefix  # type: ignore
+from services.movie_autocomplete_service import (  # type: ignore
+    autocomplete_movies,
+    build_prefix_entries,
+    extract_title_prefixes,
+    refresh_prefix_table,
+)
+from services.search_cache import search_cache  # type: ignore
+
+
+def _row(tconst, title, votes):
+    return {
+        "tconst": tconst,
+        "primary_title": title,
+        "start_year": 2000,
+        "avg_rating": Decimal("7.5"),
+        "poster_path": None,
+        "num_votes": votes,
+    }
+
+
+class PrefixExtractionTests(SimpleTestCase):
+    """Prefix extraction and top-K grouping work on normalized word starts."""
+
+    def test_extracts_word_prefixes_up_to_max_length(self):
+        self.assertEqual(
+            extract_title_prefixes("the dark knight", 2),
+            {"t", "th", "d", "da", "k", "kn"},
+        )
+
+    def test_short_words_do_not_overflow(self):
+        self.assertEqual(extract_title_prefixes("up", 3), {"u", "up"})
+
+    def test_build_prefix_entries_keeps_top_k_in_input_order(self):
+        rows = [
+            _row("tt0000001", "Matrix", 300),
+            _row("tt0000002", "Mad Max", 200),
+            _row("tt0000003", "Amélie", 100),
+        ]
+
+        entries = build_prefix_entries(rows, max_length=3, top_k=1)
+
+        self.assertEqual([entry["tconst"] for entry in entries["ma"]], ["tt0000001"])
+        self.assertEqual(entries["ame"][0]["avg_rating"], "7.5")
+
+
+class MovieAutocompleteServiceTests(TestCase):
+    """
+    Test suite for autocomplete_movies and incremental prefix refreshes.
+
+    Tests cover:
+    - Short prefixes answered from the prefix table
+    - Ranking by num_votes
+    - Fallback to fuzzy search for longer queries
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.since = timezone.now() - timedelta(seconds=1)
+        Movie.objects.create(
+            tconst="tt9970001",
+            primary_title="Qzxautocomplete Popular",
+            start_year=2010,
+            avg_rating=8.0,
+            num_votes=500000,
+        )
+        Movie.objects.create(
+            tconst="tt9970002",
+            primary_title="Qzxautocomplete Niche",
+            start_year=2012,
+            avg_rating=8.5,
+            num_votes=1000,
+        )
+
+    def setUp(self):
+        cache.clear()
+        search_cache.clear()
+        refresh_prefix_table(since=self.since)
+
+    def test_prefix_lookup_ranks_by_num_votes(self):
+        results = autocomplete_movies("Qzx")
+
+        tconsts = [movie["tconst"] for movie in results]
+        self.assertEqual(tconsts[:2], ["tt9970001", "tt9970002"])
+
+    def test_prefix_lookup_is_single_query_then_cached(self):
+        with self.assertNumQueries(1):
+            autocomplete_movies("qzx")
+
+        with self.assertNumQueries(0):
+            autocomplete_movies("QZX")
+
+    def test_refresh_stores_prefix_rows(self):
+        row = MovieTitlePrefix.objects.get(prefix="qzx")
+
+        self.assertIn("tt9970001", row.tconsts)
+        self.assertEqual(row.payload[0]["tconst"], "tt9970001")
+
+    def test_longer_query_falls_back_to_search(self):
+        results = autocomplete_movies("Qzxautocomplete Popular")
+
+        self.assertEqual(results[0]["tconst"], "tt9970001")
@@ -0,0 +1,158 @@
+"""Unit tests for movie_batch_search_service."""
+
+from unittest import skipUnless
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.test import TestCase, override_settings
+
+from movies.models import Movie  # type: ignore
+from services.movie_batch_search_service import (  # type: ignore
+    BATCH_SEARCH_WITH_AKAS_SQL,
+    search_movies_batch,
+)
+from services.movie_search_service import _build_cache_key, search_movies  # type: ignore
+from services.movie_short_query_answers import (  # type: ignore
+    lookup_short_query_answer,
+    reset_short_query_answers,
+)
+from services.search_cache import search_cache  # type: ignore
+from services.search_capabilities import SearchCapabilities  # type: ignore
+
+FULL_CAPABILITIES = SearchCapabilities(
+    has_pg_trgm=True,
+    has_unaccent=True,
+    has_immutable_unaccent=True,
+    has_trigram_index=True,
+)
+
+
+@patch(
+    "services.movie_batch_search_service.get_search_capabilities",
+    return_value=FULL_CAPABILITIES,
+)
+class MovieBatchSearchServiceTests(TestCase):
+    """
+    Test suite for search_movies_batch.
+
+    Tests cover:
+    - Parity with search_movies ranking
+    - Single round trip for cache misses
+    - Cache reuse between single and batch searches
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(
+            tconst="tt9960001",
+            primary_title="BatchTest Stellar Journey",
+            start_year=2014,
+            avg_rating=8.6,
+            num_votes=250000,
+        )
+        Movie.objects.create(
+            tconst="tt9960002",
+            primary_title="BatchTest Stellar Friendship",
+            start_year=2011,
+            avg_rating=8.5,
+            num_votes=180000,
+        )
+        Movie.objects.create(
+            tconst="tt9960003",
+            primary_title="BatchTest Café París",
+            start_year=2001,
+            avg_rating=8.3,
+            num_votes=80000,
+        )
+
+    def setUp(self):
+        cache.clear()
+        search_cache.clear()
+        reset_short_query_answers()
+
+    def test_results_keyed_by_query_and_match_single_search(self, _capabilities):
+        queries = ["BatchTest Stellar", "batchtest cafe paris", "Zq"]
+
+        results = search_movies_batch(queries)
+
+        self.assertEqual(list(results), queries)
+        cache.clear()
+        search_cache.clear()
+        with patch(
+            "services.movie_search_service.get_search_capabilities",
+            return_value=FULL_CAPABILITIES,
+        ):
+            for query in queries:
+                self.assertEqual(results[query], search_movies(query))
+
+    def test_misses_resolved_in_one_query(self, _capabilities):
+        # Load the (empty) precomputed short-query answers first
+        lookup_short_query_answer("ba", 20)
+        with self.assertNumQueries(1):
+            search_movies_batch(["BatchTest Stellar Journey", "BatchTest Café", "Ba"])
+
+    def test_cached_queries_skip_the_database(self, _capabilities):
+        search_movies_batch(["BatchTest Stellar Journey"])
+
+        with self.assertNumQueries(0):
+            results = search_movies_batch(["  BatchTest Stellar Journey  "])
+
+        self.assertEqual(results["BatchTest Stellar Journey"][0]["tconst"], "tt9960001")
+
+    def test_blank_and_duplicate_queries_are_collapsed(self, _capabilities):
+        results = search_movies_batch(["BatchTest Stellar", "BatchTest Stellar", "  "])
+
+        self.assertEqual(list(results), ["BatchTest Stellar"])
+
+    def test_precomputed_short_queries_skip_the_batch(self, _capabilities):
+        answer = [{"tconst": "tt9960001", "primary_title": "BatchTest Stellar Journey"}]
+        with patch(
+            "services.movie_batch_search_service.lookup_short_query_answer",
+            side_effect=lambda normalized, limit: answer if normalized == "ba" else None,
+        ):
+            with self.assertNumQueries(0):
+                results = search_movies_batch(["Ba"])
+
+        self.assertEqual(results["Ba"], answer)
+        # Stored under the key search_movies reads
+        self.assertEqual(search_cache.get(_build_cache_key("ba", 20)).payload, answer)
+
+    def test_in_memory_mode_resolves_misses_like_search_movies(self, _capabilities):
+        with patch(
+            "services.movie_batch_search_service.is_in_memory_search_enabled", return_value=True
+        ), patch(
+            "services.movie_batch_search_service.search_movies", return_value=[]
+        ) as single_search:
+            search_movies_batch(["BatchTest Stellar", "BatchTest Café"])
+
+        self.assertEqual(
+            [call.args[0] for call in single_search.call_args_list],
+            ["BatchTest Stellar", "BatchTest Café"],
+        )
+
+    @override_settings(MOVIE_SEARCH_SPELLING_MIN_RESULTS=1)
+    def test_low_hit_queries_get_spelling_correction(self, _capabilities):
+        with patch(
+            "services.movie_batch_search_service.is_spelling_correction_enabled", return_value=True
+        ), patch(
+            "services.movie_batch_search_service.search_movies", return_value=[]
+        ) as single_search:
+            search_movies_batch(["BatchTest Stellar", "Zzqx Nothing"])
+
+        self.assertEqual([call.args[0] for call in single_search.call_args_list], ["Zzqx Nothing"])
+
+    @skipUnless(connection.vendor == "postgresql", "trigram indexes only exist on PostgreSQL")
+    def test_alternate_title_batch_does_not_scan_movie(self, _capabilities):
+        regions = ["PL"]
+        params = [["batchtest stellar"], [0.4], regions, regions, 20, [], [], regions, regions, 20]
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            cursor.execute("EXPLAIN " + BATCH_SEARCH_WITH_AKAS_SQL, params)
+            plan = "\n".join(row[0] for row in cursor.fetchall())
+
+        # Candidates come from both trigram indexes and are joined back to movie by key.
+        self.assertIn("movie_primary_title_normalized_trgm_idx", plan)
+        self.assertIn("movie_aka_title_normalized_trgm_idx", plan)
+        self.assertNotIn("Seq Scan on movie m", plan)
@@ -0,0 +1,144 @@
+"""Unit tests for movie_neighbours_service and movie_similar_service."""
+
+import uuid
+
+import numpy as np
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase
+
+from movies.models import Movie, MovieAvailability, MovieNeighbour, Platform, UserMovie, UserPlatform  # type: ignore
+from services.movie_neighbours_service import (  # type: ignore
+    Cooccurrence,
+    MovieFeatures,
+    build_movie_neighbours,
+    compute_neighbours,
+)
+from services.movie_similar_service import get_similar_movies  # type: ignore
+from services.user_platform_cache import get_user_platform_ids  # type: ignore
+
+NO_COOCCURRENCE = Cooccurrence(np.empty(0, dtype=np.int64), np.empty((0, 0), dtype=np.float32))
+
+
+def _features(genres, years, ratings):
+    genres = np.array(genres, dtype=np.float32)
+    genres /= np.linalg.norm(genres, axis=1, keepdims=True)
+    return MovieFeatures(
+        tconsts=[f"tt{index:07d}" for index in range(len(genres))],
+        genres=genres,
+        years=np.array(years, dtype=np.float32),
+        ratings=np.array(ratings, dtype=np.float32),
+        popularity=np.ones(len(genres), dtype=np.float32),
+    )
+
+
+class ComputeNeighboursTests(SimpleTestCase):
+    """Blockwise scoring ranks neighbours and never returns the movie itself."""
+
+    def test_shared_genres_and_close_years_rank_first(self):
+        features = _features(
+            genres=[[1, 0], [1, 0], [0, 1], [1, 1]],
+            years=[2000, 2001, 1950, np.nan],
+            ratings=[8.0, 7.5, 3.0, np.nan],
+        )
+
+        neighbours = {row: list(rows) for row, rows, _ in compute_neighbours(features, NO_COOCCURRENCE, 2)}
+
+        self.assertEqual(neighbours[0], [1, 3])
+        self.assertEqual(neighbours[2], [3, 1])
+        self.assertTrue(all(row not in rows for row, rows in neighbours.items()))
+
+    def test_cooccurrence_outranks_content(self):
+        features = _features(
+            genres=[[1, 0], [1, 0], [1, 0]],
+            years=[2000, 2000, 2010],
+            ratings=[7.0, 7.0, 7.0],
+        )
+        cooccurrence = Cooccurrence(np.array([0, 2]), np.array([[0, 1], [1, 0]], dtype=np.float32))
+
+        baseline = next(compute_neighbours(features, NO_COOCCURRENCE, 1))
+        boosted = next(compute_neighbours(features, cooccurrence, 1))
+
+        self.assertEqual(list(baseline[1]), [1])
+        self.assertEqual(list(boosted[1]), [2])
+
+    def test_block_size_does_not_change_results(self):
+        rng = np.random.default_rng(7)
+        features = _features(
+            genres=rng.integers(0, 2, size=(40, 5)) + np.eye(40, 5),
+            years=rng.integers(1950, 2020, size=40),
+            ratings=rng.uniform(1, 10, size=40),
+        )
+
+        whole = [list(rows) for _, rows, _ in compute_neighbours(features, NO_COOCCURRENCE, 5, block_size=64)]
+        blocked = [list(rows) for _, rows, _ in compute_neighbours(features, NO_COOCCURRENCE, 5, block_size=7)]
+
+        self.assertEqual(whole, blocked)
+
+    def test_single_movie_has_no_neighbours(self):
+        features = _features(genres=[[1, 0]], years=[2000], ratings=[7.0])
+
+        self.assertEqual(list(compute_neighbours(features, NO_COOCCURRENCE, 5)), [])
+
+
+class MovieNeighboursDatabaseTests(TestCase):
+    """build_movie_neighbours stores lists that get_similar_movies serves."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(
+            id=uuid.uuid4(), email="neighbours@example.com", username="neighbours"
+        )
+        cls.drama = Movie.objects.create(
+            tconst="tt9980001", primary_title="Neighbours Drama", genres=["Drama"],
+            start_year=2000, avg_rating="7.0", num_votes=5000,
+        )
+        cls.drama_two = Movie.objects.create(
+            tconst="tt9980002", primary_title="Neighbours Drama Two", genres=["Drama"],
+            start_year=2001, avg_rating="7.1", num_votes=4000,
+        )
+        cls.comedy = Movie.objects.create(
+            tconst="tt9980003", primary_title="Neighbours Comedy", genres=["Comedy"],
+            start_year=1980, avg_rating="5.0", num_votes=3000,
+        )
+        cls.obscure = Movie.objects.create(
+            tconst="tt9980004", primary_title="Neighbours Obscure", genres=["Drama"], num_votes=10,
+        )
+        cls.netflix, _ = Platform.objects.get_or_create(
+            platform_slug="netflix", defaults={"platform_name": "Netflix"}
+        )
+        cls.hbo, _ = Platform.objects.get_or_create(platform_slug="hbo", defaults={"platform_name": "HBO"})
+        UserPlatform.objects.create(user_id=cls.user.id, platform=cls.netflix)
+        for platform in (cls.netflix, cls.hbo):
+            MovieAvailability.objects.create(
+                tconst=cls.drama_two, platform=platform, is_available=True,
+                last_checked="2025-01-01T00:00:00Z", source="test",
+            )
+        UserMovie.objects.create(user_id=cls.user.id, tconst=cls.drama, watched_at="2025-01-01T00:00:00Z")
+
+    def test_build_and_lookup(self):
+        written = build_movie_neighbours(top_k=2, min_votes=1000)
+
+        self.assertEqual(written, 3)
+        self.assertEqual(MovieNeighbour.objects.get(tconst=self.drama.tconst).neighbours[0], self.drama_two.tconst)
+
+        # The user's platform set comes from the platform cache once warm.
+        get_user_platform_ids(self.user.id)
+        with self.assertNumQueries(3):
+            movies = get_similar_movies(user=self.user, tconst=self.drama.tconst, limit=2)
+            availability = [[entry.platform_id for entry in movie.availability_filtered] for movie in movies]
+
+        self.assertEqual([movie.tconst for movie in movies], [self.drama_two.tconst, self.comedy.tconst])
+        self.assertEqual(availability, [[self.netflix.id], []])
+
+    def test_rebuild_drops_movies_below_min_votes(self):
+        build_movie_neighbours(top_k=2, min_votes=1000)
+        build_movie_neighbours(top_k=2, min_votes=3500)
+
+        self.assertEqual(
+            sorted(MovieNeighbour.objects.values_list("tconst", flat=True)),
+            [self.drama.tconst, self.drama_two.tconst],
+        )
+
+    def test_movie_without_neighbours_returns_empty_list(self):
+        self.assertEqual(get_similar_movies(user=self.user, tconst=self.obscure.tconst), [])
+        self.assertIsNone(get_similar_movies(user=self.user, tconst="tt0000000"))
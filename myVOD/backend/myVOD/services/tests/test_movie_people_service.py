@@ -0,0 +1,128 @@
+"""Unit tests for movie_people_service and movie_person_search_service."""
+
+import tempfile
+from pathlib import Path
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+
+from movies.models import Movie, MoviePerson, Person  # type: ignore
+from services.movie_people_service import (  # type: ignore
+    iter_crew_credits,
+    iter_people,
+    iter_principal_credits,
+    load_people,
+)
+from services.movie_person_search_service import search_movies_by_person  # type: ignore
+from services.search_capabilities import reset_search_capabilities  # type: ignore
+
+PRINCIPALS_HEADER = "tconst\tordering\tnconst\tcategory\tjob\tcharacters\n"
+CREW_HEADER = "tconst\tdirectors\twriters\n"
+NAMES_HEADER = "nconst\tprimaryName\tbirthYear\tdeathYear\tprimaryProfession\tknownForTitles\n"
+
+
+def _principal(tconst, ordering, nconst, category):
+    return f"{tconst}\t{ordering}\t{nconst}\t{category}\t\\N\t\\N\n"
+
+
+def _crew(tconst, directors, writers):
+    return f"{tconst}\t{directors}\t{writers}\n"
+
+
+def _name(nconst, name):
+    return f"{nconst}\t{name}\t\\N\t\\N\t\\N\t\\N\n"
+
+
+class PeopleParsingTests(SimpleTestCase):
+    """TSV parsing keeps searchable roles only."""
+
+    def test_principals_keep_searchable_categories(self):
+        lines = [
+            PRINCIPALS_HEADER,
+            _principal("tt0000001", 1, "nm0000001", "self"),
+            _principal("tt0000001", 2, "nm0000002", "director"),
+            _principal("tt0000001", 3, "nm0000003", "actress"),
+            _principal("tt0000001", 4, "nm0000004", "composer"),
+        ]
+
+        self.assertEqual(
+            list(iter_principal_credits(lines)),
+            [("nm0000002", "tt0000001", "director"), ("nm0000003", "tt0000001", "actress")],
+        )
+
+    def test_crew_splits_directors_and_writers(self):
+        lines = [CREW_HEADER, _crew("tt0000001", "nm0000001,nm0000002", "\\N")]
+
+        self.assertEqual(
+            list(iter_crew_credits(lines)),
+            [("nm0000001", "tt0000001", "director"), ("nm0000002", "tt0000001", "director")],
+        )
+
+    def test_names_without_primary_name_are_skipped(self):
+        lines = [NAMES_HEADER, _name("nm0000001", "Fred Astaire"), _name("nm0000002", "\\N")]
+
+        self.assertEqual(list(iter_people(lines)), [("nm0000001", "Fred Astaire")])
+
+
+class PeopleLoaderTests(TestCase):
+    """load_people keeps only people credited on known movies."""
+
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(tconst="tt9960001", primary_title="PeopleTest Inception", num_votes=2000)
+        Movie.objects.create(tconst="tt9960002", primary_title="PeopleTest Memento", num_votes=1000)
+
+    def setUp(self):
+        cache.clear()
+        reset_search_capabilities()
+        self.addCleanup(reset_search_capabilities)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.data_dir = Path(directory.name)
+        self._write("title.principals.tsv", PRINCIPALS_HEADER, [
+            _principal("tt9960001", 1, "nm9960001", "director"),
+            _principal("tt9960001", 2, "nm9960002", "actor"),
+            _principal("tt9960999", 1, "nm9960003", "actor"),
+        ])
+        self._write("title.crew.tsv", CREW_HEADER, [
+            _crew("tt9960001", "nm9960001", "nm9960001"),
+            _crew("tt9960002", "nm9960001", "\\N"),
+        ])
+        self._write("name.basics.tsv", NAMES_HEADER, [
+            _name("nm9960001", "Christopher Nolán"),
+            _name("nm9960002", "Leonardo DiCaprio"),
+            _name("nm9960003", "Unknown Movie Actor"),
+        ])
+
+    def _write(self, name, header, rows):
+        (self.data_dir / name).write_text(header + "".join(rows), encoding="utf-8")
+
+    def test_load_skips_people_without_known_movies(self):
+        counts = load_people(self.data_dir)
+
+        self.assertEqual(counts["credits_read"], 6)
+        self.assertEqual(counts["people"], 2)
+        self.assertEqual(counts["credits"], 4)
+        self.assertFalse(Person.objects.filter(nconst="nm9960003").exists())
+        self.assertEqual(
+            sorted(MoviePerson.objects.filter(nconst="nm9960001").values_list("tconst", "category")),
+            [("tt9960001", "director"), ("tt9960001", "writer"), ("tt9960002", "director")],
+        )
+
+    def test_person_search_returns_filmography_by_votes(self):
+        load_people(self.data_dir)
+
+        results = search_movies_by_person("christopher nolan")
+
+        self.assertEqual([movie["tconst"] for movie in results], ["tt9960001", "tt9960002"])
+
+    def test_person_search_tolerates_typos(self):
+        load_people(self.data_dir)
+
+        results = search_movies_by_person("Leonardo DiCaprioo")
+
+        self.assertEqual([movie["tconst"] for movie in results], ["tt9960001"])
+
+    def test_short_person_query_returns_empty(self):
+        self.assertEqual(search_movies_by_person("no"), [])
@@ -0,0 +1,138 @@
+"""Unit tests for the in-memory trigram title index."""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from services.movie_search_index import (  # type: ignore
+    TrigramTitleIndex,
+    extract_trigrams,
+)
+
+
+def _row(tconst, title, *, votes=None, rating=None, year=None, updated_at=None):
+    return {
+        "tconst": tconst,
+        "primary_title": title,
+        "start_year": year,
+        "avg_rating": rating,
+        "num_votes": votes,
+        "poster_path": None,
+        "updated_at": updated_at,
+    }
+
+
+class ExtractTrigramsTests(SimpleTestCase):
+    """Trigram extraction should follow pg_trgm padding rules."""
+
+    def test_single_word_padding(self):
+        self.assertEqual(
+            extract_trigrams("cat"),
+            {"  c", " ca", "cat", "at "},
+        )
+
+    def test_words_split_on_punctuation(self):
+        self.assertEqual(extract_trigrams("a-b"), {"  a", " a ", "  b", " b "})
+
+    def test_empty_string_has_no_trigrams(self):
+        self.assertEqual(extract_trigrams("  !!  "), set())
+
+
+class TrigramTitleIndexTests(SimpleTestCase):
+    """
+    Test suite for TrigramTitleIndex.
+
+    Tests cover:
+    - Similarity filtering and ranking tie-breakers
+    - Payload shape matching MovieSearchResultSerializer
+    - Incremental upserts and watermark tracking
+    """
+
+    def setUp(self):
+        self.index = TrigramTitleIndex.from_rows([
+            _row("tt0000001", "Stellar Journey", votes=250000, rating=Decimal("8.6"), year=2014),
+            _row("tt0000002", "Stellar Friendship", votes=180000, rating=Decimal("8.5"), year=2011),
+            _row("tt0000003", "Café París", votes=80000, rating=Decimal("8.3"), year=2001),
+        ])
+
+    def test_exact_match_ranks_first(self):
+        results = self.index.search("stellar journey", 0.4, 20)
+
+        self.assertEqual(results[0]["tconst"], "tt0000001")
+
+    def test_accent_insensitive_titles(self):
+        results = self.index.search("cafe paris", 0.4, 20)
+
+        self.assertEqual([row["tconst"] for row in results], ["tt0000003"])
+
+    def test_threshold_excludes_weak_matches(self):
+        self.assertEqual(self.index.search("zzzz", 0.1, 20), [])
+
+    def test_limit_is_respected(self):
+        self.assertEqual(len(self.index.search("stellar", 0.1, 1)), 1)
+
+    def test_payload_matches_serializer_shape(self):
+        result = self.index.search("stellar journey", 0.4, 1)[0]
+
+        self.assertEqual(result, {
+            "tconst": "tt0000001",
+            "primary_title": "Stellar Journey",
+            "start_year": 2014,
+            "avg_rating": "8.6",
+            "poster_path": None,
+            "num_votes": 250000,
+        })
+
+    def test_num_votes_breaks_ties_with_nulls_last(self):
+        index = TrigramTitleIndex.from_rows([
+            _row("tt0000011", "Popularity Tie", votes=10000),
+            _row("tt0000012", "Popularity Tie", votes=None),
+            _row("tt0000013", "Popularity Tie", votes=300000),
+        ])
+
+        results = index.search("popularity tie", 0.4, 20)
+
+        self.assertEqual(
+            [row["tconst"] for row in results],
+            ["tt0000013", "tt0000011", "tt0000012"],
+        )
+
+    def test_with_rows_replaces_existing_row(self):
+        index = self.index.with_rows([_row("tt0000001", "Renamed Voyage", votes=1)])
+
+        self.assertEqual(len(index), 3)
+        self.assertNotIn(
+            "tt0000001",
+            [row["tconst"] for row in index.search("stellar journey", 0.4, 20)],
+        )
+        self.assertEqual(index.search("renamed voyage", 0.4, 20)[0]["tconst"], "tt0000001")
+
+    def test_with_rows_leaves_the_published_index_untouched(self):
+        before = self.index.search("stellar journey", 0.4, 20)
+
+        self.index.with_rows([_row("tt0000001", "Renamed Voyage", votes=1), _row("tt0000009", "Stellar Journey")])
+
+        self.assertEqual(self.index.search("stellar journey", 0.4, 20), before)
+        self.assertEqual(self.index.search("renamed voyage", 0.4, 20), [])
+
+    def test_watermark_tracks_latest_update(self):
+        earlier = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        later = datetime(2025, 2, 1, tzinfo=timezone.utc)
+
+        index = TrigramTitleIndex.from_rows([
+            _row("tt0000021", "Later", updated_at=later),
+            _row("tt0000022", "Earlier", updated_at=earlier),
+        ])
+
+        self.assertEqual(index.watermark, later)
+
+    def test_compaction_keeps_live_rows(self):
+        index = self.index
+        for _ in range(5):
+            index = index.with_rows([_row("tt0000002", "Stellar Friendship", votes=180000)])
+
+        results = index.search("stellar friendship", 0.4, 20)
+        self.assertEqual([row["tconst"] for row in results][:1], ["tt0000002"])
+        self.assertEqual(len(index), 3)
+        self.assertEqual(len(self.index), 3)
@@ -1,13 +1,32 @@
 """Unit tests for movie_search_service."""
 
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
 from django.core.cache import cache
-from django.test import TestCase
+from django.db import connection, transaction
+from django.test import SimpleTestCase, TestCase, override_settings
 
-from movies.models import Movie  # type: ignore
+from movies.models import Movie, MovieAka  # type: ignore
 from movies.serializers import MovieSearchResultSerializer
+from services.movie_search_index import reset_movie_search_index  # type: ignore
+from services.movie_spelling_index import SPELLING_FIELDS, SpellingDictionary  # type: ignore
+from services.search_cache import search_cache  # type: ignore
+from services.search_capabilities import (  # type: ignore
+    SearchCapabilities,
+    reset_search_capabilities,
+)
 from services.movie_search_service import (  # type: ignore
+    SearchFilters,
+    SearchTelemetry,
+    _build_cache_key,
+    _build_search_queryset,
+    _normalized_title_expression,
     _calculate_similarity_threshold,
+    _fetch_search_payload,
     _normalize_search_query,
+    asearch_movies,
     search_movies,
 )
 
@@ -70,6 +89,8 @@ class MovieSearchServiceTests(TestCase):
 
     def setUp(self):
         cache.clear()
+        reset_search_capabilities()
+        search_cache.clear()
 
     def test_search_with_exact_match(self):
         """Test searching for a movie with exact title match."""
@@ -229,6 +250,45 @@ class MovieSearchServiceTests(TestCase):
         with self.assertNumQueries(0):
             search_movies("TestMovie Stellar Journey")
 
+    def test_second_call_served_from_local_tier(self):
+        """A repeated search should be answered by the per-process LRU."""
+
+        search_movies("TestMovie Stellar Journey")
+        cache.clear()  # drop the shared tier; the local tier must still answer
+
+        with self.assertNumQueries(0):
+            results = search_movies("TestMovie Stellar Journey")
+
+        self.assertEqual(results[0]["tconst"], "tt9990001")
+        self.assertEqual(search_cache.hit_rates()["local"], 0.5)
+
+    def test_stale_entry_served_while_another_request_revalidates(self):
+        """Expired entries are served stale when another request holds the lock."""
+
+        cache_key = _build_cache_key("testmovie stellar journey", 20)
+        stale_payload = [{"tconst": "tt0000000"}]
+        cache.set(cache_key, {"payload": stale_payload, "fresh_until": 0}, 60)
+        self.assertTrue(search_cache.try_lock(cache_key))
+
+        try:
+            with self.assertNumQueries(0):
+                results = search_movies("TestMovie Stellar Journey")
+        finally:
+            search_cache.unlock(cache_key)
+
+        self.assertEqual(results, stale_payload)
+
+    def test_stale_entry_revalidated_by_lock_holder(self):
+        """Expired entries are recomputed when no other request is revalidating."""
+
+        cache_key = _build_cache_key("testmovie stellar journey", 20)
+        cache.set(cache_key, {"payload": [{"tconst": "tt0000000"}], "fresh_until": 0}, 60)
+
+        results = search_movies("TestMovie Stellar Journey")
+
+        self.assertEqual(results[0]["tconst"], "tt9990001")
+        self.assertEqual(cache.get(cache_key)["payload"], results)
+
     def test_similarity_threshold_selection(self):
         """Similarity threshold should scale with normalized query length."""
 
@@ -296,3 +356,219 @@ class MovieSearchServiceTests(TestCase):
         serialized_data = dict(serialized.data)
         self.assertIn("num_votes", serialized_data)
         self.assertEqual(serialized_data["num_votes"], movie.num_votes)
+
+    def test_values_projection_matches_serializer_output(self):
+        """The .values() fetch path returns exactly what the serializer would."""
+
+        results = search_movies("TestMovie Stellar Journey")
+
+        expected = dict(MovieSearchResultSerializer(Movie.objects.get(tconst="tt9990001")).data)
+        self.assertEqual(results[0], expected)
+
+    def test_in_memory_backend_matches_database_ranking(self):
+        """In-memory index should return the same ranking as the database query."""
+
+        database_results = search_movies("TestMovie Digital World")
+        cache.clear()
+        search_cache.clear()
+        reset_movie_search_index()
+
+        with override_settings(MOVIE_SEARCH_BACKEND="memory"):
+            memory_results = search_movies("TestMovie Digital World")
+
+        reset_movie_search_index()
+        self.assertEqual(
+            [movie["tconst"] for movie in memory_results],
+            [movie["tconst"] for movie in database_results],
+        )
+        self.assertEqual(memory_results[0], database_results[0])
+
+    @patch(
+        "services.movie_search_service.get_search_capabilities",
+        return_value=SearchCapabilities(has_pg_trgm=True, has_unaccent=True, has_trigram_index=True),
+    )
+    def test_probe_without_unaccent_function_goes_straight_to_case_insensitive(self, _capabilities):
+        with patch("services.movie_search_service.logger") as logger:
+            results = search_movies("TestMovie Stellar Journey")
+
+        self.assertEqual(results[0]["tconst"], "tt9990001")
+        logger.warning.assert_not_called()
+        telemetry = logger.info.call_args.kwargs["extra"]["movie_search"]
+        self.assertEqual(telemetry["strategy"], "case_insensitive")
+        self.assertEqual(telemetry["extra"]["missing_capabilities"], ["immutable_unaccent"])
+        self.assertNotIn("fallback_reason", telemetry["extra"])
+
+    @patch(
+        "services.movie_search_service.get_search_capabilities",
+        return_value=SearchCapabilities(),
+    )
+    def test_substring_strategy_without_pg_trgm(self, _capabilities):
+        results = search_movies("Digital World")
+
+        self.assertEqual(
+            [movie["tconst"] for movie in results],
+            ["tt9990004", "tt9990005"],
+        )
+
+    def test_normalized_title_column_is_maintained_by_database(self):
+        Movie.objects.create(tconst="tt9990099", primary_title="TestMovie Crème BRÛLÉE")
+
+        movie = Movie.objects.get(tconst="tt9990099")
+
+        self.assertEqual(movie.primary_title_normalized, "testmovie creme brulee")
+
+    def test_indexable_prefilter_only_above_default_pg_trgm_threshold(self):
+        long_sql = str(_build_search_queryset(_normalized_title_expression(), "stellar", 0.4, 20).query)
+        short_sql = str(_build_search_queryset(_normalized_title_expression(), "st", 0.1, 20).query)
+
+        self.assertIn('"primary_title_normalized" %', long_sql)
+        self.assertNotIn('"primary_title_normalized" %', short_sql)
+
+    def test_cache_key_includes_filters_independent_of_order(self):
+        plain = _build_cache_key("stellar", 20)
+        drama_scifi = _build_cache_key("stellar", 20, SearchFilters(genres=("Drama", "Sci-Fi"), min_votes=10))
+        scifi_drama = _build_cache_key("stellar", 20, SearchFilters(min_votes=10, genres=("Sci-Fi", "Drama")))
+
+        self.assertEqual(plain, "movie_search:stellar:20")
+        self.assertEqual(_build_cache_key("stellar", 20, SearchFilters()), plain)
+        self.assertEqual(drama_scifi, scifi_drama)
+        self.assertNotEqual(drama_scifi, plain)
+
+    def test_search_with_year_and_votes_filters(self):
+        results = search_movies(
+            "TestMovie Stellar",
+            filters=SearchFilters(year_from=2012, min_votes=200000),
+        )
+
+        self.assertEqual([movie["tconst"] for movie in results], ["tt9990001"])
+
+    def test_search_with_genres_filter_requires_all_genres(self):
+        Movie.objects.filter(tconst="tt9990004").update(genres=["Action", "Sci-Fi"])
+        Movie.objects.filter(tconst="tt9990005").update(genres=["Action"])
+
+        results = search_movies("TestMovie Digital World", filters=SearchFilters(genres=("Action", "Sci-Fi")))
+
+        self.assertEqual([movie["tconst"] for movie in results], ["tt9990004"])
+
+    def test_filtered_and_unfiltered_searches_are_cached_separately(self):
+        unfiltered = search_movies("TestMovie Stellar")
+        filtered = search_movies("TestMovie Stellar", filters=SearchFilters(min_rating=Decimal("8.6")))
+
+        self.assertGreater(len(unfiltered), len(filtered))
+        self.assertEqual([movie["tconst"] for movie in filtered], ["tt9990001"])
+
+    @override_settings(MOVIE_SEARCH_AKA_REGIONS="PL")
+    @patch(
+        "services.movie_search_service.get_search_capabilities",
+        return_value=SearchCapabilities(
+            has_pg_trgm=True,
+            has_unaccent=True,
+            has_immutable_unaccent=True,
+            has_trigram_index=True,
+            has_aka_table=True,
+        ),
+    )
+    def test_search_matches_alternate_titles_once_per_movie(self, _capabilities):
+        MovieAka.objects.create(tconst=self.movie3, region="PL", title="TestMovie Incepcja Snu")
+        MovieAka.objects.create(tconst=self.movie3, region="PL", title="TestMovie Incepcja")
+        MovieAka.objects.create(tconst=self.movie4, region="DE", title="TestMovie Incepcja")
+
+        results = search_movies("TestMovie Incepcja")
+
+        tconsts = [movie["tconst"] for movie in results]
+        self.assertEqual(tconsts[0], "tt9990003")
+        self.assertEqual(tconsts.count("tt9990003"), 1)
+        self.assertNotIn("tt9990004", tconsts[:1])
+        self.assertEqual(results[0]["primary_title"], "TestMovie Dream Within")
+
+    def test_alternate_title_candidates_are_a_union_of_indexed_matches(self):
+        sql = str(_build_search_queryset(
+            _normalized_title_expression(), "incepcja", 0.4, 20, aka_regions=("PL",)
+        ).query)
+        where = sql.split(" WHERE ", 1)[1].split(" ORDER BY ", 1)[0]
+
+        self.assertIn(" UNION ", where)
+        self.assertNotIn(" OR ", where)
+
+    @skipUnless(connection.vendor == "postgresql", "trigram indexes only exist on PostgreSQL")
+    def test_alternate_title_search_does_not_scan_movie(self):
+        queryset = _build_search_queryset(
+            _normalized_title_expression(), "testmovie incepcja", 0.4, 20, aka_regions=("PL",)
+        )
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            # Only a plan that cannot avoid it still scans the table.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            plan = queryset.explain()
+
+        self.assertIn("movie_primary_title_normalized_trgm_idx", plan)
+        self.assertIn("movie_aka_title_normalized_trgm_idx", plan)
+        self.assertNotIn("Seq Scan on movie ", plan)
+
+    @override_settings(MOVIE_SEARCH_SPELLING_CORRECTION=True)
+    def test_misspelled_query_is_retried_with_correction(self):
+        dictionary = SpellingDictionary.from_rows(Movie.objects.values(*SPELLING_FIELDS), max_words=100)
+
+        with patch("services.movie_search_service.get_spelling_dictionary", return_value=dictionary):
+            results = search_movies("Steller Jounrey")
+
+        self.assertEqual(results[0]["tconst"], "tt9990001")
+        self.assertEqual(len({movie["tconst"] for movie in results}), len(results))
+
+    @override_settings(MOVIE_SEARCH_SPELLING_CORRECTION=True)
+    def test_correction_skipped_when_search_has_enough_results(self):
+        with patch("services.movie_search_service.get_spelling_dictionary") as get_dictionary:
+            search_movies("TestMovie")
+
+        get_dictionary.assert_not_called()
+
+
+class FetchSearchPayloadTests(SimpleTestCase):
+    """The fetch phase is timed separately from the dict projection."""
+
+    def test_rows_projected_and_phases_timed_separately(self):
+        telemetry = SearchTelemetry(
+            query="matrix", normalized_query="matrix", limit=20,
+            similarity_threshold=0.4, query_length=6, cache_key="movie_search:matrix:20",
+        )
+        rows = [{
+            "tconst": "tt0133093", "primary_title": "The Matrix", "start_year": 1999,
+            "avg_rating": Decimal("8.7"), "poster_path": None, "num_votes": 2000000,
+        }]
+
+        payload = _fetch_search_payload(telemetry, rows)
+
+        self.assertEqual(payload[0]["avg_rating"], "8.7")
+        self.assertEqual(payload[0]["tconst"], "tt0133093")
+        self.assertGreater(telemetry.db_duration_ms, 0)
+        self.assertGreater(telemetry.serialization_duration_ms, 0)
+
+
+class AsyncSearchTests(SimpleTestCase):
+    """asearch_movies answers fresh cache hits without the sync path."""
+
+    def setUp(self):
+        cache.clear()
+        search_cache.clear()
+
+    async def test_fresh_hit_served_on_event_loop(self):
+        payload = [{"tconst": "tt0133093", "primary_title": "The Matrix"}]
+        search_cache.set(_build_cache_key("matrix", 20), payload, 60)
+        search_cache.local.clear()
+
+        with patch("services.movie_search_service._search_after_lookup") as sync_path:
+            results = await asearch_movies("Matrix")
+
+        self.assertEqual(results, payload)
+        sync_path.assert_not_called()
+
+    async def test_miss_runs_sync_search(self):
+        with patch(
+            "services.movie_search_service._search_after_lookup", return_value=[]
+        ) as sync_path:
+            results = await asearch_movies("Matrix")
+
+        self.assertEqual(results, [])
+        telemetry, lookup, search_query, filters = sync_path.call_args.args
+        self.assertEqual(telemetry.normalized_query, "matrix")
+        self.assertIsNone(lookup.payload)
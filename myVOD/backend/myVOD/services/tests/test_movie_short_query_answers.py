@@ -0,0 +1,113 @@
+"""Unit tests for short-query answers and the per-class cache TTL policy."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from movies.models import Movie, MovieShortQueryAnswer  # type: ignore
+from services.movie_search_service import _cache_timeout, search_movies  # type: ignore
+from services.movie_short_query_answers import (  # type: ignore
+    _load_answers,
+    is_short_query,
+    lookup_short_query_answer,
+    rebuild_short_query_answers,
+    reset_short_query_answers,
+)
+from services.search_cache import search_cache  # type: ignore
+from services.search_capabilities import reset_search_capabilities  # type: ignore
+
+ROW = {"tconst": "tt0133093", "primary_title": "The Matrix"}
+
+
+@override_settings(
+    MOVIE_SEARCH_CACHE_TIMEOUT=60,
+    MOVIE_SEARCH_CACHE_EMPTY_TIMEOUT=300,
+    MOVIE_SEARCH_CACHE_SHORT_TIMEOUT=3600,
+)
+class CacheTimeoutPolicyTests(SimpleTestCase):
+    def test_empty_results_use_empty_ttl(self):
+        self.assertEqual(_cache_timeout("qwertyuiop", []), 300)
+        self.assertEqual(_cache_timeout("qw", []), 300)
+
+    def test_short_queries_use_short_ttl(self):
+        self.assertEqual(_cache_timeout("ma", [ROW]), 3600)
+        self.assertEqual(_cache_timeout("m a", [ROW]), 3600)
+
+    def test_other_queries_use_default_ttl(self):
+        self.assertEqual(_cache_timeout("mat", [ROW]), 60)
+
+
+class ShortQueryLookupTests(SimpleTestCase):
+    def setUp(self):
+        reset_short_query_answers()
+        self.addCleanup(reset_short_query_answers)
+
+    def test_short_query_detection_ignores_spaces(self):
+        self.assertTrue(is_short_query("m"))
+        self.assertTrue(is_short_query("m a"))
+        self.assertFalse(is_short_query("mat"))
+
+    @patch("services.movie_short_query_answers._holder")
+    def test_answer_is_truncated_to_limit(self, holder):
+        holder.get.return_value = {"ma": [ROW, {**ROW, "tconst": "tt2"}]}
+
+        self.assertEqual(lookup_short_query_answer("ma", 1), [ROW])
+        self.assertIsNone(lookup_short_query_answer("mx", 1))
+
+    @patch("services.movie_short_query_answers._holder")
+    def test_long_queries_and_large_limits_are_not_covered(self, holder):
+        holder.get.return_value = {"mat": [ROW], "ma": [ROW]}
+
+        self.assertIsNone(lookup_short_query_answer("mat", 20))
+        with override_settings(MOVIE_SEARCH_SHORT_QUERY_MAX_RESULTS=10):
+            self.assertIsNone(lookup_short_query_answer("ma", 20))
+
+    @override_settings(MOVIE_SEARCH_SHORT_QUERY_ANSWERS=False)
+    @patch("services.movie_short_query_answers._holder")
+    def test_disabled_by_setting(self, holder):
+        self.assertIsNone(lookup_short_query_answer("ma", 20))
+        holder.get.assert_not_called()
+
+
+    @patch("services.movie_short_query_answers.MovieShortQueryAnswer.objects.values_list",
+           side_effect=DatabaseError("unavailable"))
+    def test_failed_reload_keeps_previous_answers(self, _values_list):
+        self.assertEqual(_load_answers({"ma": [ROW]}), {"ma": [ROW]})
+        self.assertEqual(_load_answers(None), {})
+
+
+class ShortQueryAnswerBuildTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(tconst="tt9992001", primary_title="Qz", num_votes=100)
+        Movie.objects.create(tconst="tt9992002", primary_title="Qz Qx", num_votes=50)
+
+    def setUp(self):
+        cache.clear()
+        search_cache.clear()
+        reset_search_capabilities()
+        reset_short_query_answers()
+        self.addCleanup(reset_short_query_answers)
+
+    def test_rebuild_matches_live_search(self):
+        live = search_movies("qz")
+        cache.clear()
+        search_cache.clear()
+
+        rebuild_short_query_answers()
+
+        answer = MovieShortQueryAnswer.objects.get(query="qz")
+        self.assertEqual(answer.payload[:len(live)], live)
+        self.assertTrue(MovieShortQueryAnswer.objects.filter(query="q").exists())
+
+    def test_short_search_served_without_querying_movies(self):
+        rebuild_short_query_answers()
+        reset_short_query_answers()
+        lookup_short_query_answer("qz", 20)  # load the answer set
+
+        with self.assertNumQueries(0):
+            results = search_movies("Qz")
+
+        self.assertEqual(results[0]["tconst"], "tt9992001")
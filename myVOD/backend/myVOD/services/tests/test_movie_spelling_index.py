@@ -0,0 +1,61 @@
+"""Unit tests for the in-memory spelling dictionary."""
+
+from django.test import SimpleTestCase
+
+from services.movie_spelling_index import SpellingDictionary, edit_distance  # type: ignore
+
+ROWS = [
+    {"primary_title": "The Matrix", "num_votes": 2000000, "updated_at": None},
+    {"primary_title": "Matrix Reloaded", "num_votes": 600000, "updated_at": None},
+    {"primary_title": "Interstellar", "num_votes": 1900000, "updated_at": None},
+    {"primary_title": "Amélie", "num_votes": 780000, "updated_at": None},
+    {"primary_title": "Mattrix", "num_votes": 10, "updated_at": None},
+]
+
+
+class EditDistanceTests(SimpleTestCase):
+    def test_counts_transposition_as_one_edit(self):
+        self.assertEqual(edit_distance("matirx", "matrix", 2), 1)
+
+    def test_stops_once_bound_is_exceeded(self):
+        self.assertEqual(edit_distance("matrix", "amelie", 1), 2)
+        self.assertEqual(edit_distance("a", "abcd", 1), 2)
+
+
+class SpellingDictionaryTests(SimpleTestCase):
+    def setUp(self):
+        self.dictionary = SpellingDictionary.from_rows(ROWS, max_words=100)
+
+    def test_corrects_substitution_deletion_and_transposition(self):
+        self.assertEqual(self.dictionary.lookup("matrux"), "matrix")
+        self.assertEqual(self.dictionary.lookup("matix"), "matrix")
+        self.assertEqual(self.dictionary.lookup("interstellra"), "interstellar")
+
+    def test_ties_prefer_more_popular_word(self):
+        # "matrx" is one edit from both "matrix" and "mattrix".
+        self.assertEqual(self.dictionary.lookup("matrx"), "matrix")
+
+    def test_words_are_accent_insensitive(self):
+        self.assertIn("amelie", self.dictionary)
+
+    def test_correct_returns_none_when_nothing_changes(self):
+        self.assertIsNone(self.dictionary.correct("the matrix"))
+        self.assertIsNone(self.dictionary.correct("qwertyuiop"))
+        self.assertEqual(self.dictionary.correct("teh matrxi"), "the matrix")
+
+    def test_vocabulary_is_capped_by_popularity(self):
+        dictionary = SpellingDictionary.from_rows(ROWS, max_words=2)
+
+        self.assertEqual(len(dictionary), 2)
+        self.assertIn("matrix", dictionary)
+        self.assertNotIn("mattrix", dictionary)
+
+    def test_with_rows_adds_words_until_cap(self):
+        dictionary = SpellingDictionary.from_rows(ROWS[:1], max_words=3)
+
+        merged = dictionary.with_rows([{"primary_title": "Inception Dreams", "num_votes": 5, "updated_at": None}])
+
+        self.assertEqual(len(merged), 3)
+        self.assertEqual(merged.lookup("inceptoin"), "inception")
+        self.assertNotIn("dreams", merged)
+        self.assertNotIn("inception", dictionary)
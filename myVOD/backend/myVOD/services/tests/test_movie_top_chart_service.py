@@ -0,0 +1,82 @@
+"""Unit tests for movie_top_chart_service."""
+
+from django.test import TestCase, override_settings
+
+from movies.models import Movie, MovieAvailability, MovieTopChart, Platform  # type: ignore
+from services.movie_top_chart_service import get_top_chart, refresh_top_charts  # type: ignore
+
+
+class TopChartTests(TestCase):
+    """Charts are rebuilt from availability and paged by (num_votes, tconst)."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.netflix, _ = Platform.objects.get_or_create(platform_slug="netflix", defaults={"platform_name": "Netflix"})
+        cls.hbo, _ = Platform.objects.get_or_create(platform_slug="hbomax", defaults={"platform_name": "HBO Max"})
+        MovieAvailability.objects.all().delete()
+
+        movies = [
+            ("tt9990001", ["Drama"], 5000, [cls.netflix, cls.hbo]),
+            ("tt9990002", ["Drama", "Crime"], 4000, [cls.netflix]),
+            ("tt9990003", ["Comedy"], 4000, [cls.hbo]),
+            ("tt9990004", ["Drama"], 100, [cls.netflix]),
+            ("tt9990005", ["Drama"], 9000, []),
+        ]
+        for tconst, genres, votes, platforms in movies:
+            movie = Movie.objects.create(
+                tconst=tconst, primary_title=f"ChartTest {tconst}", genres=genres, num_votes=votes
+            )
+            for platform in platforms:
+                MovieAvailability.objects.create(
+                    tconst=movie, platform=platform, is_available=True,
+                    last_checked="2025-01-01T00:00:00Z", source="test",
+                )
+        MovieAvailability.objects.create(
+            tconst_id="tt9990005", platform=cls.hbo, is_available=False,
+            last_checked="2025-01-01T00:00:00Z", source="test",
+        )
+
+    def _tconsts(self, movies):
+        return [movie["tconst"] for movie in movies]
+
+    def test_refresh_ranks_available_movies_per_platform_and_genre(self):
+        refresh_top_charts()
+
+        self.assertEqual(
+            list(MovieTopChart.objects.filter(platform=self.netflix, genre="Drama")
+                 .order_by("rank").values_list("tconst", flat=True)),
+            ["tt9990001", "tt9990002", "tt9990004"],
+        )
+        self.assertFalse(MovieTopChart.objects.filter(tconst="tt9990005").exists())
+
+    @override_settings(MOVIE_TOP_CHART_SIZE=2)
+    def test_refresh_keeps_top_n_and_replaces_previous_rows(self):
+        refresh_top_charts()
+        refresh_top_charts()
+
+        self.assertEqual(MovieTopChart.objects.filter(platform=self.netflix, genre="").count(), 2)
+
+    def test_pages_follow_the_keyset(self):
+        refresh_top_charts()
+
+        first, key = get_top_chart([self.netflix.id], limit=2)
+        second, last_key = get_top_chart([self.netflix.id], limit=2, after=key)
+
+        self.assertEqual(self._tconsts(first), ["tt9990001", "tt9990002"])
+        self.assertEqual(key, (4000, "tt9990002"))
+        self.assertEqual(self._tconsts(second), ["tt9990004"])
+        self.assertIsNone(last_key)
+
+    def test_multiple_platforms_are_merged_without_duplicates(self):
+        refresh_top_charts()
+
+        movies, _ = get_top_chart([self.netflix.id, self.hbo.id], limit=10)
+
+        self.assertEqual(self._tconsts(movies), ["tt9990001", "tt9990002", "tt9990003", "tt9990004"])
+
+    def test_genre_chart(self):
+        refresh_top_charts()
+
+        movies, _ = get_top_chart([self.netflix.id, self.hbo.id], genre="Crime", limit=10)
+
+        self.assertEqual(self._tconsts(movies), ["tt9990002"])
@@ -0,0 +1,40 @@
+"""Unit tests for refreshing_holder."""
+
+from django.test import SimpleTestCase, override_settings
+
+from services.refreshing_holder import RefreshingHolder  # type: ignore
+
+
+class RefreshingHolderTests(SimpleTestCase):
+    """Values are built once, then replaced when the interval has passed."""
+
+    def setUp(self):
+        self.calls = []
+
+        def build(previous):
+            self.calls.append(previous)
+            return len(self.calls)
+
+        self.holder = RefreshingHolder(build, "TEST_HOLDER_REFRESH_SECONDS")
+
+    @override_settings(TEST_HOLDER_REFRESH_SECONDS=300)
+    def test_value_is_built_once_within_the_interval(self):
+        self.assertEqual(self.holder.get(), 1)
+        self.assertEqual(self.holder.get(), 1)
+
+        self.assertEqual(self.calls, [None])
+
+    @override_settings(TEST_HOLDER_REFRESH_SECONDS=0)
+    def test_refresh_receives_the_current_value(self):
+        self.holder.get()
+
+        self.assertEqual(self.holder.get(), 2)
+        self.assertEqual(self.calls, [None, 1])
+
+    @override_settings(TEST_HOLDER_REFRESH_SECONDS=300)
+    def test_reset_forces_a_fresh_build(self):
+        self.holder.get()
+        self.holder.reset()
+
+        self.assertEqual(self.holder.get(), 2)
+        self.assertEqual(self.calls, [None, None])
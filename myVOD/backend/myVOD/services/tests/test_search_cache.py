@@ -0,0 +1,105 @@
+"""Unit tests for the two-tier movie search cache."""
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from services.search_cache import LocalLRUCache, TieredSearchCache  # type: ignore
+
+
+class LocalLRUCacheTests(SimpleTestCase):
+    """The local tier should evict least recently used entries and honour expiry."""
+
+    def test_evicts_least_recently_used_entry(self):
+        lru = LocalLRUCache()
+        envelope = {"payload": [], "fresh_until": 2e9, "expires_at": 2e9}
+
+        lru.set("a", envelope, max_entries=2)
+        lru.set("b", envelope, max_entries=2)
+        lru.get("a")
+        lru.set("c", envelope, max_entries=2)
+
+        self.assertIsNotNone(lru.get("a"))
+        self.assertIsNone(lru.get("b"))
+        self.assertIsNotNone(lru.get("c"))
+
+    def test_expired_entries_are_dropped(self):
+        lru = LocalLRUCache()
+        lru.set("a", {"payload": [], "fresh_until": 0, "expires_at": 0}, max_entries=2)
+
+        self.assertIsNone(lru.get("a"))
+        self.assertEqual(len(lru), 0)
+
+    def test_zero_size_disables_tier(self):
+        lru = LocalLRUCache()
+        lru.set("a", {"payload": [], "fresh_until": 2e9, "expires_at": 2e9}, max_entries=0)
+
+        self.assertIsNone(lru.get("a"))
+
+
+class TieredSearchCacheTests(SimpleTestCase):
+    """
+    Test suite for TieredSearchCache.
+
+    Tests cover:
+    - Tier selection for fresh entries
+    - Stale entries served from the shared tier
+    - Single-flight locking
+    - Per-tier hit rates
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.search_cache = TieredSearchCache()
+
+    def test_set_populates_both_tiers(self):
+        self.search_cache.set("movie_search:test:20", [{"tconst": "tt1"}], 60)
+
+        self.assertEqual(self.search_cache.get("movie_search:test:20").tier, "local")
+        self.search_cache.local.clear()
+        lookup = self.search_cache.get("movie_search:test:20")
+        self.assertEqual(lookup.tier, "shared")
+        self.assertTrue(lookup.is_fresh)
+
+    def test_expired_entry_is_returned_as_stale(self):
+        cache.set("movie_search:test:20", {"payload": [{"tconst": "tt1"}], "fresh_until": 0}, 60)
+
+        lookup = self.search_cache.get("movie_search:test:20")
+
+        self.assertTrue(lookup.is_stale)
+        self.assertFalse(lookup.is_fresh)
+        self.assertEqual(lookup.payload, [{"tconst": "tt1"}])
+
+    def test_missing_entry(self):
+        lookup = self.search_cache.get("movie_search:missing:20")
+
+        self.assertIsNone(lookup.payload)
+        self.assertIsNone(lookup.tier)
+
+    def test_lock_is_exclusive_until_released(self):
+        self.assertTrue(self.search_cache.try_lock("movie_search:test:20"))
+        self.assertFalse(self.search_cache.try_lock("movie_search:test:20"))
+
+        self.search_cache.unlock("movie_search:test:20")
+
+        self.assertTrue(self.search_cache.try_lock("movie_search:test:20"))
+
+    def test_wait_for_fill_returns_entry_stored_by_lock_holder(self):
+        self.search_cache.set("movie_search:test:20", [{"tconst": "tt1"}], 60)
+        self.search_cache.local.clear()
+
+        lookup = self.search_cache.wait_for_fill("movie_search:test:20", 0.1)
+
+        self.assertEqual(lookup.payload, [{"tconst": "tt1"}])
+
+    def test_wait_for_fill_times_out(self):
+        lookup = self.search_cache.wait_for_fill("movie_search:missing:20", 0.05)
+
+        self.assertIsNone(lookup.payload)
+
+    @override_settings(MOVIE_SEARCH_LOCAL_CACHE_SIZE=0)
+    def test_hit_rates_per_tier(self):
+        self.search_cache.get("movie_search:test:20")  # miss on both tiers
+        self.search_cache.set("movie_search:test:20", [], 60)
+        self.search_cache.get("movie_search:test:20")  # shared hit (local tier disabled)
+
+        self.assertEqual(self.search_cache.hit_rates(), {"local": 0.0, "shared": 0.5})
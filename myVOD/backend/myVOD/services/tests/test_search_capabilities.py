@@ -0,0 +1,70 @@
+"""Unit tests for the movie search capability probe."""
+
+from unittest.mock import patch
+
+from django.db import DatabaseError
+from django.test import SimpleTestCase
+
+from services.search_capabilities import (  # type: ignore
+    STRATEGY_ACCENT_INSENSITIVE,
+    STRATEGY_CASE_INSENSITIVE,
+    STRATEGY_SUBSTRING,
+    SearchCapabilities,
+    downgrade_search_capabilities,
+    get_search_capabilities,
+    reset_search_capabilities,
+)
+
+FULL = SearchCapabilities(
+    has_pg_trgm=True,
+    has_unaccent=True,
+    has_immutable_unaccent=True,
+    has_trigram_index=True,
+)
+
+
+class SearchCapabilitiesTests(SimpleTestCase):
+    """Strategy selection follows the available PostgreSQL features."""
+
+    def test_all_features_select_accent_insensitive(self):
+        self.assertEqual(FULL.strategy, STRATEGY_ACCENT_INSENSITIVE)
+        self.assertEqual(FULL.missing, [])
+
+    def test_missing_unaccent_function_selects_case_insensitive(self):
+        capabilities = SearchCapabilities(has_pg_trgm=True, has_unaccent=True)
+
+        self.assertEqual(capabilities.strategy, STRATEGY_CASE_INSENSITIVE)
+        self.assertIn("immutable_unaccent", capabilities.missing)
+
+    def test_missing_pg_trgm_selects_substring(self):
+        self.assertEqual(SearchCapabilities().strategy, STRATEGY_SUBSTRING)
+
+
+class CapabilityCachingTests(SimpleTestCase):
+    """The probe runs once per process and can be downgraded at runtime."""
+
+    def setUp(self):
+        reset_search_capabilities()
+        self.addCleanup(reset_search_capabilities)
+
+    @patch("services.search_capabilities.probe_search_capabilities", return_value=FULL)
+    def test_probe_runs_once(self, probe):
+        get_search_capabilities()
+        get_search_capabilities()
+
+        probe.assert_called_once()
+
+    @patch("services.search_capabilities.probe_search_capabilities", side_effect=DatabaseError("down"))
+    def test_failed_probe_is_retried(self, probe):
+        get_search_capabilities()
+        get_search_capabilities()
+
+        self.assertEqual(probe.call_count, 2)
+
+    @patch("services.search_capabilities.probe_search_capabilities", return_value=FULL)
+    def test_downgrade_sticks(self, probe):
+        get_search_capabilities()
+        downgrade_search_capabilities()
+
+        self.assertEqual(get_search_capabilities().strategy, STRATEGY_CASE_INSENSITIVE)
+        probe.assert_called_once()
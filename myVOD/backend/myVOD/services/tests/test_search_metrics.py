@@ -0,0 +1,68 @@
+"""Unit tests for the movie search metrics registry."""
+
+from django.test import SimpleTestCase
+
+from services.movie_search_service import SearchTelemetry  # type: ignore
+from services.search_metrics import SearchMetricsRegistry  # type: ignore
+
+
+def _telemetry(**overrides) -> SearchTelemetry:
+    values = dict(
+        query="matrix",
+        normalized_query="matrix",
+        limit=20,
+        similarity_threshold=0.4,
+        query_length=6,
+        cache_key="movie_search:matrix:20",
+    )
+    values.update(overrides)
+    return SearchTelemetry(**values)
+
+
+class SearchMetricsRegistryTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = SearchMetricsRegistry(buckets=(10, 100))
+
+    def test_histogram_buckets_are_cumulative(self):
+        self.registry.observe(_telemetry(duration_ms=5, db_duration_ms=4))
+        self.registry.observe(_telemetry(duration_ms=50, db_duration_ms=40))
+        self.registry.observe(_telemetry(duration_ms=500, db_duration_ms=400))
+
+        output = self.registry.render_prometheus()
+
+        self.assertIn("# TYPE movie_search_duration_milliseconds histogram", output)
+        self.assertIn('movie_search_duration_milliseconds_bucket{le="10"} 1', output)
+        self.assertIn('movie_search_duration_milliseconds_bucket{le="100"} 2', output)
+        self.assertIn('movie_search_duration_milliseconds_bucket{le="+Inf"} 3', output)
+        self.assertIn("movie_search_duration_milliseconds_sum 555", output)
+        self.assertIn("movie_search_duration_milliseconds_count 3", output)
+
+    def test_cache_hits_do_not_record_backend_stages(self):
+        self.registry.observe(_telemetry(cache_status="hit", duration_ms=1, cache_duration_ms=1))
+
+        output = self.registry.render_prometheus()
+
+        self.assertIn("movie_search_cache_duration_milliseconds_count 1", output)
+        self.assertIn("movie_search_db_duration_milliseconds_count 0", output)
+        self.assertIn("movie_search_serialization_duration_milliseconds_count 0", output)
+
+    def test_requests_counted_by_cache_status_and_strategy(self):
+        self.registry.observe(_telemetry(cache_status="hit"))
+        self.registry.observe(_telemetry(cache_status="hit"))
+        self.registry.observe(_telemetry(cache_status="miss", strategy="in_memory"))
+
+        self.assertEqual(self.registry.request_counts(), {
+            ("hit", "accent_insensitive"): 2,
+            ("miss", "in_memory"): 1,
+        })
+        self.assertIn(
+            'movie_search_requests_total{cache_status="hit",strategy="accent_insensitive"} 2',
+            self.registry.render_prometheus(),
+        )
+
+    def test_reset_clears_series(self):
+        self.registry.observe(_telemetry())
+        self.registry.reset()
+
+        self.assertEqual(self.registry.request_counts(), {})
+        self.assertIn("movie_search_duration_milliseconds_count 0", self.registry.render_prometheus())
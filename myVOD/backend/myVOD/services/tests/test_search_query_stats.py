@@ -0,0 +1,127 @@
+"""Unit tests for query-frequency tracking and cache warmup."""
+
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+
+from movies.models import Movie, MovieSearchQueryStat  # type: ignore
+from services.movie_search_service import _build_cache_key  # type: ignore
+from services.search_cache import search_cache  # type: ignore
+from services.search_cache_warmup import warm_search_cache  # type: ignore
+from services.search_capabilities import reset_search_capabilities  # type: ignore
+from services.search_query_stats import (  # type: ignore
+    CountMinSketch,
+    QueryFrequencyTracker,
+    flush_query_stats,
+    prune_query_stats,
+    query_stats_paused,
+    record_search_query,
+    reset_query_stats,
+    top_queries,
+)
+
+
+class CountMinSketchTests(SimpleTestCase):
+    def test_estimates_never_undercount(self):
+        sketch = CountMinSketch(width=8, depth=3)
+        for index in range(50):
+            sketch.add((f"query {index}", 20))
+        sketch.add(("matrix", 20), count=10)
+
+        self.assertGreaterEqual(sketch.estimate(("matrix", 20)), 10)
+
+    def test_exact_when_keys_do_not_collide(self):
+        sketch = CountMinSketch()
+        sketch.add(("matrix", 20), count=3)
+
+        self.assertEqual(sketch.estimate(("matrix", 20)), 3)
+        self.assertEqual(sketch.estimate(("matrix", 10)), 0)
+
+
+class QueryFrequencyTrackerTests(SimpleTestCase):
+    def test_keeps_most_frequent_keys(self):
+        tracker = QueryFrequencyTracker(top_k=2)
+        for query, count in (("matrix", 5), ("alien", 1), ("heat", 3)):
+            for _ in range(count):
+                tracker.record(query, 20)
+
+        self.assertEqual(tracker.top(), [("matrix", 20, 5), ("heat", 20, 3)])
+
+    def test_drain_starts_new_window(self):
+        tracker = QueryFrequencyTracker(top_k=10)
+        tracker.record("matrix", 20)
+
+        self.assertEqual(tracker.drain(), [("matrix", 20, 1)])
+        self.assertEqual(tracker.top(), [])
+
+    def test_paused_recording_is_ignored(self):
+        reset_query_stats()
+        self.addCleanup(reset_query_stats)
+
+        with patch("services.search_query_stats._tracker") as tracker:
+            with query_stats_paused():
+                record_search_query("matrix", 20)
+            tracker.record.assert_not_called()
+
+    @override_settings(MOVIE_SEARCH_QUERY_STATS=False)
+    def test_disabled_by_setting(self):
+        with patch("services.search_query_stats._tracker") as tracker:
+            record_search_query("matrix", 20)
+            tracker.record.assert_not_called()
+
+
+class QueryStatsPersistenceTests(TestCase):
+    def setUp(self):
+        reset_query_stats()
+        self.addCleanup(reset_query_stats)
+
+    def test_flush_accumulates_hits(self):
+        record_search_query("matrix", 20)
+        record_search_query("matrix", 20)
+        flush_query_stats()
+        record_search_query("matrix", 20)
+        flush_query_stats()
+
+        stat = MovieSearchQueryStat.objects.get(normalized_query="matrix", result_limit=20)
+        self.assertEqual(stat.hits, 3)
+
+    def test_prune_keeps_most_searched(self):
+        now = timezone.now()
+        for query, hits in (("matrix", 10), ("alien", 1), ("heat", 5)):
+            MovieSearchQueryStat.objects.create(
+                normalized_query=query, result_limit=20, hits=hits, last_seen_at=now
+            )
+
+        self.assertEqual(prune_query_stats(keep=2), 1)
+        self.assertEqual([row[0] for row in top_queries(10)], ["matrix", "heat"])
+
+
+class WarmSearchCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Movie.objects.create(tconst="tt9991001", primary_title="TestWarm Stellar Journey", num_votes=10)
+        MovieSearchQueryStat.objects.create(
+            normalized_query="testwarm stellar", result_limit=20, hits=5, last_seen_at=timezone.now()
+        )
+
+    def setUp(self):
+        cache.clear()
+        search_cache.clear()
+        reset_search_capabilities()
+        reset_query_stats()
+
+    def test_top_queries_are_cached_and_not_counted(self):
+        counts = warm_search_cache(top_n=10)
+
+        self.assertEqual(counts, {"warmed": 1, "skipped": 0, "failed": 0})
+        lookup = search_cache.get(_build_cache_key("testwarm stellar", 20))
+        self.assertTrue(lookup.is_fresh)
+        self.assertEqual(lookup.payload[0]["tconst"], "tt9991001")
+        self.assertEqual(flush_query_stats(), 0)
+
+    def test_fresh_entries_are_skipped(self):
+        warm_search_cache(top_n=10)
+
+        self.assertEqual(warm_search_cache(top_n=10)["skipped"], 1)
@@ -0,0 +1,154 @@
+"""Unit tests for user_movie_import_service."""
+
+import io
+import uuid
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from movies.models import Movie, UserMovie, UserMovieImportJob  # type: ignore
+from services.user_movie_import_service import (  # type: ignore
+    ImportFileError,
+    apply_user_movie_import,
+    get_import_status,
+    parse_imdb_csv,
+    start_user_movie_import,
+)
+
+WATCHLIST_HEADER = "Position,Const,Created,Modified,Description,Title,URL,Title Type,IMDb Rating\n"
+RATINGS_HEADER = "Const,Your Rating,Date Rated,Title,URL,Title Type,IMDb Rating\n"
+
+
+class ParseImdbCsvTests(SimpleTestCase):
+    """Only tconsts and their dates are kept from the export."""
+
+    def test_watchlist_rows_keep_created_date(self):
+        lines = io.StringIO(
+            WATCHLIST_HEADER
+            + '1,tt9920001,2021-03-04,2021-03-04,,"Title, with comma",https://imdb.com,Movie,7.5\n'
+            + "2,tt9920002,,,,Undated,https://imdb.com,Movie,6.1\n"
+        )
+
+        rows, invalid = parse_imdb_csv(lines, "watchlist")
+
+        self.assertEqual(rows, [("tt9920001", "2021-03-04"), ("tt9920002", None)])
+        self.assertEqual(invalid, 0)
+
+    def test_ratings_rows_keep_date_rated(self):
+        lines = io.StringIO(RATINGS_HEADER + "tt9920001,8,2020-12-31,Rated,https://imdb.com,Movie,7.5\n")
+
+        rows, _invalid = parse_imdb_csv(lines, "ratings")
+
+        self.assertEqual(rows, [("tt9920001", "2020-12-31")])
+
+    def test_repeats_and_invalid_tconsts(self):
+        lines = io.StringIO(
+            RATINGS_HEADER
+            + "tt9920001,8,2020-12-31,First,,Movie,7.5\n"
+            + "tt9920001,9,2021-01-01,Again,,Movie,7.5\n"
+            + "nm0000001,9,2021-01-01,Person,,Movie,7.5\n"
+        )
+
+        rows, invalid = parse_imdb_csv(lines, "ratings")
+
+        self.assertEqual(rows, [("tt9920001", "2020-12-31")])
+        self.assertEqual(invalid, 1)
+
+    def test_file_without_const_column_is_rejected(self):
+        with self.assertRaises(ImportFileError):
+            parse_imdb_csv(io.StringIO("tconst,title\ntt9920001,Title\n"), "watchlist")
+
+    def test_too_many_rows_are_rejected(self):
+        lines = io.StringIO(RATINGS_HEADER + "".join(f"tt992000{i},8,,,,,\n" for i in range(3)))
+
+        with self.assertRaises(ImportFileError):
+            parse_imdb_csv(lines, "ratings", max_rows=2)
+
+
+class ApplyUserMovieImportTests(TestCase):
+    """Validation and batched upserts against the database."""
+
+    def setUp(self):
+        self.user_id = str(uuid.uuid4())
+        self.movies = [
+            Movie.objects.create(tconst=f"tt99200{index:02d}", primary_title=f"Import Movie {index}")
+            for index in range(5)
+        ]
+
+    def test_watchlist_import_adds_new_titles_only(self):
+        existing = UserMovie.objects.create(
+            user_id=self.user_id, tconst=self.movies[0], watchlisted_at=timezone.now(),
+            watchlist_deleted_at=timezone.now(),
+        )
+        rows = [(movie.tconst, "2021-03-04") for movie in self.movies[:3]] + [("tt9929999", None)]
+
+        result = apply_user_movie_import(None, self.user_id, "watchlist", rows, batch_size=2)
+
+        self.assertEqual(result["status"], "done")
+        self.assertEqual((result["created"], result["updated"], result["unknown"]), (2, 0, 1))
+        self.assertEqual(result["processed"], 4)
+        added = UserMovie.objects.get(user_id=self.user_id, tconst=self.movies[1])
+        self.assertEqual(added.watchlisted_at.date().isoformat(), "2021-03-04")
+        self.assertIsNone(added.watched_at)
+        # Soft-deleted entries stay deleted
+        existing.refresh_from_db()
+        self.assertIsNotNone(existing.watchlist_deleted_at)
+
+    def test_ratings_import_marks_unwatched_titles_watched(self):
+        watched_at = timezone.now()
+        UserMovie.objects.create(user_id=self.user_id, tconst=self.movies[0], watchlisted_at=watched_at)
+        already = UserMovie.objects.create(
+            user_id=self.user_id, tconst=self.movies[1], watched_at=watched_at
+        )
+        rows = [(movie.tconst, None) for movie in self.movies[:3]]
+
+        result = apply_user_movie_import(None, self.user_id, "ratings", rows)
+
+        self.assertEqual((result["created"], result["updated"]), (1, 1))
+        self.assertIsNotNone(
+            UserMovie.objects.get(user_id=self.user_id, tconst=self.movies[0]).watched_at
+        )
+        already.refresh_from_db()
+        self.assertEqual(already.watched_at, watched_at)
+
+    def test_one_validation_query_then_one_query_per_batch(self):
+        rows = [(movie.tconst, None) for movie in self.movies]
+
+        with self.assertNumQueries(1 + 3):
+            apply_user_movie_import(None, self.user_id, "watchlist", rows, batch_size=2)
+
+    def test_progress_is_readable_by_the_owner_only(self):
+        rows = [(movie.tconst, None) for movie in self.movies[:2]]
+        with patch("myVOD.celery.run_user_movie_import.delay") as delay:
+            job_id = start_user_movie_import(self.user_id, "watchlist", rows)["job_id"]
+        self.assertEqual(get_import_status(job_id, self.user_id)["status"], "queued")
+
+        apply_user_movie_import(*delay.call_args.args)
+
+        status = get_import_status(job_id, self.user_id)
+        self.assertEqual(status["status"], "done")
+        self.assertEqual(status["created"], 2)
+        self.assertNotIn("user_id", status)
+        self.assertIsNone(get_import_status(job_id, str(uuid.uuid4())))
+
+    def test_job_that_cannot_be_queued_is_marked_failed(self):
+        with patch("myVOD.celery.run_user_movie_import.delay", side_effect=ConnectionError("broker down")):
+            with self.assertRaises(ConnectionError):
+                start_user_movie_import(self.user_id, "watchlist", [(self.movies[0].tconst, None)])
+
+        job = UserMovieImportJob.objects.get(user_id=self.user_id)
+        self.assertEqual(job.status, "failed")
+        self.assertIsNotNone(job.finished_at)
+
+    def test_old_finished_jobs_are_pruned_on_start(self):
+        old = UserMovieImportJob.objects.create(
+            id=uuid.uuid4(), user_id=self.user_id, kind="ratings", status="done", total=0,
+            created_at=timezone.now() - timedelta(days=3), finished_at=timezone.now() - timedelta(days=3),
+        )
+
+        with patch("myVOD.celery.run_user_movie_import.delay"):
+            start_user_movie_import(self.user_id, "watchlist", [])
+
+        self.assertFalse(UserMovieImportJob.objects.filter(id=old.id).exists())
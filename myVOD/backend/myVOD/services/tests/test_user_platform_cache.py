@@ -0,0 +1,132 @@
+"""Unit tests for user_platform_cache."""
+
+import uuid
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from movies.models import Platform, UserPlatform  # type: ignore
+from services.user_platform_cache import (  # type: ignore
+    UserPlatformCache,
+    get_user_platform_ids,
+    invalidate_user_platform_ids,
+    user_platform_cache,
+)
+from services.user_profile_service import update_user_platforms  # type: ignore
+
+
+class StubbedLoadMixin:
+    def setUp(self):
+        cache.clear()
+        self.cache = UserPlatformCache()
+        self.user_id = str(uuid.uuid4())
+        patcher = patch.object(UserPlatformCache, "_load", side_effect=lambda user_id: self.rows[:])
+        self.load = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.rows = [1, 2]
+
+
+@override_settings(USER_PLATFORM_SHARED_CACHE=True)
+class UserPlatformCacheTierTests(StubbedLoadMixin, SimpleTestCase):
+    """Tier behaviour with the database load stubbed out."""
+
+    def test_second_read_is_served_locally(self):
+        self.assertEqual(self.cache.get(self.user_id), [1, 2])
+        self.assertEqual(self.cache.get(uuid.UUID(self.user_id)), [1, 2])
+
+        self.assertEqual(self.load.call_count, 1)
+
+    def test_other_processes_share_the_entry(self):
+        self.cache.get(self.user_id)
+
+        self.assertEqual(UserPlatformCache().get(self.user_id), [1, 2])
+        self.assertEqual(self.load.call_count, 1)
+
+    @override_settings(USER_PLATFORM_LOCAL_CACHE_SECONDS=0)
+    def test_invalidation_reaches_other_processes_through_the_version(self):
+        other_process = UserPlatformCache()
+        other_process.get(self.user_id)
+
+        self.rows = [3]
+        self.cache.invalidate(self.user_id)
+
+        self.assertEqual(other_process.get(self.user_id), [3])
+
+    @override_settings(USER_PLATFORM_LOCAL_CACHE_SECONDS=0)
+    def test_unchanged_version_revalidates_without_loading(self):
+        self.cache.get(self.user_id)
+        self.cache.get(self.user_id)
+
+        self.assertEqual(self.load.call_count, 1)
+
+    def test_evicted_version_key_does_not_revive_old_entries(self):
+        self.cache.get(self.user_id)
+        cache.delete(f"user_platforms:version:{self.user_id}")
+        self.cache.clear()
+        self.rows = [4]
+
+        self.assertEqual(self.cache.get(self.user_id), [4])
+
+
+@override_settings(USER_PLATFORM_SHARED_CACHE=False)
+class UserPlatformCacheLocalOnlyTests(StubbedLoadMixin, SimpleTestCase):
+    """Without a shared cache (LocMem fallback) nothing is written to the Django cache."""
+
+    def test_fresh_local_entry_is_served(self):
+        self.cache.get(self.user_id)
+
+        self.assertEqual(self.cache.get(self.user_id), [1, 2])
+        self.assertEqual(self.load.call_count, 1)
+        self.assertIsNone(cache.get(f"user_platforms:version:{self.user_id}"))
+
+    @override_settings(USER_PLATFORM_LOCAL_CACHE_SECONDS=0)
+    def test_expired_local_entry_is_reloaded(self):
+        other_process = UserPlatformCache()
+        other_process.get(self.user_id)
+
+        self.rows = [3]
+        self.cache.invalidate(self.user_id)
+
+        self.assertEqual(other_process.get(self.user_id), [3])
+        self.assertEqual(self.load.call_count, 2)
+
+
+class UserPlatformCacheDatabaseTests(TestCase):
+    """The accessor replaces per-request user_platform queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create(
+            id=uuid.uuid4(), email="platformcache@example.com", username="platformcache"
+        )
+        cls.netflix, _ = Platform.objects.get_or_create(platform_slug="netflix", defaults={"platform_name": "Netflix"})
+        cls.hbo, _ = Platform.objects.get_or_create(platform_slug="hbomax", defaults={"platform_name": "HBO Max"})
+        UserPlatform.objects.create(user_id=cls.user.id, platform=cls.netflix)
+
+    def setUp(self):
+        cache.clear()
+        user_platform_cache.clear()
+
+    def test_platform_ids_are_queried_once(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(get_user_platform_ids(self.user.id), [self.netflix.id])
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_user_platform_ids(str(self.user.id)), [self.netflix.id])
+
+    def test_update_user_platforms_invalidates(self):
+        get_user_platform_ids(self.user.id)
+
+        update_user_platforms(self.user, [self.netflix.id, self.hbo.id])
+
+        self.assertEqual(get_user_platform_ids(self.user.id), sorted([self.netflix.id, self.hbo.id]))
+
+    def test_invalidate_forgets_direct_writes(self):
+        get_user_platform_ids(self.user.id)
+        UserPlatform.objects.filter(user_id=self.user.id).delete()
+
+        invalidate_user_platform_ids(self.user.id)
+
+        self.assertEqual(get_user_platform_ids(self.user.id), [])
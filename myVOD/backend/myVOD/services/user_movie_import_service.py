@@ -0,0 +1,239 @@
+"""Imports IMDb watchlist and ratings CSV exports into ``user_movie``.
+
+The upload view streams the CSV through `parse_imdb_csv`, which keeps only
+(tconst, date) per title. It then hands the rows to a Celery job
+(`start_user_movie_import`, which runs `apply_user_movie_import`), so the
+database work never runs on a web worker.
+The job checks every tconst against ``movie`` with one query. It then upserts
+the known titles with ``INSERT ... ON CONFLICT`` in batches of
+USER_MOVIE_IMPORT_BATCH_SIZE. After each batch it writes the job's progress to
+its ``user_movie_import_job`` row, where GET /api/user-movies/import/<job_id>/
+reads it. The row lives in the database rather than the cache, so the web
+process and the worker agree on it even without a shared cache.
+
+- watchlist: adds titles the user doesn't have yet (dated by "Created").
+  Existing entries, including soft-deleted ones, are left alone.
+- ratings: marks titles watched (dated by "Date Rated") unless they
+  already are.
+"""
+
+import csv
+import logging
+import re
+import uuid
+from datetime import date, timedelta
+from typing import Iterable, List, Tuple
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from movies.models import UserMovieImportJob  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+IMPORT_KINDS = ('watchlist', 'ratings')
+
+# Column holding the date each kind of export stores per title.
+_DATE_COLUMNS = {'watchlist': 'Created', 'ratings': 'Date Rated'}
+_TCONST_RE = re.compile(r'^tt\d{7,8}$')
+
+KNOWN_TCONSTS_SQL = "SELECT tconst FROM movie WHERE tconst = ANY(%s::text[]);"
+
+_IMPORT_VALUES = """
+INSERT INTO user_movie AS um
+    (user_id, tconst, watchlisted_at, watchlist_deleted_at, watched_at, added_from_ai_suggestion)
+SELECT %(user_id)s::uuid, v.tconst, {watchlisted_at}, NULL, {watched_at}, false
+FROM unnest(%(tconsts)s::text[], %(dates)s::date[]) AS v(tconst, day)
+"""
+_IMPORT_DATE = "COALESCE(v.day::timestamptz, %(now)s)"
+
+IMPORT_USER_MOVIES_SQL = {
+    'watchlist': _IMPORT_VALUES.format(watchlisted_at=_IMPORT_DATE, watched_at="NULL") + """
+ON CONFLICT (user_id, tconst) DO NOTHING
+RETURNING true AS created;
+""",
+    # xmax is 0 only on freshly inserted rows; ON CONFLICT DO UPDATE leaves it set.
+    'ratings': _IMPORT_VALUES.format(watchlisted_at="NULL", watched_at=_IMPORT_DATE) + """
+ON CONFLICT (user_id, tconst) DO UPDATE
+SET watched_at = EXCLUDED.watched_at
+WHERE um.watched_at IS NULL
+RETURNING (um.xmax = 0) AS created;
+""",
+}
+
+ImportRow = Tuple[str, str | None]
+
+
+class ImportFileError(ValueError):
+    """The upload is not a usable IMDb export."""
+
+
+def _parse_day(value: str | None) -> str | None:
+    try:
+        return date.fromisoformat((value or '').strip()[:10]).isoformat()
+    except ValueError:
+        return None
+
+
+def parse_imdb_csv(lines: Iterable[str], kind: str, max_rows: int | None = None) -> Tuple[List[ImportRow], int]:
+    """
+    Read an IMDb watchlist or ratings export.
+
+    Args:
+        lines: The CSV text, e.g. a text wrapper around the uploaded file
+        kind: 'watchlist' or 'ratings'
+        max_rows: Reject files with more data rows than this (default USER_MOVIE_IMPORT_MAX_ROWS)
+
+    Returns:
+        tuple: ([(tconst, ISO date or None), ...] without repeats, count of rows without a valid tconst)
+
+    Raises:
+        ImportFileError: No "Const" column, or more than max_rows rows
+    """
+    if max_rows is None:
+        max_rows = getattr(settings, 'USER_MOVIE_IMPORT_MAX_ROWS', 20000)
+
+    reader = csv.DictReader(lines)
+    if not reader.fieldnames or 'Const' not in reader.fieldnames:
+        raise ImportFileError('Not an IMDb export: the "Const" column is missing.')
+
+    date_column = _DATE_COLUMNS[kind]
+    rows: dict = {}
+    invalid = 0
+    for line_number, row in enumerate(reader, start=1):
+        if line_number > max_rows:
+            raise ImportFileError(f'At most {max_rows} rows can be imported at once.')
+        tconst = (row.get('Const') or '').strip()
+        if not _TCONST_RE.match(tconst):
+            invalid += 1
+            continue
+        rows.setdefault(tconst, _parse_day(row.get(date_column)))
+    return list(rows.items()), invalid
+
+
+_STATUS_FIELDS = (
+    'kind', 'status', 'total', 'processed', 'created', 'updated', 'unknown', 'invalid', 'error',
+)
+
+
+def _save_status(job_id: str, **changes) -> None:
+    UserMovieImportJob.objects.filter(id=job_id).update(**changes)
+
+
+def _public_status(job: UserMovieImportJob) -> dict:
+    status = {'job_id': job.id.hex}
+    status.update((field, getattr(job, field)) for field in _STATUS_FIELDS)
+    status['created_at'] = job.created_at.isoformat()
+    status['finished_at'] = job.finished_at.isoformat() if job.finished_at else None
+    return status
+
+
+def get_import_status(job_id: str, user_id: str) -> dict | None:
+    """Progress of an import job, or None if unknown, pruned or another user's."""
+
+    job = UserMovieImportJob.objects.filter(id=job_id, user_id=user_id).first()
+    return _public_status(job) if job is not None else None
+
+
+def start_user_movie_import(user_id: str, kind: str, rows: List[ImportRow], invalid: int = 0) -> dict:
+    """
+    Record a queued import job and send it to Celery; returns the initial status.
+
+    The user's jobs that finished more than USER_MOVIE_IMPORT_STATUS_TIMEOUT
+    seconds ago are deleted first.
+
+    Raises:
+        Exception: Whatever the broker raised; the job is marked failed first
+    """
+    from myVOD.celery import run_user_movie_import  # type: ignore
+
+    now = timezone.now()
+    retention = timedelta(seconds=getattr(settings, 'USER_MOVIE_IMPORT_STATUS_TIMEOUT', 86400))
+    UserMovieImportJob.objects.filter(user_id=user_id, finished_at__lt=now - retention).delete()
+
+    job = UserMovieImportJob.objects.create(
+        id=uuid.uuid4(), user_id=user_id, kind=kind, status='queued',
+        total=len(rows), invalid=invalid, created_at=now,
+    )
+    try:
+        run_user_movie_import.delay(job.id.hex, user_id, kind, rows)
+    except Exception:
+        # Otherwise the job would read "queued" forever.
+        _save_status(job.id, status='failed', error='The import could not be queued. Please try again later.',
+                     finished_at=timezone.now())
+        raise
+    logger.info(
+        f"Queued {kind} import {job.id.hex} for user_id={user_id}: "
+        f"{len(rows)} titles, {invalid} invalid rows"
+    )
+    return _public_status(job)
+
+
+def _known_tconsts(tconsts: List[str]) -> set:
+    with connection.cursor() as cursor:
+        cursor.execute(KNOWN_TCONSTS_SQL, [tconsts])
+        return {row[0] for row in cursor.fetchall()}
+
+
+def apply_user_movie_import(job_id: str | None, user_id: str, kind: str, rows: List[ImportRow],
+                            batch_size: int | None = None) -> dict:
+    """
+    Apply an import: validate the tconsts, then upsert them batch by batch.
+
+    Each batch commits on its own, so a failed job keeps the batches it
+    finished (re-running the import is safe). Progress is saved to the job's
+    ``user_movie_import_job`` row after every batch when `job_id` is given.
+
+    Returns:
+        dict: The final status ({'total', 'processed', 'created', 'updated', 'unknown', ...})
+    """
+    batch_size = batch_size or getattr(settings, 'USER_MOVIE_IMPORT_BATCH_SIZE', 1000)
+    status = {
+        'job_id': job_id, 'kind': kind, 'total': len(rows),
+        'processed': 0, 'created': 0, 'updated': 0, 'unknown': 0, 'error': None, 'finished_at': None,
+    }
+
+    def save(**changes) -> None:
+        status.update(changes)
+        if job_id:
+            _save_status(job_id, **changes)
+
+    save(status='running')
+    try:
+        known = _known_tconsts([tconst for tconst, _day in rows])
+        rows = [row for row in rows if row[0] in known]
+        # Unknown titles count as processed: they are skipped.
+        unknown = status['total'] - len(rows)
+        save(unknown=unknown, processed=unknown)
+
+        now = timezone.now()
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            with connection.cursor() as cursor:
+                cursor.execute(IMPORT_USER_MOVIES_SQL[kind], {
+                    'user_id': user_id,
+                    'tconsts': [tconst for tconst, _day in batch],
+                    'dates': [day for _tconst, day in batch],
+                    'now': now,
+                })
+                written = [row[0] for row in cursor.fetchall()]
+            save(
+                processed=status['processed'] + len(batch),
+                created=status['created'] + sum(written),
+                updated=status['updated'] + len(written) - sum(written),
+            )
+    except Exception as e:
+        logger.error(f"User movie import {job_id} failed for user_id={user_id}: {str(e)}", exc_info=True)
+        save(status='failed', error='The import failed. Please try again later.',
+             finished_at=timezone.now())
+        raise
+
+    save(status='done', finished_at=timezone.now())
+    logger.info(
+        f"Finished {kind} import {job_id} for user_id={user_id}",
+        extra={"user_movie_import": {
+            key: status[key] for key in ('total', 'processed', 'created', 'updated', 'unknown')
+        }},
+    )
+    return status
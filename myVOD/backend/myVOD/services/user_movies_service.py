@@ -1,19 +1,40 @@
 import logging
 import uuid
 
-from django.db import transaction
-from django.db.models import Exists, OuterRef, Prefetch
+from django.db import DEFAULT_DB_ALIAS, connection, transaction
+from django.db.models import F, Prefetch
 from django.utils import timezone
 
-from movies.models import Movie, MovieAvailability, UserMovie, UserPlatform  # type: ignore
+from movies.models import Movie, MovieAvailability, Platform, UserMovie  # type: ignore
+from services.availability_mask_service import filter_available, filter_unavailable  # type: ignore
+from services.user_platform_cache import get_user_platform_ids  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# ordering parameter -> column of the keyset sort key (see user_movies.pagination).
+# Every ordering is descending with nulls last and ties broken by -id.
+USER_MOVIE_ORDERINGS = {
+    '-watchlisted_at': 'watchlisted_at',
+    '-watched_at': 'watched_at',
+    '-tconst__avg_rating': 'tconst__avg_rating',
+}
+DEFAULT_USER_MOVIE_ORDERING = {
+    'watchlist': '-watchlisted_at',
+    'watched': '-watched_at',
+}
 
-def _get_user_platform_ids(user_id):
-    return list(
-        UserPlatform.objects.filter(user_id=user_id).values_list("platform_id", flat=True)
-    )
+
+def resolve_user_movie_ordering(status_param: str, ordering_param: str | None = None) -> str:
+    """Key of USER_MOVIE_ORDERINGS a list request sorts by (the status date unless given)."""
+    return ordering_param or DEFAULT_USER_MOVIE_ORDERING.get(status_param, '-watchlisted_at')
+
+
+def user_movie_sort_field(ordering_param: str):
+    """Model field behind an ordering's `sort_key`; cursor values are checked with its to_python."""
+    path = USER_MOVIE_ORDERINGS[ordering_param]
+    if path.startswith('tconst__'):
+        return Movie._meta.get_field(path[len('tconst__'):])
+    return UserMovie._meta.get_field(path)
 
 
 def _resolve_user_uuid(user):
@@ -39,13 +60,16 @@ def build_user_movies_queryset(
     Args:
         user: The authenticated user object; must expose an `id` UUID.
         status_param: 'watchlist' or 'watched'. Required.
-        ordering_param: Optional ordering field ('-watchlisted_at' or '-tconst__avg_rating').
+        ordering_param: Optional key of USER_MOVIE_ORDERINGS; defaults to the status date.
         is_available: Optional boolean to filter by availability across user's platforms.
+
+    The queryset is annotated with `sort_key` and ordered by (sort_key DESC
+    NULLS LAST, id DESC), the keyset UserMovieKeysetPagination pages on.
     """
 
     # Resolve canonical user UUID (custom user model has UUID id)
     supabase_user_uuid = _resolve_user_uuid(user)
-    platform_ids = _get_user_platform_ids(supabase_user_uuid)
+    platform_ids = get_user_platform_ids(supabase_user_uuid)
 
     availability_prefetch = Prefetch(
         'tconst__availability_entries',
@@ -82,34 +106,153 @@ def build_user_movies_queryset(
         )
 
     if is_available is True:
-        # Use EXISTS subquery for better performance (no materialized list)
-        available_subquery = MovieAvailability.objects.filter(
-            tconst=OuterRef('tconst'),
-            platform_id__in=platform_ids,
-            is_available=True,
-        )
-        queryset = queryset.filter(Exists(available_subquery))
+        queryset = filter_available(queryset, platform_ids, prefix='tconst__')
     elif is_available is False:
-        # Movies with at least one FALSE and NO TRUE entries on user's platforms
-        has_true = MovieAvailability.objects.filter(
-            tconst=OuterRef('tconst'),
-            platform_id__in=platform_ids,
-            is_available=True,
-        )
-        has_false = MovieAvailability.objects.filter(
-            tconst=OuterRef('tconst'),
-            platform_id__in=platform_ids,
-            is_available=False,
-        )
-        queryset = queryset.filter(Exists(has_false)).exclude(Exists(has_true))
+        # Checked on at least one of the user's platforms and available on none
+        queryset = filter_unavailable(queryset, platform_ids, prefix='tconst__')
 
-    if ordering_param in ['-watchlisted_at', '-tconst__avg_rating']:
-        queryset = queryset.order_by(ordering_param)
+    ordering_param = resolve_user_movie_ordering(status_param, ordering_param)
+    queryset = queryset.annotate(sort_key=F(USER_MOVIE_ORDERINGS[ordering_param])).order_by(
+        F('sort_key').desc(nulls_last=True), '-id'
+    )
 
     return queryset
 
 
-@transaction.atomic
+# Each mutation below is one statement: the write (a CTE returning the
+# user_movie row) joined to the movie and to its availability on the user's
+# platforms. A second query runs only to explain why nothing was written.
+# The writes take arrays of tconsts/ids so apply_user_movie_operations can
+# run them set-based, one statement per action.
+WRITE_RESULT_SQL = """
+WITH written AS (
+{write}
+)
+SELECT w.id, w.user_id, w.tconst, w.watchlisted_at, w.watchlist_deleted_at, w.watched_at,
+       w.added_from_ai_suggestion, w.created,
+       m.primary_title, m.start_year, m.genres, m.avg_rating, m.poster_path,
+       a.id AS availability_id, a.platform_id, a.is_available, a.last_checked, a.source,
+       p.platform_slug, p.platform_name
+FROM written w
+JOIN movie m ON m.tconst = w.tconst
+LEFT JOIN movie_availability a ON a.tconst = w.tconst AND a.platform_id = ANY(%(platform_ids)s::int[])
+LEFT JOIN platform p ON p.id = a.platform_id
+ORDER BY a.platform_id;
+"""
+
+_RETURNING_COLUMNS = """
+RETURNING um.id, um.user_id, um.tconst, um.watchlisted_at, um.watchlist_deleted_at, um.watched_at,
+          um.added_from_ai_suggestion, """
+# xmax is 0 only on freshly inserted rows; ON CONFLICT DO UPDATE leaves it set.
+_UPSERT_RETURNING = _RETURNING_COLUMNS + "(um.xmax = 0) AS created\n"
+_UPDATE_RETURNING = _RETURNING_COLUMNS + "false AS created\n"
+
+# Inserts, or re-adds an entry that is soft-deleted or was never watchlisted.
+ADD_TO_WATCHLIST_SQL = """
+INSERT INTO user_movie AS um
+    (user_id, tconst, watchlisted_at, watchlist_deleted_at, watched_at, added_from_ai_suggestion)
+SELECT %(user_id)s::uuid, m.tconst, %(now)s, NULL, NULL, false
+FROM movie m
+WHERE m.tconst = ANY(%(tconsts)s::text[])
+ON CONFLICT (user_id, tconst) DO UPDATE
+SET watchlisted_at = EXCLUDED.watchlisted_at, watchlist_deleted_at = NULL
+WHERE um.watchlisted_at IS NULL OR um.watchlist_deleted_at IS NOT NULL
+""" + _UPSERT_RETURNING
+
+# Inserts, or marks an existing unwatched entry watched (restoring it if soft-deleted).
+ADD_AS_WATCHED_SQL = """
+INSERT INTO user_movie AS um
+    (user_id, tconst, watchlisted_at, watchlist_deleted_at, watched_at, added_from_ai_suggestion)
+SELECT %(user_id)s::uuid, m.tconst, NULL, NULL, %(now)s, false
+FROM movie m
+WHERE m.tconst = ANY(%(tconsts)s::text[])
+ON CONFLICT (user_id, tconst) DO UPDATE
+SET watched_at = EXCLUDED.watched_at, watchlist_deleted_at = NULL
+WHERE um.watched_at IS NULL
+""" + _UPSERT_RETURNING
+
+UPDATE_USER_MOVIE_SQL = {
+    # Watchlisted, not soft-deleted, not yet watched
+    'mark_as_watched': """
+UPDATE user_movie AS um
+SET watched_at = %(now)s, watchlist_deleted_at = %(now)s
+WHERE um.id = ANY(%(user_movie_ids)s::bigint[]) AND um.user_id = %(user_id)s::uuid
+  AND um.watchlisted_at IS NOT NULL AND um.watchlist_deleted_at IS NULL AND um.watched_at IS NULL
+""" + _UPDATE_RETURNING,
+    'restore_to_watchlist': """
+UPDATE user_movie AS um
+SET watched_at = NULL, watchlist_deleted_at = NULL
+WHERE um.id = ANY(%(user_movie_ids)s::bigint[]) AND um.user_id = %(user_id)s::uuid
+  AND um.watched_at IS NOT NULL
+""" + _UPDATE_RETURNING,
+}
+
+DELETE_USER_MOVIES_SQL = """
+UPDATE user_movie AS um
+SET watchlist_deleted_at = %(now)s
+WHERE um.id = ANY(%(user_movie_ids)s::bigint[]) AND um.user_id = %(user_id)s::uuid
+  AND um.watchlist_deleted_at IS NULL
+""" + _UPDATE_RETURNING
+
+# Bulk action -> (statement, key column); applied in this order.
+BULK_USER_MOVIE_ACTIONS = {
+    'add': (ADD_TO_WATCHLIST_SQL, 'tconst'),
+    'mark_as_watched': (ADD_AS_WATCHED_SQL, 'tconst'),
+    'restore_to_watchlist': (UPDATE_USER_MOVIE_SQL['restore_to_watchlist'], 'id'),
+    'delete': (DELETE_USER_MOVIES_SQL, 'id'),
+}
+
+_USER_MOVIE_FIELDS = (
+    'id', 'user_id', 'tconst_id', 'watchlisted_at', 'watchlist_deleted_at', 'watched_at',
+    'added_from_ai_suggestion',
+)
+_MOVIE_FIELDS = ('tconst', 'primary_title', 'start_year', 'genres', 'avg_rating', 'poster_path')
+_AVAILABILITY_FIELDS = ('id', 'tconst_id', 'platform_id', 'is_available', 'last_checked', 'source')
+
+
+def _user_movie_from_rows(rows):
+    """Build the UserMovie, its movie and `availability_filtered` from WRITE_RESULT_SQL rows."""
+
+    first = rows[0]
+    movie = Movie.from_db(DEFAULT_DB_ALIAS, _MOVIE_FIELDS, [
+        first['tconst'], first['primary_title'], first['start_year'], first['genres'],
+        first['avg_rating'], first['poster_path'],
+    ])
+    movie.availability_filtered = []
+    for row in rows:
+        if row['availability_id'] is None:
+            continue
+        availability = MovieAvailability.from_db(DEFAULT_DB_ALIAS, _AVAILABILITY_FIELDS, [
+            row['availability_id'], row['tconst'], row['platform_id'], row['is_available'],
+            row['last_checked'], row['source'],
+        ])
+        availability.platform = Platform.from_db(
+            DEFAULT_DB_ALIAS, ('id', 'platform_slug', 'platform_name'),
+            [row['platform_id'], row['platform_slug'], row['platform_name']],
+        )
+        movie.availability_filtered.append(availability)
+
+    user_movie = UserMovie.from_db(DEFAULT_DB_ALIAS, _USER_MOVIE_FIELDS, [
+        first['id'], first['user_id'], first['tconst'], first['watchlisted_at'],
+        first['watchlist_deleted_at'], first['watched_at'], first['added_from_ai_suggestion'],
+    ])
+    user_movie.tconst = movie
+    return user_movie, first['created']
+
+
+def _write_user_movie(write_sql: str, params: dict):
+    """Run one mutation; returns (UserMovie, created) or (None, False) if no row was written."""
+
+    params = {**params, 'platform_ids': get_user_platform_ids(params['user_id'])}
+    with connection.cursor() as cursor:
+        cursor.execute(WRITE_RESULT_SQL.format(write=write_sql), params)
+        columns = [column[0] for column in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    if not rows:
+        return None, False
+    return _user_movie_from_rows(rows)
+
+
 def add_movie_to_watchlist(*, user, tconst: str):
     """Adds a movie to user's watchlist or restores a soft-deleted entry.
 
@@ -120,14 +263,17 @@ def add_movie_to_watchlist(*, user, tconst: str):
     - Creates new entries with watchlisted_at set to current timestamp
     - Returns the created/restored UserMovie instance with prefetched data
 
+    All of this is one upsert (ADD_TO_WATCHLIST_SQL); the movie lookup only
+    runs when nothing was written, to tell a missing movie from a duplicate.
+
     Args:
         user: The authenticated user object with `email` attribute
         tconst: The IMDb movie identifier (e.g., 'tt0816692')
 
     Returns:
         UserMovie: The created or restored user_movie instance with:
-            - tconst (Movie) prefetched via select_related
-            - availability_filtered prefetched for user's platforms
+            - tconst (Movie) loaded
+            - availability_filtered set to the user's platforms
 
     Raises:
         Movie.DoesNotExist: If the movie with given tconst doesn't exist
@@ -139,79 +285,18 @@ def add_movie_to_watchlist(*, user, tconst: str):
 
     logger.info(f"Adding movie to watchlist: user_id={supabase_user_uuid}, tconst={tconst}")
 
-    # Guard clause: Validate movie exists
-    if not Movie.objects.filter(tconst=tconst).exists():
-        raise Movie.DoesNotExist(f"Movie with tconst '{tconst}' does not exist in database")
-
-    # Guard clause: Check for ANY existing entry (active OR soft-deleted)
-    # This prevents IntegrityError on unique constraint (user_id, tconst)
-    existing_entry = UserMovie.objects.filter(
-        user_id=supabase_user_uuid,
-        tconst=tconst
-    ).first()
-
-    if existing_entry:
-        # Check if it's an active watchlist entry
-        is_active = (
-            existing_entry.watchlisted_at is not None and
-            existing_entry.watchlist_deleted_at is None
-        )
-
-        logger.info(f"Found existing user_movie id={existing_entry.id}, is_active={is_active}")
-
-        if is_active:
-            raise ValueError("Movie is already on the watchlist")
-
-        # Entry exists but is soft-deleted or incomplete - restore it
-        if existing_entry.watchlist_deleted_at is not None:
-            logger.info(f"Restoring soft-deleted user_movie id={existing_entry.id}")
-            existing_entry.watchlisted_at = timezone.now()
-            existing_entry.watchlist_deleted_at = None
-            existing_entry.save(update_fields=['watchlisted_at', 'watchlist_deleted_at'])
-            user_movie = existing_entry
-        else:
-            # Entry exists but watchlisted_at is NULL - set it now
-            logger.info(f"Updating incomplete user_movie id={existing_entry.id}")
-            existing_entry.watchlisted_at = timezone.now()
-            existing_entry.save(update_fields=['watchlisted_at'])
-            user_movie = existing_entry
-    else:
-        # No existing entry - create new one
-        logger.info(f"Creating new user_movie for user_id={supabase_user_uuid}, tconst={tconst}")
-        user_movie = UserMovie.objects.create(
-            user_id=supabase_user_uuid,
-            tconst_id=tconst,
-            watchlisted_at=timezone.now(),
-            watchlist_deleted_at=None,
-            watched_at=None,
-            added_from_ai_suggestion=False
-        )
-        logger.info(f"Created new user_movie with id={user_movie.id}")
-
-    # Fetch with related data for response
-    platform_ids = _get_user_platform_ids(supabase_user_uuid)
-
-    availability_prefetch = Prefetch(
-        'tconst__availability_entries',
-        queryset=MovieAvailability.objects.filter(
-            platform_id__in=platform_ids
-        ).select_related('platform'),
-        to_attr='availability_filtered'
-    )
-
-    # Re-fetch the instance with all required prefetch/select_related
-    user_movie = (
-        UserMovie.objects
-        .filter(id=user_movie.id)
-        .select_related('tconst')
-        .prefetch_related(availability_prefetch)
-        .first()
-    )
+    user_movie, created = _write_user_movie(ADD_TO_WATCHLIST_SQL, {
+        'user_id': supabase_user_uuid, 'tconsts': [tconst], 'now': timezone.now(),
+    })
+    if user_movie is None:
+        if not Movie.objects.filter(tconst=tconst).exists():
+            raise Movie.DoesNotExist(f"Movie with tconst '{tconst}' does not exist in database")
+        raise ValueError("Movie is already on the watchlist")
 
+    logger.info(f"{'Created' if created else 'Restored'} user_movie id={user_movie.id}")
     return user_movie
 
 
-@transaction.atomic
 def add_movie_as_watched(*, user, tconst: str):
     """Add or update a movie as watched without affecting watchlisted_at when not needed."""
 
@@ -219,62 +304,27 @@ def add_movie_as_watched(*, user, tconst: str):
 
     logger.info(f"Marking movie as watched: user_id={supabase_user_uuid}, tconst={tconst}")
 
-    if not Movie.objects.filter(tconst=tconst).exists():
-        raise Movie.DoesNotExist(f"Movie with tconst '{tconst}' does not exist in database")
-
-    existing_entry = UserMovie.objects.filter(
-        user_id=supabase_user_uuid,
-        tconst=tconst
-    ).first()
-
-    created = False
+    user_movie, created = _write_user_movie(ADD_AS_WATCHED_SQL, {
+        'user_id': supabase_user_uuid, 'tconsts': [tconst], 'now': timezone.now(),
+    })
+    if user_movie is None:
+        if not Movie.objects.filter(tconst=tconst).exists():
+            raise Movie.DoesNotExist(f"Movie with tconst '{tconst}' does not exist in database")
+        raise ValueError("Movie is already marked as watched")
 
-    if existing_entry:
-        if existing_entry.watched_at is not None:
-            raise ValueError("Movie is already marked as watched")
-
-        update_fields = ['watched_at']
-        existing_entry.watched_at = timezone.now()
-
-        if existing_entry.watchlist_deleted_at is not None:
-            existing_entry.watchlist_deleted_at = None
-            update_fields.append('watchlist_deleted_at')
-
-        existing_entry.save(update_fields=update_fields)
-        user_movie = existing_entry
-    else:
-        user_movie = UserMovie.objects.create(
-            user_id=supabase_user_uuid,
-            tconst_id=tconst,
-            watchlisted_at=None,
-            watchlist_deleted_at=None,
-            watched_at=timezone.now(),
-            added_from_ai_suggestion=False
-        )
-        created = True
-
-    platform_ids = _get_user_platform_ids(supabase_user_uuid)
+    return user_movie, created
 
-    availability_prefetch = Prefetch(
-        'tconst__availability_entries',
-        queryset=MovieAvailability.objects.filter(
-            platform_id__in=platform_ids
-        ).select_related('platform'),
-        to_attr='availability_filtered'
-    )
 
-    user_movie = (
-        UserMovie.objects
-        .filter(id=user_movie.id)
-        .select_related('tconst')
-        .prefetch_related(availability_prefetch)
-        .first()
-    )
+def _update_precondition_error(user_movie, action: str) -> ValueError:
+    """Why UPDATE_USER_MOVIE_SQL[action] did not match the user's entry."""
 
-    return user_movie, created
+    if action == 'mark_as_watched':
+        if user_movie.watchlisted_at is None or user_movie.watchlist_deleted_at is not None:
+            return ValueError("Movie must be on watchlist to mark as watched")
+        return ValueError("Movie is already marked as watched")
+    return ValueError("Movie is not marked as watched, cannot restore to watchlist")
 
 
-@transaction.atomic
 def update_user_movie(*, user, user_movie_id: int, action: str):
     """Updates a user-movie entry to mark as watched or restore to watchlist.
 
@@ -287,6 +337,9 @@ def update_user_movie(*, user, user_movie_id: int, action: str):
       - Precondition: Movie must be marked as watched
     - Returns the updated UserMovie with full data (movie, availability)
 
+    Ownership and preconditions are part of the UPDATE's WHERE clause; the
+    entry is read back only when it matched nothing, to pick the error.
+
     Args:
         user: The authenticated user object with `email` attribute
         user_movie_id: The ID of the user_movie entry to update
@@ -294,8 +347,8 @@ def update_user_movie(*, user, user_movie_id: int, action: str):
 
     Returns:
         UserMovie: The updated user_movie instance with:
-            - tconst (Movie) prefetched via select_related
-            - availability_filtered prefetched for user's platforms
+            - tconst (Movie) loaded
+            - availability_filtered set to the user's platforms
 
     Raises:
         UserMovie.DoesNotExist: If user_movie not found or doesn't belong to user
@@ -305,108 +358,162 @@ def update_user_movie(*, user, user_movie_id: int, action: str):
     # Resolve canonical user UUID for the user
     supabase_user_uuid = _resolve_user_uuid(user)
 
-    # Guard clause: Fetch the user_movie and ensure it belongs to authenticated user
-    try:
-        user_movie = UserMovie.objects.get(id=user_movie_id, user_id=supabase_user_uuid)
-    except UserMovie.DoesNotExist:
-        raise UserMovie.DoesNotExist(
-            f"UserMovie with id {user_movie_id} not found or does not belong to user"
-        )
-
-    # Note: We don't check soft-deleted status here because business logic
-    # for each action should determine the appropriate error message
-    # (e.g., "must be on watchlist" for mark_as_watched)
-
-    # Handle mark_as_watched action
-    if action == 'mark_as_watched':
-        # Precondition: Movie must be on watchlist (not soft-deleted) and NOT watched
-        if user_movie.watchlisted_at is None or user_movie.watchlist_deleted_at is not None:
-            raise ValueError("Movie must be on watchlist to mark as watched")
-        if user_movie.watched_at is not None:
-            raise ValueError("Movie is already marked as watched")
-
-        # Update watched_at and soft-delete from watchlist
-        now = timezone.now()
-        user_movie.watched_at = now
-        user_movie.watchlist_deleted_at = now
-        user_movie.save(update_fields=['watched_at', 'watchlist_deleted_at'])
-
-    # Handle restore_to_watchlist action
-    elif action == 'restore_to_watchlist':
-        # Precondition: Movie must be marked as watched
-        if user_movie.watched_at is None:
-            raise ValueError("Movie is not marked as watched, cannot restore to watchlist")
-
-        # Clear watched_at and restore to watchlist (clear soft-delete)
-        user_movie.watched_at = None
-        user_movie.watchlist_deleted_at = None
-        user_movie.save(update_fields=['watched_at', 'watchlist_deleted_at'])
-
-    # Fetch with related data for response
-    platform_ids = _get_user_platform_ids(supabase_user_uuid)
-
-    availability_prefetch = Prefetch(
-        'tconst__availability_entries',
-        queryset=MovieAvailability.objects.filter(
-            platform_id__in=platform_ids
-        ).select_related('platform'),
-        to_attr='availability_filtered'
-    )
-
-    # Re-fetch the instance with all required prefetch/select_related
-    user_movie = (
-        UserMovie.objects
-        .filter(id=user_movie.id)
-        .select_related('tconst')
-        .prefetch_related(availability_prefetch)
-        .first()
-    )
+    user_movie_id = int(user_movie_id)
+    user_movie, _created = _write_user_movie(UPDATE_USER_MOVIE_SQL[action], {
+        'user_id': supabase_user_uuid, 'user_movie_ids': [user_movie_id], 'now': timezone.now(),
+    })
+    if user_movie is None:
+        existing = UserMovie.objects.filter(id=user_movie_id, user_id=supabase_user_uuid).first()
+        if existing is None:
+            raise UserMovie.DoesNotExist(
+                f"UserMovie with id {user_movie_id} not found or does not belong to user"
+            )
+        raise _update_precondition_error(existing, action)
 
     return user_movie
 
 
-@transaction.atomic
 def delete_user_movie_soft(*, user, user_movie_id: int):
     """Soft-deletes a user-movie entry.
 
     Business Logic:
     - Authorization: Ensures the user_movie belongs to the authenticated user
     - Sets watchlist_deleted_at to current timestamp
-    - Returns the updated UserMovie with full data (movie, availability)
+
+    Ownership and the not-yet-deleted check are part of a single UPDATE.
 
     Args:
         user: The authenticated user object with `email` attribute
         user_movie_id: The ID of the user_movie entry to delete
 
-    Returns:
-        UserMovie: The updated user_movie instance with:
-            - tconst (Movie) prefetched via select_related
-            - availability_filtered prefetched for user's platforms
-
     Raises:
-        UserMovie.DoesNotExist: If user_movie not found or doesn't belong to user
+        UserMovie.DoesNotExist: If user_movie not found, doesn't belong to user or is already deleted
         Exception: If Supabase user not found
     """
     # Resolve canonical user UUID for the user
     supabase_user_uuid = _resolve_user_uuid(user)
 
-    # Guard clause: Fetch the user_movie and ensure it belongs to authenticated user
-    try:
-        user_movie = UserMovie.objects.get(id=user_movie_id, user_id=supabase_user_uuid)
-    except UserMovie.DoesNotExist:
-        raise UserMovie.DoesNotExist(
-            f"UserMovie with id {user_movie_id} not found or does not belong to user"
-        )
+    updated = UserMovie.objects.filter(
+        id=user_movie_id,
+        user_id=supabase_user_uuid,
+        watchlist_deleted_at__isnull=True,
+    ).update(watchlist_deleted_at=timezone.now())
 
-    # Guard clause: Check if already soft-deleted
-    if user_movie.watchlist_deleted_at is not None:
+    # No response body needed for DELETE 204 in view
+    if not updated:
         raise UserMovie.DoesNotExist(
             f"UserMovie with id {user_movie_id} not found or does not belong to user"
         )
 
-    # Soft-delete the user_movie
-    user_movie.watchlist_deleted_at = timezone.now()
-    user_movie.save(update_fields=['watchlist_deleted_at'])
 
-    # No response body needed for DELETE 204 in view → avoid extra re-fetch
-    return user_movie
+def _bulk_failure(action: str, key, existing_movies: set, owned_ids: set) -> dict:
+    """Status and detail of an operation that wrote nothing, as its single-item endpoint reports it."""
+
+    if action in ('add', 'mark_as_watched'):
+        if key not in existing_movies:
+            return {'status': 400, 'detail': f"Movie with tconst '{key}' does not exist in database"}
+        if action == 'add':
+            return {'status': 409, 'detail': "Movie is already on the watchlist"}
+        return {'status': 409, 'detail': "Movie is already marked as watched"}
+    if action == 'restore_to_watchlist' and key in owned_ids:
+        return {'status': 400, 'detail': "Movie is not marked as watched, cannot restore to watchlist"}
+    return {
+        'status': 404,
+        'detail': f"User movie with id {key} not found or does not belong to authenticated user",
+    }
+
+
+def apply_user_movie_operations(*, user, operations):
+    """Applies many add / mark-as-watched / restore / delete operations at once.
+
+    Business Logic:
+    - Each operation behaves like its single-item endpoint:
+      - add: POST /api/user-movies/ (by tconst)
+      - mark_as_watched: POST with mark_as_watched=true (by tconst)
+      - restore_to_watchlist: PATCH /api/user-movies/<id>/ (by id)
+      - delete: DELETE /api/user-movies/<id>/ (by id)
+    - Everything runs in one transaction, one statement per action present
+      (in BULK_USER_MOVIE_ACTIONS order); failed items don't roll back the rest
+    - At most two more queries explain the items that wrote nothing
+
+    Args:
+        user: The authenticated user object
+        operations: Validated dicts with `action` and `tconst` or `id`; each
+            tconst and each id appears at most once
+
+    Returns:
+        list[dict]: One result per operation, in request order, with the HTTP
+            `status` its single-item endpoint would have returned. Written items
+            carry id, tconst, watchlisted_at and watched_at; failed ones `detail`.
+
+    Raises:
+        Exception: If Supabase user not found
+    """
+    supabase_user_uuid = _resolve_user_uuid(user)
+    now = timezone.now()
+
+    keys = {action: set() for action in BULK_USER_MOVIE_ACTIONS}
+    for operation in operations:
+        _sql, key_column = BULK_USER_MOVIE_ACTIONS[operation['action']]
+        keys[operation['action']].add(operation[key_column])
+
+    written = {}
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            for action, (sql, key_column) in BULK_USER_MOVIE_ACTIONS.items():
+                if not keys[action]:
+                    continue
+                key_param = 'tconsts' if key_column == 'tconst' else 'user_movie_ids'
+                # Sorted so concurrent requests lock rows in the same order.
+                cursor.execute(sql, {
+                    'user_id': supabase_user_uuid, 'now': now, key_param: sorted(keys[action]),
+                })
+                columns = [column[0] for column in cursor.description]
+                for values in cursor.fetchall():
+                    row = dict(zip(columns, values))
+                    written[(action, row[key_column])] = row
+
+        unwritten = [
+            (action, key) for action, action_keys in keys.items() for key in action_keys
+            if (action, key) not in written
+        ]
+        missing_tconsts = {key for action, key in unwritten if action in ('add', 'mark_as_watched')}
+        unrestored_ids = {key for action, key in unwritten if action == 'restore_to_watchlist'}
+        existing_movies = set(
+            Movie.objects.filter(tconst__in=missing_tconsts).values_list('tconst', flat=True)
+        ) if missing_tconsts else set()
+        owned_ids = set(
+            UserMovie.objects.filter(id__in=unrestored_ids, user_id=supabase_user_uuid)
+            .values_list('id', flat=True)
+        ) if unrestored_ids else set()
+
+    results = []
+    for operation in operations:
+        action = operation['action']
+        key_column = BULK_USER_MOVIE_ACTIONS[action][1]
+        key = operation[key_column]
+        result = {'action': action, key_column: key}
+        row = written.get((action, key))
+        if row is None:
+            result.update(_bulk_failure(action, key, existing_movies, owned_ids))
+        else:
+            if action == 'delete':
+                status_code = 204
+            elif action == 'add' or (action == 'mark_as_watched' and row['created']):
+                status_code = 201
+            else:
+                status_code = 200
+            result.update({
+                'status': status_code,
+                'id': row['id'],
+                'tconst': row['tconst'],
+                'watchlisted_at': row['watchlisted_at'],
+                'watched_at': row['watched_at'],
+            })
+        results.append(result)
+
+    logger.info(
+        f"Applied {len(operations)} user-movie operations for user_id={supabase_user_uuid}: "
+        f"{len(written)} written, {len(operations) - len(written)} failed"
+    )
+    return results
@@ -0,0 +1,172 @@
+"""Per-user platform set cache.
+
+Almost every authenticated request needs the ids of the user's VOD platforms,
+and the set changes only when the user edits their profile. ``get_user_platform_ids``
+is the single accessor for it. Two tiers serve the set:
+
+- the shared Django cache (Redis in production), under a key that carries a
+  per-user version number
+- a bounded per-process LRU, trusted for USER_PLATFORM_LOCAL_CACHE_SECONDS and
+  afterwards revalidated with one read of the version key
+
+``invalidate_user_platform_ids`` bumps the version. It runs immediately and,
+inside a transaction, again when that transaction commits. A request that read the old
+rows before the commit may cache them, but only under a version nobody reads
+any more.
+
+The shared tier is only correct when every process reads the same cache, i.e.
+Redis configured through CACHE_URL. Without it (USER_PLATFORM_SHARED_CACHE off,
+the default for the per-process LocMem fallback) only the local tier is used:
+an entry is reloaded from the database once it is older than
+USER_PLATFORM_LOCAL_CACHE_SECONDS, which bounds how long another process can
+serve a set the user has since changed.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import List, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from movies.models import UserPlatform  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "user_platforms"
+
+
+def _version_key(user_id: str) -> str:
+    return f"{_KEY_PREFIX}:version:{user_id}"
+
+
+def _value_key(user_id: str, version: int) -> str:
+    return f"{_KEY_PREFIX}:{user_id}:{version}"
+
+
+def _normalize_user_id(user_id) -> str:
+    return str(uuid.UUID(str(user_id)))
+
+
+def _shared_cache_enabled() -> bool:
+    return getattr(settings, "USER_PLATFORM_SHARED_CACHE", False)
+
+
+def _new_version() -> int:
+    # Larger than any version bumped from an earlier seed, so a version key
+    # evicted from the shared cache never resurrects an old value.
+    return time.time_ns() // 1000
+
+
+class UserPlatformCache:
+    """Local LRU of (version, platform ids) in front of the versioned shared entries."""
+
+    def __init__(self) -> None:
+        # user id -> (version, platform ids, monotonic time of the last version check)
+        self._entries: "OrderedDict[str, Tuple[int, Tuple[int, ...], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id) -> List[int]:
+        user_id = _normalize_user_id(user_id)
+        now = time.monotonic()
+        local = self._get_local(user_id)
+        if local is not None and now - local[2] < getattr(settings, "USER_PLATFORM_LOCAL_CACHE_SECONDS", 5):
+            return list(local[1])
+
+        if not _shared_cache_enabled():
+            platform_ids = self._load(user_id)
+            self._set_local(user_id, 0, tuple(platform_ids), now)
+            return platform_ids
+
+        try:
+            version = self._current_version(user_id)
+            if local is not None and local[0] == version:
+                self._set_local(user_id, version, local[1], now)
+                return list(local[1])
+            platform_ids = cache.get(_value_key(user_id, version))
+        except Exception:  # pragma: no cover - defensive: cache backend failure falls back to the database
+            logger.warning("Failed to read user platform cache for user %s", user_id, exc_info=True)
+            return self._load(user_id)
+
+        if platform_ids is None:
+            platform_ids = self._load(user_id)
+            try:
+                cache.set(
+                    _value_key(user_id, version),
+                    platform_ids,
+                    getattr(settings, "USER_PLATFORM_CACHE_TIMEOUT", 3600),
+                )
+            except Exception:  # pragma: no cover - defensive
+                logger.warning("Failed to store user platform cache for user %s", user_id, exc_info=True)
+        self._set_local(user_id, version, tuple(platform_ids), now)
+        return list(platform_ids)
+
+    def invalidate(self, user_id) -> None:
+        user_id = _normalize_user_id(user_id)
+        self._bump(user_id)
+        if transaction.get_connection().in_atomic_block:
+            transaction.on_commit(lambda: self._bump(user_id))
+
+    def clear(self) -> None:
+        """Drop the local tier (the shared tier is left untouched)."""
+
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, user_id: str) -> List[int]:
+        return sorted(UserPlatform.objects.filter(user_id=user_id).values_list("platform_id", flat=True))
+
+    def _current_version(self, user_id: str) -> int:
+        version = cache.get(_version_key(user_id))
+        if version is None:
+            cache.add(_version_key(user_id), _new_version(), None)
+            version = cache.get(_version_key(user_id))
+        return version
+
+    def _bump(self, user_id: str) -> None:
+        with self._lock:
+            self._entries.pop(user_id, None)
+        if not _shared_cache_enabled():
+            return
+        try:
+            cache.incr(_version_key(user_id))
+        except ValueError:
+            cache.set(_version_key(user_id), _new_version(), None)
+        except Exception:  # pragma: no cover - defensive: entries still expire on their own
+            logger.warning("Failed to invalidate user platform cache for user %s", user_id, exc_info=True)
+
+    def _get_local(self, user_id: str):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                self._entries.move_to_end(user_id)
+            return entry
+
+    def _set_local(self, user_id: str, version: int, platform_ids: Tuple[int, ...], checked_at: float) -> None:
+        max_entries = getattr(settings, "USER_PLATFORM_LOCAL_CACHE_SIZE", 10000)
+        if max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (version, platform_ids, checked_at)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+
+user_platform_cache = UserPlatformCache()
+
+
+def get_user_platform_ids(user_id) -> List[int]:
+    """Ids of the platforms the user subscribes to, sorted."""
+
+    return user_platform_cache.get(user_id)
+
+
+def invalidate_user_platform_ids(user_id) -> None:
+    """Forget the cached platform set; call after every write to the user's user_platform rows."""
+
+    user_platform_cache.invalidate(user_id)
@@ -10,6 +10,7 @@ from django.db import transaction, DatabaseError
 from django.contrib.auth import get_user_model
 from movies.models import Platform, UserPlatform
 from services.user_movies_service import _resolve_user_uuid
+from services.user_platform_cache import get_user_platform_ids, invalidate_user_platform_ids
 import uuid
 
 logger = logging.getLogger(__name__)
@@ -42,9 +43,7 @@ def get_user_profile(user):
         user_uuid = uuid.UUID(str(user_uuid_str))
 
         # Get user's platform IDs
-        user_platform_ids = UserPlatform.objects.filter(
-            user_id=user_uuid
-        ).values_list('platform_id', flat=True)
+        user_platform_ids = get_user_platform_ids(user_uuid)
 
         # Fetch platform details
         platforms = Platform.objects.filter(
@@ -138,6 +137,9 @@ def update_user_platforms(user, platform_ids: list[int]):
                     f"Added {len(to_add)} platform associations for user {user.email}"
                 )
 
+            if to_delete or to_add:
+                invalidate_user_platform_ids(user_uuid)
+
             # Fetch updated platform details
             platforms = Platform.objects.filter(
                 id__in=platform_ids
@@ -0,0 +1,85 @@
+"""
+Keyset pagination for GET /api/user-movies/.
+
+Pagination is opt-in: requests with `limit` or `cursor` get
+{"results": [...], "next": <url or null>}; requests without either still get
+the whole list as a plain array, which existing clients expect.
+
+Pages follow the (sort_key DESC NULLS LAST, id DESC) order set by
+`build_user_movies_queryset`. The cursor is the last row's (sort_key, id),
+prefixed with the ordering it was issued for so it can't be replayed against
+another one (see UserMovieQueryParamsSerializer). The next page is a range
+condition on it instead of an OFFSET, so deep pages cost the same as the first. The status partial indexes on
+(user_id, watchlisted_at DESC, id DESC) and (user_id, watched_at DESC, id DESC)
+match these orders.
+"""
+from datetime import datetime
+from decimal import Decimal
+
+from django.db.models import Q
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+
+from movies.pagination import decode_cursor, encode_cursor, next_page_url  # type: ignore
+from services.user_movies_service import resolve_user_movie_ordering  # type: ignore
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def _cursor_value(value):
+    # Full precision: DjangoJSONEncoder would truncate microseconds and break ties.
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _rows_after(queryset, sort_key, row_id, count: int) -> list:
+    """Up to `count` rows after (sort_key, row_id) in (sort_key DESC NULLS LAST, id DESC) order."""
+    if sort_key is None:
+        return list(queryset.filter(sort_key__isnull=True, id__lt=row_id)[:count])
+
+    # `sort_key <= v` is the index range condition; an OR with IS NULL would
+    # turn it into a filter over every skipped row.
+    rows = list(queryset.filter(Q(sort_key__lte=sort_key), Q(sort_key__lt=sort_key) | Q(id__lt=row_id))[:count])
+    if len(rows) < count:
+        # Past the last non-null key: continue into the NULLS LAST tail.
+        rows += list(queryset.filter(sort_key__isnull=True)[:count - len(rows)])
+    return rows
+
+
+class UserMovieKeysetPagination(BasePagination):
+    """Cursor pagination on the `sort_key` annotation and id (parameters validated by the view)."""
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if 'limit' not in params and 'cursor' not in params:
+            return None
+
+        self.request = request
+        limit = min(int(params.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE)
+        if params.get('cursor'):
+            _ordering, sort_key, row_id = decode_cursor(params['cursor'], 3)
+            rows = _rows_after(queryset, sort_key, row_id, limit + 1)
+        else:
+            rows = list(queryset[:limit + 1])
+        self.next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            ordering = resolve_user_movie_ordering(params.get('status'), params.get('ordering'))
+            self.next_cursor = encode_cursor([ordering, _cursor_value(rows[-1].sort_key), rows[-1].id])
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({'results': data, 'next': next_page_url(self.request, self.next_cursor)})
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'properties': {
+                'results': schema,
+                'next': {'type': 'string', 'format': 'uri', 'nullable': True},
+            },
+        }
@@ -1,5 +1,13 @@
 from rest_framework import serializers
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
 from movies.models import Movie, MovieAvailability, UserMovie  # type: ignore
+from movies.pagination import InvalidCursor, decode_cursor  # type: ignore
+from services.user_movies_service import (  # type: ignore
+    resolve_user_movie_ordering,
+    user_movie_sort_field,
+)
+from .pagination import MAX_PAGE_SIZE
 
 
 class MovieSerializer(serializers.ModelSerializer):
@@ -36,11 +44,11 @@ class UserMovieSerializer(serializers.ModelSerializer):
 
     def get_availability(self, obj):
         """Get availability data from prefetched attribute or query directly."""
-        # First try prefetched data
-        availability_data = getattr(obj, 'availability_filtered', [])
+        # The services load the user's platforms into the movie's `availability_filtered`
+        availability_data = getattr(obj.tconst, 'availability_filtered', None)
 
-        # If no prefetched data, try direct query as fallback
-        if not availability_data:
+        # Only entries built without it fall back to a query (all platforms)
+        if availability_data is None:
             from movies.models import MovieAvailability
             availability_data = list(MovieAvailability.objects.filter(
                 tconst=obj.tconst.tconst
@@ -55,13 +63,41 @@ class UserMovieQueryParamsSerializer(serializers.Serializer):
     - status: required, one of ['watchlist', 'watched']
     - ordering: optional, allow-listed fields
     - is_available: optional boolean (None if not provided)
+    - limit: optional page size; enables keyset pagination
+    - cursor: optional cursor from the previous page's `next` link; it must have
+      been issued for the same ordering
     """
 
     status = serializers.ChoiceField(choices=["watchlist", "watched"], required=True)
     ordering = serializers.ChoiceField(
-        choices=["-watchlisted_at", "-tconst__avg_rating"], required=False
+        choices=["-watchlisted_at", "-watched_at", "-tconst__avg_rating"], required=False
     )
     is_available = serializers.BooleanField(required=False, allow_null=True, default=None)
+    limit = serializers.IntegerField(required=False, min_value=1, max_value=MAX_PAGE_SIZE)
+    cursor = serializers.CharField(required=False, max_length=512)
+
+    def validate_cursor(self, value):
+        try:
+            ordering, _sort_key, row_id = decode_cursor(value, 3)
+        except InvalidCursor as exc:
+            raise serializers.ValidationError(str(exc))
+        if not isinstance(ordering, str) or not isinstance(row_id, int):
+            raise serializers.ValidationError("Invalid cursor.")
+        return value
+
+    def validate(self, attrs):
+        cursor = attrs.get('cursor')
+        if cursor:
+            cursor_ordering, sort_key, _row_id = decode_cursor(cursor, 3)
+            ordering = resolve_user_movie_ordering(attrs['status'], attrs.get('ordering'))
+            if cursor_ordering != ordering:
+                raise serializers.ValidationError({'cursor': ["This cursor belongs to a different ordering."]})
+            if sort_key is not None:
+                try:
+                    user_movie_sort_field(ordering).to_python(sort_key)
+                except (DjangoValidationError, TypeError, ValueError):
+                    raise serializers.ValidationError({'cursor': ["Invalid cursor."]})
+        return attrs
 
 
 class AddUserMovieCommandSerializer(serializers.Serializer):
@@ -95,3 +131,85 @@ class UpdateUserMovieCommandSerializer(serializers.Serializer):
             'invalid_choice': 'Invalid action. Must be "mark_as_watched" or "restore_to_watchlist"'
         }
     )
+
+
+def _operation_key(operation):
+    """Field identifying the target of a bulk operation."""
+    return 'tconst' if operation['action'] in ('add', 'mark_as_watched') else 'id'
+
+
+class UserMovieOperationSerializer(serializers.Serializer):
+    """One operation of POST /api/user-movies/bulk/.
+
+    add and mark_as_watched take a tconst (like POST /api/user-movies/);
+    restore_to_watchlist and delete take a user-movie id (like PATCH/DELETE).
+    """
+    action = serializers.ChoiceField(
+        choices=['add', 'mark_as_watched', 'restore_to_watchlist', 'delete'],
+        required=True,
+        error_messages={
+            'required': 'action field is required',
+            'invalid_choice': 'Invalid action. Must be "add", "mark_as_watched", "restore_to_watchlist" or "delete"'
+        }
+    )
+    tconst = serializers.RegexField(
+        regex=r'^tt\d{7,8}$',
+        required=False,
+        error_messages={
+            'invalid': 'Invalid tconst format. Expected format: tt followed by 7-8 digits (e.g., tt0816692)'
+        }
+    )
+    id = serializers.IntegerField(required=False, min_value=1)
+
+    def validate(self, attrs):
+        key = _operation_key(attrs)
+        if key not in attrs:
+            raise serializers.ValidationError({key: f'{key} field is required for action "{attrs["action"]}"'})
+        return attrs
+
+
+class BulkUserMovieCommandSerializer(serializers.Serializer):
+    """Command serializer for POST /api/user-movies/bulk/.
+
+    Validates 1..USER_MOVIES_BULK_MAX_OPERATIONS operations, each tconst and
+    each id targeted at most once.
+    """
+    operations = serializers.ListField(
+        child=UserMovieOperationSerializer(),
+        allow_empty=False,
+        error_messages={
+            'empty': 'At least one operation is required.',
+        }
+    )
+
+    def validate_operations(self, value):
+        max_operations = getattr(settings, 'USER_MOVIES_BULK_MAX_OPERATIONS', 500)
+        if len(value) > max_operations:
+            raise serializers.ValidationError(f'At most {max_operations} operations are allowed per request.')
+
+        targets = [(_operation_key(operation), operation[_operation_key(operation)]) for operation in value]
+        if len(set(targets)) != len(targets):
+            raise serializers.ValidationError('Each tconst and each id may appear in only one operation.')
+        return value
+
+
+class UserMovieImportCommandSerializer(serializers.Serializer):
+    """Command serializer for POST /api/user-movies/import/ (multipart).
+
+    - file: an IMDb watchlist or ratings CSV export, at most USER_MOVIE_IMPORT_MAX_BYTES
+    - kind: 'watchlist' (added to the watchlist) or 'ratings' (marked watched)
+    """
+    file = serializers.FileField(required=True, allow_empty_file=False)
+    kind = serializers.ChoiceField(
+        choices=['watchlist', 'ratings'],
+        required=True,
+        error_messages={
+            'invalid_choice': 'Invalid kind. Must be "watchlist" or "ratings"'
+        }
+    )
+
+    def validate_file(self, value):
+        max_bytes = getattr(settings, 'USER_MOVIE_IMPORT_MAX_BYTES', 10 * 1024 * 1024)
+        if value.size > max_bytes:
+            raise serializers.ValidationError(f'The file must be at most {max_bytes // (1024 * 1024)} MB.')
+        return value
@@ -1,11 +1,14 @@
 import uuid
 from unittest.mock import patch
 
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework.test import APITestCase
 from rest_framework import status
 
 from movies.models import Movie, Platform, UserMovie, MovieAvailability, UserPlatform  # type: ignore
+from services.availability_mask_service import refresh_availability_masks  # type: ignore
+from services.user_platform_cache import get_user_platform_ids, user_platform_cache  # type: ignore
 from dotenv import load_dotenv
 import os
 from django.utils import timezone
@@ -29,6 +32,9 @@ def resolve_test_user_uuid() -> uuid.UUID:
 class UserMovieAPITests(APITestCase):
     def setUp(self):
         self.test_user_id = resolve_test_user_uuid()
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
         from django.contrib.auth import get_user_model
 
         User = get_user_model()
@@ -98,6 +104,7 @@ class UserMovieAPITests(APITestCase):
                 "source": "test",
             },
         )
+        refresh_availability_masks()
 
         UserMovie.objects.update_or_create(
             user_id=self.user1.id,
@@ -147,6 +154,84 @@ class UserMovieAPITests(APITestCase):
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]["movie"]["tconst"], self.movie2.tconst)
 
+    def test_limit_enables_keyset_pagination(self):
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.url, {"status": "watchlist", "limit": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [item["movie"]["tconst"] for item in response.data["results"]],
+            [self.movie3.tconst],
+        )
+        self.assertIn("cursor=", response.data["next"])
+
+        second = self.client.get(response.data["next"])
+        self.assertEqual(
+            [item["movie"]["tconst"] for item in second.data["results"]],
+            [self.movie1.tconst],
+        )
+        self.assertIsNone(second.data["next"])
+
+    def test_rating_pages_put_unrated_movies_last(self):
+        unrated, _ = Movie.objects.get_or_create(tconst="tt0000004", defaults={"primary_title": "Movie 4"})
+        UserMovie.objects.update_or_create(
+            user_id=self.user1.id,
+            tconst=unrated,
+            defaults={"watchlisted_at": "2023-10-04T10:00:00Z", "watchlist_deleted_at": None},
+        )
+        self.client.force_authenticate(user=self.user1)
+
+        params = {"status": "watchlist", "ordering": "-tconst__avg_rating", "limit": 1}
+        tconsts, url = [], self.url
+        while url:
+            response = self.client.get(url, params if url == self.url else None)
+            tconsts += [item["movie"]["tconst"] for item in response.data["results"]]
+            url = response.data["next"]
+
+        self.assertEqual(tconsts, [self.movie1.tconst, self.movie3.tconst, unrated.tconst])
+
+    def test_next_page_uses_keyset_not_offset(self):
+        self.client.force_authenticate(user=self.user1)
+        first = self.client.get(self.url, {"status": "watchlist", "limit": 1})
+
+        # The page, its availability prefetch and, because this is the last page,
+        # the (empty) NULLS LAST tail; platform ids come from the platform cache,
+        # and there is no COUNT and no OFFSET.
+        with self.assertNumQueries(3) as context:
+            self.client.get(first.data["next"])
+
+        page_sql = next(query["sql"] for query in context.captured_queries if "user_movie" in query["sql"])
+        self.assertNotIn("OFFSET", page_sql)
+
+    def test_invalid_cursor_returns_400(self):
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(self.url, {"status": "watchlist", "cursor": "garbage"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+    def test_cursor_from_another_ordering_returns_400(self):
+        self.client.force_authenticate(user=self.user1)
+        first = self.client.get(self.url, {"status": "watchlist", "ordering": "-tconst__avg_rating", "limit": 1})
+        cursor = first.data["next"].split("cursor=")[1]
+
+        # Same status, default ordering (-watchlisted_at): the rating cursor must not be replayed.
+        response = self.client.get(self.url, {"status": "watchlist", "limit": 1, "cursor": cursor})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
+    def test_cursor_with_mistyped_sort_key_returns_400(self):
+        from movies.pagination import encode_cursor  # type: ignore
+
+        self.client.force_authenticate(user=self.user1)
+        response = self.client.get(
+            self.url, {"status": "watchlist", "cursor": encode_cursor(["-watchlisted_at", "7.5", 3])}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("cursor", response.data)
+
     def test_filter_by_is_available(self):
         self.client.force_authenticate(user=self.user1)
         response = self.client.get(
@@ -213,6 +298,9 @@ class UserMoviePostAPITests(APITestCase):
 
     def setUp(self):
         self.test_user_id = resolve_test_user_uuid()
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
         from django.contrib.auth import get_user_model
         User = get_user_model()
 
@@ -328,6 +416,41 @@ class UserMoviePostAPITests(APITestCase):
         self.assertIsNone(user_movie.watchlist_deleted_at)
         self.assertIsNone(user_movie.watched_at)
 
+    def test_post_is_a_single_query(self):
+        get_user_platform_ids(self.test_user_id)
+        self.client.force_authenticate(user=self.user1)
+
+        # Upsert, movie and availability on the user's platforms in one statement
+        with self.assertNumQueries(1):
+            response = self.client.post(self.url, {"tconst": "tt0111161"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [(a["platform_id"], a["platform_name"]) for a in response.data["availability"]],
+            [(self.platform1.id, "Netflix"), (self.platform2.id, "HBO Max")],
+        )
+
+    def test_post_mark_as_watched_is_a_single_query(self):
+        get_user_platform_ids(self.test_user_id)
+        self.client.force_authenticate(user=self.user1)
+
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                self.url, {"tconst": "tt0468569", "mark_as_watched": True}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(response.data["watched_at"])
+
+    def test_post_duplicate_costs_one_extra_query(self):
+        get_user_platform_ids(self.test_user_id)
+        self.client.force_authenticate(user=self.user1)
+
+        with self.assertNumQueries(2):
+            response = self.client.post(self.url, {"tconst": "tt0468569"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
     def test_post_missing_tconst(self):
         self.client.force_authenticate(user=self.user1)
         response = self.client.post(self.url, {}, format="json")
@@ -417,6 +540,9 @@ class UserMoviePatchAPITests(APITestCase):
 
     def setUp(self):
         self.test_user_id = resolve_test_user_uuid()
+        # The test user's platform set is cached across tests; start cold.
+        cache.clear()
+        user_platform_cache.clear()
 
         from django.contrib.auth import get_user_model
         User = get_user_model()
@@ -557,6 +683,27 @@ class UserMoviePatchAPITests(APITestCase):
         updated_movie = UserMovie.objects.get(id=self.user_movie_watchlist.id)
         self.assertIsNotNone(updated_movie.watched_at)
 
+    def test_patch_is_a_single_query(self):
+        get_user_platform_ids(self.test_user_id)
+        self.client.force_authenticate(user=self.user1)
+        patch_url = f"{self.url}{self.user_movie_watchlist.id}/"
+
+        with self.assertNumQueries(1):
+            response = self.client.patch(patch_url, {"action": "mark_as_watched"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([a["platform_id"] for a in response.data["availability"]], [self.platform1.id])
+
+    def test_patch_precondition_failure_costs_one_extra_query(self):
+        get_user_platform_ids(self.test_user_id)
+        self.client.force_authenticate(user=self.user1)
+        patch_url = f"{self.url}{self.user_movie_watched.id}/"
+
+        with self.assertNumQueries(2):
+            response = self.client.patch(patch_url, {"action": "mark_as_watched"}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
     def test_patch_mark_as_watched_already_watched(self):
         self.client.force_authenticate(user=self.user1)
         patch_url = f"{self.url}{self.user_movie_watched.id}/"
@@ -857,6 +1004,14 @@ class UserMoviePatchAPITests(APITestCase):
         self.assertIsNotNone(user_movie_after.watchlist_deleted_at)
         self.assertIsNotNone(user_movie_after.watchlisted_at)
 
+    def test_delete_is_a_single_query(self):
+        self.client.force_authenticate(user=self.user1)
+
+        with self.assertNumQueries(1):
+            response = self.client.delete(f"{self.url}{self.user_movie_watchlist.id}/")
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+
     def test_delete_nonexistent_returns_404(self):
         """Test that DELETE nonexistent ID returns 404 Not Found."""
         self.client.force_authenticate(user=self.user1)
@@ -922,3 +1077,267 @@ class UserMoviePatchAPITests(APITestCase):
         # Verify NOT deleted
         user2_movie_after = UserMovie.objects.get(id=user2_movie.id)
         self.assertIsNone(user2_movie_after.watchlist_deleted_at)
+
+
+class UserMovieBulkAPITests(APITestCase):
+    """Tests for POST /api/user-movies/bulk/ endpoint"""
+
+    def setUp(self):
+        self.test_user_id = resolve_test_user_uuid()
+        cache.clear()
+        user_platform_cache.clear()
+
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+
+        self.user1, _ = User.objects.get_or_create(
+            id=self.test_user_id,
+            defaults={
+                'email': 'testbulk@example.com',
+                'username': 'testbulkuser',
+                'is_active': True
+            }
+        )
+
+        self.patcher = patch('services.user_movies_service._resolve_user_uuid')
+        self.mock_get_uuid = self.patcher.start()
+        self.mock_get_uuid.return_value = str(self.test_user_id)
+
+        self.movies = [
+            Movie.objects.get_or_create(
+                tconst=f"tt99300{index:02d}", defaults={"primary_title": f"Bulk Movie {index}"}
+            )[0]
+            for index in range(20)
+        ]
+        self.user_movie_watchlist = UserMovie.objects.create(
+            user_id=self.test_user_id,
+            tconst=self.movies[0],
+            watchlisted_at=timezone.now(),
+        )
+        self.user_movie_watched = UserMovie.objects.create(
+            user_id=self.test_user_id,
+            tconst=self.movies[1],
+            watchlisted_at=timezone.now(),
+            watched_at=timezone.now(),
+        )
+
+        self.url = reverse("usermovie-bulk")
+
+    def tearDown(self):
+        self.patcher.stop()
+
+    def test_bulk_applies_every_action(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post(self.url, {"operations": [
+            {"action": "add", "tconst": self.movies[2].tconst},
+            {"action": "mark_as_watched", "tconst": self.movies[3].tconst},
+            {"action": "restore_to_watchlist", "id": self.user_movie_watched.id},
+            {"action": "delete", "id": self.user_movie_watchlist.id},
+        ]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([result["status"] for result in results], [201, 201, 200, 204])
+        self.assertEqual(results[2]["tconst"], self.movies[1].tconst)
+
+        added = UserMovie.objects.get(user_id=self.test_user_id, tconst=self.movies[2])
+        self.assertEqual(results[0]["id"], added.id)
+        self.assertIsNotNone(added.watchlisted_at)
+        watched = UserMovie.objects.get(user_id=self.test_user_id, tconst=self.movies[3])
+        self.assertIsNotNone(watched.watched_at)
+        self.user_movie_watched.refresh_from_db()
+        self.assertIsNone(self.user_movie_watched.watched_at)
+        self.user_movie_watchlist.refresh_from_db()
+        self.assertIsNotNone(self.user_movie_watchlist.watchlist_deleted_at)
+
+    def test_bulk_reports_failures_per_item(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post(self.url, {"operations": [
+            {"action": "add", "tconst": self.movies[0].tconst},
+            {"action": "add", "tconst": "tt99309999"},
+            {"action": "mark_as_watched", "tconst": self.movies[1].tconst},
+            {"action": "restore_to_watchlist", "id": self.user_movie_watchlist.id},
+            {"action": "delete", "id": 999999999},
+            {"action": "add", "tconst": self.movies[4].tconst},
+        ]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"]
+        self.assertEqual([result["status"] for result in results], [409, 400, 409, 400, 404, 201])
+        self.assertIn("does not exist", results[1]["detail"])
+        # The failures didn't roll back the successful add
+        self.assertTrue(UserMovie.objects.filter(user_id=self.test_user_id, tconst=self.movies[4]).exists())
+
+    def test_bulk_does_not_touch_other_users_movies(self):
+        other = UserMovie.objects.create(
+            user_id=uuid.uuid4(), tconst=self.movies[5], watchlisted_at=timezone.now()
+        )
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post(
+            self.url, {"operations": [{"action": "delete", "id": other.id}]}, format="json"
+        )
+
+        self.assertEqual(response.data["results"][0]["status"], 404)
+        other.refresh_from_db()
+        self.assertIsNone(other.watchlist_deleted_at)
+
+    def test_bulk_query_count_does_not_grow_with_operations(self):
+        self.client.force_authenticate(user=self.user1)
+        operations = [{"action": "mark_as_watched", "tconst": movie.tconst} for movie in self.movies[2:]]
+
+        # Savepoint, one upsert for every operation, release
+        with self.assertNumQueries(3):
+            response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual({result["status"] for result in response.data["results"]}, {201})
+
+    def test_bulk_rejects_duplicate_targets(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post(self.url, {"operations": [
+            {"action": "add", "tconst": self.movies[2].tconst},
+            {"action": "mark_as_watched", "tconst": self.movies[2].tconst},
+        ]}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_requires_the_target_field_of_each_action(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self.client.post(
+            self.url, {"operations": [{"action": "delete", "tconst": self.movies[0].tconst}]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("id", response.data["operations"][0])
+
+    def test_bulk_rejects_too_many_operations(self):
+        self.client.force_authenticate(user=self.user1)
+        operations = [{"action": "add", "tconst": movie.tconst} for movie in self.movies]
+
+        with self.settings(USER_MOVIES_BULK_MAX_OPERATIONS=10):
+            response = self.client.post(self.url, {"operations": operations}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_without_authentication_returns_401(self):
+        response = self.client.post(
+            self.url, {"operations": [{"action": "add", "tconst": self.movies[2].tconst}]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserMovieImportAPITests(APITestCase):
+    """Tests for POST /api/user-movies/import/ and GET /api/user-movies/import/<job_id>/"""
+
+    def setUp(self):
+        self.test_user_id = resolve_test_user_uuid()
+
+        from django.contrib.auth import get_user_model
+        User = get_user_model()
+
+        self.user1, _ = User.objects.get_or_create(
+            id=self.test_user_id,
+            defaults={
+                'email': 'testimport@example.com',
+                'username': 'testimportuser',
+                'is_active': True
+            }
+        )
+        self.movie, _ = Movie.objects.get_or_create(
+            tconst="tt9910001", defaults={"primary_title": "Imported Movie"}
+        )
+
+        self.delay_patcher = patch('myVOD.celery.run_user_movie_import.delay')
+        self.mock_delay = self.delay_patcher.start()
+
+        self.url = reverse("usermovie-import")
+
+    def tearDown(self):
+        self.delay_patcher.stop()
+
+    def _upload(self, content, kind="watchlist"):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+
+        upload = SimpleUploadedFile("watchlist.csv", content.encode("utf-8"), content_type="text/csv")
+        return self.client.post(self.url, {"file": upload, "kind": kind}, format="multipart")
+
+    def test_upload_queues_job_and_reports_progress(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self._upload(
+            "\ufeffPosition,Const,Created,Title\n"
+            "1,tt9910001,2021-03-04,Imported Movie\n"
+            "2,not-a-tconst,2021-03-04,Broken\n"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["status"], "queued")
+        self.assertEqual((response.data["total"], response.data["invalid"]), (1, 1))
+        job_id = response.data["job_id"]
+        self.mock_delay.assert_called_once_with(
+            job_id, str(self.test_user_id), "watchlist", [("tt9910001", "2021-03-04")]
+        )
+
+        # Run the job as the worker would
+        from services.user_movie_import_service import apply_user_movie_import  # type: ignore
+        apply_user_movie_import(*self.mock_delay.call_args.args)
+
+        progress = self.client.get(response.data["status_url"])
+        self.assertEqual(progress.status_code, status.HTTP_200_OK)
+        self.assertEqual(progress.data["status"], "done")
+        self.assertEqual(progress.data["created"], 1)
+        self.assertTrue(UserMovie.objects.filter(user_id=self.test_user_id, tconst=self.movie).exists())
+
+    def test_status_of_another_users_job_returns_404(self):
+        self.client.force_authenticate(user=self.user1)
+        job_id = self._upload("Const,Date Rated\ntt9910001,2021-03-04\n", kind="ratings").data["job_id"]
+
+        from django.contrib.auth import get_user_model
+        other, _ = get_user_model().objects.get_or_create(
+            id=uuid.uuid4(),
+            defaults={'email': 'otherimport@example.com', 'username': 'otherimportuser', 'is_active': True}
+        )
+        self.client.force_authenticate(user=other)
+
+        response = self.client.get(reverse("usermovie-import-status", kwargs={"job_id": job_id}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_job_that_cannot_be_queued_returns_500_and_is_marked_failed(self):
+        self.client.force_authenticate(user=self.user1)
+        self.mock_delay.side_effect = ConnectionError("broker down")
+
+        response = self._upload("Const,Date Rated\ntt9910001,2021-03-04\n", kind="ratings")
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        job_id = self.mock_delay.call_args.args[0]
+        progress = self.client.get(reverse("usermovie-import-status", kwargs={"job_id": job_id}))
+        self.assertEqual(progress.data["status"], "failed")
+
+    def test_file_that_is_not_an_imdb_export_returns_400(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self._upload("tconst,title\ntt9910001,Imported Movie\n")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("file", response.data)
+        self.mock_delay.assert_not_called()
+
+    def test_invalid_kind_returns_400(self):
+        self.client.force_authenticate(user=self.user1)
+
+        response = self._upload("Const\ntt9910001\n", kind="reviews")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("kind", response.data)
+
+    def test_import_without_authentication_returns_401(self):
+        response = self._upload("Const\ntt9910001\n")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
@@ -1,18 +1,34 @@
+import csv
+import io
 import logging
+from django.urls import reverse
 from rest_framework import viewsets, permissions, status
+from rest_framework.decorators import action
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from django.db import DatabaseError, IntegrityError
 from movies.models import UserMovie, Movie  # type: ignore
+from .pagination import UserMovieKeysetPagination
 from .serializers import (
     UserMovieSerializer,
     UserMovieQueryParamsSerializer,
     AddUserMovieCommandSerializer,
-    UpdateUserMovieCommandSerializer
+    BulkUserMovieCommandSerializer,
+    UpdateUserMovieCommandSerializer,
+    UserMovieImportCommandSerializer
+)
+from services.user_movie_import_service import (  # type: ignore
+    ImportFileError,
+    get_import_status,
+    parse_imdb_csv,
+    start_user_movie_import
 )
 from services.user_movies_service import (  # type: ignore
+    _resolve_user_uuid,
     build_user_movies_queryset,
     add_movie_to_watchlist,
     add_movie_as_watched,
+    apply_user_movie_operations,
     update_user_movie,
     delete_user_movie_soft
 )
@@ -30,18 +46,24 @@ class UserMovieViewSet(viewsets.ModelViewSet):
         GET /api/user-movies/?status=watchlist - retrieve user's watchlist
         GET /api/user-movies/?status=watched - retrieve watched history
         POST /api/user-movies/ - add movie to watchlist
+        POST /api/user-movies/bulk/ - apply many add/mark/restore/delete operations
+        POST /api/user-movies/import/ - import an IMDb watchlist or ratings CSV (background job)
+        GET /api/user-movies/import/<job_id>/ - progress of an import
 
     Query Parameters (GET):
         - status (required): 'watchlist' or 'watched'
-        - ordering (optional): '-watchlisted_at' or '-tconst__avg_rating'
+        - ordering (optional): '-watchlisted_at', '-watched_at' or '-tconst__avg_rating'
         - is_available (optional): boolean to filter by availability
+        - limit, cursor (optional): keyset pagination; without them the
+          whole list is returned as a plain array
 
     Request Body (POST):
         - tconst (required): IMDb movie identifier (e.g., 'tt0816692')
     """
     serializer_class = UserMovieSerializer
     permission_classes = [permissions.IsAuthenticated]
-    pagination_class = None  # Disable pagination for this endpoint (MVP)
+    # Opt-in keyset pagination (limit/cursor); never OFFSET.
+    pagination_class = UserMovieKeysetPagination
 
     # Enable GET, POST, PATCH, DELETE methods
     http_method_names = ['get', 'post', 'patch', 'delete', 'head', 'options']
@@ -61,7 +83,7 @@ class UserMovieViewSet(viewsets.ModelViewSet):
         - Ordering support
 
         Returns:
-            200: List of UserMovieDto
+            200: List of UserMovieDto, or {"results": [...], "next": <url>} with limit/cursor
             400: Invalid query parameters
             401: Not authenticated
             500: Internal server error
@@ -356,3 +378,137 @@ class UserMovieViewSet(viewsets.ModelViewSet):
                 {"detail": "An unexpected error occurred. Please try again later."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk(self, request, *args, **kwargs):
+        """
+        Apply many operations in one request (POST /api/user-movies/bulk/).
+
+        Request Body:
+            operations: up to USER_MOVIES_BULK_MAX_OPERATIONS items of
+                {"action": "add" | "mark_as_watched", "tconst": ...} or
+                {"action": "restore_to_watchlist" | "delete", "id": ...}
+
+        Implements business logic:
+        - Each operation follows its single-item endpoint's rules
+        - All operations are applied in one transaction, one statement per action
+        - An operation that fails its preconditions doesn't affect the others
+
+        Returns:
+            200: OK - {"results": [...]} in request order, each with the `status`
+                 its single-item endpoint would have returned
+            400: Bad Request - Invalid body, too many or duplicate operations
+            401: Unauthorized - Not authenticated
+            500: Internal Server Error - Unexpected error (nothing is applied)
+        """
+        command_serializer = BulkUserMovieCommandSerializer(data=request.data)
+        if not command_serializer.is_valid():
+            logger.warning(
+                f"Invalid request body for POST user-movies/bulk (user {request.user.id}): {command_serializer.errors}"
+            )
+            return Response(command_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        operations = command_serializer.validated_data['operations']
+
+        try:
+            results = apply_user_movie_operations(user=request.user, operations=operations)
+            return Response({"results": results}, status=status.HTTP_200_OK)
+
+        except DatabaseError as e:
+            logger.error(
+                f"Database error while applying {len(operations)} user-movie operations for user {request.user.id}: {str(e)}",
+                exc_info=True
+            )
+            return Response(
+                {"detail": "A database error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error while applying user-movie operations for user {request.user.id}: {str(e)}",
+                exc_info=True
+            )
+            return Response(
+                {"detail": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=False, methods=['post'], url_path='import', url_name='import',
+            parser_classes=[MultiPartParser, FormParser])
+    def import_csv(self, request, *args, **kwargs):
+        """
+        Import an IMDb CSV export (POST /api/user-movies/import/, multipart).
+
+        Request Body:
+            file: the watchlist or ratings CSV exported from IMDb
+            kind: 'watchlist' (add to watchlist) or 'ratings' (mark as watched)
+
+        Implements business logic:
+        - The upload is streamed and only tconsts and dates are kept
+        - The import itself runs as a Celery job; poll `status_url` for progress
+
+        Returns:
+            202: Accepted - job status ({"job_id", "status": "queued", "total", ...}) and status_url
+            400: Bad Request - Invalid body, file too large or not an IMDb export
+            401: Unauthorized - Not authenticated
+            500: Internal Server Error - The job could not be queued
+        """
+        command_serializer = UserMovieImportCommandSerializer(data=request.data)
+        if not command_serializer.is_valid():
+            logger.warning(
+                f"Invalid request body for POST user-movies/import (user {request.user.id}): {command_serializer.errors}"
+            )
+            return Response(command_serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        upload = command_serializer.validated_data['file']
+        kind = command_serializer.validated_data['kind']
+
+        upload.seek(0)
+        text = io.TextIOWrapper(upload.file, encoding='utf-8-sig', newline='')
+        try:
+            rows, invalid = parse_imdb_csv(text, kind)
+        except UnicodeDecodeError:
+            return Response({"file": ["The file must be a UTF-8 encoded CSV."]}, status=status.HTTP_400_BAD_REQUEST)
+        except (ImportFileError, csv.Error) as e:
+            return Response({"file": [str(e)]}, status=status.HTTP_400_BAD_REQUEST)
+        finally:
+            # Leave the upload open for Django to clean up
+            text.detach()
+
+        try:
+            job = start_user_movie_import(_resolve_user_uuid(request.user), kind, rows, invalid)
+            job['status_url'] = request.build_absolute_uri(
+                reverse('usermovie-import-status', kwargs={'job_id': job['job_id']})
+            )
+            return Response(job, status=status.HTTP_202_ACCEPTED)
+
+        except Exception as e:
+            logger.error(
+                f"Unexpected error while queueing {kind} import for user {request.user.id}: {str(e)}",
+                exc_info=True
+            )
+            return Response(
+                {"detail": "An unexpected error occurred. Please try again later."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+    @action(detail=False, methods=['get'], url_path=r'import/(?P<job_id>[0-9a-f]{32})',
+            url_name='import-status')
+    def import_status(self, request, job_id=None, *args, **kwargs):
+        """
+        Progress of an import job (GET /api/user-movies/import/<job_id>/).
+
+        Returns:
+            200: OK - {"job_id", "kind", "status": queued|running|done|failed, "total",
+                 "processed", "created", "updated", "unknown", "invalid", "error", ...}
+            401: Unauthorized - Not authenticated
+            404: Not Found - Unknown or expired job, or another user's
+        """
+        job = get_import_status(job_id, _resolve_user_uuid(request.user))
+        if job is None:
+            return Response(
+                {"detail": f"Import job {job_id} not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+        return Response(job, status=status.HTTP_200_OK)